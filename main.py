@@ -1,4 +1,16 @@
+import argparse
+import asyncio
+
 from src import server
+from src.util.startup_report import build_startup_report
 
 if __name__ == '__main__':
-  server.start_server()
+  parser = argparse.ArgumentParser(description='Starts the market data notification server')
+  parser.add_argument('--startup_report', type=int, choices=[0, 1], default=0,
+                      help='Print import and init time per module instead of starting the server')
+  cli_args = parser.parse_args()
+
+  if cli_args.startup_report == 1:
+    print(asyncio.run(build_startup_report('src.server')))
+  else:
+    server.start_server()
@@ -151,10 +151,32 @@ def get_contango_decrease_past_n_days_threshold():
 def get_vix_central_number_of_days():
     return 7
 
+def is_vix_central_history_store_enabled() -> bool:
+    return os.getenv('VIX_CENTRAL_HISTORY_STORE_ENABLED', 'true') == 'true'
+
 def get_should_compare_stocks_volume_rank() -> bool:
     val = os.getenv('SHOULD_COMPARE_STOCKS_VOLUME_RANK', 'true')
     return True if val == 'true' or not val else False
 
+def is_stocks_daily_bar_store_enabled() -> bool:
+    return os.getenv('STOCKS_DAILY_BAR_STORE_ENABLED', 'true') == 'true'
+
+def get_stocks_daily_bar_db_path(runtime_mode: RuntimeMode | None = None) -> str:
+    prod_db_path = os.getenv(
+        'STOCKS_DAILY_BAR_DB_PATH',
+        'var/stocks/stocks_daily_bars.sqlite3',
+    )
+    active_runtime_mode = (
+        DEFAULT_RUNTIME_MODE if runtime_mode is None else runtime_mode
+    )
+    # Replays of old TradingView snapshots must not write into the prod store.
+    if not active_runtime_mode.is_test_mode:
+        return prod_db_path
+    return os.getenv(
+        'STOCKS_DAILY_BAR_TEST_DB_PATH',
+        _build_test_db_path(prod_db_path),
+    )
+
 def get_display_vix_futures_contango_decrease_past_n_days() -> bool:
     val = os.getenv('DISPLAY_VIX_FUTURES_CONTANGO_DECREASE_PAST_N_DAYS', 'true')
     return True if val == 'true' or not val else False
@@ -306,6 +328,25 @@ def get_telegram_write_timeout_seconds() -> float:
 def get_telegram_pool_timeout_seconds() -> float:
     return _get_positive_float_env('TELEGRAM_POOL_TIMEOUT_SECONDS', '5')
 
+def is_telegram_outbox_enabled() -> bool:
+    return os.getenv('TELEGRAM_OUTBOX_ENABLED', 'false') == 'true'
+
+def get_telegram_outbox_per_chat_interval_seconds() -> float:
+    # Telegram allows about one message per second in a single chat.
+    return _get_positive_float_env('TELEGRAM_OUTBOX_PER_CHAT_INTERVAL_SECONDS', '1')
+
+def get_telegram_outbox_global_rate_per_second() -> float:
+    # Telegram's bot-wide limit is about 30 messages per second.
+    return _get_positive_float_env('TELEGRAM_OUTBOX_GLOBAL_RATE_PER_SECOND', '25')
+
+def get_metrics_textfile_dir() -> str:
+    # Jobs write <dir>/<job>.prom for node_exporter's textfile collector.
+    return os.getenv('METRICS_TEXTFILE_DIR', '')
+
+def get_trace_output_dir() -> str:
+    # Job runs are written here as Chrome trace-event JSON; blank disables it.
+    return os.getenv('TRACE_OUTPUT_DIR', '')
+
 def get_redis_host():
     return os.getenv('REDIS_HOST', 'localhost')
 
@@ -314,9 +355,44 @@ def get_redis_port():
 
 def get_redis_db():
     return os.getenv('REDIS_DB', 0)
+
+def is_response_cache_enabled() -> bool:
+    return os.getenv('RESPONSE_CACHE_ENABLED', 'true') == 'true'
+
+def get_response_cache_max_local_entries() -> int:
+    return int(os.getenv('RESPONSE_CACHE_MAX_LOCAL_ENTRIES', 256))
+
+def get_sentiment_response_cache_ttl_seconds() -> float:
+    return _get_positive_float_env('SENTIMENT_RESPONSE_CACHE_TTL_SECONDS', '300')
+
+def get_crypto_stats_response_cache_ttl_seconds() -> float:
+    return _get_positive_float_env('CRYPTO_STATS_RESPONSE_CACHE_TTL_SECONDS', '120')
+
+def get_cryptoquant_response_cache_ttl_seconds() -> float:
+    return _get_positive_float_env('CRYPTOQUANT_RESPONSE_CACHE_TTL_SECONDS', '300')
+
+def get_vix_central_current_response_cache_ttl_seconds() -> float:
+    return _get_positive_float_env('VIX_CENTRAL_CURRENT_RESPONSE_CACHE_TTL_SECONDS', '60')
+
+def get_vix_central_historical_response_cache_ttl_seconds() -> float:
+    # Settled historical term structures do not change once published.
+    return _get_positive_float_env('VIX_CENTRAL_HISTORICAL_RESPONSE_CACHE_TTL_SECONDS', '86400')
 def get_trading_view_days_to_store():
     return os.getenv('TRADING_VIEW_DAYS_TO_STORE', 30)
 
+def get_tradingview_payload_encoding() -> str:
+    # 'compact' (default) or 'json'. Reads accept both regardless.
+    return os.getenv('TRADINGVIEW_PAYLOAD_ENCODING', 'compact')
+
+def is_tradingview_async_ingestion_enabled() -> bool:
+    return os.getenv('TRADINGVIEW_ASYNC_INGESTION_ENABLED', 'false') == 'true'
+
+def get_tradingview_ingestion_stream_max_length() -> int:
+    return int(os.getenv('TRADINGVIEW_INGESTION_STREAM_MAX_LENGTH', 10000))
+
+def get_tradingview_max_body_bytes() -> int:
+    return int(os.getenv('TRADINGVIEW_MAX_BODY_BYTES', 1024 * 1024))
+
 def get_stocks_job_start_local_hour():
     return int(os.getenv('STOCKS_JOB_START_LOCAL_HOUR', 9))
 
@@ -329,9 +405,56 @@ def get_crypto_job_start_local_hours():
 def get_crypto_job_start_local_minutes():
     return os.getenv('CRYPTO_JOB_START_LOCAL_MINUTES', '0,15')
 
+def get_cmc_coin_detail_max_concurrency() -> int:
+    raw_value = os.getenv('CMC_COIN_DETAIL_MAX_CONCURRENCY', '4')
+    try:
+        max_concurrency = int(raw_value)
+    except ValueError as error:
+        raise RuntimeError(
+            'CMC_COIN_DETAIL_MAX_CONCURRENCY must be a positive integer'
+        ) from error
+    if max_concurrency <= 0:
+        raise RuntimeError(
+            'CMC_COIN_DETAIL_MAX_CONCURRENCY must be a positive integer'
+        )
+    return max_concurrency
+
+def get_cmc_coin_detail_cache_ttl_seconds() -> float:
+    return _get_positive_float_env('CMC_COIN_DETAIL_CACHE_TTL_SECONDS', '300')
+
+def get_fetch_scheduler_provider_limits() -> dict[str, tuple[float, int]]:
+    # Format: provider:rate_per_second:max_in_flight, comma-separated. Providers
+    # that are not listed keep the scheduler defaults.
+    raw_value = os.getenv('FETCH_SCHEDULER_PROVIDER_LIMITS', '').strip()
+    provider_limits = {}
+    if raw_value == '':
+        return provider_limits
+    for raw_entry in raw_value.split(','):
+        parts = [part.strip() for part in raw_entry.split(':')]
+        try:
+            provider, raw_rate, raw_max_in_flight = parts
+            rate_per_second = float(raw_rate)
+            max_in_flight = int(raw_max_in_flight)
+        except ValueError as error:
+            raise RuntimeError(
+                'FETCH_SCHEDULER_PROVIDER_LIMITS entries must be provider:rate_per_second:max_in_flight'
+            ) from error
+        if provider == '' or rate_per_second <= 0 or max_in_flight <= 0:
+            raise RuntimeError(
+                'FETCH_SCHEDULER_PROVIDER_LIMITS entries must be provider:rate_per_second:max_in_flight'
+            )
+        provider_limits[provider.lower()] = (rate_per_second, max_in_flight)
+    return provider_limits
+
 def get_job_delay_tolerance_second():
     return int(os.getenv('JOB_DELAY_TOLERANCE_SECOND', 60 * 30))
 
+def is_job_scheduler_enabled() -> bool:
+    return os.getenv('JOB_SCHEDULER_ENABLED', 'false') == 'true'
+
+def get_job_scheduler_poll_interval_seconds() -> float:
+    return _get_positive_float_env('JOB_SCHEDULER_POLL_INTERVAL_SECONDS', '30')
+
 def get_cryptoquant_api_token() -> str:
     return os.getenv('CRYPTOQUANT_API_TOKEN', '')
 
@@ -347,6 +470,12 @@ def has_coinalyze_api_key() -> bool:
 def is_crypto_signal_market_regime_enabled() -> bool:
     return os.getenv('CRYPTO_SIGNAL_MARKET_REGIME_ENABLED', 'false') == 'true'
 
+def is_crypto_signal_market_regime_audit_log_enabled() -> bool:
+    return os.getenv('CRYPTO_SIGNAL_MARKET_REGIME_AUDIT_LOG_ENABLED', 'false') == 'true'
+
+def is_crypto_signal_history_cube_enabled() -> bool:
+    return os.getenv('CRYPTO_SIGNAL_HISTORY_CUBE_ENABLED', 'false') == 'true'
+
 def get_crypto_signal_market_regime_provider() -> str:
     provider = os.getenv(
         'CRYPTO_SIGNAL_MARKET_REGIME_PROVIDER',
@@ -457,7 +586,7 @@ def get_crypto_signal_db_path(
         return prod_db_path
     return os.getenv(
         'CRYPTO_SIGNAL_TEST_DB_PATH',
-        _build_test_crypto_signal_db_path(prod_db_path),
+        _build_test_db_path(prod_db_path),
     )
 
 
@@ -543,7 +672,7 @@ def _parse_crypto_signal_coin_entries(
     return entries
 
 
-def _build_test_crypto_signal_db_path(prod_db_path: str) -> str:
+def _build_test_db_path(prod_db_path: str) -> str:
     path = Path(prod_db_path)
     if path.suffix == '':
         return f'{prod_db_path}.test'
@@ -9,20 +9,25 @@ tradfi_api: Optional[TradFiAPI] = None
 
 
 def get_crypto_api() -> CryptoAPI:
-    init_market_data_api()
+    # Built on first use, so runs that only need one side skip the other.
+    _init_crypto_api()
     assert crypto_api is not None
     return crypto_api
 
 
 def get_tradfi_api() -> TradFiAPI:
-    init_market_data_api()
+    _init_tradfi_api()
     assert tradfi_api is not None
     return tradfi_api
 
 
 def init_market_data_api() -> None:
+    _init_crypto_api()
+    _init_tradfi_api()
+
+
+def _init_crypto_api() -> None:
     global crypto_api
-    global tradfi_api
     if crypto_api is None:
         crypto_api_kwargs = {
             'cryptoquant_api_token': config.get_cryptoquant_api_token(),
@@ -30,6 +35,10 @@ def init_market_data_api() -> None:
         if config.has_coinalyze_api_key():
             crypto_api_kwargs['coinalyze_api_key'] = config.get_coinalyze_api_key()
         crypto_api = CryptoAPI(**crypto_api_kwargs)
+
+
+def _init_tradfi_api() -> None:
+    global tradfi_api
     if tradfi_api is None:
         tradfi_api_kwargs: dict[str, Any] = {
             'is_stealth': config.get_selenium_stealth(),
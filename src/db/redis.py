@@ -1,10 +1,28 @@
 import logging
+import time
 
 import redis.asyncio as redis
 
 from src.config import config
+from src.util.metrics import REDIS_COMMAND_DURATION
 
 logger = logging.getLogger('Redis')
+
+
+class _InstrumentedRedis(redis.Redis):
+    # Every command, including EVALSHA from registered scripts, goes through
+    # execute_command. Pipelines bypass it and are not timed.
+    async def execute_command(self, *args, **options):
+        started_at = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_DURATION.observe(
+                time.perf_counter() - started_at,
+                command=str(args[0]).upper() if args else 'UNKNOWN',
+            )
+
+
 class Redis:
     redis: redis.Redis
 
@@ -16,7 +34,7 @@ class Redis:
     async def start_redis():
         logger.info('starting redis')
         host = config.get_redis_host()
-        Redis.redis = await redis.Redis(host=host, port=config.get_redis_port(), db=config.get_redis_db())
+        Redis.redis = await _InstrumentedRedis(host=host, port=config.get_redis_port(), db=config.get_redis_db())
 
     @staticmethod
     async def stop_redis():
@@ -0,0 +1,141 @@
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger('SQLite')
+
+# Readers only need a handful of connections: the jobs are single-threaded and
+# reads do not nest deeply. Extra readers opened under contention are closed on
+# release instead of growing the idle pool.
+DEFAULT_READ_POOL_SIZE = 4
+BUSY_TIMEOUT_MS = 5_000
+# Negative cache_size is in KiB, so this is a ~16 MiB page cache per connection.
+CACHE_SIZE_KIB = 16_384
+MMAP_SIZE_BYTES = 64 * 1024 * 1024
+
+
+class SqliteConnectionManager:
+    """Process-wide writer connection plus a small pool of read-only readers.
+
+    One manager exists per resolved DB path so every repository instance in the
+    process shares the same warm connections and schema memo.
+    """
+
+    _managers: dict[str, 'SqliteConnectionManager'] = {}
+    _managers_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: str,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+    ) -> None:
+        self.db_path = db_path
+        self.read_pool_size = read_pool_size
+        self.schema_version: int | None = None
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.RLock()
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    @staticmethod
+    def get(db_path: str) -> 'SqliteConnectionManager':
+        key = str(Path(db_path).resolve())
+        with SqliteConnectionManager._managers_lock:
+            manager = SqliteConnectionManager._managers.get(key)
+            if manager is None:
+                manager = SqliteConnectionManager(db_path=db_path)
+                SqliteConnectionManager._managers[key] = manager
+            return manager
+
+    @staticmethod
+    def close_all() -> None:
+        with SqliteConnectionManager._managers_lock:
+            managers = list(SqliteConnectionManager._managers.values())
+            SqliteConnectionManager._managers.clear()
+        for manager in managers:
+            manager.close()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared writer inside one transaction.
+
+        Commits when the block exits cleanly and rolls back on error, matching
+        the `with sqlite3.connect(...)` semantics callers relied on before.
+        """
+        with self._writer_lock:
+            connection = self._get_writer()
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+            else:
+                connection.commit()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        connection = self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            self._release_reader(connection)
+
+    def close(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            readers, self._idle_readers = self._idle_readers, []
+        for connection in readers:
+            connection.close()
+        self.schema_version = None
+
+    def _get_writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            # WAL lets the read-only pool keep serving while a run is written;
+            # NORMAL sync is durable across app crashes in WAL mode and only
+            # risks the last commit on power loss, which the next run rewrites.
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._apply_shared_pragmas(connection)
+            self._writer = connection
+            logger.info('Opened SQLite writer connection for %s', self.db_path)
+        return self._writer
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        with self._readers_lock:
+            if self._idle_readers:
+                return self._idle_readers.pop()
+        connection = sqlite3.connect(
+            f'{Path(self.db_path).resolve().as_uri()}?mode=ro',
+            uri=True,
+            check_same_thread=False,
+        )
+        connection.row_factory = sqlite3.Row
+        self._apply_shared_pragmas(connection)
+        return connection
+
+    def _release_reader(self, connection: sqlite3.Connection) -> None:
+        # Readers never open write transactions, but a failed statement can
+        # still leave one pending; reset before the connection is reused.
+        if connection.in_transaction:
+            connection.rollback()
+        with self._readers_lock:
+            if len(self._idle_readers) < self.read_pool_size:
+                self._idle_readers.append(connection)
+                return
+        connection.close()
+
+    @staticmethod
+    def _apply_shared_pragmas(connection: sqlite3.Connection) -> None:
+        connection.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        connection.execute(f'PRAGMA cache_size=-{CACHE_SIZE_KIB}')
+        connection.execute(f'PRAGMA mmap_size={MMAP_SIZE_BYTES}')
+        connection.execute('PRAGMA temp_store=MEMORY')
@@ -1,5 +1,6 @@
 import logging
 
+from src.config import config
 from src.service.barchart import BarchartService
 from src.service.crypto.cryptoquant import CryptoQuantService
 from src.service.crypto.crypto_sentiment import CryptoSentimentService
@@ -10,6 +11,10 @@ from src.http_client import HttpClient
 from src.third_party_service.barchart import ThirdPartyBarchartService
 from src.third_party_service.vix_central import ThirdPartyVixCentralService
 from src.service.vix_central import VixCentralService
+from src.service.vix_central_history_store import VixCentralHistoryStore
+from src.service.response_cache import ResponseCache
+from src.service.tradingview_ingestion_queue import TradingViewIngestionQueue
+from src.notification_destination.telegram_outbox import TelegramOutbox
 from src.data_source.market_data_library import cleanup_market_data_api
 
 logger = logging.getLogger('Dependencies')
@@ -18,6 +23,7 @@ class Dependencies:
 
   # stocks
   tradingview_service: TradingViewService = None
+  tradingview_ingestion_queue: TradingViewIngestionQueue = None
   thirdparty_vix_central_service: ThirdPartyVixCentralService = None
   vix_central_service: VixCentralService = None
   thirdparty_barchart_service: ThirdPartyBarchartService = None
@@ -29,25 +35,35 @@ class Dependencies:
   crypto_sentiment_service: CryptoSentimentService = None
   crypto_stats_service: CryptoStatsService = None
 
+  # shared
+  response_cache: ResponseCache = None
+  telegram_outbox: TelegramOutbox = None
+
   @staticmethod
   async def build():
     if not Dependencies.is_initialised:
       # stocks
       Dependencies.tradingview_service = TradingViewService()
+      if config.is_tradingview_async_ingestion_enabled():
+        Dependencies.tradingview_ingestion_queue = TradingViewIngestionQueue(
+          max_length=config.get_tradingview_ingestion_stream_max_length(),
+        )
 
       vix_central_service_http_client = await HttpClient.create(base_url=ThirdPartyVixCentralService.BASE_URL, headers=ThirdPartyVixCentralService.HEADERS)
       Dependencies.thirdparty_vix_central_service = ThirdPartyVixCentralService(http_client=vix_central_service_http_client)
-      Dependencies.vix_central_service = VixCentralService(third_party_service=Dependencies.thirdparty_vix_central_service)
+      Dependencies.vix_central_service = VixCentralService(
+        third_party_service=Dependencies.thirdparty_vix_central_service,
+        history_store=VixCentralHistoryStore() if config.is_vix_central_history_store_enabled() else None,
+      )
 
-      Dependencies.thirdparty_barchart_service = ThirdPartyBarchartService()
-      Dependencies.barchart_service = BarchartService(third_party_service=Dependencies.thirdparty_barchart_service)
+      # Barchart, CNN and the crypto services wrap market data library
+      # clients, which are costly to build. Their getters build them on
+      # first use, so a crypto run never builds the Selenium-backed TradFiAPI.
 
-      Dependencies.stocks_sentiment_service = StocksSentimentService()
-
-    # crypto
-      Dependencies.cryptoquant_api_service = CryptoQuantService()
-      Dependencies.crypto_sentiment_service = CryptoSentimentService()
-      Dependencies.crypto_stats_service = CryptoStatsService()
+      if config.is_response_cache_enabled():
+        Dependencies.response_cache = ResponseCache(max_local_entries=config.get_response_cache_max_local_entries())
+      if config.is_telegram_outbox_enabled():
+        Dependencies.telegram_outbox = TelegramOutbox()
 
       Dependencies.is_initialised = True
       logger.info('Dependencies built')
@@ -62,6 +78,7 @@ class Dependencies:
 
     Dependencies.is_initialised = False
     Dependencies.tradingview_service = None
+    Dependencies.tradingview_ingestion_queue = None
     Dependencies.thirdparty_vix_central_service = None
     Dependencies.vix_central_service = None
     Dependencies.thirdparty_barchart_service = None
@@ -70,12 +87,18 @@ class Dependencies:
     Dependencies.cryptoquant_api_service = None
     Dependencies.crypto_sentiment_service = None
     Dependencies.crypto_stats_service = None
+    Dependencies.response_cache = None
+    Dependencies.telegram_outbox = None
 
   # stocks
   @staticmethod
   def get_tradingview_service():
     return Dependencies.tradingview_service
 
+  @staticmethod
+  def get_tradingview_ingestion_queue():
+    return Dependencies.tradingview_ingestion_queue
+
   @staticmethod
   def get_thirdparty_vix_central_service():
     return Dependencies.thirdparty_vix_central_service
@@ -86,25 +109,46 @@ class Dependencies:
 
   @staticmethod
   def get_thirdparty_barchart_service():
+    if Dependencies.is_initialised and Dependencies.thirdparty_barchart_service is None:
+      Dependencies.thirdparty_barchart_service = ThirdPartyBarchartService()
     return Dependencies.thirdparty_barchart_service
 
   @staticmethod
   def get_barchart_service():
+    if Dependencies.is_initialised and Dependencies.barchart_service is None:
+      Dependencies.barchart_service = BarchartService(third_party_service=Dependencies.get_thirdparty_barchart_service())
     return Dependencies.barchart_service
 
   @staticmethod
   def get_stocks_sentiment_service():
+    if Dependencies.is_initialised and Dependencies.stocks_sentiment_service is None:
+      Dependencies.stocks_sentiment_service = StocksSentimentService()
     return Dependencies.stocks_sentiment_service
 
   # crypto
   @staticmethod
   def get_cryptoquant_api_service():
+    if Dependencies.is_initialised and Dependencies.cryptoquant_api_service is None:
+      Dependencies.cryptoquant_api_service = CryptoQuantService()
     return Dependencies.cryptoquant_api_service
 
   @staticmethod
   def get_crypto_sentiment_service():
+    if Dependencies.is_initialised and Dependencies.crypto_sentiment_service is None:
+      Dependencies.crypto_sentiment_service = CryptoSentimentService()
     return Dependencies.crypto_sentiment_service
 
   @staticmethod
   def get_crypto_stats_service():
+    if Dependencies.is_initialised and Dependencies.crypto_stats_service is None:
+      Dependencies.crypto_stats_service = CryptoStatsService()
     return Dependencies.crypto_stats_service
+
+  # shared
+  @staticmethod
+  def get_response_cache():
+    return Dependencies.response_cache
+
+  @staticmethod
+  def get_telegram_outbox():
+    return Dependencies.telegram_outbox
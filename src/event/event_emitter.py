@@ -1,6 +1,7 @@
 import logging
 from pyee.asyncio import  AsyncIOEventEmitter
 
+from src.dependencies import Dependencies
 from src.notification_destination import telegram_notification
 from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE
 from src.type.market_data_type import MarketDataType
@@ -23,6 +24,18 @@ async def send_to_telegram_handler(*args, **kwargs):
         market_data_type = kwargs['market_data_type']
         # Router and background events are production-style by default; only
         # explicit job entry points should opt into test-mode delivery behavior.
+        telegram_outbox = Dependencies.get_telegram_outbox()
+        if telegram_outbox is not None:
+            # The outbox worker paces delivery, so bursts of admin messages
+            # do not trip Telegram's per-chat flood limits.
+            await telegram_notification.enqueue_message_to_channel(
+                outbox=telegram_outbox,
+                message=message,
+                chat_id=channel,
+                market_data_type=market_data_type,
+                runtime_mode=DEFAULT_RUNTIME_MODE,
+            )
+            return
         res = await telegram_notification.send_message_to_channel(
             message=message,
             chat_id=channel,
@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 import logging
 
 from src.job.crypto.crypto_digest_message_sender import CryptoDigestMessageSender
@@ -24,27 +25,28 @@ class CryptoNotificationJob(JobWrapper):
             return True
 
         now = get_current_datetime()
-        local = get_current_datetime()
-        start_local_hours = config.get_crypto_job_start_local_hours().split(',')
-        start_local_minutes = config.get_crypto_job_start_local_minutes().split(',')
-
-        if len(start_local_hours) != len(start_local_minutes):
-            raise RuntimeError("start local hours and start local minutes are not configured properly")
-
-        for i in range(0, len(start_local_hours)):
-            local_hour_int = int(start_local_hours[i])
-            local_minute_int = int(start_local_minutes[i])
-
-            local = local.replace(hour=local_hour_int, minute=local_minute_int)
+        should_run = False
+        for local in self.get_scheduled_times(now):
             delta = now - local
             should_run = abs(delta.total_seconds()) <= config.get_job_delay_tolerance_second()
             logger.info(
-                f'local time: {local}, current time: {now}, local hour to run: {local_hour_int}, local minute to run: {local_minute_int}, current hour {now.hour}, current minute: {now.minute}, delta second: {delta.total_seconds()}, should run: {should_run}')
+                f'local time: {local}, current time: {now}, local hour to run: {local.hour}, local minute to run: {local.minute}, current hour {now.hour}, current minute: {now.minute}, delta second: {delta.total_seconds()}, should run: {should_run}')
             if should_run:
                 return should_run
 
         return should_run
 
+    def get_scheduled_times(self, now: datetime.datetime) -> list[datetime.datetime]:
+        start_local_hours = config.get_crypto_job_start_local_hours().split(',')
+        start_local_minutes = config.get_crypto_job_start_local_minutes().split(',')
+
+        if len(start_local_hours) != len(start_local_minutes):
+            raise RuntimeError("start local hours and start local minutes are not configured properly")
+
+        return [
+            now.replace(hour=int(hour), minute=int(minute), second=0, microsecond=0)
+            for hour, minute in zip(start_local_hours, start_local_minutes)
+        ]
 
     @property
     def message_senders(self):
@@ -15,6 +15,7 @@ from src.job.crypto.crypto_digest_formatter import (
 )
 from src.job.message_sender_wrapper import MessageSenderWrapper
 from src.notification_destination.telegram_notification import send_message_to_admin
+from src.service.crypto.coin_detail_loader import CoinDetailLoader
 from src.service.crypto_signal.market_regime_collector import (
     CryptoSignalMarketRegimeCollector,
 )
@@ -27,6 +28,7 @@ from src.service.crypto_signal.repository import (
 )
 from src.service.crypto_signal.snapshot_builder import build_snapshot
 from src.type.market_data_type import MarketDataType
+from src.util.context_manager import set_span_attribute, trace_span
 from src.util.date_util import get_current_datetime
 from src.util.exception import get_exception_message
 from src.util.my_telegram import format_messages_to_telegram
@@ -60,6 +62,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
         self.market_regime_repository = market_regime_repository
         self.tracked_universe_entries = config.get_crypto_signal_tracked_universe()
         self.watchlist_entries = config.get_crypto_signal_watchlist()
+        self.coin_detail_loader = None
 
     @property
     def data_source(self):
@@ -71,10 +74,14 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
 
     async def format_message(self) -> List[str]:
         self._ensure_runtime_dependencies()
+        # One loader per run so every enrichment phase shares fetched details.
+        self.coin_detail_loader = self._build_coin_detail_loader()
         current = get_current_datetime()
-        sentiment = await self.sentiment_service.get_crypto_fear_greed_index()
+        with trace_span('sentiment'):
+            sentiment = await self.sentiment_service.get_crypto_fear_greed_index()
         strongest_sector, weakest_sector = await self._load_sector_snapshots()
-        spotlight = await self.cmc_service.get_spotlight()
+        with trace_span('spotlight'):
+            spotlight = await self.cmc_service.get_spotlight()
 
         standout_entries = get_standout_entries(spotlight)
         standout_coin_details = await self._load_coin_details(
@@ -90,26 +97,32 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             weakest_sector=weakest_sector,
             sector_details=sector_details,
         )
-        candidate_follow_up_entries = self._load_candidate_follow_up_entries(
-            current=current
+        # SQLite reads and writes, snapshot building and scoring run in a
+        # worker thread so a digest does not stall the server's event loop.
+        candidate_follow_up_entries = await asyncio.to_thread(
+            self._load_candidate_follow_up_entries,
+            current=current,
         )
         tracked_universe_coin_details = await self._load_tracked_universe_coin_details(
             extra_entries=candidate_follow_up_entries
         )
-
-        snapshot = self._build_signal_snapshot(
-            current=current,
-            runtime_mode=self.runtime_mode,
-            sentiment=sentiment,
-            strongest_sector=strongest_sector,
-            weakest_sector=weakest_sector,
-            standout_entries=standout_entries,
-            standout_coin_details=standout_coin_details,
-            sector_details=sector_details,
-            sector_detail_coin_details=sector_detail_coin_details,
-            tracked_universe_coin_details=tracked_universe_coin_details,
-            candidate_follow_up_entries=candidate_follow_up_entries,
-        )
+        self.coin_detail_loader.log_stats()
+
+        with trace_span('build_snapshot'):
+            snapshot = await asyncio.to_thread(
+                self._build_signal_snapshot,
+                current=current,
+                runtime_mode=self.runtime_mode,
+                sentiment=sentiment,
+                strongest_sector=strongest_sector,
+                weakest_sector=weakest_sector,
+                standout_entries=standout_entries,
+                standout_coin_details=standout_coin_details,
+                sector_details=sector_details,
+                sector_detail_coin_details=sector_detail_coin_details,
+                tracked_universe_coin_details=tracked_universe_coin_details,
+                candidate_follow_up_entries=candidate_follow_up_entries,
+            )
         self._mark_calibration_follow_up_only_coins(
             snapshot=snapshot,
             candidate_follow_up_entries=candidate_follow_up_entries,
@@ -118,7 +131,10 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             current=current,
             snapshot=snapshot,
         )
-        persistence_failure_message = self._persist_signal_snapshot(snapshot=snapshot)
+        persistence_failure_message = await asyncio.to_thread(
+            self._persist_signal_snapshot,
+            snapshot=snapshot,
+        )
         if persistence_failure_message is not None:
             await send_message_to_admin(
                 message=format_messages_to_telegram(
@@ -127,7 +143,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
                 market_data_type=MarketDataType.CRYPTO,
             )
         else:
-            self._resolve_due_candidate_outcomes(current=current)
+            await asyncio.to_thread(self._resolve_due_candidate_outcomes, current=current)
         await self._persist_market_regime_snapshots(current=current)
 
         digest_message = build_digest_message(
@@ -149,7 +165,8 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             self.sentiment_service = Dependencies.get_crypto_sentiment_service()
         if self.signal_backfill_service is None:
             self.signal_backfill_service = CryptoSignalBackfillService(
-                cmc_service=self.cmc_service
+                cmc_service=self.cmc_service,
+                candle_store=self.signal_repository,
             )
 
     def _build_signal_snapshot(
@@ -196,6 +213,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             watchlist_entries=watchlist_entries,
         )
 
+    @trace_span('backfill')
     async def _backfill_signal_history(
         self,
         current,
@@ -227,8 +245,9 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
         )
 
         try:
-            repository.init_schema()
-            observation_counts = repository.get_coin_observation_counts_since(
+            await asyncio.to_thread(repository.init_schema)
+            observation_counts = await asyncio.to_thread(
+                repository.get_coin_observation_counts_since,
                 coin_ids=[coin_id for _symbol, coin_id in persisted_entries],
                 start_timestamp_utc=history_start_utc,
             )
@@ -252,12 +271,13 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
                 days=_SIGNAL_BACKFILL_DAYS,
             )
             for backfill_snapshot in backfill_snapshots:
-                repository.save_or_merge_snapshot(backfill_snapshot)
+                await asyncio.to_thread(repository.save_or_merge_snapshot, backfill_snapshot)
         except Exception:
             logger.exception(
                 'Crypto signal backfill failed; continuing with live snapshot only'
             )
 
+    @trace_span('persist_snapshot')
     def _persist_signal_snapshot(
         self,
         snapshot,
@@ -274,6 +294,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             )
         return None
 
+    @trace_span('resolve_candidate_outcomes')
     def _resolve_due_candidate_outcomes(
         self,
         current,
@@ -319,6 +340,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
                 CALIBRATION_FOLLOW_UP_CONTEXT_TAG,
             )
 
+    @trace_span('market_regime')
     async def _persist_market_regime_snapshots(
         self,
         current,
@@ -348,7 +370,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
                 backfill_days=config.get_crypto_signal_market_regime_backfill_days(),
             )
             for snapshot in snapshots:
-                repository.save_market_regime_snapshot(snapshot)
+                await asyncio.to_thread(repository.save_market_regime_snapshot, snapshot)
         except Exception:
             logger.warning(
                 'Crypto signal market-regime collection failed; continuing digest',
@@ -377,6 +399,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             ordered_entries.setdefault(coin.coin_id, (coin.symbol, coin.coin_id))
         return list(ordered_entries.values())
 
+    @trace_span('sectors')
     async def _load_sector_snapshots(
         self,
     ) -> tuple[
@@ -397,6 +420,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
         weakest_sector = weakest_sectors[0] if weakest_sectors else None
         return strongest_sector, weakest_sector
 
+    @trace_span('sector_details')
     async def _load_sector_details(
         self,
         strongest_sector: Optional[cmc_type.Sector24hChange],
@@ -433,6 +457,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             sector_details[sector.sectorId] = detail
         return sector_details
 
+    @trace_span('sector_detail_coin_details')
     async def _load_sector_detail_coin_details(
         self,
         strongest_sector: Optional[cmc_type.Sector24hChange],
@@ -456,24 +481,22 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             log_context='sector detail coin enrichment',
         )
 
+    @trace_span('coin_details')
     async def _load_coin_details(
         self,
         coin_ids: List[int],
         log_context: str,
     ) -> Dict[int, cmc_type.CoinDetail]:
-        unique_coin_ids = list(dict.fromkeys(coin_ids))
-        if len(unique_coin_ids) == 0:
+        set_span_attribute('context', log_context)
+        set_span_attribute('coin_count', len(coin_ids))
+        if len(coin_ids) == 0:
             return {}
 
-        details = await asyncio.gather(
-            *[
-                self.cmc_service.get_coin_detail(id=coin_id)
-                for coin_id in unique_coin_ids
-            ],
-            return_exceptions=True,
-        )
+        if getattr(self, 'coin_detail_loader', None) is None:
+            self.coin_detail_loader = self._build_coin_detail_loader()
+        details = await self.coin_detail_loader.load(coin_ids)
         coin_details = {}
-        for coin_id, detail in zip(unique_coin_ids, details, strict=False):
+        for coin_id, detail in details.items():
             if isinstance(detail, Exception):
                 logger.warning(
                     'Skipping %s for %s: %s',
@@ -485,6 +508,14 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             coin_details[coin_id] = detail
         return coin_details
 
+    def _build_coin_detail_loader(self) -> CoinDetailLoader:
+        return CoinDetailLoader(
+            cmc_service=self.cmc_service,
+            max_concurrency=config.get_cmc_coin_detail_max_concurrency(),
+            ttl_seconds=config.get_cmc_coin_detail_cache_ttl_seconds(),
+        )
+
+    @trace_span('tracked_universe_coin_details')
     async def _load_tracked_universe_coin_details(
         self,
         extra_entries: List[tuple[str, int]] | None = None,
@@ -511,6 +542,7 @@ class CryptoDigestMessageSender(MessageSenderWrapper):
             log_context='tracked universe coin enrichment',
         )
 
+    @trace_span('candidate_follow_up_entries')
     def _load_candidate_follow_up_entries(
         self,
         current,
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 from typing import List
@@ -9,6 +10,7 @@ from src.notification_destination.telegram_notification import (
     send_crypto_signal_message,
     send_message_to_admin,
 )
+from src.service.crypto_signal.digest_view_loader import load_digest_view
 from src.service.crypto_signal.market_regime import (
     FUNDING_RATE_METRIC,
     OPEN_INTEREST_METRIC,
@@ -20,7 +22,7 @@ from src.service.crypto_signal.market_regime_collector import (
     COINALYZE_PROVIDER,
 )
 from src.service.crypto_signal.repository import CryptoSignalRepository
-from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+from src.service.crypto_signal.scorer import get_window_start
 from src.type.market_data_type import MarketDataType
 from src.util.date_util import get_current_datetime
 from src.util.exception import get_exception_message
@@ -94,6 +96,11 @@ class CryptoSignalDigestMessageSender(MessageSenderWrapper):
             return None
 
     async def format_message(self) -> List[str]:
+        # The digest is SQLite reads, history cube scoring and a cohort write;
+        # run it in a worker thread so the server's event loop stays free.
+        return await asyncio.to_thread(self._build_messages)
+
+    def _build_messages(self) -> List[str]:
         repository = self.signal_repository
         latest_snapshot = repository.get_latest_snapshot()
         if latest_snapshot is None:
@@ -106,12 +113,9 @@ class CryptoSignalDigestMessageSender(MessageSenderWrapper):
             return []
 
         window_label = '7d'
-        history = repository.get_snapshots_since(
-            get_window_start(latest_snapshot, window_label=window_label)
-        )
-        view = build_digest_view(
+        view = load_digest_view(
+            repository=repository,
             latest_snapshot=latest_snapshot,
-            history=history,
             watchlist_coin_ids={coin_id for _symbol, coin_id in self.watchlist_entries},
             tracked_universe_coin_ids={
                 coin_id for _symbol, coin_id in self.tracked_universe_entries
@@ -9,6 +9,7 @@ from src.notification_destination.telegram_notification import (
     send_crypto_signal_message,
 )
 from src.runtime.runtime_mode import RuntimeMode
+from src.service.crypto_signal.digest_view_loader import load_digest_views
 from src.service.crypto_signal.market_regime import (
     FUNDING_RATE_METRIC,
     OPEN_INTEREST_METRIC,
@@ -20,11 +21,13 @@ from src.service.crypto_signal.market_regime_collector import (
     COINALYZE_PROVIDER,
 )
 from src.service.crypto_signal.repository import CryptoSignalRepository
-from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+from src.service.crypto_signal.scorer import get_window_start
 
 
 logger = logging.getLogger('Crypto signal report')
 
+ALL_WINDOW_LABELS = ['3d', '7d', '30d']
+
 
 def _load_market_regime_summary(
     *,
@@ -70,6 +73,11 @@ async def main() -> None:
 Examples:
   ENV=dev PYTHONPATH="$(pwd)" poetry run python src/job/crypto/crypto_signal_report.py --window 7d --limit 3 --send_telegram=0 --test_mode=1
   ENV=dev PYTHONPATH="$(pwd)" poetry run python src/job/crypto/crypto_signal_report.py --window 7d --limit 3 --send_telegram=1 --test_mode=1
+  ENV=dev PYTHONPATH="$(pwd)" poetry run python src/job/crypto/crypto_signal_report.py --window all --limit 3 --send_telegram=0 --test_mode=1
+
+Windows:
+  --window all renders the 3d, 7d, and 30d reports from one 30d history
+  load; the shorter windows are sliced from it in memory.
 
 Phase-1 safety:
   Render with --send_telegram=0 first. Only use --send_telegram=1 after
@@ -77,7 +85,7 @@ Phase-1 safety:
   private/admin recipient, not the public crypto channel.
 """,
     )
-    parser.add_argument('--window', choices=['3d', '7d', '30d'], default='7d')
+    parser.add_argument('--window', choices=[*ALL_WINDOW_LABELS, 'all'], default='7d')
     parser.add_argument('--limit', type=int, default=3)
     parser.add_argument('--send_telegram', type=int, choices=[0, 1], default=0)
     parser.add_argument('--test_mode', type=int, choices=[0, 1], default=0)
@@ -90,41 +98,47 @@ Phase-1 safety:
         logger.info('No crypto signal snapshots are available')
         return
 
-    history = repository.get_snapshots_since(
-        get_window_start(latest_snapshot, window_label=args.window)
-    )
     watchlist_coin_ids = {
         coin_id for _symbol, coin_id in config.get_crypto_signal_watchlist()
     }
     tracked_universe_coin_ids = {
         coin_id for _symbol, coin_id in config.get_crypto_signal_tracked_universe()
     }
-    view = build_digest_view(
+    window_labels = ALL_WINDOW_LABELS if args.window == 'all' else [args.window]
+    views = load_digest_views(
+        repository=repository,
         latest_snapshot=latest_snapshot,
-        history=history,
+        window_labels=window_labels,
         watchlist_coin_ids=watchlist_coin_ids,
+        market_regime_summaries={
+            window_label: _load_market_regime_summary(
+                repository=repository,
+                latest_snapshot=latest_snapshot,
+                window_label=window_label,
+            )
+            for window_label in window_labels
+        },
         tracked_universe_coin_ids=tracked_universe_coin_ids,
-        window_label=args.window,
         limit=args.limit,
         min_dynamic_price_usd=config.get_crypto_signal_dynamic_candidate_min_price_usd(),
         min_dynamic_volume_24h=config.get_crypto_signal_dynamic_candidate_min_volume_24h(),
-        market_regime_summary=_load_market_regime_summary(
-            repository=repository,
-            latest_snapshot=latest_snapshot,
-            window_label=args.window,
-        ),
     )
-    message = build_crypto_signal_message(view)
-    print(message)
-    logger.info(message)
+    messages = [
+        build_crypto_signal_message(views[window_label])
+        for window_label in window_labels
+    ]
+    for message in messages:
+        print(message)
+        logger.info(message)
 
     if args.send_telegram == 1:
         init_telegram_bots()
-        await send_crypto_signal_message(
-            message=message,
-            chat_id=config.get_crypto_signal_recipient_id(),
-            runtime_mode=runtime_mode,
-        )
+        for message in messages:
+            await send_crypto_signal_message(
+                message=message,
+                chat_id=config.get_crypto_signal_recipient_id(),
+                runtime_mode=runtime_mode,
+            )
 
 
 if __name__ == '__main__':
@@ -133,4 +147,6 @@ if __name__ == '__main__':
     #   ENV=dev PYTHONPATH="$(pwd)" poetry run python src/job/crypto/crypto_signal_report.py --window 7d --limit 3 --send_telegram=0 --test_mode=1
     # - Send the same rendered report to the private/admin signal recipient:
     #   ENV=dev PYTHONPATH="$(pwd)" poetry run python src/job/crypto/crypto_signal_report.py --window 7d --limit 3 --send_telegram=1 --test_mode=1
+    # - Render the 3d, 7d, and 30d reports from one history load:
+    #   ENV=dev PYTHONPATH="$(pwd)" poetry run python src/job/crypto/crypto_signal_report.py --window all --limit 3 --send_telegram=0 --test_mode=1
     asyncio.run(main())
@@ -0,0 +1,220 @@
+import argparse
+import asyncio
+import datetime
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+
+from src.config import config
+from src.job.job_slot_store import JobSlotStore
+from src.job.job_wrapper import JobWrapper
+from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE, RuntimeMode
+from src.util.context_manager import TimeTrackerContext
+from src.util.date_util import get_current_datetime
+from src.util.exception import get_exception_message
+from src.util.metrics import JOB_RUN_DURATION
+
+logger = logging.getLogger('Job scheduler')
+
+
+@dataclass(slots=True)
+class JobRun:
+    job: str
+    trigger: str
+    is_test_mode: bool
+    started_at: datetime.datetime
+    finished_at: datetime.datetime | None = None
+    # running, succeeded, failed or cancelled
+    status: str = 'running'
+
+
+class JobScheduler:
+    """Runs notification jobs inside the server process.
+
+    Unlike `JobWrapper.start`, runs reuse the dependencies, Redis client and
+    Telegram bots the server has already built, so a run only pays for its
+    message senders. A slot fires once, on the first poll within
+    `JOB_DELAY_TOLERANCE_SECOND` after its scheduled time. With a slot store
+    that holds across restarts and replicas. A job never runs twice at the
+    same time in one process; a manual trigger for a running job is rejected.
+    Runs share the server's event loop, so message senders move their
+    blocking SQLite and scoring work to threads with `asyncio.to_thread`.
+    """
+
+    def __init__(
+        self,
+        jobs: dict[str, JobWrapper],
+        poll_interval_seconds: float = 30.0,
+        clock: Callable[[], datetime.datetime] = get_current_datetime,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        slot_store: JobSlotStore | None = None,
+    ):
+        self.jobs = jobs
+        self.slot_store = slot_store
+        self.poll_interval_seconds = poll_interval_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.last_runs: dict[str, JobRun] = {}
+        self._last_slots: dict[str, datetime.datetime] = {}
+        self._running: dict[str, asyncio.Task] = {}
+
+    async def run(self) -> None:
+        logger.info(f'Scheduling {", ".join(self.jobs)}')
+        try:
+            while True:
+                try:
+                    await self.start_due_jobs()
+                except Exception as e:
+                    logger.error(get_exception_message(e, cls=self.__class__.__name__))
+                await self.sleep(self.poll_interval_seconds)
+        finally:
+            await self.stop()
+
+    async def start_due_jobs(self) -> list[str]:
+        """Start every job with a slot that is due and not yet run. Returns
+        the names of the jobs started."""
+        now = self.clock()
+        started = []
+        for name, job in self.jobs.items():
+            slot = self._get_due_slot(job, now)
+            if slot is None or self._last_slots.get(name) == slot:
+                continue
+            # Mark the slot even when the job is still busy with an earlier
+            # run so it is skipped instead of started late.
+            self._last_slots[name] = slot
+            if self.slot_store is not None and not await self.slot_store.claim(
+                name, slot, ttl_seconds=config.get_job_delay_tolerance_second()
+            ):
+                logger.info(f'{name} slot {slot} already fired, skipping')
+                continue
+            if name in self._running:
+                logger.warning(f'{name} is still running, skipping slot {slot}')
+                continue
+            self._start(name, DEFAULT_RUNTIME_MODE, trigger='schedule')
+            started.append(name)
+        return started
+
+    def trigger(self, name: str, test_mode: bool = False) -> bool:
+        """Start a job now, regardless of its schedule. Returns False when the
+        job is already running."""
+        if name not in self.jobs:
+            raise KeyError(name)
+        if name in self._running:
+            return False
+        self._start(name, RuntimeMode.from_test_mode(test_mode), trigger='manual')
+        return True
+
+    def get_status(self) -> dict[str, dict]:
+        now = self.clock()
+        status = {}
+        for name, job in self.jobs.items():
+            last_run = self.last_runs.get(name)
+            try:
+                scheduled_times = [slot.isoformat() for slot in job.get_scheduled_times(now)]
+                schedule_error = None
+            except (RuntimeError, ValueError) as e:
+                # A misconfigured schedule is reported for its job instead of
+                # failing the whole status response.
+                scheduled_times = []
+                schedule_error = str(e)
+            status[name] = {
+                'running': name in self._running,
+                'scheduled_times': scheduled_times,
+                'schedule_error': schedule_error,
+                'last_run': None if last_run is None else {
+                    'trigger': last_run.trigger,
+                    'is_test_mode': last_run.is_test_mode,
+                    'started_at': last_run.started_at.isoformat(),
+                    'finished_at': None if last_run.finished_at is None else last_run.finished_at.isoformat(),
+                    'status': last_run.status,
+                },
+            }
+        return status
+
+    async def wait_for_running_jobs(self) -> None:
+        await asyncio.gather(*self._running.values(), return_exceptions=True)
+
+    async def stop(self) -> None:
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _get_due_slot(self, job: JobWrapper, now: datetime.datetime) -> datetime.datetime | None:
+        tolerance_second = config.get_job_delay_tolerance_second()
+        # Only slots that have passed are due, unlike the +/- tolerance window
+        # in `should_run` for cron runs that may start slightly early.
+        due_slots = [
+            slot for slot in job.get_scheduled_times(now)
+            if 0 <= (now - slot).total_seconds() <= tolerance_second
+        ]
+        return max(due_slots) if len(due_slots) > 0 else None
+
+    def _start(self, name: str, runtime_mode: RuntimeMode, trigger: str) -> None:
+        # Registered before the task runs so a second trigger in the same
+        # event loop turn sees the job as running.
+        task = asyncio.create_task(self._run_job(name, runtime_mode, trigger))
+        self._running[name] = task
+        task.add_done_callback(lambda _task: self._running.pop(name, None))
+
+    async def _run_job(self, name: str, runtime_mode: RuntimeMode, trigger: str) -> None:
+        job = self.jobs[name]
+        job.runtime_mode = runtime_mode
+        job_run = JobRun(
+            job=name,
+            trigger=trigger,
+            is_test_mode=runtime_mode.is_test_mode,
+            started_at=self.clock(),
+        )
+        self.last_runs[name] = job_run
+        started_at = time.perf_counter()
+        try:
+            with TimeTrackerContext(job.job_name):
+                try:
+                    await job.run_message_senders()
+                    job_run.status = 'succeeded'
+                except asyncio.CancelledError:
+                    job_run.status = 'cancelled'
+                    raise
+                except Exception as e:
+                    job_run.status = 'failed'
+                    await job.report_failure(e)
+        finally:
+            job_run.finished_at = self.clock()
+            JOB_RUN_DURATION.observe(time.perf_counter() - started_at, job=job.job_name)
+
+
+def build_default_jobs() -> dict[str, JobWrapper]:
+    # Imported here so the trigger CLI does not load every message sender.
+    from src.job.crypto.crypto import CryptoNotificationJob
+    from src.job.stocks.stocks import StocksNotificationJob
+
+    return {
+        'stocks': StocksNotificationJob(),
+        'crypto': CryptoNotificationJob(),
+    }
+
+
+async def trigger_job(base_url: str, name: str, test_mode: bool) -> dict:
+    headers = {}
+    if config.get_env() == 'prod':
+        headers['X-Api-Auth'] = config.get_api_auth_token()
+    async with aiohttp.ClientSession(base_url=base_url, headers=headers) as session:
+        async with session.post(f'/jobs/{name}/run', params={'test_mode': str(test_mode).lower()}) as res:
+            return {'status': res.status, 'body': await res.json()}
+
+
+# Trigger a job in the running server instead of spawning a new process:
+# ENV=dev poetry run python src/job/job_scheduler.py crypto --test_mode=1
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Triggers a notification job in the running server')
+    parser.add_argument('job', help='Job name, e.g. stocks or crypto')
+    parser.add_argument('--test_mode', type=int, choices=[0, 1], default=0, help='Run in test mode for dev testing')
+    parser.add_argument('--base_url', default='http://localhost:8080', help='Server to trigger the job in')
+    cli_args = parser.parse_args()
+
+    result = asyncio.run(trigger_job(cli_args.base_url, cli_args.job, cli_args.test_mode == 1))
+    logger.info(result)
@@ -0,0 +1,43 @@
+import datetime
+import logging
+from typing import Any, Callable
+
+from src.db.redis import Redis
+from src.util.exception import get_exception_message
+
+logger = logging.getLogger('Job slot store')
+
+REDIS_KEY_PREFIX = 'job-scheduler:slot'
+
+
+class JobSlotStore:
+    """Records fired schedule slots in Redis, shared by every server process.
+
+    A claim is `SET NX` on one key per job and slot, so a restart or reload
+    inside the delay tolerance, or a second replica, does not fire a slot
+    that has already run. Keys expire once the slot can no longer be due.
+    """
+
+    def __init__(
+        self,
+        redis_client_getter: Callable[[], Any] = Redis.get_client,
+        key_prefix: str = REDIS_KEY_PREFIX,
+    ):
+        self.redis_client_getter = redis_client_getter
+        self.key_prefix = key_prefix
+
+    async def claim(self, job: str, slot: datetime.datetime, ttl_seconds: int) -> bool:
+        """Return True when this process may fire the slot."""
+        try:
+            claimed = await self.redis_client_getter().set(
+                f'{self.key_prefix}:{job}:{slot.isoformat()}',
+                datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+                nx=True,
+                ex=max(ttl_seconds, 1),
+            )
+        except Exception as e:
+            # Without Redis the in-process check still fires each slot once
+            # per process, which beats missing the digest.
+            logger.warning(get_exception_message(e, cls=self.__class__.__name__))
+            return True
+        return bool(claimed)
@@ -1,17 +1,23 @@
 import argparse
+import datetime
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
 from typing import List
 
 from src.job.message_sender_wrapper import MessageSenderWrapper
 from src.config import config
 from src.db.redis import Redis
+from src.db.sqlite import SqliteConnectionManager
 from src.dependencies import Dependencies
 from src.notification_destination.telegram_notification import send_message_to_channel, \
     market_data_type_to_admin_chat_id, init_telegram_bots
 from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE, RuntimeMode
 from src.util.context_manager import TimeTrackerContext
 from src.util.exception import get_exception_message
+from src.util.metrics import JOB_RUN_DURATION, REGISTRY
+from src.util.startup_report import build_startup_report, get_module_name
 from src.util.my_telegram import format_messages_to_telegram
 from src.type.market_data_type import MarketDataType
 
@@ -28,8 +34,14 @@ class JobWrapper(ABC):
         parser.add_argument('--force_run', type=int, choices=[0, 1], default=0,
                             help='Run regardless of the timing it is scheduled to run at')
         parser.add_argument('--test_mode', type=int, choices=[0, 1], default=0, help='Run in test mode for dev testing')
+        parser.add_argument('--startup_report', type=int, choices=[0, 1], default=0,
+                            help='Print import and init time per module instead of running the job')
         cli_args = parser.parse_args()
 
+        if cli_args.startup_report == 1:
+            print(await build_startup_report(get_module_name(type(self))))
+            return None
+
         force_run: bool = cli_args.force_run == 1
         test_mode: bool = cli_args.test_mode == 1
 
@@ -38,38 +50,70 @@ class JobWrapper(ABC):
         if not force_run and not self.should_run(self.runtime_mode):
             return
 
-        with TimeTrackerContext(f'{self.market_data_type.value.lower()}_notification_job'):
+        job_name = self.job_name
+        job_started_at = time.perf_counter()
+        with TimeTrackerContext(job_name):
             init_telegram_bots()
             # TODO: May need a lock in the future
-            messages = []
-            if self.runtime_mode.is_test_mode:
-                messages.insert(0, '*THIS IS A TEST MESSAGE: Parameters have been adjusted*')
-            elif config.get_simulate_tradingview_traffic():
-                messages.insert(0, '*SIMULATING TRAFFIC FROM TRADING VIEW*')
-
             try:
                 await Redis.start_redis()
                 await Dependencies.build()
 
-                res = []
-                for message_sender in self.message_senders:
-                    r = await message_sender.start()
-                    res.append(r)
-
-                return res
+                return await self.run_message_senders()
 
             except Exception as e:
-                logger.error(get_exception_message(e, cls=self.__class__.__name__))
-                messages.append(f"{get_exception_message(e, cls=self.__class__.__name__, should_escape_markdown=True)}")
-                message = format_messages_to_telegram(messages)
-                await send_message_to_channel(message=message, chat_id=market_data_type_to_admin_chat_id[self.market_data_type],
-                                              market_data_type=self.market_data_type,
-                                              runtime_mode=self.runtime_mode)
+                await self.report_failure(e)
                 return None
             finally:
                 await Redis.stop_redis()
                 # await Dependencies.get_vix_central_service().cleanup()
                 await Dependencies.cleanup()
+                # Closing the last connection checkpoints the WAL back into the
+                # main DB file before the process exits.
+                SqliteConnectionManager.close_all()
+                JOB_RUN_DURATION.observe(time.perf_counter() - job_started_at, job=job_name)
+                self._write_metrics_textfile(job_name)
+
+    @property
+    def job_name(self) -> str:
+        return f'{self.market_data_type.value.lower()}_notification_job'
+
+    async def run_message_senders(self) -> list:
+        """Run every sender once against already-built dependencies."""
+        res = []
+        for message_sender in self.message_senders:
+            r = await message_sender.start()
+            res.append(r)
+        return res
+
+    async def report_failure(self, e: Exception) -> None:
+        # Called from an except block so the traceback is still available.
+        messages = []
+        if self.runtime_mode.is_test_mode:
+            messages.append('*THIS IS A TEST MESSAGE: Parameters have been adjusted*')
+        elif config.get_simulate_tradingview_traffic():
+            messages.append('*SIMULATING TRAFFIC FROM TRADING VIEW*')
+        logger.error(get_exception_message(e, cls=self.__class__.__name__))
+        messages.append(f"{get_exception_message(e, cls=self.__class__.__name__, should_escape_markdown=True)}")
+        message = format_messages_to_telegram(messages)
+        await send_message_to_channel(message=message, chat_id=market_data_type_to_admin_chat_id[self.market_data_type],
+                                      market_data_type=self.market_data_type,
+                                      runtime_mode=self.runtime_mode)
+
+    def get_scheduled_times(self, now: datetime.datetime) -> list[datetime.datetime]:
+        """Start times on the day of `now`, in its timezone. Jobs without a
+        fixed schedule return none and only run when triggered."""
+        return []
+
+    @staticmethod
+    def _write_metrics_textfile(job_name: str) -> None:
+        textfile_dir = config.get_metrics_textfile_dir()
+        if not textfile_dir:
+            return
+        try:
+            REGISTRY.write_textfile(os.path.join(textfile_dir, f'{job_name}.prom'))
+        except Exception as e:
+            logger.error(f'Failed to write metrics textfile: {get_exception_message(e)}')
 
     @abstractmethod
     def should_run(self, runtime_mode: RuntimeMode | None = None) -> bool:
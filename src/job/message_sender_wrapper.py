@@ -5,6 +5,7 @@ from typing import List
 from src.notification_destination.telegram_notification import send_message_to_channel, \
     market_data_type_to_admin_chat_id, market_data_type_to_chat_id
 from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE, RuntimeMode
+from src.util.context_manager import trace_span
 from src.util.exception import get_exception_message
 from src.util.my_telegram import format_messages_to_telegram
 
@@ -18,17 +19,19 @@ class MessageSenderWrapper(ABC):
 
     async def start(self):
         try:
-            messages = await self.format_message()
+            with trace_span(f'{self.__class__.__name__}.format_message'):
+                messages = await self.format_message()
 
             if messages is None or len(messages) == 0:
                 logger.warning(f"No message to send for market data type: {self.market_data_type}, data source: {self.data_source}")
                 return
 
             telegram_message = format_messages_to_telegram(messages)
-            res = await send_message_to_channel(message=telegram_message,
-                                                chat_id=market_data_type_to_chat_id[self.market_data_type],
-                                                market_data_type=self.market_data_type,
-                                                runtime_mode=self.runtime_mode)
+            with trace_span(f'{self.__class__.__name__}.send_message'):
+                res = await send_message_to_channel(message=telegram_message,
+                                                    chat_id=market_data_type_to_chat_id[self.market_data_type],
+                                                    market_data_type=self.market_data_type,
+                                                    runtime_mode=self.runtime_mode)
             return res
         except Exception as e:
             logger.error(get_exception_message(e, cls=self.__class__.__name__))
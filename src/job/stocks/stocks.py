@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 import logging
 
 from src.job.job_wrapper import JobWrapper
@@ -20,9 +21,7 @@ class StocksNotificationJob(JobWrapper):
             return True
 
         now = get_current_datetime()
-        local = get_current_datetime()
-        local = local.replace(hour=config.get_stocks_job_start_local_hour(),
-                              minute=config.get_stocks_job_start_local_minute())
+        local = self.get_scheduled_times(now)[0]
         delta = now - local
 
         should_run = abs(delta.total_seconds()) <= config.get_job_delay_tolerance_second()
@@ -30,6 +29,11 @@ class StocksNotificationJob(JobWrapper):
             f'local time: {local}, current time: {now}, local hour to run: {config.get_stocks_job_start_local_hour()}, local minute to run: {config.get_stocks_job_start_local_minute()}, current hour {now.hour}, current minute: {now.minute}, delta second: {delta.total_seconds()}, should run: {should_run}')
         return should_run
 
+    def get_scheduled_times(self, now: datetime.datetime) -> list[datetime.datetime]:
+        return [now.replace(hour=config.get_stocks_job_start_local_hour(),
+                            minute=config.get_stocks_job_start_local_minute(),
+                            second=0, microsecond=0)]
+
     @property
     def message_senders(self):
         return [StocksDigestMessageSender(runtime_mode=self.runtime_mode)]
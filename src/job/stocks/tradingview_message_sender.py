@@ -6,13 +6,14 @@ from typing import List, Optional
 from src.dependencies import Dependencies
 from src.config import config
 from src.job.message_sender_wrapper import MessageSenderWrapper
+from src.service.barchart_volume_history import BarchartVolumeHistoryLoader
+from src.service.stocks_daily_bar_store import StocksDailyBarStore
 from src.type.trading_view import TradingViewDataType, TradingViewData, TradingViewStocksData
 from src.util.date_util import get_datetime_from_timestamp, get_most_recent_non_weekend_or_today, \
     get_current_date_preserve_time
 from src.util.my_telegram import escape_markdown, exclamation_mark
 from src.type.market_data_type import MarketDataType
 from src.util.number import friendly_number
-from src.util.sleep import sleep
 
 
 logger = logging.getLogger('Trading view message sender')
@@ -44,6 +45,14 @@ class TradingViewMessageSender(MessageSenderWrapper):
         super().__init__(runtime_mode=runtime_mode)
         self.tradingview_service = Dependencies.get_tradingview_service()
         self.barchart_service = Dependencies.get_barchart_service()
+        self.volume_history_loader = BarchartVolumeHistoryLoader(
+            barchart_service=self.barchart_service,
+            bar_store=(
+                StocksDailyBarStore(runtime_mode=self.runtime_mode)
+                if config.is_stocks_daily_bar_store_enabled()
+                else None
+            ),
+        )
         self.market_indices = ['SPY', 'QQQ', 'IWM', 'DIA']
         self.market_indices = sorted(self.market_indices)
 
@@ -74,12 +83,14 @@ class TradingViewMessageSender(MessageSenderWrapper):
 
         economy_indicator_payload = None if tradingview_economy_indicator_data is None else tradingview_economy_indicator_data.data
 
+        trading_date = get_datetime_from_timestamp(tradingview_stocks_data.score).date()
         tradingview_message = await self._format_tradingview_message(
             stocks_payload=tradingview_stocks_data.data,
             economy_indicator_payload=economy_indicator_payload,
+            trading_date=trading_date,
         )
         if tradingview_message is not None:
-            tradingview_date = get_datetime_from_timestamp(tradingview_stocks_data.score).strftime("%Y-%m-%d")
+            tradingview_date = trading_date.strftime("%Y-%m-%d")
             tradingview_message = (
                 f"*Trading view market data at {escape_markdown(tradingview_date)}:*"
                 f"\n\n{tradingview_message}"
@@ -89,7 +100,12 @@ class TradingViewMessageSender(MessageSenderWrapper):
         return messages
 
     # TODO: type
-    async def _format_tradingview_message(self, stocks_payload: TradingViewData, economy_indicator_payload: TradingViewData):
+    async def _format_tradingview_message(
+        self,
+        stocks_payload: TradingViewData,
+        economy_indicator_payload: TradingViewData,
+        trading_date: datetime.date | None = None,
+    ):
         if stocks_payload is None:
             return None
 
@@ -111,16 +127,47 @@ class TradingViewMessageSender(MessageSenderWrapper):
 
         messages = []
         if len(sorted_stocks) > 0:
-            messages.append(await self._format_message_for_stocks(sorted_stocks))
+            messages.append(await self._format_message_for_stocks(sorted_stocks, trading_date=trading_date))
         if len(sorted_economy_indicators) > 0:
             messages.append(self._format_message_for_economy_indicators(sorted_economy_indicators))
 
         return '\n\n'.join(messages)
 
     # TODO: refactor this with _format_message_for_economy_indicators
-    async def _format_message_for_stocks(self, sorted_payload: List[TradingViewStocksData]):
+    async def _format_message_for_stocks(
+        self,
+        sorted_payload: List[TradingViewStocksData],
+        trading_date: datetime.date | None = None,
+    ):
+        historical_volumes_by_symbol = {}
+        if config.get_should_compare_stocks_volume_rank():
+            if trading_date is not None:
+                try:
+                    self.volume_history_loader.record_tradingview_bars(
+                        payloads=sorted_payload,
+                        trading_date=trading_date,
+                    )
+                except Exception as error:
+                    # The bar store only saves Barchart calls; never fail the digest on it.
+                    logger.warning('Skip recording TradingView daily bars: %s', error)
+            # One concurrent batch instead of a serial call (and pause) per symbol.
+            try:
+                historical_volumes_by_symbol = await self.volume_history_loader.load(
+                    symbols=[
+                        payload.symbol.upper()
+                        for payload in sorted_payload
+                        if isinstance(payload.volumes, list) and len(payload.volumes) > 0
+                    ],
+                    num_days=30,
+                    trading_date=trading_date,
+                )
+            except Exception as error:
+                logger.warning('Skip volume enrichment after history load failure: %s', error)
         entries = [
-            await self._build_stocks_message_entry(payload)
+            self._build_stocks_message_entry(
+                payload,
+                historical_volumes=historical_volumes_by_symbol.get(payload.symbol.upper()),
+            )
             for payload in sorted_payload
         ]
 
@@ -155,9 +202,10 @@ class TradingViewMessageSender(MessageSenderWrapper):
 
         return '\n\n'.join(blocks)
 
-    async def _build_stocks_message_entry(
+    def _build_stocks_message_entry(
         self,
         payload: TradingViewStocksData,
+        historical_volumes: List[float] | Exception | None = None,
     ) -> StocksMessageEntry:
         symbol = payload.symbol.upper()
         close = payload.close_prices[0]
@@ -173,38 +221,19 @@ class TradingViewMessageSender(MessageSenderWrapper):
         volumes = payload.volumes
         if volumes is not None and isinstance(volumes, list) and len(volumes) > 0:
             volume_text = friendly_number(volumes[0], decimal_places=2)
-            if config.get_should_compare_stocks_volume_rank():
+            if isinstance(historical_volumes, Exception):
+                logger.warning(
+                    'Skip Barchart volume enrichment for %s after provider failure: %s',
+                    symbol,
+                    historical_volumes,
+                )
+            elif historical_volumes is not None:
                 try:
-                    stock_prices = await self.barchart_service.get_stock_price(
-                        symbol=symbol,
-                        num_days=30,
-                    )
-                    await sleep(max_sec=0.2)
-                    historical_volumes = [x.volume for x in stock_prices]
-                    max_days_to_compare = self.get_current_data_highest_volume_info(
-                        historical_volumes
-                    )
-                    if max_days_to_compare is not None and len(historical_volumes) > 1:
-                        # Require both conditions: today's volume must remain the highest
-                        # over the accepted lookback window, and the jump versus the prior
-                        # day must still clear a ratio threshold worth calling out.
-                        volume_ratio_diff = abs(
-                            (historical_volumes[0] - historical_volumes[1])
-                            / historical_volumes[1]
-                        )
-                        if (
-                            volume_ratio_diff
-                            > config.get_stocks_volume_alert_ratio_threshold(
-                                is_test_mode=self.runtime_mode.relax_thresholds
-                            )
-                        ):
-                            volume_alert = (
-                                f'Highest(+{volume_ratio_diff:.2%} vs previous day) volume for the '
-                                f'past {max_days_to_compare} days {exclamation_mark()}'
-                            )
+                    volume_alert = self._build_volume_alert(historical_volumes)
                 except Exception as error:
+                    # Bad history for one symbol only drops its volume alert.
                     logger.warning(
-                        'Skip Barchart volume enrichment for %s after provider failure: %s',
+                        'Skip Barchart volume enrichment for %s after comparison failure: %s',
                         symbol,
                         error,
                     )
@@ -237,6 +266,28 @@ class TradingViewMessageSender(MessageSenderWrapper):
             overextended_alert=overextended_alert,
         )
 
+    def _build_volume_alert(self, historical_volumes: List[float]) -> str | None:
+        max_days_to_compare = self.get_current_data_highest_volume_info(historical_volumes)
+        if max_days_to_compare is None or len(historical_volumes) < 2:
+            return None
+        if historical_volumes[1] == 0:
+            # No previous-day volume to compare against.
+            return None
+        # Require both conditions: today's volume must remain the highest over the
+        # accepted lookback window, and the jump versus the prior day must still
+        # clear a ratio threshold worth calling out.
+        volume_ratio_diff = abs(
+            (historical_volumes[0] - historical_volumes[1]) / historical_volumes[1]
+        )
+        if volume_ratio_diff <= config.get_stocks_volume_alert_ratio_threshold(
+            is_test_mode=self.runtime_mode.relax_thresholds
+        ):
+            return None
+        return (
+            f'Highest(+{volume_ratio_diff:.2%} vs previous day) volume for the '
+            f'past {max_days_to_compare} days {exclamation_mark()}'
+        )
+
     def _split_highlighted_stock_entries(
         self,
         entries: List[StocksMessageEntry],
@@ -1,11 +1,14 @@
 import logging
+import time
 from typing import List
 
 import telegram
 import src.config.config as config
+from src.notification_destination.telegram_outbox import TelegramOutbox
 from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE, RuntimeMode
 from src.type.market_data_type import MarketDataType
 from src.util.exception import get_exception_message
+from src.util.metrics import TELEGRAM_REQUEST_DURATION
 from src.util.my_telegram import escape_markdown, message_separator
 
 # TODO: Clean up
@@ -17,57 +20,85 @@ crypto_bot = None
 crypto_admin_bot = None
 crypto_dev_bot = None
 
-chat_id_to_telegram_client = {}
 market_data_type_to_admin_chat_id = {}
 market_data_type_to_chat_id = {}
 
 logger = logging.getLogger('Telegram notification')
 MAX_TELEGRAM_MESSAGE_LENGTH = 4096
 
-def _build_telegram_request() -> telegram.request.HTTPXRequest:
-    return telegram.request.HTTPXRequest(
-        connect_timeout=config.get_telegram_connect_timeout_seconds(),
-        read_timeout=config.get_telegram_read_timeout_seconds(),
-        write_timeout=config.get_telegram_write_timeout_seconds(),
-        pool_timeout=config.get_telegram_pool_timeout_seconds(),
+class _InstrumentedTelegramRequest(telegram.request.BaseRequest):
+    """Times every Bot API call made through the wrapped request."""
+
+    def __init__(self, request: telegram.request.BaseRequest):
+        self.request = request
+
+    async def initialize(self) -> None:
+        await self.request.initialize()
+
+    async def shutdown(self) -> None:
+        await self.request.shutdown()
+
+    async def do_request(self, url: str, method: str, *args, **kwargs):
+        # The url embeds the bot token; only the API method name is a label.
+        endpoint = url.rsplit('/', 1)[-1]
+        started_at = time.perf_counter()
+        outcome = 'error'
+        try:
+            status_code, payload = await self.request.do_request(url, method, *args, **kwargs)
+            outcome = 'success' if status_code < 400 else 'error'
+            return status_code, payload
+        finally:
+            TELEGRAM_REQUEST_DURATION.observe(
+                time.perf_counter() - started_at, endpoint=endpoint, outcome=outcome,
+            )
+
+def _build_telegram_request() -> telegram.request.BaseRequest:
+    return _InstrumentedTelegramRequest(
+        telegram.request.HTTPXRequest(
+            connect_timeout=config.get_telegram_connect_timeout_seconds(),
+            read_timeout=config.get_telegram_read_timeout_seconds(),
+            write_timeout=config.get_telegram_write_timeout_seconds(),
+            pool_timeout=config.get_telegram_pool_timeout_seconds(),
+        )
     )
 
+class _TelegramClients(dict):
+    """Chat id -> bot. Each bot is built on the first lookup for its chat,
+    since every bot opens its own HTTP client and most runs use one or two."""
+
+    def __init__(self):
+        super().__init__()
+        self.bot_configs: dict[str, tuple[str, str]] = {}
+
+    def register(self, chat_id, name: str, token: str) -> None:
+        self.pop(chat_id, None)
+        self.bot_configs[chat_id] = (name, token)
+
+    def __missing__(self, chat_id):
+        # Unknown chats still raise KeyError.
+        name, token = self.bot_configs[chat_id]
+        bot = telegram.Bot(token=token, request=_build_telegram_request())
+        # Keep the module-level handle, e.g. crypto_admin_bot, in sync.
+        globals()[name] = bot
+        self[chat_id] = bot
+        return bot
+
+chat_id_to_telegram_client = _TelegramClients()
+
 def init_telegram_bots():
     global stocks_bot, stocks_admin_bot, stocks_dev_bot, crypto_bot, crypto_admin_bot, crypto_dev_bot
     logger.info('Initialising telegram bots')
-    stocks_bot = telegram.Bot(
-        token=config.get_telegram_stocks_bot_token(),
-        request=_build_telegram_request(),
-    )
-    stocks_admin_bot = telegram.Bot(
-        token=config.get_telegram_stocks_admin_bot_token(),
-        request=_build_telegram_request(),
-    )
-    stocks_dev_bot = telegram.Bot(
-        token=config.get_telegram_stocks_dev_bot_token(),
-        request=_build_telegram_request(),
-    )
-    crypto_bot = telegram.Bot(
-        token=config.get_telegram_crypto_bot_token(),
-        request=_build_telegram_request(),
-    )
-    crypto_admin_bot = telegram.Bot(
-        token=config.get_telegram_crypto_admin_bot_token(),
-        request=_build_telegram_request(),
-    )
-    crypto_dev_bot = telegram.Bot(
-        token=config.get_telegram_crypto_dev_bot_token(),
-        request=_build_telegram_request(),
-    )
+    stocks_bot = stocks_admin_bot = stocks_dev_bot = None
+    crypto_bot = crypto_admin_bot = crypto_dev_bot = None
 
-    global chat_id_to_telegram_client
-    chat_id_to_telegram_client[config.get_telegram_stocks_channel_id()] = stocks_bot
-    chat_id_to_telegram_client[config.get_telegram_stocks_admin_id()] = stocks_admin_bot
-    chat_id_to_telegram_client[config.get_telegram_stocks_dev_id()] = stocks_dev_bot
+    # Tokens and chat ids are read now so missing config still fails at startup.
+    chat_id_to_telegram_client.register(config.get_telegram_stocks_channel_id(), 'stocks_bot', config.get_telegram_stocks_bot_token())
+    chat_id_to_telegram_client.register(config.get_telegram_stocks_admin_id(), 'stocks_admin_bot', config.get_telegram_stocks_admin_bot_token())
+    chat_id_to_telegram_client.register(config.get_telegram_stocks_dev_id(), 'stocks_dev_bot', config.get_telegram_stocks_dev_bot_token())
 
-    chat_id_to_telegram_client[config.get_telegram_crypto_channel_id()] = crypto_bot
-    chat_id_to_telegram_client[config.get_telegram_crypto_admin_id()] = crypto_admin_bot
-    chat_id_to_telegram_client[config.get_telegram_crypto_dev_id()] = crypto_dev_bot
+    chat_id_to_telegram_client.register(config.get_telegram_crypto_channel_id(), 'crypto_bot', config.get_telegram_crypto_bot_token())
+    chat_id_to_telegram_client.register(config.get_telegram_crypto_admin_id(), 'crypto_admin_bot', config.get_telegram_crypto_admin_bot_token())
+    chat_id_to_telegram_client.register(config.get_telegram_crypto_dev_id(), 'crypto_dev_bot', config.get_telegram_crypto_dev_bot_token())
 
     global market_data_type_to_admin_chat_id
     market_data_type_to_admin_chat_id[MarketDataType.STOCKS] = config.get_telegram_stocks_admin_id()
@@ -93,19 +124,12 @@ async def send_message_to_channel(
         logger.warning('market_data_type is not passed in')
         return
 
-    # Callers that omit runtime_mode should stay on the normal delivery path
-    # instead of inheriting dev routing from any ambient process configuration.
-    active_runtime_mode = (
-        DEFAULT_RUNTIME_MODE if runtime_mode is None else runtime_mode
+    chat_id, is_admin_chat = _resolve_channel_target(
+        chat_id=chat_id,
+        market_data_type=market_data_type,
+        runtime_mode=runtime_mode,
     )
-    use_dev_telegram = active_runtime_mode.use_dev_telegram
-    if use_dev_telegram or config.get_simulate_tradingview_traffic():
-        chat_id = get_dev_channel_id_from_market_data_type(market_data_type)
-
     telegram_client = chat_id_to_telegram_client[chat_id]
-    is_admin_chat = chat_id == get_admin_channel_id_from_market_data_type(
-        market_data_type
-    )
 
     try:
         if not is_admin_chat and len(message) > MAX_TELEGRAM_MESSAGE_LENGTH:
@@ -142,6 +166,66 @@ async def send_message_to_channel(
         except Exception as fallback_error:
             logger.error(get_exception_message(fallback_error))
 
+async def enqueue_message_to_channel(
+    outbox: TelegramOutbox,
+    message: str,
+    chat_id,
+    market_data_type: MarketDataType,
+    runtime_mode: RuntimeMode | None = None,
+):
+    """Queue a message for the outbox worker with the same routing and
+    splitting as `send_message_to_channel`, without waiting on Telegram."""
+    if config.get_disable_telegram():
+        logger.info('Telegram is disabled')
+        return
+
+    if market_data_type is None:
+        logger.warning('market_data_type is not passed in')
+        return
+
+    chat_id, is_admin_chat = _resolve_channel_target(
+        chat_id=chat_id,
+        market_data_type=market_data_type,
+        runtime_mode=runtime_mode,
+    )
+    if not is_admin_chat and len(message) > MAX_TELEGRAM_MESSAGE_LENGTH:
+        chunks = _split_message_for_telegram(message=message)
+    else:
+        chunks = [message]
+    return await outbox.enqueue(chat_id=chat_id, chunks=chunks)
+
+async def send_outbox_chunk(chat_id: str, text: str):
+    # Errors propagate so the outbox worker can honor RetryAfter and retry.
+    return await chat_id_to_telegram_client[chat_id].send_message(
+        chat_id,
+        text=text,
+        parse_mode='MarkdownV2',
+    )
+
+def split_rejected_outbox_chunk(chat_id: str, text: str, error: Exception) -> List[str] | None:
+    """Mirror the "message is too long" retry of `send_message_to_channel`:
+    returns smaller chunks for a non-admin chat, or None when the outbox
+    worker should drop the message instead."""
+    admin_chat_ids = {str(admin_chat_id) for admin_chat_id in market_data_type_to_admin_chat_id.values()}
+    if str(chat_id) in admin_chat_ids or not _is_message_too_long_error(error):
+        return None
+    chunks = _split_message_for_telegram(message=text)
+    return chunks if len(chunks) > 1 else None
+
+async def alert_dropped_outbox_message(chat_id: str, error: Exception):
+    # Same fallback alert as send_message_to_channel, so a dropped message is not silent.
+    try:
+        await chat_id_to_telegram_client[chat_id].send_message(
+            chat_id,
+            text=_build_telegram_error_alert(
+                context='Telegram outbox delivery',
+                error_text=get_exception_message(error),
+            ),
+            parse_mode='MarkdownV2',
+        )
+    except Exception as fallback_error:
+        logger.error(get_exception_message(fallback_error))
+
 async def send_message_to_admin(message: str, market_data_type: MarketDataType):
     channel_id = get_admin_channel_id_from_market_data_type(market_data_type)
     telegram_client = chat_id_to_telegram_client[channel_id]
@@ -226,6 +310,26 @@ def print_telegram_message(res: telegram.Message):
     logging.info(f"Sent to {res.chat.title} {res.chat.type} at {res.date}. Message id {res.id}")
 
 
+def _resolve_channel_target(
+    chat_id,
+    market_data_type: MarketDataType,
+    runtime_mode: RuntimeMode | None,
+):
+    # Callers that omit runtime_mode should stay on the normal delivery path
+    # instead of inheriting dev routing from any ambient process configuration.
+    active_runtime_mode = (
+        DEFAULT_RUNTIME_MODE if runtime_mode is None else runtime_mode
+    )
+    use_dev_telegram = active_runtime_mode.use_dev_telegram
+    if use_dev_telegram or config.get_simulate_tradingview_traffic():
+        chat_id = get_dev_channel_id_from_market_data_type(market_data_type)
+
+    is_admin_chat = chat_id == get_admin_channel_id_from_market_data_type(
+        market_data_type
+    )
+    return chat_id, is_admin_chat
+
+
 def _resolve_crypto_signal_target(
     requested_chat_id: str | None,
     runtime_mode: RuntimeMode,
@@ -241,7 +345,10 @@ def _resolve_crypto_signal_target(
         raise RuntimeError(
             'Crypto signal delivery to the public crypto channel is disabled in phase 1'
         )
-    return crypto_admin_bot, resolved_chat_id
+    telegram_client = crypto_admin_bot
+    if telegram_client is None:
+        telegram_client = chat_id_to_telegram_client[config.get_telegram_crypto_admin_id()]
+    return telegram_client, resolved_chat_id
 
 
 def _build_telegram_error_alert(context: str, error_text: str) -> str:
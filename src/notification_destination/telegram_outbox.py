@@ -0,0 +1,265 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from telegram.error import BadRequest, RetryAfter
+
+from src.db.redis import Redis
+from src.util.exception import get_exception_message
+
+logger = logging.getLogger('Telegram outbox')
+
+KEY_PREFIX = 'telegram-outbox'
+
+
+@dataclass(slots=True)
+class TelegramOutboxStats:
+    queued_by_chat: dict[str, int]
+    delivered: int
+    dropped: int
+    rate_limited: int
+    # Enqueue to last chunk sent, over the most recent deliveries.
+    latency_ms_avg: float | None
+    latency_ms_max: int | None
+
+
+def _decode(value) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def _get_retry_after_seconds(error: RetryAfter) -> float:
+    # python-telegram-bot 20.x reports seconds; newer releases may use timedelta.
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class TelegramOutbox:
+    """Durable per-chat FIFO of pending Telegram messages in Redis.
+
+    Each chat has its own list so one rate-limited chat never holds back the
+    others, and a set tracks which chats have pending messages. A message is
+    stored with all of its split chunks and the index of the next chunk to
+    send, so a retry resumes where it stopped and chunks stay in order.
+    Delivery counters and latency are kept per process.
+    """
+
+    def __init__(
+        self,
+        redis_client_getter: Callable[[], Any] = Redis.get_client,
+        key_prefix: str = KEY_PREFIX,
+        clock: Callable[[], float] = time.time,
+        latency_window: int = 500,
+    ):
+        self.redis_client_getter = redis_client_getter
+        self.key_prefix = key_prefix
+        self.clock = clock
+        self.chats_key = f'{key_prefix}:chats'
+        self.delivered = 0
+        self.dropped = 0
+        self.rate_limited = 0
+        self.latencies_ms: deque[int] = deque(maxlen=latency_window)
+
+    def _get_chat_key(self, chat_id: str) -> str:
+        return f'{self.key_prefix}:chat:{chat_id}'
+
+    async def enqueue(self, chat_id, chunks: list[str]) -> str:
+        chat_id = str(chat_id)
+        entry = {
+            'id': uuid.uuid4().hex,
+            'chat_id': chat_id,
+            'chunks': chunks,
+            'next_chunk': 0,
+            'attempts': 0,
+            'enqueued_at': self.clock(),
+        }
+        redis_client = self.redis_client_getter()
+        await redis_client.rpush(self._get_chat_key(chat_id), json.dumps(entry))
+        await redis_client.sadd(self.chats_key, chat_id)
+        return entry['id']
+
+    async def get_chat_ids(self) -> list[str]:
+        chat_ids = await self.redis_client_getter().smembers(self.chats_key)
+        return sorted(_decode(chat_id) for chat_id in chat_ids)
+
+    async def peek(self, chat_id: str) -> dict | None:
+        raw_entry = await self.redis_client_getter().lindex(self._get_chat_key(chat_id), 0)
+        return json.loads(raw_entry) if raw_entry is not None else None
+
+    async def update_head(self, chat_id: str, entry: dict) -> None:
+        # Producers only append, so with a single worker the head is stable.
+        await self.redis_client_getter().lset(self._get_chat_key(chat_id), 0, json.dumps(entry))
+
+    async def pop_head(self, chat_id: str) -> None:
+        await self.redis_client_getter().lpop(self._get_chat_key(chat_id))
+
+    async def release_chat(self, chat_id: str) -> None:
+        redis_client = self.redis_client_getter()
+        await redis_client.srem(self.chats_key, chat_id)
+        # A message enqueued between the empty peek and the removal would
+        # otherwise be stranded until the next enqueue for this chat.
+        if await redis_client.llen(self._get_chat_key(chat_id)) > 0:
+            await redis_client.sadd(self.chats_key, chat_id)
+
+    def record_delivered(self, entry: dict) -> None:
+        self.delivered += 1
+        self.latencies_ms.append(max(0, int((self.clock() - entry['enqueued_at']) * 1000)))
+
+    async def get_stats(self) -> TelegramOutboxStats:
+        redis_client = self.redis_client_getter()
+        queued_by_chat = {}
+        for chat_id in await self.get_chat_ids():
+            queued_by_chat[chat_id] = await redis_client.llen(self._get_chat_key(chat_id))
+        return TelegramOutboxStats(
+            queued_by_chat=queued_by_chat,
+            delivered=self.delivered,
+            dropped=self.dropped,
+            rate_limited=self.rate_limited,
+            latency_ms_avg=(
+                sum(self.latencies_ms) / len(self.latencies_ms) if self.latencies_ms else None
+            ),
+            latency_ms_max=max(self.latencies_ms) if self.latencies_ms else None,
+        )
+
+
+class TelegramOutboxWorker:
+    """Drains the outbox within Telegram's flood limits.
+
+    Sends are spaced by `per_chat_interval_seconds` within a chat and by
+    `1 / global_rate_per_second` across all chats. A `RetryAfter` pauses only
+    the affected chat for the requested time and does not count as an attempt.
+    A `BadRequest` is permanent, so the chunk is either re-split by
+    `split_rejected_chunk` or the message is dropped at once; other errors back
+    off and drop the message after `max_attempts`. `on_drop` is awaited for
+    every dropped message so the chat can still be alerted.
+    """
+
+    def __init__(
+        self,
+        outbox: TelegramOutbox,
+        sender: Callable[[str, str], Awaitable[Any]],
+        split_rejected_chunk: Callable[[str, str, Exception], list[str] | None] | None = None,
+        on_drop: Callable[[str, Exception], Awaitable[Any]] | None = None,
+        per_chat_interval_seconds: float = 1.0,
+        global_rate_per_second: float = 25.0,
+        max_attempts: int = 5,
+        retry_backoff_seconds: float = 5.0,
+        poll_interval_seconds: float = 0.5,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.outbox = outbox
+        self.sender = sender
+        self.split_rejected_chunk = split_rejected_chunk
+        self.on_drop = on_drop
+        self.per_chat_interval_seconds = per_chat_interval_seconds
+        self.global_interval_seconds = 1 / global_rate_per_second
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.sleep = sleep
+        self.chat_ready_at: dict[str, float] = {}
+        self.global_ready_at = 0.0
+
+    async def run(self) -> None:
+        logger.info(f'Delivering {self.outbox.key_prefix} messages')
+        while True:
+            try:
+                sent = await self.deliver_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(get_exception_message(e, cls=self.__class__.__name__))
+                sent = 0
+            await self.sleep(self._get_idle_seconds() if sent == 0 else 0)
+
+    async def deliver_due(self) -> int:
+        """Send at most one chunk per ready chat. Returns chunks sent."""
+        sent = 0
+        for chat_id in await self.outbox.get_chat_ids():
+            now = self.outbox.clock()
+            if now < self.global_ready_at:
+                break
+            if now < self.chat_ready_at.get(chat_id, 0):
+                continue
+            entry = await self.outbox.peek(chat_id)
+            if entry is None:
+                await self.outbox.release_chat(chat_id)
+                self.chat_ready_at.pop(chat_id, None)
+                continue
+            if await self._send_next_chunk(chat_id, entry):
+                sent += 1
+        return sent
+
+    async def _send_next_chunk(self, chat_id: str, entry: dict) -> bool:
+        chunk = entry['chunks'][entry['next_chunk']]
+        self.global_ready_at = self.outbox.clock() + self.global_interval_seconds
+        try:
+            await self.sender(chat_id, chunk)
+        except RetryAfter as e:
+            retry_after_seconds = _get_retry_after_seconds(e)
+            self.outbox.rate_limited += 1
+            self.chat_ready_at[chat_id] = self.outbox.clock() + retry_after_seconds
+            logger.warning(f'Telegram asked to retry chat {chat_id} after {retry_after_seconds}s')
+            return False
+        except BadRequest as e:
+            self._log_send_failure(chat_id, entry, e)
+            pieces = None
+            if self.split_rejected_chunk is not None:
+                pieces = self.split_rejected_chunk(chat_id, chunk, e)
+            if pieces:
+                entry['chunks'][entry['next_chunk']:entry['next_chunk'] + 1] = pieces
+                await self.outbox.update_head(chat_id, entry)
+                logger.warning(f'Split rejected chunk of outbox message {entry["id"]} into {len(pieces)}')
+                return False
+            await self._drop(chat_id, entry, e)
+            return False
+        except Exception as e:
+            entry['attempts'] += 1
+            self._log_send_failure(chat_id, entry, e)
+            if entry['attempts'] >= self.max_attempts:
+                await self._drop(chat_id, entry, e)
+                return False
+            await self.outbox.update_head(chat_id, entry)
+            self.chat_ready_at[chat_id] = (
+                self.outbox.clock() + self.retry_backoff_seconds * entry['attempts']
+            )
+            return False
+
+        self.chat_ready_at[chat_id] = self.outbox.clock() + self.per_chat_interval_seconds
+        entry['next_chunk'] += 1
+        if entry['next_chunk'] < len(entry['chunks']):
+            await self.outbox.update_head(chat_id, entry)
+        else:
+            await self.outbox.pop_head(chat_id)
+            self.outbox.record_delivered(entry)
+        return True
+
+    def _log_send_failure(self, chat_id: str, entry: dict, error: Exception) -> None:
+        logger.error(
+            f'Failed to send chunk {entry["next_chunk"] + 1}/{len(entry["chunks"])} of outbox message '
+            f'{entry["id"]} to {chat_id}: {get_exception_message(error, cls=self.__class__.__name__)}'
+        )
+
+    async def _drop(self, chat_id: str, entry: dict, error: Exception) -> None:
+        logger.error(f'Dropping outbox message {entry["id"]} after {entry["attempts"]} attempts')
+        self.outbox.dropped += 1
+        await self.outbox.pop_head(chat_id)
+        if self.on_drop is None:
+            return
+        try:
+            await self.on_drop(chat_id, error)
+        except Exception as e:
+            logger.error(get_exception_message(e, cls=self.__class__.__name__))
+
+    def _get_idle_seconds(self) -> float:
+        now = self.outbox.clock()
+        ready_ats = [self.global_ready_at, *self.chat_ready_at.values()]
+        waits = [ready_at - now for ready_at in ready_ats if ready_at > now]
+        return min([self.poll_interval_seconds, *waits])
@@ -1,10 +1,18 @@
 from fastapi import APIRouter
+from src.config import config
 from src.dependencies import Dependencies
+from src.service.response_cache import load_cached
 
 router = APIRouter(prefix="/crypto_stats")
 
 @router.get("/topsectors")
 async def get_top_sectors_24h(sort_by='avg_price_change', sort_direction='desc', limit = 10):
   service = Dependencies.get_crypto_stats_service()
-  res = await service.get_sectors_24h_change(sort_by=sort_by, sort_direction=sort_direction, limit=limit)
+  res = await load_cached(
+    Dependencies.get_response_cache(),
+    namespace='crypto_stats/topsectors',
+    params={'sort_by': sort_by, 'sort_direction': sort_direction, 'limit': limit},
+    ttl_seconds=config.get_crypto_stats_response_cache_ttl_seconds(),
+    loader=lambda: service.get_sectors_24h_change(sort_by=sort_by, sort_direction=sort_direction, limit=limit),
+  )
   return {"data": res}
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, HTTPException
 from market_data_library.util.exception import CryptoQuantApiError
 
+from src.config import config
 from src.dependencies import Dependencies
+from src.service.response_cache import load_cached
 
 router = APIRouter(prefix="/cryptoquant")
 
@@ -12,7 +14,13 @@ async def get_price_ohlcv(symbol: str = 'BTC', window: str = 'day', limit: int |
     if service is None:
         raise HTTPException(status_code=503, detail='CryptoQuant service is unavailable')
     try:
-        res = await service.get_price_ohlcv(symbol=symbol, window=window, limit=limit)
+        res = await load_cached(
+            Dependencies.get_response_cache(),
+            namespace='cryptoquant/price-ohlcv',
+            params={'symbol': symbol, 'window': window, 'limit': limit},
+            ttl_seconds=config.get_cryptoquant_response_cache_ttl_seconds(),
+            loader=lambda: service.get_price_ohlcv(symbol=symbol, window=window, limit=limit),
+        )
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
     except CryptoQuantApiError as exc:
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException, Request
+from starlette.responses import JSONResponse
+
+router = APIRouter(prefix="/jobs")
+
+def _get_job_scheduler(request: Request):
+  job_scheduler = getattr(request.app.state, 'job_scheduler', None)
+  if job_scheduler is None:
+    raise HTTPException(status_code=503, detail='Job scheduler is not enabled')
+  return job_scheduler
+
+@router.get("")
+async def get_jobs(request: Request):
+  return {"data": _get_job_scheduler(request).get_status()}
+
+@router.post("/{job_name}/run")
+async def run_job(request: Request, job_name: str, test_mode: bool = False):
+  # Runs in the background; poll GET /jobs for the outcome.
+  job_scheduler = _get_job_scheduler(request)
+  try:
+    started = job_scheduler.trigger(job_name, test_mode=test_mode)
+  except KeyError:
+    raise HTTPException(status_code=404, detail=f'Unknown job {job_name}') from None
+  if not started:
+    raise HTTPException(status_code=409, detail=f'{job_name} is already running')
+  return JSONResponse(status_code=202, content={'data': 'Accepted'})
@@ -0,0 +1,15 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+from src.dependencies import Dependencies
+
+router = APIRouter(prefix="/response-cache")
+
+@router.get("/stats")
+async def get_stats():
+  # Counters are per process: local hits, Redis hits, upstream misses, and
+  # requests coalesced onto an in-flight upstream call.
+  response_cache = Dependencies.get_response_cache()
+  if response_cache is None:
+    return {"data": None}
+  return {"data": asdict(response_cache.get_stats())}
@@ -1,23 +1,43 @@
 from fastapi import APIRouter
+from src.config import config
 from src.dependencies import Dependencies
+from src.service.response_cache import load_cached
 
 router = APIRouter(prefix="/sentiment")
 
 @router.get("/crypto-fear-greed")
 async def get_crypto_fear_greed(from_source=False, days=365):
   service = Dependencies.get_crypto_sentiment_service()
-  if from_source:
-    res = await service.get_crypto_fear_greed_index_from_source(days=days)
-  else:
-    res = await service.get_crypto_fear_greed_index(days=days)
+
+  async def load():
+    if from_source:
+      return await service.get_crypto_fear_greed_index_from_source(days=days)
+    return await service.get_crypto_fear_greed_index(days=days)
+
+  res = await load_cached(
+    Dependencies.get_response_cache(),
+    namespace='sentiment/crypto-fear-greed',
+    params={'from_source': from_source, 'days': days},
+    ttl_seconds=config.get_sentiment_response_cache_ttl_seconds(),
+    loader=load,
+  )
   return {"data": res}
 
 
 @router.get("/stocks-fear-greed")
 async def get_stocks_fear_greed(from_source=False):
   service = Dependencies.get_stocks_sentiment_service()
-  if from_source:
-    res = await service.get_stocks_fear_greed_index_from_source()
-  else:
-    res = await service.get_stocks_fear_greed_index()
+
+  async def load():
+    if from_source:
+      return await service.get_stocks_fear_greed_index_from_source()
+    return await service.get_stocks_fear_greed_index()
+
+  res = await load_cached(
+    Dependencies.get_response_cache(),
+    namespace='sentiment/stocks-fear-greed',
+    params={'from_source': from_source},
+    ttl_seconds=config.get_sentiment_response_cache_ttl_seconds(),
+    loader=load,
+  )
   return {"data": res}
@@ -0,0 +1,15 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+from src.dependencies import Dependencies
+
+router = APIRouter(prefix="/telegram-outbox")
+
+@router.get("/stats")
+async def get_stats():
+  # Queue depth is shared through Redis; delivery counters and latency are
+  # for this process's worker only.
+  telegram_outbox = Dependencies.get_telegram_outbox()
+  if telegram_outbox is None:
+    return {"data": None}
+  return {"data": asdict(await telegram_outbox.get_stats())}
@@ -1,12 +1,19 @@
 import json
 import logging
+from dataclasses import asdict
 from typing import Any
 
 from fastapi import APIRouter, Request
+from starlette.responses import JSONResponse
 
 from src.config import config
 from src.dependencies import Dependencies
 from src.event.event_emitter import async_ee
+from src.service.tradingview_body import (
+    TradingViewBodyTooLargeError,
+    parse_tradingview_body_text,
+    validate_tradingview_body,
+)
 from src.type.market_data_type import MarketDataType
 from src.type.trading_view import TradingViewDataType
 from src.util.date_util import get_current_date
@@ -32,6 +39,15 @@ async def tradingview_daily_stocks_data(request: Request):
     # skew: 140-150
 
     messages = []
+    # The source is checked before the body is read, so traffic from anywhere
+    # else costs no parsing.
+    if not is_allowed_tradingview_source(request.client.host):
+        messages.append(
+            f"*[Potential malicious request warning]‼️*\n*Request ip {escape_markdown(request.client.host)} is not from a configured TradingView source or whitelist{escape_markdown('.')}*\n*Content length:* {format_alert_value(request.headers.get('content-length', 'unknown'))}")
+        message = format_messages_to_telegram(messages)
+        async_ee.emit('send_to_telegram', message=message, channel=config.get_telegram_stocks_admin_id(), market_data_type=MarketDataType.STOCKS)
+        return {"data": "OK"}
+
     try:
         body = await parse_tradingview_request_body(request)
         filtered_body = filter_tradingview_request_body(body)
@@ -66,15 +82,53 @@ async def tradingview_daily_stocks_data(request: Request):
         async_ee.emit('send_to_telegram', message=message, channel=config.get_telegram_stocks_admin_id(), market_data_type=MarketDataType.STOCKS)
         return {"data": "OK"}
 
-    trading_view_ips = config.get_trading_view_ips()
-    whitelist_ips = config.get_whitelist_ips()
-    if not config.get_simulate_tradingview_traffic() and request.client.host not in trading_view_ips and request.client.host not in whitelist_ips:
+    try:
+        validate_tradingview_body(filtered_body)
+    except ValueError as e:
         messages.append(
-            f"*[Potential malicious request warning]‼️*\n*Request ip {escape_markdown(request.client.host)} is not from a configured TradingView source or whitelist{escape_markdown('.')}*\n{format_tradingview_alert_context(filtered_body)}")
+            f"*Invalid TradingView payload:* {escape_markdown(str(e))}\n*Request ip:* {escape_markdown(request.client.host)}\n{format_tradingview_alert_context(filtered_body)}")
         message = format_messages_to_telegram(messages)
         async_ee.emit('send_to_telegram', message=message, channel=config.get_telegram_stocks_admin_id(), market_data_type=MarketDataType.STOCKS)
         return {"data": "OK"}
 
+    ingestion_queue = Dependencies.get_tradingview_ingestion_queue()
+    if ingestion_queue is not None:
+        # Close alerts arrive in bursts against a short webhook timeout, so
+        # only append to the stream here; the ingestion worker saves and
+        # notifies. The stored body has the secret stripped.
+        await ingestion_queue.enqueue(body=filtered_body, client_host=request.client.host)
+        return JSONResponse(status_code=202, content={'data': 'Accepted'})
+
+    return await save_tradingview_payload(filtered_body, request_test_mode)
+
+
+@router.get("/ingestion/stats")
+async def tradingview_ingestion_stats():
+    ingestion_queue = Dependencies.get_tradingview_ingestion_queue()
+    if ingestion_queue is None:
+        return {"data": None}
+    return {"data": asdict(await ingestion_queue.get_stats())}
+
+
+async def handle_queued_tradingview_payload(filtered_body: dict, client_host: str):
+    # Secret and source IP were checked before the payload was queued. Errors
+    # propagate so the worker redelivers; it logs each failed delivery.
+    request_test_mode = filtered_body.get('test_mode', 'false') == 'true'
+    await save_tradingview_payload(filtered_body, request_test_mode)
+
+
+async def alert_dropped_tradingview_payload(filtered_body: dict, client_host: str, error: Exception):
+    # Called once per payload, after its final delivery fails.
+    message = format_messages_to_telegram([
+        f"Queued trading view payload error: {get_exception_message(error, should_escape_markdown=True)}\n"
+        f"*Request ip:* {escape_markdown(str(client_host))}\n"
+        f"{format_tradingview_alert_context(filtered_body)}"
+    ])
+    async_ee.emit('send_to_telegram', message=message, channel=config.get_telegram_stocks_admin_id(), market_data_type=MarketDataType.STOCKS)
+
+
+async def save_tradingview_payload(filtered_body: dict, request_test_mode: bool):
+    messages = []
     tradingview_service = Dependencies.get_tradingview_service()
     # Save to redis
     now = get_current_date()
@@ -82,7 +136,7 @@ async def tradingview_daily_stocks_data(request: Request):
     json_data = {}
     timestamp = get_tradingview_score(filtered_body, fallback=now)
     [add_res, remove_res] = await tradingview_service.save_tradingview_data(
-        data=json.dumps(filtered_body),
+        data=filtered_body,
         key=key,
         score=timestamp,
         test_mode=request_test_mode,
@@ -114,11 +168,13 @@ async def tradingview_daily_stocks_data(request: Request):
         }
     }
 
-async def parse_tradingview_request_body(request: Request) -> dict:
-    raw_body = await request.body()
-    if raw_body is None:
-        raise ValueError('TradingView request body is empty')
+def is_allowed_tradingview_source(client_host: str) -> bool:
+    if config.get_simulate_tradingview_traffic():
+        return True
+    return client_host in config.get_trading_view_ips() or client_host in config.get_whitelist_ips()
 
+async def parse_tradingview_request_body(request: Request) -> dict:
+    raw_body = await read_request_body(request, max_bytes=config.get_tradingview_max_body_bytes())
     raw_text = raw_body.decode('utf-8').strip()
     if not raw_text:
         raise ValueError('TradingView request body is empty')
@@ -129,38 +185,20 @@ async def parse_tradingview_request_body(request: Request) -> dict:
 
     return body
 
-def parse_tradingview_body_text(raw_text: str):
-    candidates = [raw_text]
-    if '\\"' in raw_text:
-        candidates.append(raw_text.replace('\\"', '"'))
-        try:
-            candidates.append(raw_text.encode('utf-8').decode('unicode_escape'))
-        except UnicodeDecodeError:
-            pass
-
-    last_error = None
-    seen = set()
-    while candidates:
-        candidate = candidates.pop(0)
-        if candidate in seen:
-            continue
-        seen.add(candidate)
-        try:
-            parsed = json.loads(candidate)
-        except json.JSONDecodeError as exc:
-            last_error = exc
-            continue
-
-        if isinstance(parsed, str):
-            candidates.append(parsed)
-            continue
-
-        return parsed
-
-    if last_error is not None:
-        raise last_error
-
-    raise ValueError('TradingView request body is not valid JSON')
+async def read_request_body(request: Request, max_bytes: int) -> bytes:
+    # Content-Length rejects most oversized bodies without reading them; the
+    # running count covers chunked bodies and a wrong header.
+    content_length = request.headers.get('content-length')
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+        raise TradingViewBodyTooLargeError(f'TradingView request body is larger than {max_bytes} bytes')
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise TradingViewBodyTooLargeError(f'TradingView request body is larger than {max_bytes} bytes')
+        chunks.append(chunk)
+    return b''.join(chunks)
 
 def filter_tradingview_request_body(body: dict) -> dict:
     return {k: v for k, v in body.items() if k != 'secret'}
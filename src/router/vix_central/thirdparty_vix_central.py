@@ -1,7 +1,9 @@
 import logging
 
 from fastapi import APIRouter, Response, status
+from src.config import config
 from src.dependencies import Dependencies
+from src.service.response_cache import load_cached
 from src.util.exception import get_exception_message
 
 router = APIRouter(prefix="/thirdparty/vixcentral")
@@ -10,7 +12,13 @@ logger = logging.getLogger('Third party vix central')
 @router.get("/current")
 async def get_current():
   thirdparty_vix_central_service = Dependencies.get_thirdparty_vix_central_service()
-  res = await thirdparty_vix_central_service.get_current()
+  res = await load_cached(
+    Dependencies.get_response_cache(),
+    namespace='thirdparty/vixcentral/current',
+    params={},
+    ttl_seconds=config.get_vix_central_current_response_cache_ttl_seconds(),
+    loader=thirdparty_vix_central_service.get_current,
+  )
   return {"data": res}
 
 
@@ -23,7 +31,13 @@ async def get_historical(date: str, response: Response):
   thirdparty_vix_central_service = Dependencies.get_thirdparty_vix_central_service()
 
   try:
-    res = await thirdparty_vix_central_service.get_historical(date=date)
+    res = await load_cached(
+      Dependencies.get_response_cache(),
+      namespace='thirdparty/vixcentral/historical',
+      params={'date': date},
+      ttl_seconds=config.get_vix_central_historical_response_cache_ttl_seconds(),
+      loader=lambda: thirdparty_vix_central_service.get_historical(date=date),
+    )
     return {"data": res}
   except Exception as e:
     logger.error(get_exception_message(e))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 
@@ -5,19 +6,28 @@ from fastapi import FastAPI, Request
 import uvicorn
 import os
 
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Match
 
-from src.data_source.market_data_library import init_market_data_api
 from src.dependencies import Dependencies
-from src.notification_destination.telegram_notification import init_telegram_bots
+from src.notification_destination.telegram_notification import alert_dropped_outbox_message, init_telegram_bots, send_outbox_chunk, split_rejected_outbox_chunk
+from src.job.job_scheduler import JobScheduler, build_default_jobs
+from src.job.job_slot_store import JobSlotStore
+from src.notification_destination.telegram_outbox import TelegramOutboxWorker
 from src.router.barchart import thirdparty_barchart
 from src.router.cryptoquant import cryptoquant
+from src.router.jobs import jobs
 from src.router.sentiment import sentiment
 from src.router.vix_central import thirdparty_vix_central, vix_central
 from src.router.tradingview import tradingview
 from src.router.crypto_stats import crypto_stats
+from src.router.response_cache import response_cache
+from src.router.telegram_outbox import telegram_outbox
+from src.service.tradingview_ingestion_queue import TradingViewIngestionWorker
 import src.config.config as config
 from src.db.redis import Redis
+from src.util.exception import get_exception_message
+from src.util.metrics import EXPOSITION_CONTENT_TYPE, HTTP_REQUEST_DURATION, REGISTRY
 
 app = FastAPI()
 app.include_router(tradingview.router)
@@ -30,6 +40,10 @@ app.include_router(thirdparty_barchart.router)
 app.include_router(cryptoquant.router)
 app.include_router(sentiment.router)
 app.include_router(crypto_stats.router)
+# shared
+app.include_router(response_cache.router)
+app.include_router(telegram_outbox.router)
+app.include_router(jobs.router)
 
 env = os.getenv('ENV')
 
@@ -48,18 +62,69 @@ def start_server():
 
     uvicorn.run("server:app", app_dir="src", reload_dirs=["src"], host="0.0.0.0", port=8080, reload=reload)
 
+# Long-running workers started with the server and cancelled on shutdown.
+background_tasks: list[asyncio.Task] = []
+
+
 @app.on_event("startup")
 async def startup_event():
     await Dependencies.build()
     await Redis.start_redis()
+    # Market data library clients and Telegram bots are built on first use.
     init_telegram_bots()
-    init_market_data_api()
+    ingestion_queue = Dependencies.get_tradingview_ingestion_queue()
+    if ingestion_queue is not None:
+        worker = TradingViewIngestionWorker(
+            queue=ingestion_queue,
+            handler=tradingview.handle_queued_tradingview_payload,
+            on_drop=tradingview.alert_dropped_tradingview_payload,
+        )
+        background_tasks.append(asyncio.create_task(worker.run()))
+    telegram_outbox = Dependencies.get_telegram_outbox()
+    if telegram_outbox is not None:
+        outbox_worker = TelegramOutboxWorker(
+            outbox=telegram_outbox,
+            sender=send_outbox_chunk,
+            split_rejected_chunk=split_rejected_outbox_chunk,
+            on_drop=alert_dropped_outbox_message,
+            per_chat_interval_seconds=config.get_telegram_outbox_per_chat_interval_seconds(),
+            global_rate_per_second=config.get_telegram_outbox_global_rate_per_second(),
+        )
+        background_tasks.append(asyncio.create_task(outbox_worker.run()))
+    if config.is_job_scheduler_enabled():
+        app.state.job_scheduler = JobScheduler(
+            jobs=build_default_jobs(),
+            poll_interval_seconds=config.get_job_scheduler_poll_interval_seconds(),
+            slot_store=JobSlotStore(),
+        )
+        background_tasks.append(asyncio.create_task(app.state.job_scheduler.run()))
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    # Unacked stream entries and undelivered outbox messages stay in Redis
+    # and are picked up again on restart.
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # A worker that already died must not skip the cleanup below.
+            logger.error(get_exception_message(e))
+    background_tasks.clear()
     await Dependencies.cleanup()
     await Redis.stop_redis()
 
+def _get_route_template(request: Request) -> str:
+    # Label by path template so ids in the url do not create new series.
+    for route in request.app.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, 'path', request.url.path)
+    return 'unmatched'
+
 @app.middleware("http")
 async def log_request_and_time_taken(request: Request, call_next):
     start_time = time.time()
@@ -72,6 +137,12 @@ async def log_request_and_time_taken(request: Request, call_next):
     response = await call_next(request)
     time_elapsed = time.time() - start_time
     response.headers["X-Process-Time"] = str(time_elapsed)
+    HTTP_REQUEST_DURATION.observe(
+        time_elapsed,
+        method=request.method,
+        route=_get_route_template(request),
+        status=str(response.status_code),
+    )
     logger.info(
         "Response: method=%s path=%s status=%s elapsed_seconds=%s",
         request.method,
@@ -99,3 +170,7 @@ async def auth_check(request: Request, call_next):
 @app.get("/healthz")
 async def heath_check():
     return {"data": "Market data notification is running!"}
+
+@app.get("/metrics")
+async def get_metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type=EXPOSITION_CONTENT_TYPE)
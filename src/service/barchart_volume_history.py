@@ -0,0 +1,171 @@
+import asyncio
+import datetime
+import logging
+from typing import Dict, List
+
+from src.service.stocks_daily_bar_store import (
+    BARCHART_SOURCE,
+    TRADINGVIEW_SOURCE,
+    StocksDailyBar,
+    StocksDailyBarStore,
+)
+from src.type.trading_view import TradingViewStocksData
+from src.util.date_util import get_trading_sessions_ending_at
+
+logger = logging.getLogger('Barchart volume history')
+
+
+class BarchartVolumeHistoryLoader:
+    """Loads N-session volume histories for a batch of symbols at once.
+
+    Symbols are de-duplicated and fetched concurrently; Barchart calls go
+    through the shared fetch scheduler, which applies the `barchart` rate and
+    in-flight limits. With a bar store and a trading date, histories are read
+    from the store and Barchart is only asked for the sessions it is missing,
+    so once TradingView bars are recorded each day a warm store needs no
+    Barchart calls at all.
+    """
+
+    def __init__(self, barchart_service, bar_store: StocksDailyBarStore | None = None):
+        self.barchart_service = barchart_service
+        self.bar_store = bar_store
+
+    def record_tradingview_bars(
+        self,
+        payloads: List[TradingViewStocksData],
+        trading_date: datetime.date,
+    ) -> None:
+        """Store the close/volume arrays TradingView sends, newest first."""
+        if self.bar_store is None:
+            return
+        bars = []
+        for payload in payloads:
+            close_prices = payload.close_prices or []
+            volumes = payload.volumes or []
+            sessions = get_trading_sessions_ending_at(
+                trading_date,
+                max(len(close_prices), len(volumes)),
+            )
+            for index, session in enumerate(sessions):
+                close = close_prices[index] if index < len(close_prices) else None
+                volume = volumes[index] if index < len(volumes) else None
+                if close is None and volume is None:
+                    continue
+                bars.append(
+                    StocksDailyBar(
+                        symbol=payload.symbol.upper(),
+                        session_date=session.isoformat(),
+                        open=None,
+                        high=None,
+                        low=None,
+                        close=close,
+                        volume=volume,
+                        source=TRADINGVIEW_SOURCE,
+                    )
+                )
+        self.bar_store.save_bars(bars)
+
+    async def load(
+        self,
+        symbols: List[str],
+        num_days: int = 30,
+        trading_date: datetime.date | None = None,
+    ) -> Dict[str, List[float] | Exception]:
+        """Return volumes (most recent first) by symbol.
+
+        Symbols whose fetch failed, or whose history still misses a session
+        after the fetch, map to an exception instead.
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        if self.bar_store is None or trading_date is None:
+            fetched = await asyncio.gather(
+                *[self._fetch(symbol, num_days) for symbol in unique_symbols],
+                return_exceptions=True,
+            )
+            return {
+                symbol: (
+                    result if isinstance(result, BaseException)
+                    else [stock_price.volume for stock_price in result]
+                )
+                for symbol, result in zip(unique_symbols, fetched, strict=True)
+            }
+
+        sessions = [
+            session.isoformat()
+            for session in get_trading_sessions_ending_at(trading_date, num_days)
+        ]
+        stored_bars = self.bar_store.get_bars(unique_symbols, sessions[-1], sessions[0])
+        # Barchart only returns the most recent N records, so reach back as far
+        # as the oldest missing session.
+        records_to_fetch_by_symbol = {}
+        for symbol in unique_symbols:
+            bars_by_session = stored_bars.get(symbol, {})
+            missing_indexes = [
+                index
+                for index, session in enumerate(sessions)
+                if session not in bars_by_session or bars_by_session[session].volume is None
+            ]
+            if len(missing_indexes) > 0:
+                records_to_fetch_by_symbol[symbol] = missing_indexes[-1] + 1
+
+        fetched = await asyncio.gather(
+            *[
+                self._fetch(symbol, num_records)
+                for symbol, num_records in records_to_fetch_by_symbol.items()
+            ],
+            return_exceptions=True,
+        )
+        fetched_by_symbol = dict(zip(records_to_fetch_by_symbol, fetched, strict=True))
+        self.bar_store.save_bars(
+            [
+                StocksDailyBar(
+                    symbol=symbol,
+                    session_date=str(stock_price.date)[:10],
+                    open=stock_price.open_price,
+                    high=stock_price.high_price,
+                    low=stock_price.low_price,
+                    close=stock_price.close_price,
+                    volume=stock_price.volume,
+                    source=BARCHART_SOURCE,
+                )
+                for symbol, stock_prices in fetched_by_symbol.items()
+                if not isinstance(stock_prices, BaseException)
+                for stock_price in stock_prices
+            ]
+        )
+        logger.info(
+            'Daily volume history: %s symbols, %s complete in store, %s fetched from Barchart',
+            len(unique_symbols),
+            len(unique_symbols) - len(records_to_fetch_by_symbol),
+            len(records_to_fetch_by_symbol),
+        )
+
+        if len(fetched_by_symbol) > 0:
+            stored_bars = self.bar_store.get_bars(unique_symbols, sessions[-1], sessions[0])
+        volumes_by_symbol: Dict[str, List[float] | Exception] = {}
+        for symbol in unique_symbols:
+            bars_by_session = stored_bars.get(symbol, {})
+            fetch_error = fetched_by_symbol.get(symbol)
+            if isinstance(fetch_error, BaseException):
+                volumes_by_symbol[symbol] = fetch_error
+                continue
+            missing_sessions = [
+                session
+                for session in sessions
+                if session not in bars_by_session or bars_by_session[session].volume is None
+            ]
+            if len(missing_sessions) > 0:
+                # A partial history would rank against the wrong sessions, e.g.
+                # when Barchart skips a day or its latest records stop short of
+                # an older trading date.
+                volumes_by_symbol[symbol] = ValueError(
+                    f'No {symbol} volume for sessions {", ".join(missing_sessions)}'
+                )
+                continue
+            volumes_by_symbol[symbol] = [
+                bars_by_session[session].volume for session in sessions
+            ]
+        return volumes_by_symbol
+
+    async def _fetch(self, symbol: str, num_records: int):
+        return await self.barchart_service.get_stock_price(symbol=symbol, num_days=num_records)
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger('Coin detail loader')
+
+
+@dataclass(slots=True)
+class CoinDetailLoaderStats:
+    requested: int = 0
+    upstream_calls: int = 0
+    memo_hits: int = 0
+    coalesced: int = 0
+
+    @property
+    def saved_calls(self) -> int:
+        return self.memo_hits + self.coalesced
+
+
+class CoinDetailLoader:
+    """Per-run CMC coin-detail fetcher shared by every enrichment phase.
+
+    Spotlight, sector detail, and tracked-universe enrichment ask for
+    overlapping coin ids. Each id is fetched at most once per TTL, concurrent
+    requests for an id wait on the same call, and upstream concurrency is
+    bounded so a large universe does not burst the CMC quota.
+    """
+
+    def __init__(
+        self,
+        cmc_service,
+        max_concurrency: int = 4,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cmc_service = cmc_service
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.stats = CoinDetailLoaderStats()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._details_by_coin_id: Dict[int, tuple[float, Any]] = {}
+        self._inflight: Dict[int, asyncio.Future] = {}
+
+    async def load(self, coin_ids: List[int]) -> Dict[int, Any]:
+        """Return details by coin id; failed ids map to their exception."""
+        unique_coin_ids = list(dict.fromkeys(coin_ids))
+        details = await asyncio.gather(
+            *[self._load_one(coin_id) for coin_id in unique_coin_ids],
+            return_exceptions=True,
+        )
+        return dict(zip(unique_coin_ids, details, strict=True))
+
+    def log_stats(self) -> None:
+        logger.info(
+            'CMC coin detail: %s requested, %s upstream calls, %s saved '
+            '(%s memoized, %s coalesced)',
+            self.stats.requested,
+            self.stats.upstream_calls,
+            self.stats.saved_calls,
+            self.stats.memo_hits,
+            self.stats.coalesced,
+        )
+
+    async def _load_one(self, coin_id: int) -> Any:
+        self.stats.requested += 1
+        memoized = self._details_by_coin_id.get(coin_id)
+        if memoized is not None:
+            expires_at, detail = memoized
+            if expires_at > self.clock():
+                self.stats.memo_hits += 1
+                return detail
+            del self._details_by_coin_id[coin_id]
+
+        inflight = self._inflight.get(coin_id)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._fetch(coin_id))
+        self._inflight[coin_id] = task
+
+        def _clear_inflight(_task: asyncio.Future) -> None:
+            if self._inflight.get(coin_id) is _task:
+                del self._inflight[coin_id]
+
+        task.add_done_callback(_clear_inflight)
+        return await asyncio.shield(task)
+
+    async def _fetch(self, coin_id: int) -> Any:
+        async with self._semaphore:
+            self.stats.upstream_calls += 1
+            detail = await self.cmc_service.get_coin_detail(id=coin_id)
+        # Failures are not memoized: a later phase may still enrich the coin.
+        self._details_by_coin_id[coin_id] = (self.clock() + self.ttl_seconds, detail)
+        return detail
@@ -7,6 +7,7 @@ from market_data_library.core.crypto.coinalyze.type import (
 )
 
 from src.data_source.market_data_library import get_crypto_api
+from src.util.fetch_scheduler import COINALYZE_PROVIDER, schedule_fetch
 
 
 class CoinalyzeService:
@@ -29,7 +30,10 @@ class CoinalyzeService:
     async def get_future_markets(self) -> list[CoinalyzeFutureMarket]:
         if self.coinalyze_service is None:
             raise RuntimeError('COINALYZE_API_KEY is not configured')
-        return await self.coinalyze_service.get_future_markets()
+        return await schedule_fetch(
+            COINALYZE_PROVIDER,
+            self.coinalyze_service.get_future_markets,
+        )
 
     async def get_open_interest_history(
         self,
@@ -41,12 +45,15 @@ class CoinalyzeService:
     ) -> list[CoinalyzeHistorySeries]:
         if self.coinalyze_service is None:
             raise RuntimeError('COINALYZE_API_KEY is not configured')
-        return await self.coinalyze_service.get_open_interest_history(
-            symbols=symbols,
-            interval=interval,
-            from_timestamp_seconds=from_timestamp_seconds,
-            to_timestamp_seconds=to_timestamp_seconds,
-            convert_to_usd=convert_to_usd,
+        return await schedule_fetch(
+            COINALYZE_PROVIDER,
+            lambda: self.coinalyze_service.get_open_interest_history(
+                symbols=symbols,
+                interval=interval,
+                from_timestamp_seconds=from_timestamp_seconds,
+                to_timestamp_seconds=to_timestamp_seconds,
+                convert_to_usd=convert_to_usd,
+            ),
         )
 
     async def get_funding_rate_history(
@@ -58,9 +65,12 @@ class CoinalyzeService:
     ) -> list[CoinalyzeHistorySeries]:
         if self.coinalyze_service is None:
             raise RuntimeError('COINALYZE_API_KEY is not configured')
-        return await self.coinalyze_service.get_funding_rate_history(
-            symbols=symbols,
-            interval=interval,
-            from_timestamp_seconds=from_timestamp_seconds,
-            to_timestamp_seconds=to_timestamp_seconds,
+        return await schedule_fetch(
+            COINALYZE_PROVIDER,
+            lambda: self.coinalyze_service.get_funding_rate_history(
+                symbols=symbols,
+                interval=interval,
+                from_timestamp_seconds=from_timestamp_seconds,
+                to_timestamp_seconds=to_timestamp_seconds,
+            ),
         )
@@ -7,6 +7,7 @@ from market_data_library.types import alternativeme_type
 from src.data_source.market_data_library import get_crypto_api
 from src.type.sentiment import FearGreedResult, FearGreedData, FearGreedAverage
 from src.util.date_util import parse
+from src.util.fetch_scheduler import ALTERNATIVE_ME_PROVIDER, schedule_fetch
 from src.util.list_util import is_list_out_of_range
 
 logger = logging.getLogger('Crypto sentiment service')
@@ -101,5 +102,8 @@ class CryptoSentimentService:
     async def get_crypto_fear_greed_index_from_source(self, days=365) -> alternativeme_type.AlternativeMeFearGreedIndex:
         if days is None or not isinstance(days, int):
             days = 365
-        data = await self.alternativeme_service.get_fear_greed_index(days=days)
+        data = await schedule_fetch(
+            ALTERNATIVE_ME_PROVIDER,
+            lambda: self.alternativeme_service.get_fear_greed_index(days=days),
+        )
         return data
@@ -2,6 +2,7 @@ from typing import List
 
 from market_data_library.types import cmc_type
 from src.data_source.market_data_library import get_crypto_api
+from src.util.fetch_scheduler import CMC_PROVIDER, schedule_fetch
 
 
 class CryptoStatsService:
@@ -18,11 +19,17 @@ class CryptoStatsService:
             sort_direction = 'desc'
         if limit is None or limit == '':
             limit = 10
-        data: cmc_type.CMCSector24hChange = await self.cmc_service.get_sector_24h_change(sort_by=sort_by, sort_direction=sort_direction)
+        data: cmc_type.CMCSector24hChange = await schedule_fetch(
+            CMC_PROVIDER,
+            lambda: self.cmc_service.get_sector_24h_change(sort_by=sort_by, sort_direction=sort_direction),
+        )
         return data.data[:limit]
 
     async def get_coin_detail(self, id: int) -> cmc_type.CoinDetail:
-        coin_detail: cmc_type.CMCCoinDetail = await self.cmc_service.get_coin_detail(id=id)
+        coin_detail: cmc_type.CMCCoinDetail = await schedule_fetch(
+            CMC_PROVIDER,
+            lambda: self.cmc_service.get_coin_detail(id=id),
+        )
         return coin_detail.data
 
     async def get_ohlcv_historical(
@@ -30,18 +37,25 @@ class CryptoStatsService:
         id: int,
         interval: str = '24h',
     ) -> cmc_type.OHLCVHistorical:
-        data: cmc_type.CMCOHLCVHistorical = await self.cmc_service.get_ohlcv_historical(
-            id=id,
-            interval=interval,
+        data: cmc_type.CMCOHLCVHistorical = await schedule_fetch(
+            CMC_PROVIDER,
+            lambda: self.cmc_service.get_ohlcv_historical(
+                id=id,
+                interval=interval,
+            ),
         )
         return data.data
 
     async def get_sector_detail(self, sector_id: str) -> cmc_type.SectorDetail:
-        data: cmc_type.CMCSectorDetail = await self.cmc_service.get_sector_detail(
-            sector_id=sector_id
+        data: cmc_type.CMCSectorDetail = await schedule_fetch(
+            CMC_PROVIDER,
+            lambda: self.cmc_service.get_sector_detail(sector_id=sector_id),
         )
         return data.data
 
     async def get_spotlight(self, limit=30, rank_range=500, timeframe='24h') -> cmc_type.Spotlight:
-        data: cmc_type.CMCSpotlight = await self.cmc_service.get_spotlight(limit=limit, rank_range=rank_range, timeframe=timeframe)
+        data: cmc_type.CMCSpotlight = await schedule_fetch(
+            CMC_PROVIDER,
+            lambda: self.cmc_service.get_spotlight(limit=limit, rank_range=rank_range, timeframe=timeframe),
+        )
         return data.data
@@ -2,6 +2,7 @@ from market_data_library.types import cryptoquant_type
 from market_data_library.util.exception import CryptoQuantApiError
 
 from src.data_source.market_data_library import get_crypto_api
+from src.util.fetch_scheduler import CRYPTOQUANT_PROVIDER, schedule_fetch
 
 
 class CryptoQuantService:
@@ -15,10 +16,13 @@ class CryptoQuantService:
             raise RuntimeError('CRYPTOQUANT_API_TOKEN is not configured')
 
         try:
-            return await self.cryptoquant_service.get_price_ohlcv(
-                symbol=symbol,
-                window=window,
-                limit=limit,
+            return await schedule_fetch(
+                CRYPTOQUANT_PROVIDER,
+                lambda: self.cryptoquant_service.get_price_ohlcv(
+                    symbol=symbol,
+                    window=window,
+                    limit=limit,
+                ),
             )
         except CryptoQuantApiError:
             raise
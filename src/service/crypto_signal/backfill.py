@@ -8,10 +8,12 @@ from market_data_library.types import cmc_type
 from src.service.crypto.crypto_stats import CryptoStatsService
 from src.service.crypto_signal.models import (
     CryptoSignalCoinSnapshot,
+    CryptoSignalOhlcvCandle,
     CryptoSignalRunRecord,
     CryptoSignalSnapshot,
 )
-from src.service.crypto_signal.repository import SNAPSHOT_VERSION
+from src.service.crypto_signal.repository import SNAPSHOT_VERSION, CryptoSignalRepository
+from src.util.fetch_scheduler import FetchPriority, fetch_priority
 
 
 logger = logging.getLogger('Crypto signal backfill')
@@ -21,11 +23,17 @@ logger = logging.getLogger('Crypto signal backfill')
 BACKFILL_SOURCE_NAME = 'CMC historical bootstrap'
 BACKFILL_RUNTIME_MODE = 'bootstrap'
 BACKFILL_INTERVAL = '24h'
+BACKFILL_INTERVAL_LENGTH = datetime.timedelta(hours=24)
 
 
 class CryptoSignalBackfillService:
-    def __init__(self, cmc_service: CryptoStatsService | None = None) -> None:
+    def __init__(
+        self,
+        cmc_service: CryptoStatsService | None = None,
+        candle_store: CryptoSignalRepository | None = None,
+    ) -> None:
         self.cmc_service = cmc_service or CryptoStatsService()
+        self.candle_store = candle_store
 
     async def build_snapshots(
         self,
@@ -38,40 +46,92 @@ class CryptoSignalBackfillService:
         if len(unique_entries) == 0:
             return []
 
-        history_results = await asyncio.gather(
-            *[
-                self.cmc_service.get_ohlcv_historical(
-                    id=coin_id,
-                    interval=BACKFILL_INTERVAL,
-                )
-                for _symbol, coin_id in unique_entries
-            ],
-            return_exceptions=True,
+        coin_ids = list(dict.fromkeys(coin_id for _symbol, coin_id in unique_entries))
+        window_start_utc = current_timestamp_utc - datetime.timedelta(days=days)
+        latest_stored_timestamps = (
+            self.candle_store.get_latest_ohlcv_candle_timestamps(
+                coin_ids=coin_ids,
+                interval=BACKFILL_INTERVAL,
+            )
+            if self.candle_store is not None
+            else {}
         )
+        # A completed candle newer than the stored one cannot exist until a
+        # full interval has passed since it closed, so those coins are served
+        # from the store without an upstream call.
+        fresh_after_utc = current_timestamp_utc - BACKFILL_INTERVAL_LENGTH
+        stale_entries = [
+            (symbol, coin_id)
+            for symbol, coin_id in unique_entries
+            if latest_stored_timestamps.get(coin_id) is None
+            or latest_stored_timestamps[coin_id] < fresh_after_utc
+        ]
 
-        grouped_snapshots: OrderedDict[datetime.datetime, CryptoSignalSnapshot] = (
-            OrderedDict()
-        )
-        window_start_utc = current_timestamp_utc - datetime.timedelta(days=days)
+        # Backfill requests queue behind live-run CMC calls in the shared
+        # fetch scheduler instead of bursting the provider quota.
+        with fetch_priority(FetchPriority.BACKFILL):
+            history_results = await asyncio.gather(
+                *[
+                    self.cmc_service.get_ohlcv_historical(
+                        id=coin_id,
+                        interval=BACKFILL_INTERVAL,
+                    )
+                    for _symbol, coin_id in stale_entries
+                ],
+                return_exceptions=True,
+            )
 
+        fetched_candles: dict[int, list[CryptoSignalOhlcvCandle]] = {}
         for (symbol, coin_id), history_result in zip(
-            unique_entries,
+            stale_entries,
             history_results,
             strict=False,
         ):
             if isinstance(history_result, Exception):
                 logger.warning(
-                    'Skipping crypto signal backfill for %s (%s): %s',
+                    'Skipping crypto signal backfill fetch for %s (%s): %s',
                     symbol,
                     coin_id,
                     history_result,
                 )
                 continue
-            self._merge_coin_history(
-                grouped_snapshots=grouped_snapshots,
+            fetched_candles[coin_id] = self._build_candles(
                 symbol=symbol,
                 coin_id=coin_id,
                 history=history_result,
+                current_timestamp_utc=current_timestamp_utc,
+            )
+
+        if self.candle_store is None:
+            candles_by_coin_id = fetched_candles
+        else:
+            self.candle_store.save_ohlcv_candles(
+                [candle for candles in fetched_candles.values() for candle in candles]
+            )
+            # Coins whose refresh failed still merge whatever the store holds.
+            candles_by_coin_id = self.candle_store.get_ohlcv_candles_since(
+                coin_ids=coin_ids,
+                interval=BACKFILL_INTERVAL,
+                start_timestamp_utc=window_start_utc,
+            )
+        logger.info(
+            'Crypto signal backfill: %s coins, %s fetched upstream, '
+            '%s served from the candle store',
+            len(coin_ids),
+            len(stale_entries),
+            len(coin_ids) - len(stale_entries),
+        )
+
+        grouped_snapshots: OrderedDict[datetime.datetime, CryptoSignalSnapshot] = (
+            OrderedDict()
+        )
+        for coin_id in coin_ids:
+            candles = candles_by_coin_id.get(coin_id)
+            if not candles:
+                continue
+            self._merge_coin_history(
+                grouped_snapshots=grouped_snapshots,
+                candles=candles,
                 watchlist_coin_ids=watchlist_coin_ids,
                 window_start_utc=window_start_utc,
                 current_timestamp_utc=current_timestamp_utc,
@@ -79,48 +139,72 @@ class CryptoSignalBackfillService:
 
         return list(grouped_snapshots.values())
 
-    def _merge_coin_history(
+    def _build_candles(
         self,
-        grouped_snapshots: OrderedDict[datetime.datetime, CryptoSignalSnapshot],
         symbol: str,
         coin_id: int,
         history: cmc_type.OHLCVHistorical,
-        watchlist_coin_ids: set[int],
-        window_start_utc: datetime.datetime,
         current_timestamp_utc: datetime.datetime,
-    ) -> None:
-        sorted_quotes = sorted(
-            history.quotes,
-            key=lambda quote: self._parse_quote_timestamp(quote),
-        )
-        previous_quote: cmc_type.OHLCVHistoricalQuote | None = None
-
-        for quote in sorted_quotes:
+    ) -> list[CryptoSignalOhlcvCandle]:
+        candles = []
+        for quote in history.quotes:
             quote_timestamp_utc = self._parse_quote_timestamp(quote)
             # Provider quote timestamps follow candle/bucket boundaries rather
             # than "time fetched". For 24h history, the API can still return
             # today's in-progress candle labeled with the day-end timestamp,
-            # which may be later than the current live run time. Bootstrap rows
-            # should only represent completed past observations, so skip the
-            # current/future bucket here and let the live run persist its own
-            # snapshot separately.
+            # which may be later than the current live run time. Only completed
+            # past candles are kept, so the store never holds a partial bucket
+            # and the live run persists its own snapshot separately.
             if quote_timestamp_utc >= current_timestamp_utc:
-                previous_quote = quote
                 continue
-            if quote_timestamp_utc < window_start_utc:
+            candles.append(
+                CryptoSignalOhlcvCandle(
+                    coin_id=coin_id,
+                    symbol=history.symbol or symbol,
+                    name=history.name,
+                    interval=BACKFILL_INTERVAL,
+                    candle_timestamp_utc=quote_timestamp_utc,
+                    open_usd=quote.quote.open,
+                    high_usd=quote.quote.high,
+                    low_usd=quote.quote.low,
+                    close_usd=quote.quote.close,
+                    volume_usd=quote.quote.volume,
+                )
+            )
+        return candles
+
+    def _merge_coin_history(
+        self,
+        grouped_snapshots: OrderedDict[datetime.datetime, CryptoSignalSnapshot],
+        candles: list[CryptoSignalOhlcvCandle],
+        watchlist_coin_ids: set[int],
+        window_start_utc: datetime.datetime,
+        current_timestamp_utc: datetime.datetime,
+    ) -> None:
+        sorted_candles = sorted(
+            candles,
+            key=lambda candle: candle.candle_timestamp_utc,
+        )
+        previous_candle: CryptoSignalOhlcvCandle | None = None
+
+        for candle in sorted_candles:
+            candle_timestamp_utc = candle.candle_timestamp_utc
+            if candle_timestamp_utc >= current_timestamp_utc:
+                continue
+            if candle_timestamp_utc < window_start_utc:
                 # Preserve the last earlier candle so the first retained row can
                 # still compute a 24h change from real provider history.
-                previous_quote = quote
+                previous_candle = candle
                 continue
 
-            snapshot = grouped_snapshots.get(quote_timestamp_utc)
+            snapshot = grouped_snapshots.get(candle_timestamp_utc)
             if snapshot is None:
                 # Group all coins that share the same historical timestamp into
                 # one synthetic run so bootstrap data matches the normal
                 # one-run-many-coins storage model.
                 snapshot = CryptoSignalSnapshot(
                     run=CryptoSignalRunRecord(
-                        run_timestamp_utc=quote_timestamp_utc,
+                        run_timestamp_utc=candle_timestamp_utc,
                         runtime_mode=BACKFILL_RUNTIME_MODE,
                         source_name=BACKFILL_SOURCE_NAME,
                         snapshot_version=SNAPSHOT_VERSION,
@@ -147,32 +231,34 @@ class CryptoSignalBackfillService:
                     ),
                     coins=[],
                 )
-                grouped_snapshots[quote_timestamp_utc] = snapshot
+                grouped_snapshots[candle_timestamp_utc] = snapshot
 
             snapshot.coins.append(
                 CryptoSignalCoinSnapshot(
-                    coin_id=coin_id,
-                    symbol=history.symbol or symbol,
-                    name=history.name,
-                    price_usd=quote.quote.close,
+                    coin_id=candle.coin_id,
+                    symbol=candle.symbol,
+                    name=candle.name,
+                    price_usd=candle.close_usd,
                     price_change_24h=self._calculate_change_pct(
-                        current_value=quote.quote.close,
+                        current_value=candle.close_usd,
                         previous_value=(
-                            previous_quote.quote.close if previous_quote is not None else None
+                            previous_candle.close_usd if previous_candle is not None else None
                         ),
                     ),
-                    volume_24h=quote.quote.volume,
+                    volume_24h=candle.volume_usd,
                     volume_change_pct_24h=self._calculate_change_pct(
-                        current_value=quote.quote.volume,
+                        current_value=candle.volume_usd,
                         previous_value=(
-                            previous_quote.quote.volume if previous_quote is not None else None
+                            previous_candle.volume_usd if previous_candle is not None else None
                         ),
                     ),
-                    is_watchlist=coin_id in watchlist_coin_ids,
-                    context_tags=('watchlist',) if coin_id in watchlist_coin_ids else (),
+                    is_watchlist=candle.coin_id in watchlist_coin_ids,
+                    context_tags=(
+                        ('watchlist',) if candle.coin_id in watchlist_coin_ids else ()
+                    ),
                 )
             )
-            previous_quote = quote
+            previous_candle = candle
 
     @staticmethod
     def _parse_quote_timestamp(
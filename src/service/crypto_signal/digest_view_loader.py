@@ -0,0 +1,145 @@
+from bisect import bisect_left
+
+from src.config import config
+from src.service.crypto_signal.models import (
+    CryptoSignalDigestView,
+    CryptoSignalMarketRegimeSummary,
+    CryptoSignalSnapshot,
+)
+from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+from src.service.crypto_signal.window_aggregates import (
+    build_digest_view_from_aggregates,
+)
+
+
+def load_digest_view(
+    repository,
+    latest_snapshot: CryptoSignalSnapshot,
+    window_label: str,
+    watchlist_coin_ids: set[int],
+    **view_kwargs,
+) -> CryptoSignalDigestView:
+    """Build the digest view from the cheapest source that matches the history.
+
+    Rolling window aggregates are read when they are anchored to
+    `latest_snapshot`; otherwise the window history is loaded and scored,
+    column-wise when the history cube is enabled.
+    """
+    window_aggregates = repository.get_window_aggregates(
+        latest_snapshot=latest_snapshot,
+        window_label=window_label,
+        watchlist_coin_ids=watchlist_coin_ids,
+    )
+    if window_aggregates is not None:
+        return build_digest_view_from_aggregates(
+            latest_snapshot=latest_snapshot,
+            window_aggregates=window_aggregates,
+            watchlist_coin_ids=watchlist_coin_ids,
+            window_label=window_label,
+            **view_kwargs,
+        )
+
+    window_start_utc = get_window_start(latest_snapshot, window_label=window_label)
+    if config.is_crypto_signal_history_cube_enabled():
+        # Same view as build_digest_view, scored column-wise so large
+        # tracked universes do not spend minutes in per-coin list loops.
+        # Imported here so NumPy stays optional.
+        from src.service.crypto_signal.history_cube import build_digest_view_from_cube
+
+        return build_digest_view_from_cube(
+            latest_snapshot=latest_snapshot,
+            history_cube=repository.get_history_cube_since(window_start_utc),
+            watchlist_coin_ids=watchlist_coin_ids,
+            window_label=window_label,
+            **view_kwargs,
+        )
+    return build_digest_view(
+        latest_snapshot=latest_snapshot,
+        history=repository.get_snapshots_since(window_start_utc),
+        watchlist_coin_ids=watchlist_coin_ids,
+        window_label=window_label,
+        **view_kwargs,
+    )
+
+
+def load_digest_views(
+    repository,
+    latest_snapshot: CryptoSignalSnapshot,
+    window_labels: list[str],
+    watchlist_coin_ids: set[int],
+    market_regime_summaries: dict[str, CryptoSignalMarketRegimeSummary | None] | None = None,
+    **view_kwargs,
+) -> dict[str, CryptoSignalDigestView]:
+    """Build digest views for several windows from one history load.
+
+    Windows with anchored aggregates read them directly. The rest share a
+    single load of the longest remaining window, and shorter windows are
+    sliced from it in memory instead of re-reading overlapping runs.
+    """
+    market_regime_summaries = market_regime_summaries or {}
+    window_starts_utc = {
+        window_label: get_window_start(latest_snapshot, window_label=window_label)
+        for window_label in window_labels
+    }
+    views: dict[str, CryptoSignalDigestView] = {}
+    for window_label in window_labels:
+        window_aggregates = repository.get_window_aggregates(
+            latest_snapshot=latest_snapshot,
+            window_label=window_label,
+            watchlist_coin_ids=watchlist_coin_ids,
+        )
+        if window_aggregates is not None:
+            views[window_label] = build_digest_view_from_aggregates(
+                latest_snapshot=latest_snapshot,
+                window_aggregates=window_aggregates,
+                watchlist_coin_ids=watchlist_coin_ids,
+                window_label=window_label,
+                market_regime_summary=market_regime_summaries.get(window_label),
+                **view_kwargs,
+            )
+
+    history_window_labels = [
+        window_label for window_label in window_labels if window_label not in views
+    ]
+    if history_window_labels:
+        superset_start_utc = min(
+            window_starts_utc[window_label] for window_label in history_window_labels
+        )
+        if config.is_crypto_signal_history_cube_enabled():
+            from src.service.crypto_signal.history_cube import (
+                build_digest_view_from_cube,
+                slice_history_cube_since,
+            )
+
+            superset_cube = repository.get_history_cube_since(superset_start_utc)
+            for window_label in history_window_labels:
+                views[window_label] = build_digest_view_from_cube(
+                    latest_snapshot=latest_snapshot,
+                    history_cube=slice_history_cube_since(
+                        superset_cube, window_starts_utc[window_label]
+                    ),
+                    watchlist_coin_ids=watchlist_coin_ids,
+                    window_label=window_label,
+                    market_regime_summary=market_regime_summaries.get(window_label),
+                    **view_kwargs,
+                )
+        else:
+            # get_snapshots_since returns runs oldest first, so each window is
+            # a suffix of the superset.
+            superset_history = repository.get_snapshots_since(superset_start_utc)
+            run_timestamps_utc = [
+                snapshot.run.run_timestamp_utc for snapshot in superset_history
+            ]
+            for window_label in history_window_labels:
+                first_run_index = bisect_left(
+                    run_timestamps_utc, window_starts_utc[window_label]
+                )
+                views[window_label] = build_digest_view(
+                    latest_snapshot=latest_snapshot,
+                    history=superset_history[first_run_index:],
+                    watchlist_coin_ids=watchlist_coin_ids,
+                    window_label=window_label,
+                    market_regime_summary=market_regime_summaries.get(window_label),
+                    **view_kwargs,
+                )
+    return {window_label: views[window_label] for window_label in window_labels}
@@ -0,0 +1,448 @@
+import datetime
+from bisect import bisect_left
+from dataclasses import dataclass
+from statistics import mean
+from typing import Any, Callable, Hashable, Sequence
+
+import numpy as np
+
+from src.service.crypto_signal.models import (
+    CryptoSignalCandidate,
+    CryptoSignalCoinSnapshot,
+    CryptoSignalDigestView,
+    CryptoSignalMarketRegimeSummary,
+    CryptoSignalSnapshot,
+)
+from src.service.crypto_signal.scorer import (
+    _BEARISH_ATTENTION_TAGS,
+    _BULLISH_ATTENTION_TAGS,
+    _MIN_OBSERVATIONS_TO_SCORE,
+    _build_candidate,
+    _build_scored_candidate,
+    _score_price_persistence,
+    assemble_digest_view,
+)
+
+
+# NumPy means use pairwise float summation while the list scorer uses the exact
+# `statistics.mean`. Rows whose vectorized result lands this close to a rounding
+# or threshold boundary are rescored with the exact mean so both paths agree.
+_EXACT_MEAN_RELATIVE_TOLERANCE = 1e-9
+
+@dataclass(slots=True)
+class CryptoSignalHistoryCube:
+    """Coins x runs columnar view of a crypto signal history window.
+
+    Numeric columns use NaN for NULL or absent observations; `present` marks
+    which (coin, run) cells were stored at all. Context tags are dictionary
+    encoded: `context_tag_codes` indexes `context_tag_vocabulary`, whose entry 0
+    is the empty tuple, so tag order and repeats survive for exact scoring.
+    """
+
+    run_timestamps_utc: list[datetime.datetime]
+    coin_ids: np.ndarray
+    coin_index_by_id: dict[int, int]
+    present: np.ndarray
+    price_usd: np.ndarray
+    price_change_24h: np.ndarray
+    volume_24h: np.ndarray
+    volume_change_pct_24h: np.ndarray
+    is_watchlist: np.ndarray
+    context_tag_codes: np.ndarray
+    context_tag_vocabulary: list[tuple[str, ...]]
+    # Newest observation per coin row, used when a watchlist coin is missing
+    # from the latest snapshot but still has history in the window.
+    latest_coins: list[CryptoSignalCoinSnapshot]
+
+    @property
+    def coin_count(self) -> int:
+        return len(self.latest_coins)
+
+    @property
+    def run_count(self) -> int:
+        return len(self.run_timestamps_utc)
+
+
+@dataclass(slots=True)
+class HistoryCubeColumns:
+    """One entry per stored (coin, run) observation, oldest run first.
+
+    `context_tag_keys` may hold raw stored values such as tag JSON; the cube
+    builder decodes each distinct key once.
+    """
+
+    run_indexes: Sequence[int]
+    coin_ids: Sequence[int]
+    price_usd: Sequence[float | None]
+    price_change_24h: Sequence[float | None]
+    volume_24h: Sequence[float | None]
+    volume_change_pct_24h: Sequence[float | None]
+    is_watchlist: Sequence[bool]
+    context_tag_keys: Sequence[Hashable]
+
+
+def build_history_cube(
+    run_timestamps_utc: list[datetime.datetime],
+    columns: HistoryCubeColumns,
+    load_latest_coins: Callable[[list[int]], list[CryptoSignalCoinSnapshot]],
+    decode_context_tags: Callable[[Any], tuple[str, ...]] = tuple,
+) -> CryptoSignalHistoryCube:
+    """Build a cube from observation columns.
+
+    `load_latest_coins` receives, per cube coin row, the column position of
+    that coin's newest observation and returns the matching full snapshots, so
+    text columns are only materialized once per coin rather than per cell.
+    """
+    coin_index_by_id: dict[int, int] = {}
+    coin_indexes = np.fromiter(
+        (
+            coin_index_by_id.setdefault(coin_id, len(coin_index_by_id))
+            for coin_id in columns.coin_ids
+        ),
+        dtype=np.intp,
+        count=len(columns.coin_ids),
+    )
+    context_tag_code_by_key: dict[Hashable, int] = {}
+    context_tag_codes = np.fromiter(
+        (
+            context_tag_code_by_key.setdefault(key, len(context_tag_code_by_key))
+            for key in columns.context_tag_keys
+        ),
+        dtype=np.int32,
+        count=len(columns.context_tag_keys),
+    )
+    # Keys are remapped so code 0 is the empty tuple, which absent cells use.
+    context_tag_vocabulary: list[tuple[str, ...]] = [()]
+    vocabulary_code_by_tags: dict[tuple[str, ...], int] = {(): 0}
+    vocabulary_codes = np.zeros(len(context_tag_code_by_key), dtype=np.int32)
+    for key, key_code in context_tag_code_by_key.items():
+        context_tags = decode_context_tags(key)
+        vocabulary_code = vocabulary_code_by_tags.get(context_tags)
+        if vocabulary_code is None:
+            vocabulary_code = len(context_tag_vocabulary)
+            vocabulary_code_by_tags[context_tags] = vocabulary_code
+            context_tag_vocabulary.append(context_tags)
+        vocabulary_codes[key_code] = vocabulary_code
+
+    shape = (len(coin_index_by_id), len(run_timestamps_utc))
+    cells = (coin_indexes, np.asarray(columns.run_indexes, dtype=np.intp))
+
+    def build_float_column(values: Sequence[float | None]) -> np.ndarray:
+        column = np.full(shape, np.nan, dtype=np.float64)
+        # dtype=float maps None to NaN in one C-level pass.
+        column[cells] = np.asarray(values, dtype=np.float64)
+        return column
+
+    present = np.zeros(shape, dtype=bool)
+    present[cells] = True
+    is_watchlist = np.zeros(shape, dtype=bool)
+    is_watchlist[cells] = np.asarray(columns.is_watchlist, dtype=bool)
+    context_tag_code_column = np.zeros(shape, dtype=np.int32)
+    context_tag_code_column[cells] = vocabulary_codes[context_tag_codes]
+
+    # Observations are oldest-first, so a coin's last position is its newest.
+    latest_positions = np.zeros(shape[0], dtype=np.intp)
+    latest_positions[coin_indexes] = np.arange(len(coin_indexes))
+
+    return CryptoSignalHistoryCube(
+        run_timestamps_utc=run_timestamps_utc,
+        coin_ids=np.asarray(list(coin_index_by_id), dtype=np.int64),
+        coin_index_by_id=coin_index_by_id,
+        present=present,
+        price_usd=build_float_column(columns.price_usd),
+        price_change_24h=build_float_column(columns.price_change_24h),
+        volume_24h=build_float_column(columns.volume_24h),
+        volume_change_pct_24h=build_float_column(columns.volume_change_pct_24h),
+        is_watchlist=is_watchlist,
+        context_tag_codes=context_tag_code_column,
+        context_tag_vocabulary=context_tag_vocabulary,
+        latest_coins=load_latest_coins(latest_positions.tolist()),
+    )
+
+
+def build_history_cube_from_snapshots(
+    history: list[CryptoSignalSnapshot],
+) -> CryptoSignalHistoryCube:
+    run_indexes = [
+        run_index
+        for run_index, snapshot in enumerate(history)
+        for _coin in snapshot.coins
+    ]
+    coins = [coin for snapshot in history for coin in snapshot.coins]
+    return build_history_cube(
+        run_timestamps_utc=[snapshot.run.run_timestamp_utc for snapshot in history],
+        columns=HistoryCubeColumns(
+            run_indexes=run_indexes,
+            coin_ids=[coin.coin_id for coin in coins],
+            price_usd=[coin.price_usd for coin in coins],
+            price_change_24h=[coin.price_change_24h for coin in coins],
+            volume_24h=[coin.volume_24h for coin in coins],
+            volume_change_pct_24h=[coin.volume_change_pct_24h for coin in coins],
+            is_watchlist=[coin.is_watchlist for coin in coins],
+            context_tag_keys=[coin.context_tags for coin in coins],
+        ),
+        load_latest_coins=lambda positions: [coins[position] for position in positions],
+    )
+
+
+def slice_history_cube_since(
+    history_cube: CryptoSignalHistoryCube,
+    start_timestamp_utc: datetime.datetime,
+) -> CryptoSignalHistoryCube:
+    """Narrow a cube to runs at or after `start_timestamp_utc`.
+
+    Lets a caller load the longest window once and score shorter windows from
+    it. Coin rows with no observation left in the slice are dropped, so the
+    result matches a cube loaded for the shorter window directly.
+    """
+    first_run_index = bisect_left(history_cube.run_timestamps_utc, start_timestamp_utc)
+    present = history_cube.present[:, first_run_index:]
+    kept_coin_indexes = np.flatnonzero(present.any(axis=1))
+    coin_ids = history_cube.coin_ids[kept_coin_indexes]
+    return CryptoSignalHistoryCube(
+        run_timestamps_utc=history_cube.run_timestamps_utc[first_run_index:],
+        coin_ids=coin_ids,
+        coin_index_by_id={
+            int(coin_id): coin_index for coin_index, coin_id in enumerate(coin_ids)
+        },
+        present=present[kept_coin_indexes],
+        price_usd=history_cube.price_usd[kept_coin_indexes, first_run_index:],
+        price_change_24h=history_cube.price_change_24h[
+            kept_coin_indexes, first_run_index:
+        ],
+        volume_24h=history_cube.volume_24h[kept_coin_indexes, first_run_index:],
+        volume_change_pct_24h=history_cube.volume_change_pct_24h[
+            kept_coin_indexes, first_run_index:
+        ],
+        is_watchlist=history_cube.is_watchlist[kept_coin_indexes, first_run_index:],
+        context_tag_codes=history_cube.context_tag_codes[
+            kept_coin_indexes, first_run_index:
+        ],
+        context_tag_vocabulary=history_cube.context_tag_vocabulary,
+        # A coin's newest observation is in every suffix slice that keeps it.
+        latest_coins=[
+            history_cube.latest_coins[coin_index] for coin_index in kept_coin_indexes
+        ],
+    )
+
+
+@dataclass(slots=True)
+class _CubeScores:
+    observation_count: np.ndarray
+    window_price_change_pct: np.ndarray
+    price_persistence_score: np.ndarray
+    volume_confirmation_score: np.ndarray
+    attention_persistence_score: np.ndarray
+    breadth_alignment_score: np.ndarray
+
+
+def build_digest_view_from_cube(
+    latest_snapshot: CryptoSignalSnapshot,
+    history_cube: CryptoSignalHistoryCube,
+    watchlist_coin_ids: set[int],
+    window_label: str,
+    tracked_universe_coin_ids: set[int] | None = None,
+    limit: int = 3,
+    min_dynamic_price_usd: float = 1.0,
+    min_dynamic_volume_24h: float = 50_000_000.0,
+    market_regime_summary: CryptoSignalMarketRegimeSummary | None = None,
+) -> CryptoSignalDigestView:
+    """Vectorized equivalent of `scorer.build_digest_view`.
+
+    Component scores for every coin row are computed in one pass over the cube
+    and fed through the same candidate and ranking code as the list scorer, so
+    the returned view is identical for the same history window.
+    """
+    scores = _score_history_cube(history_cube)
+
+    def build_cube_candidate(
+        latest_coin: CryptoSignalCoinSnapshot,
+    ) -> CryptoSignalCandidate:
+        coin_index = history_cube.coin_index_by_id.get(latest_coin.coin_id)
+        if coin_index is None:
+            # Mirrors the list scorer's single-observation fallback when the
+            # latest coin is outside the loaded history window.
+            return _build_candidate(
+                latest_coin=latest_coin,
+                history=[latest_coin],
+                latest_snapshot=latest_snapshot,
+                window_label=window_label,
+            )
+        window_price_change_pct = scores.window_price_change_pct[coin_index]
+        return _build_scored_candidate(
+            latest_coin=latest_coin,
+            latest_snapshot=latest_snapshot,
+            window_label=window_label,
+            observation_count=int(scores.observation_count[coin_index]),
+            window_price_change_pct=(
+                None
+                if np.isnan(window_price_change_pct)
+                else float(window_price_change_pct)
+            ),
+            price_persistence_score=int(scores.price_persistence_score[coin_index]),
+            volume_confirmation_score=int(
+                scores.volume_confirmation_score[coin_index]
+            ),
+            attention_persistence_score=int(
+                scores.attention_persistence_score[coin_index]
+            ),
+            breadth_alignment_score=int(scores.breadth_alignment_score[coin_index]),
+        )
+
+    def build_missing_watchlist_candidate(
+        coin_id: int,
+    ) -> CryptoSignalCandidate | None:
+        coin_index = history_cube.coin_index_by_id.get(coin_id)
+        if coin_index is None:
+            return None
+        return build_cube_candidate(history_cube.latest_coins[coin_index])
+
+    latest_coins_by_id = {coin.coin_id: coin for coin in latest_snapshot.coins}
+    return assemble_digest_view(
+        latest_snapshot=latest_snapshot,
+        candidates=[
+            build_cube_candidate(latest_coin)
+            for latest_coin in latest_coins_by_id.values()
+        ],
+        build_missing_watchlist_candidate=build_missing_watchlist_candidate,
+        watchlist_coin_ids=watchlist_coin_ids,
+        window_label=window_label,
+        tracked_universe_coin_ids=tracked_universe_coin_ids,
+        limit=limit,
+        min_dynamic_price_usd=min_dynamic_price_usd,
+        min_dynamic_volume_24h=min_dynamic_volume_24h,
+        market_regime_summary=market_regime_summary,
+    )
+
+
+def _score_history_cube(history_cube: CryptoSignalHistoryCube) -> _CubeScores:
+    present = history_cube.present
+    observation_count = present.sum(axis=1)
+
+    price_changes = history_cube.price_change_24h
+    has_price_change = ~np.isnan(price_changes)
+    price_change_count = has_price_change.sum(axis=1)
+    positive_hits = (price_changes > 0).sum(axis=1)
+    negative_hits = (price_changes < 0).sum(axis=1)
+    price_change_sum = np.where(has_price_change, price_changes, 0.0).sum(axis=1)
+    price_change_abs_sum = np.abs(
+        np.where(has_price_change, price_changes, 0.0)
+    ).sum(axis=1)
+    has_any_price_change = price_change_count > 0
+    safe_price_change_count = np.maximum(price_change_count, 1)
+    balance = (positive_hits - negative_hits) / safe_price_change_count
+    average_change = price_change_sum / safe_price_change_count
+    average_component = np.clip(average_change / 15.0, -1.0, 1.0)
+    raw_price_score = np.clip((balance * 0.7 + average_component * 0.3) * 4, -4, 4)
+    # np.rint rounds half to even like the builtin round() the list scorer uses.
+    price_persistence_score = np.where(
+        has_any_price_change,
+        np.rint(raw_price_score),
+        0,
+    ).astype(np.int64)
+    price_score_tolerance = _EXACT_MEAN_RELATIVE_TOLERANCE * (
+        1 + price_change_abs_sum / safe_price_change_count
+    )
+    ambiguous_price_rows = has_any_price_change & (
+        np.abs(raw_price_score - (np.floor(raw_price_score) + 0.5))
+        <= price_score_tolerance
+    )
+    for coin_index in np.flatnonzero(ambiguous_price_rows):
+        price_persistence_score[coin_index] = _score_price_persistence(
+            price_changes[coin_index][has_price_change[coin_index]].tolist()
+        )
+
+    scorable = observation_count >= _MIN_OBSERVATIONS_TO_SCORE
+    price_persistence_score = np.where(scorable, price_persistence_score, 0)
+    trend_sign = np.sign(price_persistence_score)
+
+    volume_changes = history_cube.volume_change_pct_24h
+    has_volume_change = ~np.isnan(volume_changes)
+    volume_change_count = has_volume_change.sum(axis=1)
+    safe_volume_change_count = np.maximum(volume_change_count, 1)
+    filled_volume_changes = np.where(has_volume_change, volume_changes, 0.0)
+    average_volume_change = filled_volume_changes.sum(axis=1) / safe_volume_change_count
+    is_volume_confirmed = (volume_change_count > 0) & (average_volume_change >= 15)
+    volume_tolerance = _EXACT_MEAN_RELATIVE_TOLERANCE * (
+        1 + np.abs(filled_volume_changes).sum(axis=1) / safe_volume_change_count
+    )
+    ambiguous_volume_rows = (
+        (trend_sign != 0)
+        & (volume_change_count > 0)
+        & (np.abs(average_volume_change - 15) <= volume_tolerance)
+    )
+    for coin_index in np.flatnonzero(ambiguous_volume_rows):
+        is_volume_confirmed[coin_index] = (
+            mean(volume_changes[coin_index][has_volume_change[coin_index]].tolist())
+            >= 15
+        )
+    volume_confirmation_score = np.where(is_volume_confirmed, trend_sign * 2, 0)
+
+    # Tag scoring runs once per distinct tag tuple and is gathered per cell.
+    vocabulary = history_cube.context_tag_vocabulary
+    tag_codes = history_cube.context_tag_codes
+    bullish_hits_by_code = np.asarray(
+        [sum(1 for tag in tags if tag in _BULLISH_ATTENTION_TAGS) for tags in vocabulary],
+        dtype=np.int64,
+    )
+    bearish_hits_by_code = np.asarray(
+        [sum(1 for tag in tags if tag in _BEARISH_ATTENTION_TAGS) for tags in vocabulary],
+        dtype=np.int64,
+    )
+    has_sector_leader_by_code = np.asarray(
+        ['sector_leader_strongest' in tags for tags in vocabulary],
+        dtype=bool,
+    )
+    has_sector_loser_by_code = np.asarray(
+        ['sector_loser_weakest' in tags for tags in vocabulary],
+        dtype=bool,
+    )
+    spotlight_hits = np.where(
+        trend_sign > 0,
+        bullish_hits_by_code[tag_codes].sum(axis=1),
+        bearish_hits_by_code[tag_codes].sum(axis=1),
+    )
+    attention_persistence_score = np.select(
+        [spotlight_hits >= 4, spotlight_hits >= 2],
+        [trend_sign * 2, trend_sign],
+        0,
+    )
+    breadth_alignment_score = np.select(
+        [
+            (trend_sign > 0) & has_sector_leader_by_code[tag_codes].any(axis=1),
+            (trend_sign < 0) & has_sector_loser_by_code[tag_codes].any(axis=1),
+        ],
+        [1, -1],
+        0,
+    )
+
+    # First-to-last return over cells with a positive price, as in
+    # `_calculate_window_price_change_pct`.
+    is_priced = history_cube.price_usd > 0
+    priced_count = is_priced.sum(axis=1)
+    run_count = history_cube.run_count
+    if run_count == 0:
+        first_priced_index = last_priced_index = np.zeros(0, dtype=np.intp)
+    else:
+        first_priced_index = is_priced.argmax(axis=1)
+        last_priced_index = run_count - 1 - is_priced[:, ::-1].argmax(axis=1)
+    coin_rows = np.arange(history_cube.coin_count)
+    first_price = history_cube.price_usd[coin_rows, first_priced_index]
+    last_price = history_cube.price_usd[coin_rows, last_priced_index]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        window_price_change_pct = np.where(
+            priced_count >= 2,
+            ((last_price - first_price) / first_price) * 100,
+            np.nan,
+        )
+
+    return _CubeScores(
+        observation_count=observation_count,
+        window_price_change_pct=window_price_change_pct,
+        price_persistence_score=price_persistence_score,
+        volume_confirmation_score=np.where(scorable, volume_confirmation_score, 0),
+        attention_persistence_score=np.where(
+            scorable, attention_persistence_score, 0
+        ),
+        breadth_alignment_score=np.where(scorable, breadth_alignment_score, 0),
+    )
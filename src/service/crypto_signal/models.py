@@ -1,5 +1,6 @@
 import datetime
 from dataclasses import dataclass, field
+from fractions import Fraction
 
 
 CALIBRATION_FOLLOW_UP_CONTEXT_TAG = 'calibration_follow_up'
@@ -125,6 +126,45 @@ class CryptoSignalDigestView:
     watchlist_candidates: list[CryptoSignalCandidate] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class CryptoSignalWindowAggregate:
+    window_label: str
+    coin_id: int
+    observation_count: int = 0
+    price_change_count: int = 0
+    price_change_positive_count: int = 0
+    price_change_negative_count: int = 0
+    # Exact sums keep the aggregate mean identical to `statistics.mean` over
+    # the same window, even after many incremental adds and expiries.
+    price_change_sum: Fraction = Fraction(0)
+    volume_change_count: int = 0
+    volume_change_sum: Fraction = Fraction(0)
+    bullish_attention_hits: int = 0
+    bearish_attention_hits: int = 0
+    sector_leader_count: int = 0
+    sector_loser_count: int = 0
+    priced_count: int = 0
+    first_priced_run_timestamp_utc: datetime.datetime | None = None
+    first_price_usd: float | None = None
+    last_priced_run_timestamp_utc: datetime.datetime | None = None
+    last_price_usd: float | None = None
+    last_observed_run_id: int | None = None
+    last_observed_run_timestamp_utc: datetime.datetime | None = None
+
+
+@dataclass(slots=True)
+class CryptoSignalWindowAggregates:
+    window_label: str
+    anchor_run_timestamp_utc: datetime.datetime
+    aggregates_by_coin_id: dict[int, CryptoSignalWindowAggregate] = field(
+        default_factory=dict
+    )
+    # Newest in-window observation for watchlist coins the latest run omitted.
+    latest_coins_by_id: dict[int, CryptoSignalCoinSnapshot] = field(
+        default_factory=dict
+    )
+
+
 @dataclass(slots=True)
 class CryptoSignalCandidateCohort:
     signal_run_timestamp_utc: datetime.datetime
@@ -167,3 +207,17 @@ class CryptoSignalCandidateOutcome:
     resolved_run_timestamp_utc: datetime.datetime | None = None
     created_at_utc: datetime.datetime | None = None
     updated_at_utc: datetime.datetime | None = None
+
+
+@dataclass(slots=True)
+class CryptoSignalOhlcvCandle:
+    coin_id: int
+    symbol: str
+    name: str
+    interval: str
+    candle_timestamp_utc: datetime.datetime
+    open_usd: float | None
+    high_usd: float | None
+    low_usd: float | None
+    close_usd: float | None
+    volume_usd: float | None
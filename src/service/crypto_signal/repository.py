@@ -1,10 +1,12 @@
 import datetime
 import json
 import sqlite3
+from fractions import Fraction
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, ContextManager, Iterable
 
 from src.config import config
+from src.db.sqlite import SqliteConnectionManager
 from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE, RuntimeMode
 from src.service.crypto_signal.models import (
     CryptoSignalCandidateCohort,
@@ -13,12 +15,29 @@ from src.service.crypto_signal.models import (
     CryptoSignalDigestView,
     CryptoSignalMarketRegimeMetric,
     CryptoSignalMarketRegimeSnapshot,
+    CryptoSignalOhlcvCandle,
     CryptoSignalRunRecord,
     CryptoSignalSnapshot,
+    CryptoSignalWindowAggregate,
+    CryptoSignalWindowAggregates,
 )
+from src.service.crypto_signal.window_aggregates import (
+    FIRST_PRICED_EDGE,
+    LAST_OBSERVED_EDGE,
+    LAST_PRICED_EDGE,
+    WINDOW_AGGREGATE_LENGTHS,
+    WindowAggregateObservation,
+    apply_window_observation,
+)
+from src.util.metrics import instrument_sqlite_repository
+
+if TYPE_CHECKING:
+    from src.service.crypto_signal.history_cube import CryptoSignalHistoryCube
 
 
 SNAPSHOT_VERSION = 1
+# Bump when init_schema() DDL changes so long-lived processes re-run it once.
+SCHEMA_VERSION = 4
 BTC_COIN_ID = 1
 ETH_COIN_ID = 1027
 OUTCOME_WINDOWS = {
@@ -30,10 +49,64 @@ OUTCOME_MAX_FOLLOW_UP_LAG = datetime.timedelta(hours=12)
 OUTCOME_STATUS_PENDING = 'pending'
 OUTCOME_STATUS_RESOLVED = 'resolved'
 OUTCOME_STATUS_MISSING = 'missing'
+# Stay well below SQLite's default bound-parameter limit in IN (...) lookups.
+_SQLITE_IN_CHUNK_SIZE = 500
+_WINDOW_AGGREGATES_ANCHOR_KEY = 'window_aggregates_anchor_utc'
+# Scheduled collections re-fetch overlapping history under later snapshots.
+# Only a newer version of a fact replaces the stored one: a later observation,
+# or a later write of the same observation.
+_INSERT_LATEST_MARKET_REGIME_METRIC_SQL = """
+    INSERT INTO crypto_signal_market_regime_latest_metrics (
+        runtime_mode,
+        asset_symbol,
+        metric_name,
+        source_timestamp_utc,
+        provider,
+        venue_scope,
+        instrument_scope,
+        interval,
+        metric_value,
+        unit,
+        snapshot_id,
+        snapshot_observed_at_utc,
+        created_at_utc
+    )
+"""
+_LATEST_MARKET_REGIME_METRIC_CONFLICT_SQL = """
+    ON CONFLICT (
+        runtime_mode,
+        asset_symbol,
+        metric_name,
+        source_timestamp_utc,
+        provider,
+        venue_scope,
+        instrument_scope,
+        interval
+    ) DO UPDATE SET
+        metric_value=excluded.metric_value,
+        unit=excluded.unit,
+        snapshot_id=excluded.snapshot_id,
+        snapshot_observed_at_utc=excluded.snapshot_observed_at_utc,
+        created_at_utc=excluded.created_at_utc
+    WHERE (
+        excluded.snapshot_observed_at_utc,
+        excluded.created_at_utc,
+        excluded.snapshot_id
+    ) >= (
+        crypto_signal_market_regime_latest_metrics.snapshot_observed_at_utc,
+        crypto_signal_market_regime_latest_metrics.created_at_utc,
+        crypto_signal_market_regime_latest_metrics.snapshot_id
+    )
+"""
+_UPSERT_LATEST_MARKET_REGIME_METRIC_SQL = (
+    _INSERT_LATEST_MARKET_REGIME_METRIC_SQL
+    + 'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    + _LATEST_MARKET_REGIME_METRIC_CONFLICT_SQL
+)
 
 SCHEMA_DOCS = {
     'crypto_signal_metadata': {
-        'key': 'Metadata key. Phase 1 uses schema_version.',
+        'key': 'Metadata key, such as schema_version or window_aggregates_anchor_utc.',
         'value': 'Metadata value stored as text.',
     },
     'crypto_signal_runs': {
@@ -97,6 +170,21 @@ SCHEMA_DOCS = {
         'source_timestamp_utc': 'Provider source timestamp for the metric value.',
         'created_at_utc': 'UTC write timestamp for the persisted metric row.',
     },
+    'crypto_signal_market_regime_latest_metrics': {
+        'runtime_mode': 'Runtime mode label of the snapshot that last wrote the value.',
+        'asset_symbol': 'Benchmark asset symbol, initially BTC.',
+        'metric_name': 'Stable metric name, such as open_interest_usd or funding_rate.',
+        'source_timestamp_utc': 'Provider source timestamp for the metric value.',
+        'provider': 'Provider name, such as coinalyze or binance.',
+        'venue_scope': 'Exchange or aggregate venue scope.',
+        'instrument_scope': 'Provider instrument scope or symbol.',
+        'interval': 'Sampling interval for the stored metric.',
+        'metric_value': 'Latest observed numeric value for this source timestamp.',
+        'unit': 'Metric unit, such as usd or percent.',
+        'snapshot_id': 'Regime snapshot that last wrote the value.',
+        'snapshot_observed_at_utc': 'Observation timestamp of that snapshot; newer observations win.',
+        'created_at_utc': 'UTC write timestamp of the latest value.',
+    },
     'crypto_signal_candidate_cohorts': {
         'cohort_id': 'Synthetic emitted-candidate cohort identifier.',
         'signal_run_timestamp_utc': 'UTC timestamp for the operator signal run.',
@@ -126,9 +214,44 @@ SCHEMA_DOCS = {
         'eth_relative_return_pct': 'Candidate return minus ETH return.',
         'missing_reason': 'Reason an outcome could not be resolved.',
     },
+    'crypto_signal_window_aggregates': {
+        'window_label': 'Digest window the aggregate covers, such as 7d.',
+        'coin_id': 'CMC coin identifier.',
+        'observation_count': 'Coin snapshot rows inside the window.',
+        'price_change_count': 'Rows with a non-null 24h price change.',
+        'price_change_positive_count': 'Rows with a positive 24h price change.',
+        'price_change_negative_count': 'Rows with a negative 24h price change.',
+        'price_change_sum': 'Exact rational sum of 24h price changes, stored as text.',
+        'volume_change_count': 'Rows with a non-null 24h volume change.',
+        'volume_change_sum': 'Exact rational sum of 24h volume changes, stored as text.',
+        'bullish_attention_hits': 'Bullish spotlight tag occurrences inside the window.',
+        'bearish_attention_hits': 'Bearish spotlight tag occurrences inside the window.',
+        'sector_leader_count': 'Rows tagged sector_leader_strongest.',
+        'sector_loser_count': 'Rows tagged sector_loser_weakest.',
+        'priced_count': 'Rows with a positive USD price.',
+        'first_priced_run_timestamp_utc': 'Oldest run in the window with a positive price.',
+        'first_price_usd': 'Price at first_priced_run_timestamp_utc.',
+        'last_priced_run_timestamp_utc': 'Newest run in the window with a positive price.',
+        'last_price_usd': 'Price at last_priced_run_timestamp_utc.',
+        'last_observed_run_id': 'Newest run in the window that observed the coin.',
+        'last_observed_run_timestamp_utc': 'Timestamp of last_observed_run_id.',
+    },
+    'crypto_signal_ohlcv_candles': {
+        'coin_id': 'CMC coin identifier.',
+        'interval': 'Provider candle interval, such as 24h.',
+        'candle_timestamp_utc': 'Provider candle close timestamp in UTC.',
+        'symbol': 'Coin ticker reported with the candle history.',
+        'name': 'Coin display name reported with the candle history.',
+        'open_usd': 'Candle open price in USD.',
+        'high_usd': 'Candle high price in USD.',
+        'low_usd': 'Candle low price in USD.',
+        'close_usd': 'Candle close price in USD.',
+        'volume_usd': 'Candle volume in USD.',
+    },
 }
 
 
+@instrument_sqlite_repository('crypto_signal')
 class CryptoSignalRepository:
     def __init__(
         self,
@@ -143,10 +266,13 @@ class CryptoSignalRepository:
         )
 
     def init_schema(self) -> None:
-        db_parent = Path(self.db_path).parent
-        db_parent.mkdir(parents=True, exist_ok=True)
+        connection_manager = self._connection_manager()
+        # The DDL batch is idempotent but not free; run it once per process and
+        # DB path instead of before every write.
+        if connection_manager.schema_version == SCHEMA_VERSION:
+            return
 
-        with self._connect() as connection:
+        with connection_manager.writer() as connection:
             connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS crypto_signal_metadata (
@@ -264,6 +390,45 @@ class CryptoSignalRepository:
                 ON crypto_signal_market_regime_metrics (metric_name, source_timestamp_utc)
                 """
             )
+            # Each collection re-fetches the whole backfill window, so reads
+            # come from this one-row-per-fact table instead of the observation
+            # log. The primary key leads with the read filters and, without a
+            # rowid, holds every column, so window reads are a covering range
+            # scan.
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crypto_signal_market_regime_latest_metrics (
+                    runtime_mode TEXT NOT NULL,
+                    asset_symbol TEXT NOT NULL,
+                    metric_name TEXT NOT NULL,
+                    source_timestamp_utc TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    venue_scope TEXT NOT NULL,
+                    instrument_scope TEXT NOT NULL,
+                    interval TEXT NOT NULL,
+                    metric_value REAL NULL,
+                    unit TEXT NOT NULL,
+                    snapshot_id INTEGER NOT NULL,
+                    snapshot_observed_at_utc TEXT NOT NULL,
+                    created_at_utc TEXT NOT NULL,
+                    PRIMARY KEY (
+                        runtime_mode,
+                        asset_symbol,
+                        metric_name,
+                        source_timestamp_utc,
+                        provider,
+                        venue_scope,
+                        instrument_scope,
+                        interval
+                    )
+                ) WITHOUT ROWID
+                """
+            )
+            if connection.execute(
+                'SELECT 1 FROM crypto_signal_market_regime_latest_metrics LIMIT 1'
+            ).fetchone() is None:
+                # First run after an upgrade: seed from the observation log.
+                self._backfill_latest_market_regime_metrics(connection)
             connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS crypto_signal_candidate_cohorts (
@@ -341,6 +506,53 @@ class CryptoSignalRepository:
                 )
                 """
             )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crypto_signal_window_aggregates (
+                    window_label TEXT NOT NULL,
+                    coin_id INTEGER NOT NULL,
+                    observation_count INTEGER NOT NULL,
+                    price_change_count INTEGER NOT NULL,
+                    price_change_positive_count INTEGER NOT NULL,
+                    price_change_negative_count INTEGER NOT NULL,
+                    price_change_sum TEXT NOT NULL,
+                    volume_change_count INTEGER NOT NULL,
+                    volume_change_sum TEXT NOT NULL,
+                    bullish_attention_hits INTEGER NOT NULL,
+                    bearish_attention_hits INTEGER NOT NULL,
+                    sector_leader_count INTEGER NOT NULL,
+                    sector_loser_count INTEGER NOT NULL,
+                    priced_count INTEGER NOT NULL,
+                    first_priced_run_timestamp_utc TEXT NULL,
+                    first_price_usd REAL NULL,
+                    last_priced_run_timestamp_utc TEXT NULL,
+                    last_price_usd REAL NULL,
+                    last_observed_run_id INTEGER NULL,
+                    last_observed_run_timestamp_utc TEXT NULL,
+                    PRIMARY KEY (window_label, coin_id)
+                )
+                """
+            )
+            # Completed provider candles are immutable, so bootstrap backfill
+            # keeps them here and only asks CMC again once a newer candle can
+            # exist. The primary key doubles as the per-coin range index.
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crypto_signal_ohlcv_candles (
+                    coin_id INTEGER NOT NULL,
+                    interval TEXT NOT NULL,
+                    candle_timestamp_utc TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    open_usd REAL NULL,
+                    high_usd REAL NULL,
+                    low_usd REAL NULL,
+                    close_usd REAL NULL,
+                    volume_usd REAL NULL,
+                    PRIMARY KEY (coin_id, interval, candle_timestamp_utc)
+                ) WITHOUT ROWID
+                """
+            )
             # Current phase-1 reads filter one run via the (run_id, coin_id)
             # primary key, then sort a small per-run coin set in memory. Add a
             # (run_id, symbol, coin_id) index only if that per-run sort becomes
@@ -351,15 +563,15 @@ class CryptoSignalRepository:
                 VALUES ('schema_version', ?)
                 ON CONFLICT(key) DO UPDATE SET value=excluded.value
                 """,
-                (str(SNAPSHOT_VERSION),),
+                (str(SCHEMA_VERSION),),
             )
-            connection.commit()
+        connection_manager.schema_version = SCHEMA_VERSION
 
     def save_snapshot(self, snapshot: CryptoSignalSnapshot) -> CryptoSignalSnapshot:
         self.init_schema()
         created_at_utc = self._utcnow()
 
-        with self._connect() as connection:
+        with self._write_connection() as connection:
             cursor = connection.execute(
                 """
                 INSERT INTO crypto_signal_runs (
@@ -444,7 +656,24 @@ class CryptoSignalRepository:
                     for coin in snapshot.coins
                 ],
             )
-            connection.commit()
+            # Keep the rolling digest aggregates in the same transaction so a
+            # reader never sees a run the aggregates do not reflect yet.
+            run_timestamp_utc = self._normalize_timestamp(
+                snapshot.run.run_timestamp_utc
+            )
+            self._refresh_window_aggregates(
+                connection=connection,
+                run_timestamp_utc=run_timestamp_utc,
+                removed_observations=[],
+                added_observations=[
+                    self._build_window_observation(
+                        coin=coin,
+                        run_id=run_id,
+                        run_timestamp_utc=run_timestamp_utc,
+                    )
+                    for coin in snapshot.coins
+                ],
+            )
 
         snapshot.run.run_id = run_id
         snapshot.run.created_at_utc = created_at_utc
@@ -463,7 +692,7 @@ class CryptoSignalRepository:
         if len(cohorts) == 0:
             return []
 
-        with self._connect() as connection:
+        with self._write_connection() as connection:
             for cohort in cohorts:
                 self._upsert_candidate_cohort(
                     connection=connection,
@@ -481,7 +710,6 @@ class CryptoSignalRepository:
                     cohort=cohort,
                     created_at_utc=created_at_utc,
                 )
-            connection.commit()
         return cohorts
 
     def get_unresolved_candidate_follow_up_entries(
@@ -491,7 +719,7 @@ class CryptoSignalRepository:
     ) -> list[tuple[str, int]]:
         if not Path(self.db_path).exists():
             return []
-        with self._connect() as connection:
+        with self._read_connection() as connection:
             try:
                 rows = connection.execute(
                     """
@@ -527,44 +755,127 @@ class CryptoSignalRepository:
         self.init_schema()
         updated_at_utc = self._utcnow()
 
-        with self._connect() as connection:
+        with self._write_connection() as connection:
+            # Resolve every due outcome in one statement: the follow-up and
+            # baseline runs come from indexed scalar subqueries, and prices are
+            # joined by (run_id, coin_id) primary key. A backlog after a job
+            # outage is then one read and one batched write, not 4+ queries
+            # per outcome.
             due_rows = connection.execute(
                 """
+                WITH due AS (
+                    SELECT
+                        outcome.cohort_id,
+                        outcome.outcome_window,
+                        outcome.target_timestamp_utc,
+                        cohort.coin_id,
+                        cohort.baseline_price_usd,
+                        (
+                            SELECT run.run_id
+                            FROM crypto_signal_runs AS run
+                            WHERE run.runtime_mode = cohort.runtime_mode
+                              AND run.run_timestamp_utc >= outcome.target_timestamp_utc
+                            ORDER BY run.run_timestamp_utc ASC
+                            LIMIT 1
+                        ) AS outcome_run_id,
+                        (
+                            SELECT run.run_id
+                            FROM crypto_signal_runs AS run
+                            WHERE run.runtime_mode = cohort.runtime_mode
+                              AND run.run_timestamp_utc = cohort.signal_run_timestamp_utc
+                            LIMIT 1
+                        ) AS baseline_run_id
+                    FROM crypto_signal_candidate_outcomes AS outcome
+                    INNER JOIN crypto_signal_candidate_cohorts AS cohort
+                      ON cohort.cohort_id = outcome.cohort_id
+                    WHERE cohort.runtime_mode = ?
+                      AND outcome.status NOT IN (?, ?)
+                      AND outcome.target_timestamp_utc <= ?
+                )
                 SELECT
-                    outcome.*,
-                    cohort.signal_run_timestamp_utc,
-                    cohort.runtime_mode,
-                    cohort.coin_id,
-                    cohort.baseline_price_usd
-                FROM crypto_signal_candidate_outcomes AS outcome
-                INNER JOIN crypto_signal_candidate_cohorts AS cohort
-                  ON cohort.cohort_id = outcome.cohort_id
-                WHERE cohort.runtime_mode = ?
-                  AND outcome.status NOT IN (?, ?)
-                  AND outcome.target_timestamp_utc <= ?
-                ORDER BY outcome.target_timestamp_utc ASC, cohort.coin_id ASC
+                    due.cohort_id,
+                    due.outcome_window,
+                    due.target_timestamp_utc,
+                    due.baseline_price_usd,
+                    outcome_run.run_timestamp_utc AS resolved_run_timestamp_utc,
+                    candidate.price_usd AS candidate_price_usd,
+                    btc.price_usd AS btc_price_usd,
+                    eth.price_usd AS eth_price_usd,
+                    baseline_btc.price_usd AS btc_baseline_price_usd,
+                    baseline_eth.price_usd AS eth_baseline_price_usd
+                FROM due
+                LEFT JOIN crypto_signal_runs AS outcome_run
+                  ON outcome_run.run_id = due.outcome_run_id
+                LEFT JOIN crypto_signal_coin_snapshots AS candidate
+                  ON candidate.run_id = due.outcome_run_id
+                 AND candidate.coin_id = due.coin_id
+                LEFT JOIN crypto_signal_coin_snapshots AS btc
+                  ON btc.run_id = due.outcome_run_id
+                 AND btc.coin_id = ?
+                LEFT JOIN crypto_signal_coin_snapshots AS eth
+                  ON eth.run_id = due.outcome_run_id
+                 AND eth.coin_id = ?
+                LEFT JOIN crypto_signal_coin_snapshots AS baseline_btc
+                  ON baseline_btc.run_id = due.baseline_run_id
+                 AND baseline_btc.coin_id = ?
+                LEFT JOIN crypto_signal_coin_snapshots AS baseline_eth
+                  ON baseline_eth.run_id = due.baseline_run_id
+                 AND baseline_eth.coin_id = ?
+                ORDER BY due.target_timestamp_utc ASC, due.coin_id ASC
                 """,
                 (
                     runtime_mode,
                     OUTCOME_STATUS_RESOLVED,
                     OUTCOME_STATUS_MISSING,
                     self._format_timestamp(current_timestamp_utc),
+                    BTC_COIN_ID,
+                    ETH_COIN_ID,
+                    BTC_COIN_ID,
+                    ETH_COIN_ID,
                 ),
             ).fetchall()
-            resolved_outcomes = []
-            for row in due_rows:
-                outcome = self._resolve_candidate_outcome_row(
-                    connection=connection,
+            # A backlog repeats a few hundred distinct run timestamps across
+            # tens of thousands of rows, so convert each one once per batch.
+            timestamps_by_text: dict[str, datetime.datetime] = {}
+            resolved_outcomes = [
+                self._build_resolved_candidate_outcome(
                     row=row,
                     updated_at_utc=updated_at_utc,
+                    timestamps_by_text=timestamps_by_text,
                 )
-                self._update_candidate_outcome(
-                    connection=connection,
-                    outcome=outcome,
-                    updated_at_utc=updated_at_utc,
-                )
-                resolved_outcomes.append(outcome)
-            connection.commit()
+                for row in due_rows
+            ]
+            texts_by_timestamp = {
+                timestamp: text for text, timestamp in timestamps_by_text.items()
+            }
+            updated_at_text = self._format_timestamp(updated_at_utc)
+            connection.executemany(
+                """
+                UPDATE crypto_signal_candidate_outcomes
+                SET status = ?,
+                    candidate_price_usd = ?,
+                    btc_price_usd = ?,
+                    eth_price_usd = ?,
+                    absolute_return_pct = ?,
+                    btc_relative_return_pct = ?,
+                    eth_relative_return_pct = ?,
+                    missing_reason = ?,
+                    resolved_run_timestamp_utc = ?,
+                    updated_at_utc = ?
+                WHERE cohort_id = ?
+                  AND outcome_window = ?
+                """,
+                [
+                    self._serialize_candidate_outcome_update(
+                        outcome=outcome,
+                        resolved_run_timestamp_text=texts_by_timestamp.get(
+                            outcome.resolved_run_timestamp_utc
+                        ),
+                        updated_at_text=updated_at_text,
+                    )
+                    for outcome in resolved_outcomes
+                ],
+            )
         return resolved_outcomes
 
     def save_market_regime_snapshot(
@@ -574,7 +885,7 @@ class CryptoSignalRepository:
         self.init_schema()
         created_at_utc = self._utcnow()
 
-        with self._connect() as connection:
+        with self._write_connection() as connection:
             connection.execute(
                 """
                 INSERT INTO crypto_signal_market_regime_snapshots (
@@ -636,31 +947,45 @@ class CryptoSignalRepository:
             ).fetchone()
             snapshot_id = int(snapshot_row['snapshot_id'])
             connection.executemany(
-                """
-                INSERT INTO crypto_signal_market_regime_metrics (
-                    snapshot_id,
-                    metric_name,
-                    metric_value,
-                    unit,
-                    source_timestamp_utc,
-                    created_at_utc
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT (snapshot_id, metric_name, source_timestamp_utc)
-                DO UPDATE SET
-                    metric_value=excluded.metric_value,
-                    unit=excluded.unit,
-                    created_at_utc=excluded.created_at_utc
-                """,
+                _UPSERT_LATEST_MARKET_REGIME_METRIC_SQL,
                 [
-                    self._serialize_market_regime_metric(
+                    self._serialize_latest_market_regime_metric(
                         metric=metric,
+                        snapshot=snapshot,
                         snapshot_id=snapshot_id,
                         created_at_utc=created_at_utc,
                     )
                     for metric in snapshot.metrics
                 ],
             )
-            connection.commit()
+            # The raw observation log is an optional audit trail; reads only
+            # use the latest-value table above.
+            if config.is_crypto_signal_market_regime_audit_log_enabled():
+                connection.executemany(
+                    """
+                    INSERT INTO crypto_signal_market_regime_metrics (
+                        snapshot_id,
+                        metric_name,
+                        metric_value,
+                        unit,
+                        source_timestamp_utc,
+                        created_at_utc
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (snapshot_id, metric_name, source_timestamp_utc)
+                    DO UPDATE SET
+                        metric_value=excluded.metric_value,
+                        unit=excluded.unit,
+                        created_at_utc=excluded.created_at_utc
+                    """,
+                    [
+                        self._serialize_market_regime_metric(
+                            metric=metric,
+                            snapshot_id=snapshot_id,
+                            created_at_utc=created_at_utc,
+                        )
+                        for metric in snapshot.metrics
+                    ],
+                )
 
         snapshot.snapshot_id = snapshot_id
         snapshot.created_at_utc = created_at_utc
@@ -685,52 +1010,41 @@ class CryptoSignalRepository:
             return []
         placeholders = ','.join('?' for _ in metric_names)
         scope_filters = []
-        params = [
-            runtime_mode,
-            asset_symbol,
+        params = [runtime_mode, asset_symbol, *metric_names]
+        params.extend([
             self._format_timestamp(start_timestamp_utc),
             self._format_timestamp(end_timestamp_utc),
-        ]
+        ])
         if provider is not None:
-            scope_filters.append('snapshot.provider = ?')
+            scope_filters.append('provider = ?')
             params.append(provider)
         if venue_scope is not None:
-            scope_filters.append('snapshot.venue_scope = ?')
+            scope_filters.append('venue_scope = ?')
             params.append(venue_scope)
         if instrument_scope is not None:
-            scope_filters.append('snapshot.instrument_scope = ?')
+            scope_filters.append('instrument_scope = ?')
             params.append(instrument_scope)
         if interval is not None:
-            scope_filters.append('snapshot.interval = ?')
+            scope_filters.append('interval = ?')
             params.append(interval)
-        params.extend(metric_names)
         scope_filter_sql = (
             ''
             if not scope_filters
             else ' AND ' + ' AND '.join(scope_filters)
         )
-        with self._connect() as connection:
+        with self._read_connection() as connection:
             try:
                 rows = connection.execute(
                     f"""
-                    SELECT
-                        metric.*,
-                        snapshot.observed_at_utc AS snapshot_observed_at_utc,
-                        snapshot.provider,
-                        snapshot.asset_symbol,
-                        snapshot.venue_scope,
-                        snapshot.instrument_scope,
-                        snapshot.interval
-                    FROM crypto_signal_market_regime_metrics AS metric
-                    INNER JOIN crypto_signal_market_regime_snapshots AS snapshot
-                      ON snapshot.snapshot_id = metric.snapshot_id
-                    WHERE snapshot.runtime_mode = ?
-                      AND snapshot.asset_symbol = ?
-                      AND metric.source_timestamp_utc >= ?
-                      AND metric.source_timestamp_utc <= ?
+                    SELECT *
+                    FROM crypto_signal_market_regime_latest_metrics
+                    WHERE runtime_mode = ?
+                      AND asset_symbol = ?
+                      AND metric_name IN ({placeholders})
+                      AND source_timestamp_utc >= ?
+                      AND source_timestamp_utc <= ?
                       {scope_filter_sql}
-                      AND metric.metric_name IN ({placeholders})
-                    ORDER BY metric.source_timestamp_utc ASC, metric.metric_name ASC
+                    ORDER BY source_timestamp_utc ASC, metric_name ASC
                     """,
                     params,
                 ).fetchall()
@@ -738,10 +1052,7 @@ class CryptoSignalRepository:
                 if 'no such table' in str(error):
                     return []
                 raise
-        return [
-            self._build_market_regime_metric(row)
-            for row in self._dedupe_market_regime_metric_rows(rows)
-        ]
+        return [self._build_market_regime_metric(row) for row in rows]
 
     def save_or_merge_snapshot(
         self,
@@ -750,7 +1061,7 @@ class CryptoSignalRepository:
         self.init_schema()
         created_at_utc = self._utcnow()
 
-        with self._connect() as connection:
+        with self._write_connection() as connection:
             existing_run = connection.execute(
                 """
                 SELECT run_id, created_at_utc
@@ -759,51 +1070,46 @@ class CryptoSignalRepository:
                 """,
                 (self._format_timestamp(snapshot.run.run_timestamp_utc),),
             ).fetchone()
-            if existing_run is None:
-                # Keep the normal write path authoritative for first creation so
-                # bootstrap merges and live writes share the same row shape.
-                return self.save_snapshot(snapshot)
-
-            run_id = int(existing_run['run_id'])
-            # Bootstrap history is assembled coin-by-coin, but the persisted
-            # model is one run per timestamp. Merge additional coins into the
-            # existing run instead of creating duplicate run rows.
-            connection.executemany(
-                """
-                INSERT INTO crypto_signal_coin_snapshots (
-                    run_id,
-                    coin_id,
-                    symbol,
-                    name,
-                    price_usd,
-                    price_change_24h,
-                    volume_24h,
-                    volume_change_pct_24h,
-                    is_watchlist,
-                    context_tags_json,
-                    created_at_utc
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(run_id, coin_id) DO UPDATE SET
-                    symbol=excluded.symbol,
-                    name=excluded.name,
-                    price_usd=excluded.price_usd,
-                    price_change_24h=excluded.price_change_24h,
-                    volume_24h=excluded.volume_24h,
-                    volume_change_pct_24h=excluded.volume_change_pct_24h,
-                    is_watchlist=excluded.is_watchlist,
-                    context_tags_json=excluded.context_tags_json,
-                    created_at_utc=excluded.created_at_utc
-                """,
-                [
-                    self._serialize_coin_snapshot(
-                        coin=coin,
-                        run_id=run_id,
-                        created_at_utc=created_at_utc,
-                    )
-                    for coin in snapshot.coins
-                ],
-            )
-            connection.commit()
+            if existing_run is not None:
+                run_id = int(existing_run['run_id'])
+                run_timestamp_utc = self._normalize_timestamp(
+                    snapshot.run.run_timestamp_utc
+                )
+                # Merged coins replace their earlier row for this run, so the
+                # aggregates drop the old observation before adding the new one.
+                replaced_observations = self._get_run_window_observations(
+                    connection=connection,
+                    run_id=run_id,
+                    run_timestamp_utc=run_timestamp_utc,
+                    coin_ids=[coin.coin_id for coin in snapshot.coins],
+                )
+                self._upsert_coin_snapshots(
+                    connection=connection,
+                    snapshot=snapshot,
+                    run_id=run_id,
+                    created_at_utc=created_at_utc,
+                )
+                self._refresh_window_aggregates(
+                    connection=connection,
+                    run_timestamp_utc=run_timestamp_utc,
+                    removed_observations=replaced_observations,
+                    added_observations=[
+                        self._build_window_observation(
+                            coin=coin,
+                            run_id=run_id,
+                            run_timestamp_utc=run_timestamp_utc,
+                        )
+                        # A repeated coin is upserted twice; only the last
+                        # row survives, so only it is counted.
+                        for coin in {
+                            coin.coin_id: coin for coin in snapshot.coins
+                        }.values()
+                    ],
+                )
+        if existing_run is None:
+            # Keep the normal write path authoritative for first creation so
+            # bootstrap merges and live writes share the same row shape.
+            return self.save_snapshot(snapshot)
 
         existing_created_at = self._parse_timestamp(existing_run['created_at_utc'])
         snapshot.run.run_id = run_id
@@ -813,6 +1119,474 @@ class CryptoSignalRepository:
             coin.created_at_utc = created_at_utc
         return snapshot
 
+    def _upsert_coin_snapshots(
+        self,
+        connection: sqlite3.Connection,
+        snapshot: CryptoSignalSnapshot,
+        run_id: int,
+        created_at_utc: datetime.datetime,
+    ) -> None:
+        # Bootstrap history is assembled coin-by-coin, but the persisted
+        # model is one run per timestamp. Merge additional coins into the
+        # existing run instead of creating duplicate run rows.
+        connection.executemany(
+            """
+            INSERT INTO crypto_signal_coin_snapshots (
+                run_id,
+                coin_id,
+                symbol,
+                name,
+                price_usd,
+                price_change_24h,
+                volume_24h,
+                volume_change_pct_24h,
+                is_watchlist,
+                context_tags_json,
+                created_at_utc
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(run_id, coin_id) DO UPDATE SET
+                symbol=excluded.symbol,
+                name=excluded.name,
+                price_usd=excluded.price_usd,
+                price_change_24h=excluded.price_change_24h,
+                volume_24h=excluded.volume_24h,
+                volume_change_pct_24h=excluded.volume_change_pct_24h,
+                is_watchlist=excluded.is_watchlist,
+                context_tags_json=excluded.context_tags_json,
+                created_at_utc=excluded.created_at_utc
+            """,
+            [
+                self._serialize_coin_snapshot(
+                    coin=coin,
+                    run_id=run_id,
+                    created_at_utc=created_at_utc,
+                )
+                for coin in snapshot.coins
+            ],
+        )
+
+    def _refresh_window_aggregates(
+        self,
+        connection: sqlite3.Connection,
+        run_timestamp_utc: datetime.datetime,
+        removed_observations: list[WindowAggregateObservation],
+        added_observations: list[WindowAggregateObservation],
+    ) -> None:
+        anchor_row = connection.execute(
+            """
+            SELECT value
+            FROM crypto_signal_metadata
+            WHERE key = ?
+            """,
+            (_WINDOW_AGGREGATES_ANCHOR_KEY,),
+        ).fetchone()
+        if anchor_row is None:
+            # First write after the aggregates table was introduced, or after
+            # an upgrade from a DB that never maintained it.
+            self._rebuild_window_aggregates(connection)
+            return
+
+        anchor_timestamp_utc = self._parse_timestamp(anchor_row['value'])
+        new_anchor_timestamp_utc = max(anchor_timestamp_utc, run_timestamp_utc)
+        for window_label, window_length in WINDOW_AGGREGATE_LENGTHS.items():
+            old_window_start_utc = anchor_timestamp_utc - window_length
+            new_window_start_utc = new_anchor_timestamp_utc - window_length
+            # Removals go first so an edge they invalidate is recomputed from
+            # stored rows rather than patched by a later add.
+            changes = [
+                (observation, -1)
+                for observation in self._get_window_observations(
+                    connection=connection,
+                    start_timestamp_utc=old_window_start_utc,
+                    end_timestamp_utc=new_window_start_utc,
+                )
+            ]
+            if run_timestamp_utc >= old_window_start_utc:
+                changes.extend(
+                    (observation, -1) for observation in removed_observations
+                )
+            if run_timestamp_utc >= new_window_start_utc:
+                changes.extend((observation, 1) for observation in added_observations)
+            if len(changes) == 0:
+                continue
+
+            aggregates_by_coin_id = self._get_window_aggregate_rows(
+                connection=connection,
+                window_label=window_label,
+                coin_ids=list({observation.coin_id for observation, _sign in changes}),
+            )
+            stale_edges_by_coin_id: dict[int, set[str]] = {}
+            for observation, sign in changes:
+                aggregate = aggregates_by_coin_id.get(observation.coin_id)
+                if aggregate is None:
+                    aggregate = CryptoSignalWindowAggregate(
+                        window_label=window_label,
+                        coin_id=observation.coin_id,
+                    )
+                    aggregates_by_coin_id[observation.coin_id] = aggregate
+                apply_window_observation(
+                    aggregate=aggregate,
+                    observation=observation,
+                    sign=sign,
+                    stale_edges=stale_edges_by_coin_id.setdefault(
+                        observation.coin_id, set()
+                    ),
+                )
+            self._recompute_window_aggregate_edges(
+                connection=connection,
+                aggregates_by_coin_id=aggregates_by_coin_id,
+                stale_edges_by_coin_id=stale_edges_by_coin_id,
+                window_start_utc=new_window_start_utc,
+                window_end_utc=new_anchor_timestamp_utc,
+            )
+            self._write_window_aggregates(
+                connection=connection,
+                aggregates=list(aggregates_by_coin_id.values()),
+            )
+        self._write_window_aggregates_anchor(connection, new_anchor_timestamp_utc)
+
+    def _rebuild_window_aggregates(self, connection: sqlite3.Connection) -> None:
+        connection.execute('DELETE FROM crypto_signal_window_aggregates')
+        latest_run_row = connection.execute(
+            """
+            SELECT MAX(run_timestamp_utc) AS run_timestamp_utc
+            FROM crypto_signal_runs
+            """
+        ).fetchone()
+        if latest_run_row['run_timestamp_utc'] is None:
+            return
+        anchor_timestamp_utc = self._parse_timestamp(
+            latest_run_row['run_timestamp_utc']
+        )
+        for window_label, window_length in WINDOW_AGGREGATE_LENGTHS.items():
+            aggregates_by_coin_id: dict[int, CryptoSignalWindowAggregate] = {}
+            # Observations arrive oldest first, so plain adds leave every
+            # first/last edge correct without a recompute pass.
+            for observation in self._get_window_observations(
+                connection=connection,
+                start_timestamp_utc=anchor_timestamp_utc - window_length,
+            ):
+                aggregate = aggregates_by_coin_id.get(observation.coin_id)
+                if aggregate is None:
+                    aggregate = CryptoSignalWindowAggregate(
+                        window_label=window_label,
+                        coin_id=observation.coin_id,
+                    )
+                    aggregates_by_coin_id[observation.coin_id] = aggregate
+                apply_window_observation(
+                    aggregate=aggregate,
+                    observation=observation,
+                    sign=1,
+                    stale_edges=set(),
+                )
+            self._write_window_aggregates(
+                connection=connection,
+                aggregates=list(aggregates_by_coin_id.values()),
+            )
+        self._write_window_aggregates_anchor(connection, anchor_timestamp_utc)
+
+    def _recompute_window_aggregate_edges(
+        self,
+        connection: sqlite3.Connection,
+        aggregates_by_coin_id: dict[int, CryptoSignalWindowAggregate],
+        stale_edges_by_coin_id: dict[int, set[str]],
+        window_start_utc: datetime.datetime,
+        window_end_utc: datetime.datetime,
+    ) -> None:
+        for edge, order, priced_only in (
+            (FIRST_PRICED_EDGE, 'ASC', True),
+            (LAST_PRICED_EDGE, 'DESC', True),
+            (LAST_OBSERVED_EDGE, 'DESC', False),
+        ):
+            pending_coin_ids = {
+                coin_id
+                for coin_id, stale_edges in stale_edges_by_coin_id.items()
+                if edge in stale_edges
+                and aggregates_by_coin_id[coin_id].observation_count > 0
+                and (
+                    not priced_only
+                    or aggregates_by_coin_id[coin_id].priced_count > 0
+                )
+            }
+            if len(pending_coin_ids) == 0:
+                continue
+            run_rows = connection.execute(
+                f"""
+                SELECT run_id, run_timestamp_utc
+                FROM crypto_signal_runs
+                WHERE run_timestamp_utc >= ?
+                  AND run_timestamp_utc <= ?
+                ORDER BY run_timestamp_utc {order}
+                """,
+                (
+                    self._format_timestamp(window_start_utc),
+                    self._format_timestamp(window_end_utc),
+                ),
+            )
+            # Expiring the oldest run usually stales the first edge of every
+            # coin in it, and the next run normally resolves all of them, so
+            # walk runs outward from the window boundary instead of per coin.
+            for run_row in run_rows:
+                run_timestamp_utc = self._parse_timestamp(run_row['run_timestamp_utc'])
+                pending_chunk_ids = list(pending_coin_ids)
+                for chunk_start in range(0, len(pending_chunk_ids), _SQLITE_IN_CHUNK_SIZE):
+                    chunk = pending_chunk_ids[chunk_start:chunk_start + _SQLITE_IN_CHUNK_SIZE]
+                    placeholders = ','.join('?' for _ in chunk)
+                    price_filter_sql = 'AND price_usd > 0' if priced_only else ''
+                    rows = connection.execute(
+                        f"""
+                        SELECT coin_id, price_usd
+                        FROM crypto_signal_coin_snapshots
+                        WHERE run_id = ?
+                          AND coin_id IN ({placeholders})
+                          {price_filter_sql}
+                        """,
+                        [run_row['run_id'], *chunk],
+                    ).fetchall()
+                    for row in rows:
+                        aggregate = aggregates_by_coin_id[row['coin_id']]
+                        if edge == FIRST_PRICED_EDGE:
+                            aggregate.first_priced_run_timestamp_utc = run_timestamp_utc
+                            aggregate.first_price_usd = row['price_usd']
+                        elif edge == LAST_PRICED_EDGE:
+                            aggregate.last_priced_run_timestamp_utc = run_timestamp_utc
+                            aggregate.last_price_usd = row['price_usd']
+                        else:
+                            aggregate.last_observed_run_id = run_row['run_id']
+                            aggregate.last_observed_run_timestamp_utc = run_timestamp_utc
+                        pending_coin_ids.discard(row['coin_id'])
+                if len(pending_coin_ids) == 0:
+                    break
+
+    def _get_window_observations(
+        self,
+        connection: sqlite3.Connection,
+        start_timestamp_utc: datetime.datetime,
+        end_timestamp_utc: datetime.datetime | None = None,
+    ) -> list[WindowAggregateObservation]:
+        """Coin rows for runs in [start, end), oldest run first."""
+        params = [self._format_timestamp(start_timestamp_utc)]
+        end_filter_sql = ''
+        if end_timestamp_utc is not None:
+            if end_timestamp_utc <= start_timestamp_utc:
+                return []
+            end_filter_sql = 'AND run.run_timestamp_utc < ?'
+            params.append(self._format_timestamp(end_timestamp_utc))
+        cursor = connection.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(
+            f"""
+            SELECT
+                coin.run_id,
+                run.run_timestamp_utc,
+                coin.coin_id,
+                coin.price_usd,
+                coin.price_change_24h,
+                coin.volume_change_pct_24h,
+                coin.context_tags_json
+            FROM crypto_signal_runs AS run
+            INNER JOIN crypto_signal_coin_snapshots AS coin
+              ON coin.run_id = run.run_id
+            WHERE run.run_timestamp_utc >= ?
+              {end_filter_sql}
+            ORDER BY run.run_timestamp_utc ASC
+            """,
+            params,
+        ).fetchall()
+        return self._build_window_observations_from_rows(rows)
+
+    def _get_run_window_observations(
+        self,
+        connection: sqlite3.Connection,
+        run_id: int,
+        run_timestamp_utc: datetime.datetime,
+        coin_ids: list[int],
+    ) -> list[WindowAggregateObservation]:
+        unique_coin_ids = list(dict.fromkeys(coin_ids))
+        cursor = connection.cursor()
+        cursor.row_factory = None
+        rows = []
+        for chunk_start in range(0, len(unique_coin_ids), _SQLITE_IN_CHUNK_SIZE):
+            chunk = unique_coin_ids[chunk_start:chunk_start + _SQLITE_IN_CHUNK_SIZE]
+            placeholders = ','.join('?' for _ in chunk)
+            rows.extend(
+                cursor.execute(
+                    f"""
+                    SELECT
+                        run_id,
+                        ?,
+                        coin_id,
+                        price_usd,
+                        price_change_24h,
+                        volume_change_pct_24h,
+                        context_tags_json
+                    FROM crypto_signal_coin_snapshots
+                    WHERE run_id = ?
+                      AND coin_id IN ({placeholders})
+                    """,
+                    [self._format_timestamp(run_timestamp_utc), run_id, *chunk],
+                ).fetchall()
+            )
+        return self._build_window_observations_from_rows(rows)
+
+    def _build_window_observations_from_rows(
+        self,
+        rows: list[tuple],
+    ) -> list[WindowAggregateObservation]:
+        context_tags_by_json: dict[str, tuple[str, ...]] = {}
+        timestamps_by_text: dict[str, datetime.datetime] = {}
+        observations = []
+        for (
+            run_id,
+            run_timestamp_utc,
+            coin_id,
+            price_usd,
+            price_change_24h,
+            volume_change_pct_24h,
+            context_tags_json,
+        ) in rows:
+            context_tags = context_tags_by_json.get(context_tags_json)
+            if context_tags is None:
+                context_tags = tuple(json.loads(context_tags_json))
+                context_tags_by_json[context_tags_json] = context_tags
+            parsed_run_timestamp_utc = timestamps_by_text.get(run_timestamp_utc)
+            if parsed_run_timestamp_utc is None:
+                parsed_run_timestamp_utc = self._parse_timestamp(run_timestamp_utc)
+                timestamps_by_text[run_timestamp_utc] = parsed_run_timestamp_utc
+            observations.append(
+                WindowAggregateObservation(
+                    coin_id=coin_id,
+                    run_id=run_id,
+                    run_timestamp_utc=parsed_run_timestamp_utc,
+                    price_usd=price_usd,
+                    price_change_24h=price_change_24h,
+                    volume_change_pct_24h=volume_change_pct_24h,
+                    context_tags=context_tags,
+                )
+            )
+        return observations
+
+    def _get_window_aggregate_rows(
+        self,
+        connection: sqlite3.Connection,
+        window_label: str,
+        coin_ids: list[int] | None = None,
+    ) -> dict[int, CryptoSignalWindowAggregate]:
+        if coin_ids is None:
+            rows = connection.execute(
+                """
+                SELECT *
+                FROM crypto_signal_window_aggregates
+                WHERE window_label = ?
+                """,
+                (window_label,),
+            ).fetchall()
+        else:
+            rows = []
+            for chunk_start in range(0, len(coin_ids), _SQLITE_IN_CHUNK_SIZE):
+                chunk = coin_ids[chunk_start:chunk_start + _SQLITE_IN_CHUNK_SIZE]
+                placeholders = ','.join('?' for _ in chunk)
+                rows.extend(
+                    connection.execute(
+                        f"""
+                        SELECT *
+                        FROM crypto_signal_window_aggregates
+                        WHERE window_label = ?
+                          AND coin_id IN ({placeholders})
+                        """,
+                        [window_label, *chunk],
+                    ).fetchall()
+                )
+        return {
+            int(row['coin_id']): self._build_window_aggregate(row)
+            for row in rows
+        }
+
+    def _write_window_aggregates(
+        self,
+        connection: sqlite3.Connection,
+        aggregates: list[CryptoSignalWindowAggregate],
+    ) -> None:
+        connection.executemany(
+            """
+            DELETE FROM crypto_signal_window_aggregates
+            WHERE window_label = ?
+              AND coin_id = ?
+            """,
+            [
+                (aggregate.window_label, aggregate.coin_id)
+                for aggregate in aggregates
+                if aggregate.observation_count <= 0
+            ],
+        )
+        connection.executemany(
+            """
+            INSERT INTO crypto_signal_window_aggregates (
+                window_label,
+                coin_id,
+                observation_count,
+                price_change_count,
+                price_change_positive_count,
+                price_change_negative_count,
+                price_change_sum,
+                volume_change_count,
+                volume_change_sum,
+                bullish_attention_hits,
+                bearish_attention_hits,
+                sector_leader_count,
+                sector_loser_count,
+                priced_count,
+                first_priced_run_timestamp_utc,
+                first_price_usd,
+                last_priced_run_timestamp_utc,
+                last_price_usd,
+                last_observed_run_id,
+                last_observed_run_timestamp_utc
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(window_label, coin_id) DO UPDATE SET
+                observation_count=excluded.observation_count,
+                price_change_count=excluded.price_change_count,
+                price_change_positive_count=excluded.price_change_positive_count,
+                price_change_negative_count=excluded.price_change_negative_count,
+                price_change_sum=excluded.price_change_sum,
+                volume_change_count=excluded.volume_change_count,
+                volume_change_sum=excluded.volume_change_sum,
+                bullish_attention_hits=excluded.bullish_attention_hits,
+                bearish_attention_hits=excluded.bearish_attention_hits,
+                sector_leader_count=excluded.sector_leader_count,
+                sector_loser_count=excluded.sector_loser_count,
+                priced_count=excluded.priced_count,
+                first_priced_run_timestamp_utc=excluded.first_priced_run_timestamp_utc,
+                first_price_usd=excluded.first_price_usd,
+                last_priced_run_timestamp_utc=excluded.last_priced_run_timestamp_utc,
+                last_price_usd=excluded.last_price_usd,
+                last_observed_run_id=excluded.last_observed_run_id,
+                last_observed_run_timestamp_utc=excluded.last_observed_run_timestamp_utc
+            """,
+            [
+                self._serialize_window_aggregate(aggregate)
+                for aggregate in aggregates
+                if aggregate.observation_count > 0
+            ],
+        )
+
+    def _write_window_aggregates_anchor(
+        self,
+        connection: sqlite3.Connection,
+        anchor_timestamp_utc: datetime.datetime,
+    ) -> None:
+        connection.execute(
+            """
+            INSERT INTO crypto_signal_metadata (key, value)
+            VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value=excluded.value
+            """,
+            (
+                _WINDOW_AGGREGATES_ANCHOR_KEY,
+                self._format_timestamp(anchor_timestamp_utc),
+            ),
+        )
+
     def get_coin_observation_counts_since(
         self,
         coin_ids: list[int],
@@ -827,7 +1601,7 @@ class CryptoSignalRepository:
 
         placeholders = ','.join('?' for _ in unique_coin_ids)
         params = [self._format_timestamp(start_timestamp_utc), *unique_coin_ids]
-        with self._connect() as connection:
+        with self._read_connection() as connection:
             try:
                 rows = connection.execute(
                     f"""
@@ -853,10 +1627,160 @@ class CryptoSignalRepository:
         )
         return counts
 
+    def save_ohlcv_candles(self, candles: list[CryptoSignalOhlcvCandle]) -> None:
+        if len(candles) == 0:
+            return
+        self.init_schema()
+        with self._write_connection() as connection:
+            connection.executemany(
+                """
+                INSERT INTO crypto_signal_ohlcv_candles (
+                    coin_id,
+                    interval,
+                    candle_timestamp_utc,
+                    symbol,
+                    name,
+                    open_usd,
+                    high_usd,
+                    low_usd,
+                    close_usd,
+                    volume_usd
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(coin_id, interval, candle_timestamp_utc) DO UPDATE SET
+                    symbol=excluded.symbol,
+                    name=excluded.name,
+                    open_usd=excluded.open_usd,
+                    high_usd=excluded.high_usd,
+                    low_usd=excluded.low_usd,
+                    close_usd=excluded.close_usd,
+                    volume_usd=excluded.volume_usd
+                """,
+                [
+                    (
+                        candle.coin_id,
+                        candle.interval,
+                        self._format_timestamp(candle.candle_timestamp_utc),
+                        candle.symbol,
+                        candle.name,
+                        candle.open_usd,
+                        candle.high_usd,
+                        candle.low_usd,
+                        candle.close_usd,
+                        candle.volume_usd,
+                    )
+                    for candle in candles
+                ],
+            )
+
+    def get_latest_ohlcv_candle_timestamps(
+        self,
+        coin_ids: list[int],
+        interval: str,
+    ) -> dict[int, datetime.datetime]:
+        unique_coin_ids = list(dict.fromkeys(coin_ids))
+        if len(unique_coin_ids) == 0 or not Path(self.db_path).exists():
+            return {}
+
+        latest_timestamps: dict[int, datetime.datetime] = {}
+        with self._read_connection() as connection:
+            for chunk_start in range(0, len(unique_coin_ids), _SQLITE_IN_CHUNK_SIZE):
+                chunk = unique_coin_ids[chunk_start:chunk_start + _SQLITE_IN_CHUNK_SIZE]
+                placeholders = ','.join('?' for _ in chunk)
+                try:
+                    rows = connection.execute(
+                        f"""
+                        SELECT coin_id, MAX(candle_timestamp_utc) AS latest_timestamp_utc
+                        FROM crypto_signal_ohlcv_candles
+                        WHERE interval = ?
+                          AND coin_id IN ({placeholders})
+                        GROUP BY coin_id
+                        """,
+                        [interval, *chunk],
+                    ).fetchall()
+                except sqlite3.OperationalError as error:
+                    if 'no such table' in str(error):
+                        return {}
+                    raise
+                latest_timestamps.update(
+                    {
+                        int(row['coin_id']): self._parse_timestamp(
+                            row['latest_timestamp_utc']
+                        )
+                        for row in rows
+                    }
+                )
+        return latest_timestamps
+
+    def get_ohlcv_candles_since(
+        self,
+        coin_ids: list[int],
+        interval: str,
+        start_timestamp_utc: datetime.datetime,
+    ) -> dict[int, list[CryptoSignalOhlcvCandle]]:
+        """Return candles at or after start per coin, oldest first.
+
+        Each coin also gets its newest candle before start so the first
+        in-range candle can still compute a 24h change.
+        """
+        unique_coin_ids = list(dict.fromkeys(coin_ids))
+        if len(unique_coin_ids) == 0 or not Path(self.db_path).exists():
+            return {}
+
+        formatted_start = self._format_timestamp(start_timestamp_utc)
+        candles_by_coin_id: dict[int, list[CryptoSignalOhlcvCandle]] = {}
+        with self._read_connection() as connection:
+            for chunk_start in range(0, len(unique_coin_ids), _SQLITE_IN_CHUNK_SIZE):
+                chunk = unique_coin_ids[chunk_start:chunk_start + _SQLITE_IN_CHUNK_SIZE]
+                placeholders = ','.join('?' for _ in chunk)
+                try:
+                    rows = connection.execute(
+                        f"""
+                        SELECT candle.*
+                        FROM crypto_signal_ohlcv_candles AS candle
+                        WHERE candle.interval = ?
+                          AND candle.coin_id IN ({placeholders})
+                          AND candle.candle_timestamp_utc >= COALESCE(
+                            (
+                              SELECT MAX(previous.candle_timestamp_utc)
+                              FROM crypto_signal_ohlcv_candles AS previous
+                              WHERE previous.coin_id = candle.coin_id
+                                AND previous.interval = candle.interval
+                                AND previous.candle_timestamp_utc < ?
+                            ),
+                            ?
+                          )
+                        ORDER BY candle.coin_id, candle.candle_timestamp_utc
+                        """,
+                        [interval, *chunk, formatted_start, formatted_start],
+                    ).fetchall()
+                except sqlite3.OperationalError as error:
+                    if 'no such table' in str(error):
+                        return {}
+                    raise
+                for row in rows:
+                    candles_by_coin_id.setdefault(int(row['coin_id']), []).append(
+                        CryptoSignalOhlcvCandle(
+                            coin_id=int(row['coin_id']),
+                            symbol=row['symbol'],
+                            name=row['name'],
+                            interval=row['interval'],
+                            candle_timestamp_utc=self._parse_timestamp(
+                                row['candle_timestamp_utc']
+                            ),
+                            open_usd=row['open_usd'],
+                            high_usd=row['high_usd'],
+                            low_usd=row['low_usd'],
+                            close_usd=row['close_usd'],
+                            volume_usd=row['volume_usd'],
+                        )
+                    )
+        return candles_by_coin_id
+
     def get_latest_snapshot(self) -> CryptoSignalSnapshot | None:
         if not Path(self.db_path).exists():
             return None
-        with self._connect() as connection:
+        with self._read_connection() as connection:
             try:
                 # The local report path must be able to inspect an existing DB
                 # through a read-only connection, so read helpers cannot call
@@ -881,27 +1805,313 @@ class CryptoSignalRepository:
         self,
         start_timestamp_utc: datetime.datetime,
     ) -> list[CryptoSignalSnapshot]:
+        run_rows, coin_rows = self._get_window_rows_since(start_timestamp_utc)
+        return self._build_snapshots_from_rows(
+            run_rows=run_rows,
+            coin_rows=coin_rows,
+        )
+
+    def get_history_cube_since(
+        self,
+        start_timestamp_utc: datetime.datetime,
+    ) -> 'CryptoSignalHistoryCube':
+        """Load the same window as `get_snapshots_since` as a columnar cube.
+
+        Cells are read as numeric tuples straight into NumPy columns; full coin
+        rows are only fetched for each coin's newest observation.
+        """
+        # NumPy is only imported when the optional history cube is used.
+        from src.service.crypto_signal.history_cube import (
+            HistoryCubeColumns,
+            build_history_cube,
+        )
+
+        empty_columns = HistoryCubeColumns(
+            run_indexes=(),
+            coin_ids=(),
+            price_usd=(),
+            price_change_24h=(),
+            volume_24h=(),
+            volume_change_pct_24h=(),
+            is_watchlist=(),
+            context_tag_keys=(),
+        )
         if not Path(self.db_path).exists():
-            return []
-        with self._connect() as connection:
+            return build_history_cube([], empty_columns, lambda _positions: [])
+        with self._read_connection() as connection:
             try:
+                # Keep the run, cell, and latest-coin reads on one WAL snapshot.
+                connection.execute('BEGIN')
                 run_rows = connection.execute(
                     """
-                    SELECT *
+                    SELECT run_id, run_timestamp_utc
                     FROM crypto_signal_runs
                     WHERE run_timestamp_utc >= ?
                     ORDER BY run_timestamp_utc ASC
                     """,
                     (self._format_timestamp(start_timestamp_utc),),
                 ).fetchall()
+                cell_cursor = connection.cursor()
+                cell_cursor.row_factory = None
+                cell_rows = cell_cursor.execute(
+                    """
+                    SELECT
+                        coin.run_id,
+                        coin.coin_id,
+                        coin.price_usd,
+                        coin.price_change_24h,
+                        coin.volume_24h,
+                        coin.volume_change_pct_24h,
+                        coin.is_watchlist,
+                        coin.context_tags_json
+                    FROM crypto_signal_runs AS run
+                    INNER JOIN crypto_signal_coin_snapshots AS coin
+                      ON coin.run_id = run.run_id
+                    WHERE run.run_timestamp_utc >= ?
+                    ORDER BY run.run_timestamp_utc ASC
+                    """,
+                    (self._format_timestamp(start_timestamp_utc),),
+                ).fetchall()
             except sqlite3.OperationalError as error:
                 if 'no such table' in str(error):
-                    return []
+                    return build_history_cube([], empty_columns, lambda _positions: [])
+                raise
+
+            run_index_by_id = {
+                run_row['run_id']: run_index
+                for run_index, run_row in enumerate(run_rows)
+            }
+            (
+                run_ids,
+                coin_ids,
+                prices_usd,
+                price_changes_24h,
+                volumes_24h,
+                volume_changes_pct_24h,
+                watchlist_flags,
+                context_tags_jsons,
+            ) = zip(*cell_rows) if cell_rows else ((),) * 8
+            return build_history_cube(
+                run_timestamps_utc=[
+                    self._parse_timestamp(run_row['run_timestamp_utc'])
+                    for run_row in run_rows
+                ],
+                columns=HistoryCubeColumns(
+                    run_indexes=[run_index_by_id[run_id] for run_id in run_ids],
+                    coin_ids=coin_ids,
+                    price_usd=prices_usd,
+                    price_change_24h=price_changes_24h,
+                    volume_24h=volumes_24h,
+                    volume_change_pct_24h=volume_changes_pct_24h,
+                    is_watchlist=watchlist_flags,
+                    context_tag_keys=context_tags_jsons,
+                ),
+                load_latest_coins=lambda positions: self._get_coin_snapshots_by_key(
+                    connection,
+                    [(run_ids[position], coin_ids[position]) for position in positions],
+                ),
+                decode_context_tags=lambda context_tags_json: tuple(
+                    json.loads(context_tags_json)
+                ),
+            )
+
+    def get_window_aggregates(
+        self,
+        latest_snapshot: CryptoSignalSnapshot,
+        window_label: str,
+        watchlist_coin_ids: set[int],
+    ) -> CryptoSignalWindowAggregates | None:
+        """Load the rolling per-coin aggregates for one digest window.
+
+        Returns None when the aggregates are missing or are not anchored to
+        `latest_snapshot`, so callers can fall back to scoring raw history.
+        """
+        if window_label not in WINDOW_AGGREGATE_LENGTHS:
+            raise RuntimeError(f'Unsupported crypto signal window: {window_label}')
+        if not Path(self.db_path).exists():
+            return None
+        with self._read_connection() as connection:
+            try:
+                connection.execute('BEGIN')
+                anchor_row = connection.execute(
+                    """
+                    SELECT value
+                    FROM crypto_signal_metadata
+                    WHERE key = ?
+                    """,
+                    (_WINDOW_AGGREGATES_ANCHOR_KEY,),
+                ).fetchone()
+                if anchor_row is None or anchor_row['value'] != self._format_timestamp(
+                    latest_snapshot.run.run_timestamp_utc
+                ):
+                    return None
+                aggregates_by_coin_id = self._get_window_aggregate_rows(
+                    connection=connection,
+                    window_label=window_label,
+                )
+            except sqlite3.OperationalError as error:
+                if 'no such table' in str(error):
+                    return None
                 raise
-            return [
-                self._build_snapshot_from_row(connection, run_row)
-                for run_row in run_rows
+
+            # Watchlist coins missing from the latest run are rendered from
+            # their newest in-window row, as build_digest_view does.
+            latest_coin_ids = {coin.coin_id for coin in latest_snapshot.coins}
+            carried_keys = [
+                (aggregates_by_coin_id[coin_id].last_observed_run_id, coin_id)
+                for coin_id in sorted(watchlist_coin_ids)
+                if coin_id not in latest_coin_ids
+                and coin_id in aggregates_by_coin_id
+                and aggregates_by_coin_id[coin_id].last_observed_run_id is not None
             ]
+            carried_coins = self._get_coin_snapshots_by_key(connection, carried_keys)
+        return CryptoSignalWindowAggregates(
+            window_label=window_label,
+            anchor_run_timestamp_utc=self._parse_timestamp(anchor_row['value']),
+            aggregates_by_coin_id=aggregates_by_coin_id,
+            latest_coins_by_id={coin.coin_id: coin for coin in carried_coins},
+        )
+
+    def _get_coin_snapshots_by_key(
+        self,
+        connection: sqlite3.Connection,
+        keys: list[tuple[int, int]],
+    ) -> list[CryptoSignalCoinSnapshot]:
+        coin_ids_by_run_id: dict[int, list[int]] = {}
+        for run_id, coin_id in keys:
+            coin_ids_by_run_id.setdefault(run_id, []).append(coin_id)
+        # Most coins were last seen in the newest run, so this is usually one
+        # primary-key query per chunk rather than one per coin.
+        coins_by_key: dict[tuple[int, int], CryptoSignalCoinSnapshot] = {}
+        for run_id, run_coin_ids in coin_ids_by_run_id.items():
+            for chunk_start in range(0, len(run_coin_ids), _SQLITE_IN_CHUNK_SIZE):
+                chunk = run_coin_ids[chunk_start:chunk_start + _SQLITE_IN_CHUNK_SIZE]
+                placeholders = ','.join('?' for _ in chunk)
+                rows = connection.execute(
+                    f"""
+                    SELECT *
+                    FROM crypto_signal_coin_snapshots
+                    WHERE run_id = ?
+                      AND coin_id IN ({placeholders})
+                    """,
+                    [run_id, *chunk],
+                ).fetchall()
+                for row in rows:
+                    coins_by_key[(row['run_id'], row['coin_id'])] = (
+                        self._build_coin_snapshot(row)
+                    )
+        return [coins_by_key[key] for key in keys]
+
+    def _get_window_rows_since(
+        self,
+        start_timestamp_utc: datetime.datetime,
+    ) -> tuple[list[sqlite3.Row], list[tuple]]:
+        if not Path(self.db_path).exists():
+            return [], []
+        with self._read_connection() as connection:
+            try:
+                # Both reads share one WAL snapshot so every coin row belongs to
+                # a returned run even if a job commits in between; the reader
+                # pool rolls the transaction back on release.
+                connection.execute('BEGIN')
+                run_rows = connection.execute(
+                    """
+                    SELECT *
+                    FROM crypto_signal_runs
+                    WHERE run_timestamp_utc >= ?
+                    ORDER BY run_timestamp_utc ASC
+                    """,
+                    (self._format_timestamp(start_timestamp_utc),),
+                ).fetchall()
+                # Hydrate every coin row in the window with one range query
+                # instead of one coin query per run; a 30d hourly window would
+                # otherwise cost 700+ round trips. Plain tuples skip the
+                # per-column sqlite3.Row lookups on this bulk path.
+                coin_cursor = connection.cursor()
+                coin_cursor.row_factory = None
+                coin_rows = coin_cursor.execute(
+                    """
+                    SELECT
+                        coin.run_id,
+                        coin.coin_id,
+                        coin.symbol,
+                        coin.name,
+                        coin.price_usd,
+                        coin.price_change_24h,
+                        coin.volume_24h,
+                        coin.volume_change_pct_24h,
+                        coin.is_watchlist,
+                        coin.context_tags_json,
+                        coin.created_at_utc
+                    FROM crypto_signal_runs AS run
+                    INNER JOIN crypto_signal_coin_snapshots AS coin
+                      ON coin.run_id = run.run_id
+                    WHERE run.run_timestamp_utc >= ?
+                    ORDER BY run.run_timestamp_utc ASC, coin.symbol ASC, coin.coin_id ASC
+                    """,
+                    (self._format_timestamp(start_timestamp_utc),),
+                ).fetchall()
+            except sqlite3.OperationalError as error:
+                if 'no such table' in str(error):
+                    return [], []
+                raise
+        return run_rows, coin_rows
+
+    def _build_snapshots_from_rows(
+        self,
+        run_rows: list[sqlite3.Row],
+        coin_rows: list[tuple],
+    ) -> list[CryptoSignalSnapshot]:
+        coins_by_run_id: dict[int, list[CryptoSignalCoinSnapshot]] = {
+            run_row['run_id']: [] for run_row in run_rows
+        }
+        # Coin rows repeat a small set of context-tag JSON strings and one
+        # created_at per run, so decode each distinct value once per batch.
+        context_tags_by_json: dict[str, tuple[str, ...]] = {}
+        timestamps_by_text: dict[str, datetime.datetime] = {}
+        for (
+            run_id,
+            coin_id,
+            symbol,
+            name,
+            price_usd,
+            price_change_24h,
+            volume_24h,
+            volume_change_pct_24h,
+            is_watchlist,
+            context_tags_json,
+            created_at_utc,
+        ) in coin_rows:
+            context_tags = context_tags_by_json.get(context_tags_json)
+            if context_tags is None:
+                context_tags = tuple(json.loads(context_tags_json))
+                context_tags_by_json[context_tags_json] = context_tags
+            parsed_created_at_utc = timestamps_by_text.get(created_at_utc)
+            if parsed_created_at_utc is None:
+                parsed_created_at_utc = self._parse_timestamp(created_at_utc)
+                timestamps_by_text[created_at_utc] = parsed_created_at_utc
+            coins_by_run_id[run_id].append(
+                CryptoSignalCoinSnapshot(
+                    coin_id=coin_id,
+                    symbol=symbol,
+                    name=name,
+                    price_usd=price_usd,
+                    price_change_24h=price_change_24h,
+                    volume_24h=volume_24h,
+                    volume_change_pct_24h=volume_change_pct_24h,
+                    is_watchlist=bool(is_watchlist),
+                    context_tags=context_tags,
+                    run_id=run_id,
+                    created_at_utc=parsed_created_at_utc,
+                )
+            )
+        return [
+            CryptoSignalSnapshot(
+                run=self._build_run_record(run_row),
+                coins=coins_by_run_id[run_row['run_id']],
+            )
+            for run_row in run_rows
+        ]
 
     def _build_snapshot_from_row(
         self,
@@ -1093,19 +2303,17 @@ class CryptoSignalRepository:
             ],
         )
 
-    def _resolve_candidate_outcome_row(
+    def _build_resolved_candidate_outcome(
         self,
-        connection: sqlite3.Connection,
         row: sqlite3.Row,
         updated_at_utc: datetime.datetime,
+        timestamps_by_text: dict[str, datetime.datetime],
     ) -> CryptoSignalCandidateOutcome:
-        target_timestamp_utc = self._parse_timestamp(row['target_timestamp_utc'])
-        outcome_run = self._find_first_run_at_or_after(
-            connection=connection,
-            runtime_mode=row['runtime_mode'],
-            target_timestamp_utc=target_timestamp_utc,
+        target_timestamp_utc = self._parse_cached_timestamp(
+            row['target_timestamp_utc'],
+            timestamps_by_text,
         )
-        if outcome_run is None:
+        if row['resolved_run_timestamp_utc'] is None:
             return CryptoSignalCandidateOutcome(
                 cohort_id=row['cohort_id'],
                 outcome_window=row['outcome_window'],
@@ -1114,8 +2322,9 @@ class CryptoSignalRepository:
                 missing_reason='missing_follow_up_run',
                 updated_at_utc=updated_at_utc,
             )
-        resolved_run_timestamp_utc = self._parse_timestamp(
-            outcome_run['run_timestamp_utc']
+        resolved_run_timestamp_utc = self._parse_cached_timestamp(
+            row['resolved_run_timestamp_utc'],
+            timestamps_by_text,
         )
         if resolved_run_timestamp_utc - target_timestamp_utc > OUTCOME_MAX_FOLLOW_UP_LAG:
             return CryptoSignalCandidateOutcome(
@@ -1128,31 +2337,12 @@ class CryptoSignalRepository:
                 updated_at_utc=updated_at_utc,
             )
 
-        prices = self._get_prices_for_run(
-            connection=connection,
-            run_id=int(outcome_run['run_id']),
-            coin_ids=[int(row['coin_id']), BTC_COIN_ID, ETH_COIN_ID],
-        )
         baseline_price_usd = row['baseline_price_usd']
-        candidate_price_usd = prices.get(int(row['coin_id']))
-        btc_price_usd = prices.get(BTC_COIN_ID)
-        eth_price_usd = prices.get(ETH_COIN_ID)
-        baseline_run = self._find_run_by_timestamp(
-            connection=connection,
-            runtime_mode=row['runtime_mode'],
-            run_timestamp_utc=self._parse_timestamp(row['signal_run_timestamp_utc']),
-        )
-        baseline_prices = (
-            {}
-            if baseline_run is None
-            else self._get_prices_for_run(
-                connection=connection,
-                run_id=int(baseline_run['run_id']),
-                coin_ids=[BTC_COIN_ID, ETH_COIN_ID],
-            )
-        )
-        btc_baseline_price_usd = baseline_prices.get(BTC_COIN_ID)
-        eth_baseline_price_usd = baseline_prices.get(ETH_COIN_ID)
+        candidate_price_usd = row['candidate_price_usd']
+        btc_price_usd = row['btc_price_usd']
+        eth_price_usd = row['eth_price_usd']
+        btc_baseline_price_usd = row['btc_baseline_price_usd']
+        eth_baseline_price_usd = row['eth_baseline_price_usd']
 
         missing_reasons = []
         if baseline_price_usd is None:
@@ -1212,105 +2402,27 @@ class CryptoSignalRepository:
             updated_at_utc=updated_at_utc,
         )
 
-    def _update_candidate_outcome(
-        self,
-        connection: sqlite3.Connection,
+    @staticmethod
+    def _serialize_candidate_outcome_update(
         outcome: CryptoSignalCandidateOutcome,
-        updated_at_utc: datetime.datetime,
-    ) -> None:
-        connection.execute(
-            """
-            UPDATE crypto_signal_candidate_outcomes
-            SET status = ?,
-                candidate_price_usd = ?,
-                btc_price_usd = ?,
-                eth_price_usd = ?,
-                absolute_return_pct = ?,
-                btc_relative_return_pct = ?,
-                eth_relative_return_pct = ?,
-                missing_reason = ?,
-                resolved_run_timestamp_utc = ?,
-                updated_at_utc = ?
-            WHERE cohort_id = ?
-              AND outcome_window = ?
-            """,
-            (
-                outcome.status,
-                outcome.candidate_price_usd,
-                outcome.btc_price_usd,
-                outcome.eth_price_usd,
-                outcome.absolute_return_pct,
-                outcome.btc_relative_return_pct,
-                outcome.eth_relative_return_pct,
-                outcome.missing_reason,
-                (
-                    None
-                    if outcome.resolved_run_timestamp_utc is None
-                    else self._format_timestamp(outcome.resolved_run_timestamp_utc)
-                ),
-                self._format_timestamp(updated_at_utc),
-                outcome.cohort_id,
-                outcome.outcome_window,
-            ),
+        resolved_run_timestamp_text: str | None,
+        updated_at_text: str,
+    ) -> tuple:
+        return (
+            outcome.status,
+            outcome.candidate_price_usd,
+            outcome.btc_price_usd,
+            outcome.eth_price_usd,
+            outcome.absolute_return_pct,
+            outcome.btc_relative_return_pct,
+            outcome.eth_relative_return_pct,
+            outcome.missing_reason,
+            resolved_run_timestamp_text,
+            updated_at_text,
+            outcome.cohort_id,
+            outcome.outcome_window,
         )
 
-    def _find_first_run_at_or_after(
-        self,
-        connection: sqlite3.Connection,
-        runtime_mode: str,
-        target_timestamp_utc: datetime.datetime,
-    ) -> sqlite3.Row | None:
-        return connection.execute(
-            """
-            SELECT *
-            FROM crypto_signal_runs
-            WHERE runtime_mode = ?
-              AND run_timestamp_utc >= ?
-            ORDER BY run_timestamp_utc ASC
-            LIMIT 1
-            """,
-            (runtime_mode, self._format_timestamp(target_timestamp_utc)),
-        ).fetchone()
-
-    def _find_run_by_timestamp(
-        self,
-        connection: sqlite3.Connection,
-        runtime_mode: str,
-        run_timestamp_utc: datetime.datetime,
-    ) -> sqlite3.Row | None:
-        return connection.execute(
-            """
-            SELECT *
-            FROM crypto_signal_runs
-            WHERE runtime_mode = ?
-              AND run_timestamp_utc = ?
-            LIMIT 1
-            """,
-            (runtime_mode, self._format_timestamp(run_timestamp_utc)),
-        ).fetchone()
-
-    def _get_prices_for_run(
-        self,
-        connection: sqlite3.Connection,
-        run_id: int,
-        coin_ids: list[int],
-    ) -> dict[int, float]:
-        placeholders = ','.join('?' for _ in coin_ids)
-        rows = connection.execute(
-            f"""
-            SELECT coin_id, price_usd
-            FROM crypto_signal_coin_snapshots
-            WHERE run_id = ?
-              AND coin_id IN ({placeholders})
-              AND price_usd IS NOT NULL
-            """,
-            [run_id, *coin_ids],
-        ).fetchall()
-        return {
-            int(row['coin_id']): float(row['price_usd'])
-            for row in rows
-        }
-
     def _build_run_record(self, row: sqlite3.Row) -> CryptoSignalRunRecord:
         return CryptoSignalRunRecord(
             run_id=row['run_id'],
@@ -1356,6 +2468,82 @@ class CryptoSignalRepository:
             created_at_utc=self._parse_timestamp(row['created_at_utc']),
         )
 
+    def _build_window_aggregate(
+        self,
+        row: sqlite3.Row,
+    ) -> CryptoSignalWindowAggregate:
+        return CryptoSignalWindowAggregate(
+            window_label=row['window_label'],
+            coin_id=row['coin_id'],
+            observation_count=row['observation_count'],
+            price_change_count=row['price_change_count'],
+            price_change_positive_count=row['price_change_positive_count'],
+            price_change_negative_count=row['price_change_negative_count'],
+            price_change_sum=Fraction(row['price_change_sum']),
+            volume_change_count=row['volume_change_count'],
+            volume_change_sum=Fraction(row['volume_change_sum']),
+            bullish_attention_hits=row['bullish_attention_hits'],
+            bearish_attention_hits=row['bearish_attention_hits'],
+            sector_leader_count=row['sector_leader_count'],
+            sector_loser_count=row['sector_loser_count'],
+            priced_count=row['priced_count'],
+            first_priced_run_timestamp_utc=self._parse_optional_timestamp(
+                row['first_priced_run_timestamp_utc']
+            ),
+            first_price_usd=row['first_price_usd'],
+            last_priced_run_timestamp_utc=self._parse_optional_timestamp(
+                row['last_priced_run_timestamp_utc']
+            ),
+            last_price_usd=row['last_price_usd'],
+            last_observed_run_id=row['last_observed_run_id'],
+            last_observed_run_timestamp_utc=self._parse_optional_timestamp(
+                row['last_observed_run_timestamp_utc']
+            ),
+        )
+
+    def _serialize_window_aggregate(
+        self,
+        aggregate: CryptoSignalWindowAggregate,
+    ) -> tuple:
+        return (
+            aggregate.window_label,
+            aggregate.coin_id,
+            aggregate.observation_count,
+            aggregate.price_change_count,
+            aggregate.price_change_positive_count,
+            aggregate.price_change_negative_count,
+            str(aggregate.price_change_sum),
+            aggregate.volume_change_count,
+            str(aggregate.volume_change_sum),
+            aggregate.bullish_attention_hits,
+            aggregate.bearish_attention_hits,
+            aggregate.sector_leader_count,
+            aggregate.sector_loser_count,
+            aggregate.priced_count,
+            self._format_optional_timestamp(aggregate.first_priced_run_timestamp_utc),
+            aggregate.first_price_usd,
+            self._format_optional_timestamp(aggregate.last_priced_run_timestamp_utc),
+            aggregate.last_price_usd,
+            aggregate.last_observed_run_id,
+            self._format_optional_timestamp(aggregate.last_observed_run_timestamp_utc),
+        )
+
+    @staticmethod
+    def _build_window_observation(
+        coin: CryptoSignalCoinSnapshot,
+        run_id: int,
+        run_timestamp_utc: datetime.datetime,
+    ) -> WindowAggregateObservation:
+        return WindowAggregateObservation(
+            coin_id=coin.coin_id,
+            run_id=run_id,
+            run_timestamp_utc=run_timestamp_utc,
+            price_usd=coin.price_usd,
+            price_change_24h=coin.price_change_24h,
+            volume_change_pct_24h=coin.volume_change_pct_24h,
+            context_tags=tuple(coin.context_tags),
+        )
+
     def _serialize_coin_snapshot(
         self,
         coin: CryptoSignalCoinSnapshot,
@@ -1411,39 +2599,70 @@ class CryptoSignalRepository:
             created_at_utc=self._parse_timestamp(row['created_at_utc']),
         )
 
+    def _serialize_latest_market_regime_metric(
+        self,
+        metric: CryptoSignalMarketRegimeMetric,
+        snapshot: CryptoSignalMarketRegimeSnapshot,
+        snapshot_id: int,
+        created_at_utc: datetime.datetime,
+    ) -> tuple:
+        return (
+            snapshot.runtime_mode,
+            snapshot.asset_symbol,
+            metric.metric_name,
+            self._format_timestamp(metric.source_timestamp_utc),
+            snapshot.provider,
+            snapshot.venue_scope,
+            snapshot.instrument_scope,
+            snapshot.interval,
+            metric.metric_value,
+            metric.unit,
+            snapshot_id,
+            self._format_timestamp(snapshot.observed_at_utc),
+            self._format_timestamp(created_at_utc),
+        )
+
     @staticmethod
-    def _dedupe_market_regime_metric_rows(
-        rows: list[sqlite3.Row],
-    ) -> list[sqlite3.Row]:
-        latest_by_fact_key: dict[tuple, sqlite3.Row] = {}
-        for row in rows:
-            # Scheduled collections can re-fetch overlapping historical points
-            # under later snapshots. Read-side summaries use the latest stored
-            # fact for each provider/scope/metric/source timestamp.
-            fact_key = (
-                row['provider'],
-                row['asset_symbol'],
-                row['venue_scope'],
-                row['instrument_scope'],
-                row['interval'],
-                row['metric_name'],
-                row['source_timestamp_utc'],
-            )
-            existing = latest_by_fact_key.get(fact_key)
-            if existing is None or (
-                _market_regime_row_version_key(row)
-                > _market_regime_row_version_key(existing)
-            ):
-                latest_by_fact_key[fact_key] = row
-        return sorted(
-            latest_by_fact_key.values(),
-            key=lambda row: (row['source_timestamp_utc'], row['metric_name']),
+    def _backfill_latest_market_regime_metrics(
+        connection: sqlite3.Connection,
+    ) -> None:
+        # The upsert keeps the newest version, so the log can be replayed in
+        # any order. `WHERE true` lets SQLite parse ON CONFLICT after a SELECT.
+        connection.execute(
+            _INSERT_LATEST_MARKET_REGIME_METRIC_SQL
+            + """
+            SELECT
+                snapshot.runtime_mode,
+                snapshot.asset_symbol,
+                metric.metric_name,
+                metric.source_timestamp_utc,
+                snapshot.provider,
+                snapshot.venue_scope,
+                snapshot.instrument_scope,
+                snapshot.interval,
+                metric.metric_value,
+                metric.unit,
+                metric.snapshot_id,
+                snapshot.observed_at_utc,
+                metric.created_at_utc
+            FROM crypto_signal_market_regime_metrics AS metric
+            INNER JOIN crypto_signal_market_regime_snapshots AS snapshot
+              ON snapshot.snapshot_id = metric.snapshot_id
+            WHERE true
+            """
+            + _LATEST_MARKET_REGIME_METRIC_CONFLICT_SQL
         )
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.db_path)
-        connection.row_factory = sqlite3.Row
-        return connection
+    def _connection_manager(self) -> SqliteConnectionManager:
+        return SqliteConnectionManager.get(self.db_path)
+
+    def _write_connection(self) -> ContextManager[sqlite3.Connection]:
+        return self._connection_manager().writer()
+
+    def _read_connection(self) -> ContextManager[sqlite3.Connection]:
+        # Read helpers go through the read-only pool, so they can inspect an
+        # existing DB without init_schema() or metadata writes.
+        return self._connection_manager().reader()
 
     @staticmethod
     def _utcnow() -> datetime.datetime:
@@ -1464,13 +2683,34 @@ class CryptoSignalRepository:
     def _parse_timestamp(value: str) -> datetime.datetime:
         return datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
 
+    @classmethod
+    def _normalize_timestamp(cls, value: datetime.datetime) -> datetime.datetime:
+        # Match the stored second-precision UTC text so in-memory window
+        # comparisons agree with the SQL range filters.
+        return cls._parse_timestamp(cls._format_timestamp(value))
 
-def _market_regime_row_version_key(row: sqlite3.Row) -> tuple[str, str, int]:
-    return (
-        row['snapshot_observed_at_utc'],
-        row['created_at_utc'],
-        int(row['snapshot_id']),
-    )
+    @classmethod
+    def _parse_cached_timestamp(
+        cls,
+        value: str,
+        timestamps_by_text: dict[str, datetime.datetime],
+    ) -> datetime.datetime:
+        parsed_value = timestamps_by_text.get(value)
+        if parsed_value is None:
+            parsed_value = cls._parse_timestamp(value)
+            timestamps_by_text[value] = parsed_value
+        return parsed_value
+
+    @classmethod
+    def _format_optional_timestamp(
+        cls,
+        value: datetime.datetime | None,
+    ) -> str | None:
+        return None if value is None else cls._format_timestamp(value)
+
+    @classmethod
+    def _parse_optional_timestamp(cls, value: str | None) -> datetime.datetime | None:
+        return None if value is None else cls._parse_timestamp(value)
 
 
 def _calculate_return_pct(
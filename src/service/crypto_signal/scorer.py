@@ -1,6 +1,7 @@
 import datetime
 from collections import defaultdict
 from statistics import mean
+from typing import Callable
 
 from src.service.crypto_signal.models import (
     CALIBRATION_FOLLOW_UP_CONTEXT_TAG,
@@ -62,9 +63,6 @@ def build_digest_view(
     min_dynamic_volume_24h: float = 50_000_000.0,
     market_regime_summary: CryptoSignalMarketRegimeSummary | None = None,
 ) -> CryptoSignalDigestView:
-    tracked_universe_coin_ids = (
-        set() if tracked_universe_coin_ids is None else tracked_universe_coin_ids
-    )
     latest_coins_by_id = {coin.coin_id: coin for coin in latest_snapshot.coins}
     history_by_coin_id: dict[int, list[CryptoSignalCoinSnapshot]] = defaultdict(list)
     for snapshot in history:
@@ -80,6 +78,55 @@ def build_digest_view(
         )
         for latest_coin in latest_coins_by_id.values()
     ]
+
+    def build_missing_watchlist_candidate(
+        coin_id: int,
+    ) -> CryptoSignalCandidate | None:
+        recent_history = history_by_coin_id.get(coin_id)
+        if not recent_history:
+            return None
+        return _build_candidate(
+            latest_coin=recent_history[-1],
+            history=recent_history,
+            latest_snapshot=latest_snapshot,
+            window_label=window_label,
+        )
+
+    return assemble_digest_view(
+        latest_snapshot=latest_snapshot,
+        candidates=candidates,
+        build_missing_watchlist_candidate=build_missing_watchlist_candidate,
+        watchlist_coin_ids=watchlist_coin_ids,
+        window_label=window_label,
+        tracked_universe_coin_ids=tracked_universe_coin_ids,
+        limit=limit,
+        min_dynamic_price_usd=min_dynamic_price_usd,
+        min_dynamic_volume_24h=min_dynamic_volume_24h,
+        market_regime_summary=market_regime_summary,
+    )
+
+
+def assemble_digest_view(
+    latest_snapshot: CryptoSignalSnapshot,
+    candidates: list[CryptoSignalCandidate],
+    build_missing_watchlist_candidate: Callable[[int], CryptoSignalCandidate | None],
+    watchlist_coin_ids: set[int],
+    window_label: str,
+    tracked_universe_coin_ids: set[int] | None = None,
+    limit: int = 3,
+    min_dynamic_price_usd: float = 1.0,
+    min_dynamic_volume_24h: float = 50_000_000.0,
+    market_regime_summary: CryptoSignalMarketRegimeSummary | None = None,
+) -> CryptoSignalDigestView:
+    """Rank scored candidates into the digest sections.
+
+    Shared by the list-based and history-cube scoring paths so both apply the
+    same filters, tie-breaks, and watchlist continuity rules. `candidates` must
+    follow `latest_snapshot.coins` order because the section sorts are stable.
+    """
+    tracked_universe_coin_ids = (
+        set() if tracked_universe_coin_ids is None else tracked_universe_coin_ids
+    )
     candidates_by_coin_id = {
         candidate.coin_id: candidate for candidate in candidates
     }
@@ -127,20 +174,13 @@ def build_digest_view(
     for coin_id in sorted(watchlist_coin_ids):
         if coin_id in candidates_by_coin_id:
             continue
-        recent_history = history_by_coin_id.get(coin_id)
-        if not recent_history:
-            continue
         # Keep the watchlist section stable even when the latest live snapshot
         # omitted the coin, as long as there is still recent retained history
         # inside the requested analysis window.
-        watchlist_candidates.append(
-            _build_candidate(
-                latest_coin=recent_history[-1],
-                history=recent_history,
-                latest_snapshot=latest_snapshot,
-                window_label=window_label,
-            )
-        )
+        watchlist_candidate = build_missing_watchlist_candidate(coin_id)
+        if watchlist_candidate is None:
+            continue
+        watchlist_candidates.append(watchlist_candidate)
 
     strong_candidates.sort(key=lambda candidate: (-candidate.score, candidate.symbol))
     weak_candidates.sort(key=lambda candidate: (candidate.score, candidate.symbol))
@@ -205,6 +245,30 @@ def _build_candidate(
             trend_sign=trend_sign,
             history=history,
         )
+    return _build_scored_candidate(
+        latest_coin=latest_coin,
+        latest_snapshot=latest_snapshot,
+        window_label=window_label,
+        observation_count=observation_count,
+        window_price_change_pct=_calculate_window_price_change_pct(history),
+        price_persistence_score=price_persistence_score,
+        volume_confirmation_score=volume_confirmation_score,
+        attention_persistence_score=attention_persistence_score,
+        breadth_alignment_score=breadth_alignment_score,
+    )
+
+
+def _build_scored_candidate(
+    latest_coin: CryptoSignalCoinSnapshot,
+    latest_snapshot: CryptoSignalSnapshot,
+    window_label: str,
+    observation_count: int,
+    window_price_change_pct: float | None,
+    price_persistence_score: int,
+    volume_confirmation_score: int,
+    attention_persistence_score: int,
+    breadth_alignment_score: int,
+) -> CryptoSignalCandidate:
     total_score = (
         price_persistence_score
         + volume_confirmation_score
@@ -241,7 +305,7 @@ def _build_candidate(
         latest_price_usd=latest_coin.price_usd,
         latest_volume_24h=latest_coin.volume_24h,
         latest_price_change_24h=latest_coin.price_change_24h,
-        window_price_change_pct=_calculate_window_price_change_pct(history),
+        window_price_change_pct=window_price_change_pct,
         latest_volume_change_pct_24h=latest_coin.volume_change_pct_24h,
         latest_context_tags=latest_coin.context_tags,
         score=total_score,
@@ -279,10 +343,21 @@ def _score_price_persistence(price_changes: list[float]) -> int:
     if len(price_changes) == 0:
         return 0
 
-    positive_hits = len([change for change in price_changes if change > 0])
-    negative_hits = len([change for change in price_changes if change < 0])
-    balance = (positive_hits - negative_hits) / len(price_changes)
-    average_change = mean(price_changes)
+    return _score_price_persistence_from_totals(
+        positive_hits=len([change for change in price_changes if change > 0]),
+        negative_hits=len([change for change in price_changes if change < 0]),
+        change_count=len(price_changes),
+        average_change=mean(price_changes),
+    )
+
+
+def _score_price_persistence_from_totals(
+    positive_hits: int,
+    negative_hits: int,
+    change_count: int,
+    average_change: float,
+) -> int:
+    balance = (positive_hits - negative_hits) / change_count
     # Mix direction consistency with average move size so one outsized candle
     # does not dominate the signal if the rest of the window disagrees.
     average_component = _clamp(average_change / 15.0, -1.0, 1.0)
@@ -296,9 +371,19 @@ def _score_volume_confirmation(
     if trend_sign == 0 or len(volume_changes) == 0:
         return 0
 
+    return _score_volume_confirmation_from_average(
+        trend_sign=trend_sign,
+        average_volume_change=mean(volume_changes),
+    )
+
+
+def _score_volume_confirmation_from_average(
+    trend_sign: int,
+    average_volume_change: float,
+) -> int:
     # Volume only confirms an existing price direction in phase 1; it is not
     # allowed to create a directional signal on its own.
-    return trend_sign * 2 if mean(volume_changes) >= 15 else 0
+    return trend_sign * 2 if average_volume_change >= 15 else 0
 
 
 def _score_attention_persistence(
@@ -320,6 +405,13 @@ def _score_attention_persistence(
         for tag in coin.context_tags
         if tag in relevant_tags
     )
+    return _score_attention_persistence_from_hits(
+        trend_sign=trend_sign,
+        spotlight_hits=spotlight_hits,
+    )
+
+
+def _score_attention_persistence_from_hits(trend_sign: int, spotlight_hits: int) -> int:
     if spotlight_hits >= 4:
         return trend_sign * 2
     if spotlight_hits >= 2:
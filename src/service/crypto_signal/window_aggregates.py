@@ -0,0 +1,317 @@
+import datetime
+from dataclasses import dataclass
+from fractions import Fraction
+
+from src.service.crypto_signal.models import (
+    CryptoSignalCandidate,
+    CryptoSignalCoinSnapshot,
+    CryptoSignalDigestView,
+    CryptoSignalMarketRegimeSummary,
+    CryptoSignalSnapshot,
+    CryptoSignalWindowAggregate,
+    CryptoSignalWindowAggregates,
+)
+from src.service.crypto_signal.scorer import (
+    _BEARISH_ATTENTION_TAGS,
+    _BULLISH_ATTENTION_TAGS,
+    _MIN_OBSERVATIONS_TO_SCORE,
+    _WINDOW_LENGTHS,
+    _build_candidate,
+    _build_scored_candidate,
+    _score_attention_persistence_from_hits,
+    _score_price_persistence_from_totals,
+    _score_volume_confirmation_from_average,
+    _sign,
+    assemble_digest_view,
+)
+
+
+WINDOW_AGGREGATE_LENGTHS = dict(_WINDOW_LENGTHS)
+
+# Edges are order statistics, so removing the observation that defines one
+# cannot be undone arithmetically; the repository re-reads stale edges.
+FIRST_PRICED_EDGE = 'first_priced'
+LAST_PRICED_EDGE = 'last_priced'
+LAST_OBSERVED_EDGE = 'last_observed'
+
+
+@dataclass(slots=True)
+class WindowAggregateObservation:
+    coin_id: int
+    run_id: int
+    run_timestamp_utc: datetime.datetime
+    price_usd: float | None
+    price_change_24h: float | None
+    volume_change_pct_24h: float | None
+    context_tags: tuple[str, ...]
+
+
+def apply_window_observation(
+    aggregate: CryptoSignalWindowAggregate,
+    observation: WindowAggregateObservation,
+    sign: int,
+    stale_edges: set[str],
+) -> None:
+    """Add (sign=1) or remove (sign=-1) one coin observation from a window.
+
+    Removing the observation behind a first/last edge clears that edge and
+    records it in `stale_edges`; later adds leave stale edges alone so the
+    caller can recompute them from stored rows once the batch is applied.
+    """
+    _apply_observation_totals(aggregate, observation, sign)
+    if sign > 0:
+        _apply_added_run_edges(aggregate, observation, stale_edges)
+    else:
+        _expire_run_edges(aggregate, observation, stale_edges)
+
+
+def _apply_observation_totals(
+    aggregate: CryptoSignalWindowAggregate,
+    observation: WindowAggregateObservation,
+    sign: int,
+) -> None:
+    aggregate.observation_count += sign
+    if observation.price_change_24h is not None:
+        aggregate.price_change_count += sign
+        if observation.price_change_24h > 0:
+            aggregate.price_change_positive_count += sign
+        elif observation.price_change_24h < 0:
+            aggregate.price_change_negative_count += sign
+        aggregate.price_change_sum = _add_signed(
+            aggregate.price_change_sum, observation.price_change_24h, sign
+        )
+    if observation.volume_change_pct_24h is not None:
+        aggregate.volume_change_count += sign
+        aggregate.volume_change_sum = _add_signed(
+            aggregate.volume_change_sum, observation.volume_change_pct_24h, sign
+        )
+    _apply_context_tags(aggregate, observation.context_tags, sign)
+    if _is_priced(observation):
+        aggregate.priced_count += sign
+
+
+def _apply_context_tags(
+    aggregate: CryptoSignalWindowAggregate,
+    context_tags: tuple[str, ...],
+    sign: int,
+) -> None:
+    for tag in context_tags:
+        if tag in _BULLISH_ATTENTION_TAGS:
+            aggregate.bullish_attention_hits += sign
+        if tag in _BEARISH_ATTENTION_TAGS:
+            aggregate.bearish_attention_hits += sign
+    if 'sector_leader_strongest' in context_tags:
+        aggregate.sector_leader_count += sign
+    if 'sector_loser_weakest' in context_tags:
+        aggregate.sector_loser_count += sign
+
+
+def _apply_added_run_edges(
+    aggregate: CryptoSignalWindowAggregate,
+    observation: WindowAggregateObservation,
+    stale_edges: set[str],
+) -> None:
+    run_timestamp_utc = observation.run_timestamp_utc
+    if LAST_OBSERVED_EDGE not in stale_edges and (
+        aggregate.last_observed_run_timestamp_utc is None
+        or run_timestamp_utc > aggregate.last_observed_run_timestamp_utc
+    ):
+        aggregate.last_observed_run_id = observation.run_id
+        aggregate.last_observed_run_timestamp_utc = run_timestamp_utc
+    if not _is_priced(observation):
+        return
+    if FIRST_PRICED_EDGE not in stale_edges and (
+        aggregate.first_priced_run_timestamp_utc is None
+        or run_timestamp_utc < aggregate.first_priced_run_timestamp_utc
+    ):
+        aggregate.first_priced_run_timestamp_utc = run_timestamp_utc
+        aggregate.first_price_usd = observation.price_usd
+    if LAST_PRICED_EDGE not in stale_edges and (
+        aggregate.last_priced_run_timestamp_utc is None
+        or run_timestamp_utc > aggregate.last_priced_run_timestamp_utc
+    ):
+        aggregate.last_priced_run_timestamp_utc = run_timestamp_utc
+        aggregate.last_price_usd = observation.price_usd
+
+
+def _expire_run_edges(
+    aggregate: CryptoSignalWindowAggregate,
+    observation: WindowAggregateObservation,
+    stale_edges: set[str],
+) -> None:
+    run_timestamp_utc = observation.run_timestamp_utc
+    if run_timestamp_utc == aggregate.last_observed_run_timestamp_utc:
+        stale_edges.add(LAST_OBSERVED_EDGE)
+        aggregate.last_observed_run_id = None
+        aggregate.last_observed_run_timestamp_utc = None
+    if not _is_priced(observation):
+        return
+    if run_timestamp_utc == aggregate.first_priced_run_timestamp_utc:
+        stale_edges.add(FIRST_PRICED_EDGE)
+        aggregate.first_priced_run_timestamp_utc = None
+        aggregate.first_price_usd = None
+    if run_timestamp_utc == aggregate.last_priced_run_timestamp_utc:
+        stale_edges.add(LAST_PRICED_EDGE)
+        aggregate.last_priced_run_timestamp_utc = None
+        aggregate.last_price_usd = None
+
+
+def _is_priced(observation: WindowAggregateObservation) -> bool:
+    return observation.price_usd is not None and observation.price_usd > 0
+
+
+def build_digest_view_from_aggregates(
+    latest_snapshot: CryptoSignalSnapshot,
+    window_aggregates: CryptoSignalWindowAggregates,
+    watchlist_coin_ids: set[int],
+    window_label: str,
+    tracked_universe_coin_ids: set[int] | None = None,
+    limit: int = 3,
+    min_dynamic_price_usd: float = 1.0,
+    min_dynamic_volume_24h: float = 50_000_000.0,
+    market_regime_summary: CryptoSignalMarketRegimeSummary | None = None,
+) -> CryptoSignalDigestView:
+    """Equivalent of `scorer.build_digest_view` over persisted window aggregates.
+
+    Work is proportional to the coins in the window rather than to the number
+    of retained runs, so digest latency stays flat as cadence grows.
+    """
+    if window_aggregates.window_label != window_label:
+        raise RuntimeError(
+            f'Window aggregates are for {window_aggregates.window_label}, not {window_label}'
+        )
+    if (
+        window_aggregates.anchor_run_timestamp_utc
+        != latest_snapshot.run.run_timestamp_utc
+    ):
+        raise RuntimeError('Window aggregates are not anchored to the latest snapshot')
+
+    def build_aggregate_candidate(
+        latest_coin: CryptoSignalCoinSnapshot,
+    ) -> CryptoSignalCandidate:
+        aggregate = window_aggregates.aggregates_by_coin_id.get(latest_coin.coin_id)
+        if aggregate is None:
+            return _build_candidate(
+                latest_coin=latest_coin,
+                history=[latest_coin],
+                latest_snapshot=latest_snapshot,
+                window_label=window_label,
+            )
+        (
+            price_persistence_score,
+            volume_confirmation_score,
+            attention_persistence_score,
+            breadth_alignment_score,
+        ) = _score_window_aggregate(aggregate)
+        return _build_scored_candidate(
+            latest_coin=latest_coin,
+            latest_snapshot=latest_snapshot,
+            window_label=window_label,
+            observation_count=aggregate.observation_count,
+            window_price_change_pct=_calculate_aggregate_window_price_change_pct(
+                aggregate
+            ),
+            price_persistence_score=price_persistence_score,
+            volume_confirmation_score=volume_confirmation_score,
+            attention_persistence_score=attention_persistence_score,
+            breadth_alignment_score=breadth_alignment_score,
+        )
+
+    def build_missing_watchlist_candidate(
+        coin_id: int,
+    ) -> CryptoSignalCandidate | None:
+        latest_coin = window_aggregates.latest_coins_by_id.get(coin_id)
+        if latest_coin is None:
+            return None
+        return build_aggregate_candidate(latest_coin)
+
+    latest_coins_by_id = {coin.coin_id: coin for coin in latest_snapshot.coins}
+    return assemble_digest_view(
+        latest_snapshot=latest_snapshot,
+        candidates=[
+            build_aggregate_candidate(latest_coin)
+            for latest_coin in latest_coins_by_id.values()
+        ],
+        build_missing_watchlist_candidate=build_missing_watchlist_candidate,
+        watchlist_coin_ids=watchlist_coin_ids,
+        window_label=window_label,
+        tracked_universe_coin_ids=tracked_universe_coin_ids,
+        limit=limit,
+        min_dynamic_price_usd=min_dynamic_price_usd,
+        min_dynamic_volume_24h=min_dynamic_volume_24h,
+        market_regime_summary=market_regime_summary,
+    )
+
+
+def _add_signed(total: Fraction, value: float, sign: int) -> Fraction:
+    # Exact sums keep the mean identical to `statistics.mean` no matter how
+    # many adds and expiries the aggregate has been through.
+    return total + Fraction(value) if sign > 0 else total - Fraction(value)
+
+
+def _score_window_aggregate(
+    aggregate: CryptoSignalWindowAggregate,
+) -> tuple[int, int, int, int]:
+    if aggregate.observation_count < _MIN_OBSERVATIONS_TO_SCORE:
+        return 0, 0, 0, 0
+
+    if aggregate.price_change_count == 0:
+        price_persistence_score = 0
+    else:
+        # float(Fraction) rounds the exact mean once, which is what
+        # `statistics.mean` returns for the same float inputs.
+        price_persistence_score = _score_price_persistence_from_totals(
+            positive_hits=aggregate.price_change_positive_count,
+            negative_hits=aggregate.price_change_negative_count,
+            change_count=aggregate.price_change_count,
+            average_change=float(
+                aggregate.price_change_sum / aggregate.price_change_count
+            ),
+        )
+    trend_sign = _sign(price_persistence_score)
+    if trend_sign == 0:
+        return price_persistence_score, 0, 0, 0
+
+    volume_confirmation_score = (
+        0
+        if aggregate.volume_change_count == 0
+        else _score_volume_confirmation_from_average(
+            trend_sign=trend_sign,
+            average_volume_change=float(
+                aggregate.volume_change_sum / aggregate.volume_change_count
+            ),
+        )
+    )
+    attention_persistence_score = _score_attention_persistence_from_hits(
+        trend_sign=trend_sign,
+        spotlight_hits=(
+            aggregate.bullish_attention_hits
+            if trend_sign > 0
+            else aggregate.bearish_attention_hits
+        ),
+    )
+    if trend_sign > 0:
+        breadth_alignment_score = 1 if aggregate.sector_leader_count > 0 else 0
+    else:
+        breadth_alignment_score = -1 if aggregate.sector_loser_count > 0 else 0
+    return (
+        price_persistence_score,
+        volume_confirmation_score,
+        attention_persistence_score,
+        breadth_alignment_score,
+    )
+
+
+def _calculate_aggregate_window_price_change_pct(
+    aggregate: CryptoSignalWindowAggregate,
+) -> float | None:
+    if (
+        aggregate.priced_count < 2
+        or aggregate.first_price_usd is None
+        or aggregate.last_price_usd is None
+    ):
+        return None
+    return (
+        (aggregate.last_price_usd - aggregate.first_price_usd)
+        / aggregate.first_price_usd
+    ) * 100
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from fastapi.encoders import jsonable_encoder
+
+from src.db.redis import Redis
+
+logger = logging.getLogger('Response cache')
+
+REDIS_KEY_PREFIX = 'response_cache'
+
+
+@dataclass(slots=True)
+class ResponseCacheStats:
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    redis_errors: int = 0
+
+
+def build_cache_key(namespace: str, params: dict[str, Any]) -> str:
+    # Query params arrive as strings over HTTP but as ints/bools from direct
+    # calls and defaults, so '365' and 365 must share one entry.
+    normalized_params = {
+        name: str(value).strip()
+        for name, value in params.items()
+        if value is not None
+    }
+    return f'{REDIS_KEY_PREFIX}:{namespace}:{json.dumps(normalized_params, sort_keys=True, separators=(",", ":"))}'
+
+
+class ResponseCache:
+    """Two-tier TTL cache for upstream-backed API responses.
+
+    An in-process LRU answers repeat requests without a network hop; Redis
+    shares entries across workers and restarts. Concurrent misses for the same
+    key are coalesced onto one upstream call. Values are stored JSON-encoded,
+    so both tiers return what FastAPI would have serialized anyway.
+    """
+
+    def __init__(
+        self,
+        max_local_entries: int = 256,
+        redis_client_getter: Callable[[], Any] = Redis.get_client,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_local_entries = max_local_entries
+        self.redis_client_getter = redis_client_getter
+        self.clock = clock
+        self.stats = ResponseCacheStats()
+        self._local_entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        params: dict[str, Any],
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        key = build_cache_key(namespace, params)
+        local_entry = self._local_entries.get(key)
+        if local_entry is not None:
+            expires_at, value = local_entry
+            if expires_at > self.clock():
+                self._local_entries.move_to_end(key)
+                self.stats.local_hits += 1
+                return value
+            del self._local_entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._load(key, ttl_seconds, loader))
+        self._inflight[key] = task
+
+        def _clear_inflight(_task: asyncio.Future) -> None:
+            if self._inflight.get(key) is _task:
+                del self._inflight[key]
+
+        task.add_done_callback(_clear_inflight)
+        # Shield the shared load so one cancelled request does not fail the
+        # others waiting on it.
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> ResponseCacheStats:
+        return self.stats
+
+    def clear_local(self) -> None:
+        self._local_entries.clear()
+
+    async def _load(
+        self,
+        key: str,
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        redis_entry = await self._get_redis_entry(key)
+        if redis_entry is not None:
+            expires_at, value = redis_entry
+            if expires_at > self.clock():
+                self.stats.redis_hits += 1
+                self._set_local_entry(key, expires_at, value)
+                return value
+
+        self.stats.misses += 1
+        value = jsonable_encoder(await loader())
+        expires_at = self.clock() + ttl_seconds
+        self._set_local_entry(key, expires_at, value)
+        await self._set_redis_entry(key, expires_at, ttl_seconds, value)
+        return value
+
+    def _set_local_entry(self, key: str, expires_at: float, value: Any) -> None:
+        self._local_entries[key] = (expires_at, value)
+        self._local_entries.move_to_end(key)
+        while len(self._local_entries) > self.max_local_entries:
+            self._local_entries.popitem(last=False)
+
+    async def _get_redis_entry(self, key: str) -> tuple[float, Any] | None:
+        try:
+            raw_entry = await self.redis_client_getter().get(key)
+        except Exception:
+            # Redis is only a shared tier; an outage costs upstream calls, not
+            # failed API responses.
+            self.stats.redis_errors += 1
+            logger.warning('Failed to read response cache key %s from Redis', key, exc_info=True)
+            return None
+        if raw_entry is None:
+            return None
+        try:
+            entry = json.loads(raw_entry)
+            return entry['expires_at'], entry['data']
+        except (ValueError, KeyError, TypeError):
+            # A truncated or foreign value is a miss; the reload overwrites it.
+            self.stats.redis_errors += 1
+            logger.warning('Failed to decode response cache key %s from Redis', key, exc_info=True)
+            return None
+
+    async def _set_redis_entry(
+        self,
+        key: str,
+        expires_at: float,
+        ttl_seconds: float,
+        value: Any,
+    ) -> None:
+        # The absolute expiry travels with the value so a worker that reads
+        # the entry late does not extend its lifetime in its local tier.
+        raw_entry = json.dumps({'expires_at': expires_at, 'data': value})
+        try:
+            await self.redis_client_getter().set(
+                key,
+                raw_entry,
+                px=max(1, int(ttl_seconds * 1000)),
+            )
+        except Exception:
+            self.stats.redis_errors += 1
+            logger.warning('Failed to write response cache key %s to Redis', key, exc_info=True)
+
+
+async def load_cached(
+    cache: ResponseCache | None,
+    namespace: str,
+    params: dict[str, Any],
+    ttl_seconds: float,
+    loader: Callable[[], Awaitable[Any]],
+) -> Any:
+    if cache is None:
+        return await loader()
+    return await cache.get_or_load(
+        namespace=namespace,
+        params=params,
+        ttl_seconds=ttl_seconds,
+        loader=loader,
+    )
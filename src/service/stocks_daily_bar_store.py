@@ -0,0 +1,156 @@
+import datetime
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ContextManager
+
+from src.config import config
+from src.db.sqlite import SqliteConnectionManager
+from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE, RuntimeMode
+from src.util.metrics import instrument_sqlite_repository
+
+SCHEMA_VERSION = 1
+BARCHART_SOURCE = 'barchart'
+TRADINGVIEW_SOURCE = 'tradingview'
+# Stay well below SQLite's default bound-parameter limit in IN (...) lookups.
+_SQLITE_IN_CHUNK_SIZE = 500
+
+
+@dataclass(slots=True)
+class StocksDailyBar:
+    symbol: str
+    # XNYS session date, "yyyy-mm-dd".
+    session_date: str
+    open: float | None
+    high: float | None
+    low: float | None
+    close: float | None
+    volume: float | None
+    source: str
+
+
+@instrument_sqlite_repository('stocks_daily_bar')
+class StocksDailyBarStore:
+    """Local SQLite store of daily stock bars keyed by symbol and XNYS session.
+
+    Settled sessions never change, so each bar is downloaded once. TradingView
+    bars only carry close and volume; a Barchart bar for the same session
+    replaces them, while a TradingView bar never overwrites a Barchart one.
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        runtime_mode: RuntimeMode | None = None,
+    ) -> None:
+        active_runtime_mode = (
+            DEFAULT_RUNTIME_MODE if runtime_mode is None else runtime_mode
+        )
+        self.db_path = db_path or config.get_stocks_daily_bar_db_path(
+            runtime_mode=active_runtime_mode
+        )
+
+    def init_schema(self) -> None:
+        connection_manager = self._connection_manager()
+        if connection_manager.schema_version == SCHEMA_VERSION:
+            return
+
+        with connection_manager.writer() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS stocks_daily_bars (
+                    symbol TEXT NOT NULL,
+                    session_date TEXT NOT NULL,
+                    open REAL NULL,
+                    high REAL NULL,
+                    low REAL NULL,
+                    close REAL NULL,
+                    volume REAL NULL,
+                    source TEXT NOT NULL,
+                    updated_at_utc TEXT NOT NULL,
+                    PRIMARY KEY (symbol, session_date)
+                ) WITHOUT ROWID
+                """
+            )
+        connection_manager.schema_version = SCHEMA_VERSION
+
+    def save_bars(self, bars: list[StocksDailyBar]) -> None:
+        if len(bars) == 0:
+            return
+        self.init_schema()
+        updated_at_utc = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        with self._connection_manager().writer() as connection:
+            connection.executemany(
+                """
+                INSERT INTO stocks_daily_bars (
+                    symbol, session_date, open, high, low, close, volume, source, updated_at_utc
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(symbol, session_date) DO UPDATE SET
+                    open=COALESCE(excluded.open, stocks_daily_bars.open),
+                    high=COALESCE(excluded.high, stocks_daily_bars.high),
+                    low=COALESCE(excluded.low, stocks_daily_bars.low),
+                    close=COALESCE(excluded.close, stocks_daily_bars.close),
+                    volume=COALESCE(excluded.volume, stocks_daily_bars.volume),
+                    source=excluded.source,
+                    updated_at_utc=excluded.updated_at_utc
+                WHERE excluded.source = ? OR stocks_daily_bars.source = excluded.source
+                """,
+                [
+                    (
+                        bar.symbol,
+                        bar.session_date,
+                        bar.open,
+                        bar.high,
+                        bar.low,
+                        bar.close,
+                        bar.volume,
+                        bar.source,
+                        updated_at_utc,
+                        BARCHART_SOURCE,
+                    )
+                    for bar in bars
+                ],
+            )
+
+    def get_bars(
+        self,
+        symbols: list[str],
+        start_session_date: str,
+        end_session_date: str,
+    ) -> dict[str, dict[str, StocksDailyBar]]:
+        """Return bars by symbol, then by session date, within the inclusive range."""
+        unique_symbols = list(dict.fromkeys(symbols))
+        if len(unique_symbols) == 0 or not Path(self.db_path).exists():
+            return {}
+
+        bars_by_symbol: dict[str, dict[str, StocksDailyBar]] = {}
+        with self._read_connection() as connection:
+            for chunk_start in range(0, len(unique_symbols), _SQLITE_IN_CHUNK_SIZE):
+                chunk = unique_symbols[chunk_start:chunk_start + _SQLITE_IN_CHUNK_SIZE]
+                placeholders = ','.join('?' for _ in chunk)
+                try:
+                    rows = connection.execute(
+                        f"""
+                        SELECT symbol, session_date, open, high, low, close, volume, source
+                        FROM stocks_daily_bars
+                        WHERE symbol IN ({placeholders})
+                          AND session_date BETWEEN ? AND ?
+                        """,
+                        [*chunk, start_session_date, end_session_date],
+                    ).fetchall()
+                except sqlite3.OperationalError as error:
+                    if 'no such table' in str(error):
+                        return {}
+                    raise
+                for row in rows:
+                    bars_by_symbol.setdefault(row['symbol'], {})[row['session_date']] = (
+                        StocksDailyBar(**dict(row))
+                    )
+        return bars_by_symbol
+
+    def _connection_manager(self) -> SqliteConnectionManager:
+        return SqliteConnectionManager.get(self.db_path)
+
+    def _read_connection(self) -> ContextManager[sqlite3.Connection]:
+        return self._connection_manager().reader()
@@ -9,6 +9,7 @@ from market_data_library.types import cnn_type
 
 from src.data_source.market_data_library import get_tradfi_api
 from src.type.sentiment import FearGreedAverage, FearGreedData, FearGreedResult
+from src.util.fetch_scheduler import CNN_PROVIDER, schedule_fetch
 
 logger = logging.getLogger("Stocks sentiment service")
 
@@ -190,6 +191,6 @@ class StocksSentimentService:
 
     async def get_stocks_fear_greed_index_from_source(self) -> cnn_type.CnnFearGreedIndex:
         fear_greed_res: cnn_type.CnnFearGreedIndex = (
-            await self.cnn_service.get_fear_greed_index()
+            await schedule_fetch(CNN_PROVIDER, self.cnn_service.get_fear_greed_index)
         )
         return fear_greed_res
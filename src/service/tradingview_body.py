@@ -0,0 +1,70 @@
+import json
+from typing import Any
+
+from src.service.tradingview_codec import SERIES_FIELDS
+from src.type.trading_view import TradingViewDataType
+
+# A JSON string holding the body counts as one layer; TradingView and the
+# replay scripts use at most two.
+MAX_ENCODING_LAYERS = 3
+_DATA_TYPES = frozenset(data_type.value for data_type in TradingViewDataType)
+_NUMBER_TYPES = (int, float)
+# Unescaping can leave control characters such as newlines inside strings.
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+
+class TradingViewBodyTooLargeError(ValueError):
+    pass
+
+
+def parse_tradingview_body_text(raw_text: str) -> Any:
+    """Decode a webhook body sent as JSON, shell-escaped JSON (`{\\"type\\": ...}`)
+    or JSON encoded as a JSON string.
+
+    The encoding is read from the first characters, so each layer is decoded
+    exactly once instead of trying every variant of the whole body.
+    """
+    text = raw_text
+    for _ in range(MAX_ENCODING_LAYERS):
+        if _is_shell_escaped(text):
+            # Undo the escaping by decoding the text as the inside of a string.
+            text = _JSON_DECODER.decode(f'"{text}"')
+        parsed = _JSON_DECODER.decode(text)
+        if not isinstance(parsed, str):
+            return parsed
+        text = parsed.strip()
+    raise ValueError(f'TradingView request body has more than {MAX_ENCODING_LAYERS} encoding layers')
+
+
+def _is_shell_escaped(text: str) -> bool:
+    if not text.startswith('{'):
+        return False
+    index = 1
+    while index < len(text) and text[index] in ' \t\r\n':
+        index += 1
+    return text.startswith('\\"', index)
+
+
+def validate_tradingview_body(body: dict) -> None:
+    """Check the fields that are saved and later read by the stocks job."""
+    if body.get('type') not in _DATA_TYPES:
+        raise ValueError(f'type must be one of {", ".join(sorted(_DATA_TYPES))}')
+    data = body.get('data')
+    if not isinstance(data, list):
+        raise ValueError('data must be a list')
+    for index, item in enumerate(data):
+        if not isinstance(item, dict):
+            raise ValueError(f'data[{index}] must be an object')
+        symbol = item.get('symbol')
+        if not isinstance(symbol, str) or symbol == '':
+            raise ValueError(f'data[{index}].symbol must be a non-empty string')
+        timeframe = item.get('timeframe')
+        if timeframe is not None and not isinstance(timeframe, str):
+            raise ValueError(f'data[{index}].timeframe must be a string')
+        for name in SERIES_FIELDS:
+            series = item.get(name)
+            if series is None:
+                continue
+            # type() rather than isinstance() so booleans are rejected.
+            if not isinstance(series, list) or not all(type(value) in _NUMBER_TYPES for value in series):
+                raise ValueError(f'data[{index}].{name} must be a list of numbers')
@@ -0,0 +1,164 @@
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Protocol
+
+# Legacy members are JSON text and always start with '{', so a leading NUL
+# byte cannot collide with them.
+COMPACT_MAGIC = b'\x00TV'
+COMPACT_VERSION = 1
+SERIES_FIELDS = ('close_prices', 'ema20s', 'volumes')
+_HEADER_LENGTH = struct.Struct('<I')
+_JSON_SERIES = 'j'
+
+
+class TradingViewPayloadCodec(Protocol):
+    def encode(self, body: dict) -> bytes:
+        ...
+
+    def decode(self, raw: bytes | str) -> dict:
+        ...
+
+
+class JsonTradingViewPayloadCodec:
+    """Legacy encoding: the filtered webhook body as JSON text."""
+
+    def encode(self, body: dict) -> bytes:
+        return json.dumps(body).encode('utf-8')
+
+    def decode(self, raw: bytes | str) -> dict:
+        return decode_tradingview_payload(raw)
+
+
+class CompactTradingViewPayloadCodec:
+    """Versioned binary encoding for stored TradingView payloads.
+
+    Layout: magic, version byte, then a zlib stream holding a length-prefixed
+    JSON header (scalar fields plus per-series type code and length) followed
+    by the packed little-endian series. Integer series are packed as int64 and
+    float series as float64, so values round-trip with their original types.
+    Series with anything other than plain numbers stay in the JSON header.
+    """
+
+    def __init__(self, compression_level: int = 6):
+        self.compression_level = compression_level
+
+    def encode(self, body: dict) -> bytes:
+        items = body.get('data')
+        meta = {name: value for name, value in body.items() if name != 'data'}
+        header = {'meta': meta, 'items': None}
+        packed_series = []
+        if isinstance(items, list):
+            header['items'] = []
+            for item in items:
+                if not isinstance(item, dict):
+                    header['items'].append({'raw': item})
+                    continue
+                item_header = {
+                    name: value for name, value in item.items() if name not in SERIES_FIELDS
+                }
+                item_header['series'] = _pack_item_series(item, packed_series)
+                header['items'].append(item_header)
+        elif 'data' in body:
+            meta['data'] = items
+
+        header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        payload = b''.join([_HEADER_LENGTH.pack(len(header_bytes)), header_bytes, *packed_series])
+        return (
+            COMPACT_MAGIC
+            + bytes([COMPACT_VERSION])
+            + zlib.compress(payload, self.compression_level)
+        )
+
+    def decode(self, raw: bytes | str) -> dict:
+        return decode_tradingview_payload(raw)
+
+
+def decode_tradingview_payload(raw: bytes | str) -> dict:
+    """Decode a stored member in any supported encoding, including legacy JSON."""
+    if isinstance(raw, str) or not raw.startswith(COMPACT_MAGIC):
+        return json.loads(raw)
+
+    version = raw[len(COMPACT_MAGIC)]
+    if version != COMPACT_VERSION:
+        raise ValueError(f'Unsupported TradingView payload encoding version {version}')
+
+    payload = zlib.decompress(raw[len(COMPACT_MAGIC) + 1:])
+    (header_length,) = _HEADER_LENGTH.unpack_from(payload)
+    offset = _HEADER_LENGTH.size
+    header = json.loads(payload[offset:offset + header_length])
+    offset += header_length
+
+    body = dict(header['meta'])
+    if header['items'] is None:
+        return body
+
+    items = []
+    for item_header in header['items']:
+        if 'raw' in item_header:
+            items.append(item_header['raw'])
+            continue
+        series_header = item_header.pop('series')
+        item = item_header
+        for name, (type_code, value, *int_positions) in series_header.items():
+            if type_code == _JSON_SERIES:
+                item[name] = value
+                continue
+            values = array(type_code)
+            byte_length = value * values.itemsize
+            values.frombytes(payload[offset:offset + byte_length])
+            offset += byte_length
+            if sys.byteorder != 'little':
+                values.byteswap()
+            item[name] = values.tolist()
+            for index in int_positions[0] if int_positions else ():
+                item[name][index] = int(item[name][index])
+        items.append(item)
+    body['data'] = items
+    return body
+
+
+def _pack_item_series(item: dict, packed_series: list[bytes]) -> dict:
+    """Append the item's packed series to `packed_series` and return their header."""
+    series_header = {}
+    for name in SERIES_FIELDS:
+        if name not in item:
+            continue
+        type_code = _get_series_type_code(item[name])
+        if type_code == _JSON_SERIES:
+            series_header[name] = [_JSON_SERIES, item[name]]
+            continue
+        values = array(type_code, item[name])
+        if sys.byteorder != 'little':
+            values.byteswap()
+        series_header[name] = [type_code, len(values)]
+        if type_code == 'd':
+            # JSON parses whole numbers as int; remember where so mixed
+            # series decode with the same types.
+            int_positions = [
+                index
+                for index, value in enumerate(item[name])
+                if type(value) is int  # noqa: E721 exact type excludes bool
+            ]
+            if int_positions:
+                series_header[name].append(int_positions)
+        packed_series.append(values.tobytes())
+    return series_header
+
+
+def _get_series_type_code(values) -> str:
+    if not isinstance(values, list):
+        return _JSON_SERIES
+    # bool is an int subclass but would not round-trip through either array.
+    if all(type(value) is int for value in values):  # noqa: E721 exact type excludes bool
+        if all(-(2 ** 63) <= value < 2 ** 63 for value in values):
+            return 'q'
+        return _JSON_SERIES
+    if all(
+        type(value) is float or (type(value) is int and abs(value) <= 2 ** 53)  # noqa: E721 exact types exclude bool
+        for value in values
+    ):
+        return 'd'
+    return _JSON_SERIES
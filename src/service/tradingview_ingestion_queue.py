@@ -0,0 +1,276 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from redis.exceptions import ResponseError
+
+from src.db.redis import Redis
+from src.util.exception import get_exception_message
+
+logger = logging.getLogger('Trading view ingestion queue')
+
+STREAM_KEY = 'tradingview-webhook-stream'
+CONSUMER_GROUP = 'tradingview-webhook-workers'
+
+
+@dataclass(slots=True)
+class TradingViewIngestionStats:
+    # Entries retained in the stream, including already acknowledged ones.
+    length: int
+    # Delivered to a worker but not yet acknowledged.
+    pending: int
+    # Appended but not yet delivered to any worker. None when Redis < 7.
+    lag: int | None
+    oldest_pending_age_ms: int | None
+
+
+def _decode(value) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def _get_entry_timestamp_ms(entry_id) -> int:
+    # Stream ids are "<unix ms>-<sequence>".
+    return int(_decode(entry_id).split('-', 1)[0])
+
+
+class TradingViewIngestionQueue:
+    """Durable Redis Stream between the TradingView webhook and its worker.
+
+    The webhook only appends an entry, so a burst of close alerts is
+    acknowledged in milliseconds. Entries stay pending until a worker acks
+    them, so a crash mid-processing is redelivered instead of lost.
+    """
+
+    def __init__(
+        self,
+        redis_client_getter: Callable[[], Any] = Redis.get_client,
+        stream_key: str = STREAM_KEY,
+        group_name: str = CONSUMER_GROUP,
+        max_length: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.redis_client_getter = redis_client_getter
+        self.stream_key = stream_key
+        self.group_name = group_name
+        self.max_length = max_length
+        self.clock = clock
+
+    async def enqueue(self, body: dict, client_host: str) -> str:
+        entry_id = await self.redis_client_getter().xadd(
+            self.stream_key,
+            {
+                'body': json.dumps(body, separators=(',', ':')),
+                'client_host': client_host,
+            },
+            maxlen=self.max_length,
+            approximate=True,
+        )
+        return _decode(entry_id)
+
+    async def ensure_group(self) -> None:
+        try:
+            await self.redis_client_getter().xgroup_create(
+                self.stream_key,
+                self.group_name,
+                id='0',
+                mkstream=True,
+            )
+        except ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    async def get_stats(self) -> TradingViewIngestionStats:
+        redis_client = self.redis_client_getter()
+        length = await redis_client.xlen(self.stream_key)
+        try:
+            groups = await redis_client.xinfo_groups(self.stream_key)
+        except ResponseError:
+            # The stream does not exist until the first enqueue or worker start.
+            groups = []
+        group = next(
+            (group for group in groups if _decode(group.get('name')) == self.group_name),
+            None,
+        )
+        if group is None:
+            return TradingViewIngestionStats(
+                length=length,
+                pending=0,
+                lag=length,
+                oldest_pending_age_ms=None,
+            )
+
+        oldest_pending_age_ms = None
+        pending = int(group.get('pending') or 0)
+        if pending > 0:
+            summary = await redis_client.xpending(self.stream_key, self.group_name)
+            if summary.get('min') is not None:
+                oldest_pending_age_ms = max(
+                    0,
+                    int(self.clock() * 1000) - _get_entry_timestamp_ms(summary['min']),
+                )
+        lag = group.get('lag')
+        return TradingViewIngestionStats(
+            length=length,
+            pending=pending,
+            lag=int(lag) if lag is not None else None,
+            oldest_pending_age_ms=oldest_pending_age_ms,
+        )
+
+
+class TradingViewIngestionWorker:
+    """Consumer-group worker that applies queued webhook payloads.
+
+    A payload whose handler raises stays pending and is reclaimed once it has
+    been idle for `claim_idle_ms`; after `max_deliveries` attempts it is
+    acknowledged and dropped so one bad payload cannot wedge the queue.
+    `on_drop` is awaited once for a payload dropped after its final failed
+    delivery, so alerts are not repeated for every retry.
+    """
+
+    def __init__(
+        self,
+        queue: TradingViewIngestionQueue,
+        handler: Callable[[dict, str], Awaitable[Any]],
+        on_drop: Callable[[dict, str, Exception], Awaitable[Any]] | None = None,
+        consumer_name: str | None = None,
+        batch_size: int = 50,
+        block_ms: int = 1_000,
+        claim_idle_ms: int = 60_000,
+        max_deliveries: int = 3,
+    ):
+        self.queue = queue
+        self.handler = handler
+        self.on_drop = on_drop
+        self.consumer_name = consumer_name or f'{socket.gethostname()}-{os.getpid()}'
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.max_deliveries = max_deliveries
+
+    async def run(self) -> None:
+        logger.info(f'Consuming {self.queue.stream_key} as {self.consumer_name}')
+        group_ready = False
+        while True:
+            try:
+                # Inside the loop so Redis being down at boot is retried, and
+                # so a stream lost to a flush or restart, which XADD recreates
+                # without the group, gets its group back.
+                if not group_ready:
+                    await self.queue.ensure_group()
+                    group_ready = True
+                await self.process_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if isinstance(e, ResponseError) and 'NOGROUP' in str(e):
+                    group_ready = False
+                logger.error(get_exception_message(e, cls=self.__class__.__name__))
+                await asyncio.sleep(self.block_ms / 1000)
+
+    async def process_batch(self) -> int:
+        """Process reclaimed stale entries, then new ones. Returns entries handled."""
+        entries = await self._claim_stale_entries()
+        if len(entries) == 0:
+            response = await self.queue.redis_client_getter().xreadgroup(
+                self.queue.group_name,
+                self.consumer_name,
+                {self.queue.stream_key: '>'},
+                count=self.batch_size,
+                block=self.block_ms,
+            )
+            entries = [
+                (entry_id, fields, 1)
+                for _stream, stream_entries in response or []
+                for entry_id, fields in stream_entries
+            ]
+
+        for entry_id, fields, delivery in entries:
+            await self._handle_entry(entry_id, fields, delivery)
+        return len(entries)
+
+    async def _handle_entry(self, entry_id, fields: dict | None, delivery: int) -> None:
+        if not fields:
+            # A reclaimed entry that was trimmed from the stream has no body.
+            await self.queue.redis_client_getter().xack(
+                self.queue.stream_key,
+                self.queue.group_name,
+                entry_id,
+            )
+            return
+        fields = {_decode(key): _decode(value) for key, value in fields.items()}
+        body = {}
+        try:
+            body = json.loads(fields['body'])
+            await self.handler(body, fields.get('client_host'))
+        except Exception as e:
+            logger.error(
+                f'Failed to process {self.queue.stream_key} entry {_decode(entry_id)} '
+                f'(delivery {delivery}/{self.max_deliveries}): '
+                f'{get_exception_message(e, cls=self.__class__.__name__)}'
+            )
+            if delivery < self.max_deliveries:
+                # Leave the entry pending; it is reclaimed after claim_idle_ms.
+                return
+            logger.error(f'Dropping {self.queue.stream_key} entry {_decode(entry_id)} after {delivery} failed deliveries')
+            if self.on_drop is not None:
+                try:
+                    await self.on_drop(body, fields.get('client_host'), e)
+                except Exception as drop_error:
+                    logger.error(get_exception_message(drop_error, cls=self.__class__.__name__))
+        await self.queue.redis_client_getter().xack(
+            self.queue.stream_key,
+            self.queue.group_name,
+            entry_id,
+        )
+
+    async def _claim_stale_entries(self) -> list:
+        redis_client = self.queue.redis_client_getter()
+        stale_entries = await redis_client.xpending_range(
+            self.queue.stream_key,
+            self.queue.group_name,
+            min='-',
+            max='+',
+            count=self.batch_size,
+            idle=self.claim_idle_ms,
+        )
+        if len(stale_entries) == 0:
+            return []
+
+        claim_ids = []
+        deliveries = {}
+        for stale_entry in stale_entries:
+            # Reached only when the final delivery did not finish, e.g. the
+            # process stopped mid-handler, so there is no error to report.
+            if stale_entry['times_delivered'] >= self.max_deliveries:
+                logger.error(
+                    f'Dropping {self.queue.stream_key} entry {_decode(stale_entry["message_id"])} '
+                    f'after {stale_entry["times_delivered"]} failed deliveries'
+                )
+                await redis_client.xack(
+                    self.queue.stream_key,
+                    self.queue.group_name,
+                    stale_entry['message_id'],
+                )
+            else:
+                claim_ids.append(stale_entry['message_id'])
+                deliveries[_decode(stale_entry['message_id'])] = stale_entry['times_delivered'] + 1
+        if len(claim_ids) == 0:
+            return []
+        # Claiming also covers entries left by a previous process, whose
+        # consumer name (host and pid) no longer exists.
+        claimed_entries = await redis_client.xclaim(
+            self.queue.stream_key,
+            self.queue.group_name,
+            self.consumer_name,
+            min_idle_time=self.claim_idle_ms,
+            message_ids=claim_ids,
+        )
+        return [
+            (entry_id, fields, deliveries.get(_decode(entry_id), self.max_deliveries))
+            for entry_id, fields in claimed_entries
+        ]
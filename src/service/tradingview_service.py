@@ -1,21 +1,64 @@
-import json
 import logging
 from typing import Optional
 
 from src.config import config
 from src.db.redis import Redis
+from src.service.tradingview_codec import (
+    CompactTradingViewPayloadCodec,
+    JsonTradingViewPayloadCodec,
+    TradingViewPayloadCodec,
+)
 from src.type.trading_view import TradingViewDataType, TradingViewData, TradingViewStocksData, TradingViewRedisData
 from src.util.exception import get_exception_message
 
 logger = logging.getLogger('Trading view service')
+
+# KEYS[1]: sorted set key
+# ARGV: data, score, test_mode (1/0), days to store
+# Test replays keep request-local semantics and only add. The non-test path
+# replaces an existing same-score payload so the latest market-close anchor
+# wins. Then the oldest entries beyond the retention count are trimmed.
+# Returns {<add count>, <remove count>}.
+SAVE_TRADINGVIEW_DATA_SCRIPT = """
+local key = KEYS[1]
+local data = ARGV[1]
+local score = ARGV[2]
+local test_mode = ARGV[3] == '1'
+local days_to_store = tonumber(ARGV[4])
+
+if not test_mode then
+    redis.call('ZREMRANGEBYSCORE', key, score, score)
+end
+local add_res = redis.call('ZADD', key, score, data)
+
+local remove_res = 0
+local num_elements = redis.call('ZCARD', key)
+if num_elements > days_to_store then
+    remove_res = redis.call('ZREMRANGEBYRANK', key, 0, num_elements - days_to_store - 1)
+end
+return {add_res, remove_res}
+"""
+
+
 class TradingViewService:
+    def __init__(self, codec: TradingViewPayloadCodec | None = None):
+        if codec is None:
+            codec = (
+                JsonTradingViewPayloadCodec()
+                if config.get_tradingview_payload_encoding() == 'json'
+                else CompactTradingViewPayloadCodec()
+            )
+        # Only writes use the configured codec; reads accept every encoding,
+        # so legacy JSON members stay readable after switching.
+        self.codec = codec
+
     async def get_tradingview_daily_stocks_data(self, type: TradingViewDataType) -> Optional[TradingViewRedisData]:
         try:
             key = self.get_redis_key_for_stocks(type)
             tradingview_data = await Redis.get_client().zrange(key, start=0, end=0, desc=True, withscores=True)
             if (len(tradingview_data) == 0):
                 return TradingViewRedisData(key=key, data=None, score=None)
-            data_parsed = json.loads(tradingview_data[0][0])
+            data_parsed = self.codec.decode(tradingview_data[0][0])
             return TradingViewRedisData(key=key, data=self.hydrate_tradingview_data(data_parsed), score=int(tradingview_data[0][1]))
         except Exception as e:
             logger.error(get_exception_message(e, cls=self.__class__.__name__, should_escape_markdown=True))
@@ -23,29 +66,21 @@ class TradingViewService:
 
     # score = timestamp of current date(without time)
     # return: [<add count>, <remove count>]
-    async def save_tradingview_data(self, data: str, key: str, score: int, test_mode: bool = False):
+    async def save_tradingview_data(self, data: dict, key: str, score: int, test_mode: bool = False):
         redis_client = Redis.get_client()
-        tradingview_data = await redis_client.zrange(key, start=score, end=score, desc=True, byscore=True)
-        # Keep request-local test replay semantics, but let the non-test path replace
-        # an existing same-score payload so the latest market-close anchor wins.
-        # Queue the remove and add in one Redis transaction to avoid a gap where the
-        # old anchor is deleted but the replacement has not been written yet.
-        if not test_mode and tradingview_data is not None and len(tradingview_data) > 0:
-            pipeline = redis_client.pipeline(transaction=True)
-            pipeline.zremrangebyscore(key, min=score, max=score)
-            pipeline.zadd(key, {data: score})
-            (_, add_res) = await pipeline.execute()
-        else:
-            add_res = await redis_client.zadd(key, {data: score})
-
-        # remove old keys
-        num_elements = await redis_client.zcard(key)
-        if num_elements <= config.get_trading_view_days_to_store():
-            return [add_res, 0]
-
-        num_elements_to_remove = num_elements - config.get_trading_view_days_to_store()
-        remove_res = await redis_client.zremrangebyrank(key, 0, num_elements_to_remove - 1)
-
+        # The replace, add and retention trim run as one server-side script, so
+        # concurrent webhooks of the same type cannot interleave between the
+        # steps, and the whole save costs a single round trip.
+        save_script = redis_client.register_script(SAVE_TRADINGVIEW_DATA_SCRIPT)
+        [add_res, remove_res] = await save_script(
+            keys=[key],
+            args=[
+                self.codec.encode(data),
+                score,
+                1 if test_mode else 0,
+                int(config.get_trading_view_days_to_store()),
+            ],
+        )
         return [add_res, remove_res]
 
     def hydrate_tradingview_data(self, data) -> TradingViewData:
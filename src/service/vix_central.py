@@ -6,6 +6,7 @@ import calendar
 from typing import List
 from src.config import config
 from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE, RuntimeMode
+from src.service.vix_central_history_store import VixCentralHistoryStore
 from src.third_party_service.vix_central import ThirdPartyVixCentralService
 from src.util import date_util
 
@@ -54,6 +55,7 @@ class VixCentralService:
         third_party_service=ThirdPartyVixCentralService,
         number_of_days_to_store=None,
         contango_decrease_past_n_days_threshold=None,
+        history_store: VixCentralHistoryStore | None = None,
     ):
         if number_of_days_to_store is None:
             number_of_days_to_store = config.get_vix_central_number_of_days()
@@ -62,6 +64,9 @@ class VixCentralService:
         self.number_of_days_to_store = number_of_days_to_store
         self.contango_decrease_past_n_days_threshold = contango_decrease_past_n_days_threshold
         self.third_party_service = third_party_service
+        # Optional cross-process store of settled historical rows, so cron
+        # jobs that start cold do not re-download the whole lookback.
+        self.history_store = history_store
         # most recent to least recent
         self.recent_values: RecentVixFuturesValues = RecentVixFuturesValues(self.contango_decrease_past_n_days_threshold)
 
@@ -76,7 +81,6 @@ class VixCentralService:
         self,
         runtime_mode: RuntimeMode | None = None,
     ) -> RecentVixFuturesValues:
-        coros = []
         active_runtime_mode = (
             DEFAULT_RUNTIME_MODE if runtime_mode is None else runtime_mode
         )
@@ -129,8 +133,9 @@ class VixCentralService:
                 date = date_util.get_most_recent_non_weekend_or_today(reference_date - datetime.timedelta(days=1))
 
                 historical_dates.append(date)
-                coros.append(self.third_party_service.get_historical(date.strftime("%Y-%m-%d")))
-            res = await asyncio.gather(*coros)
+            res = await self._get_historical_values(
+                [date.strftime("%Y-%m-%d") for date in historical_dates]
+            )
 
             for i in range(0, len(res)):
                 self.recent_values.vix_futures_values.append(
@@ -151,6 +156,23 @@ class VixCentralService:
 
         return self._compute_contango_alert_threshold(values_to_return)
 
+    async def _get_historical_values(self, dates: List[str]) -> list:
+        stored_values = {}
+        if self.history_store is not None:
+            stored_values = await self.history_store.get_many(dates)
+
+        missing_dates = [date for date in dates if date not in stored_values]
+        if len(missing_dates) > 0:
+            logger.info(f'Fetching {len(missing_dates)} of {len(dates)} historical vix central dates')
+            fetched_values = await asyncio.gather(
+                *[self.third_party_service.get_historical(date) for date in missing_dates]
+            )
+            fetched_by_date = dict(zip(missing_dates, fetched_values, strict=True))
+            if self.history_store is not None:
+                await self.history_store.save_many(fetched_by_date)
+            stored_values.update(fetched_by_date)
+        return [stored_values[date] for date in dates]
+
     def _modify_contango_testing_mode(
         self,
         recent_values: RecentVixFuturesValues,
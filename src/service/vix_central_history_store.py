@@ -0,0 +1,57 @@
+import json
+import logging
+from typing import Any, Callable
+
+from src.db.redis import Redis
+from src.util.exception import get_exception_message
+
+logger = logging.getLogger('Vix central history store')
+
+REDIS_KEY = 'vix-central-historical'
+
+
+class VixCentralHistoryStore:
+    """Redis hash of raw `ajax_historical` rows keyed by "yyyy-mm-dd".
+
+    A settled trading day's term structure never changes, so each date is
+    fetched from vixcentral.com once and then served to every later process.
+    Raw provider rows are stored rather than `VixFuturesValue`s because
+    contract months are inferred relative to the current run's anchor.
+    """
+
+    def __init__(
+        self,
+        redis_client_getter: Callable[[], Any] = Redis.get_client,
+        key: str = REDIS_KEY,
+    ):
+        self.redis_client_getter = redis_client_getter
+        self.key = key
+
+    async def get_many(self, dates: list[str]) -> dict[str, Any]:
+        if len(dates) == 0:
+            return {}
+        try:
+            raw_values = await self.redis_client_getter().hmget(self.key, dates)
+        except Exception as e:
+            # A store outage degrades to fetching every date upstream.
+            logger.warning(get_exception_message(e, cls=self.__class__.__name__))
+            return {}
+        return {
+            date: json.loads(raw_value)
+            for date, raw_value in zip(dates, raw_values, strict=True)
+            if raw_value is not None
+        }
+
+    async def save_many(self, historical_by_date: dict[str, Any]) -> None:
+        if len(historical_by_date) == 0:
+            return
+        try:
+            await self.redis_client_getter().hset(
+                self.key,
+                mapping={
+                    date: json.dumps(historical, separators=(',', ':'))
+                    for date, historical in historical_by_date.items()
+                },
+            )
+        except Exception as e:
+            logger.warning(get_exception_message(e, cls=self.__class__.__name__))
@@ -1,6 +1,7 @@
 
 from typing import List
 from src.data_source.market_data_library import get_tradfi_api
+from src.util.fetch_scheduler import BARCHART_PROVIDER, schedule_fetch
 from market_data_library.types import barchart_type
 class ThirdPartyBarchartService:
     def __init__(self):
@@ -10,5 +11,8 @@ class ThirdPartyBarchartService:
         await self.barchart_stocks.cleanup()
 
     async def get_stock_price(self, symbol: str, num_days = 30) -> List[barchart_type.StockPrice]:
-        data = await self.barchart_stocks.get_stock_prices(symbol=symbol, max_records=num_days)
+        data = await schedule_fetch(
+            BARCHART_PROVIDER,
+            lambda: self.barchart_stocks.get_stock_prices(symbol=symbol, max_records=num_days),
+        )
         return data
@@ -1,6 +1,7 @@
 import logging
 
 from src.http_client import HttpClient
+from src.util.fetch_scheduler import VIX_CENTRAL_PROVIDER, schedule_fetch
 
 
 # Monday to friday, 24 hours
@@ -26,6 +27,9 @@ class ThirdPartyVixCentralService:
   #    prices used for contango
   # 8: repeated spot VIX index values
   async def get_current(self):
+    return await schedule_fetch(VIX_CENTRAL_PROVIDER, self._get_current)
+
+  async def _get_current(self):
     res = await self.http_client.get(url='/ajax_update')
     if res.status != 200:
       logger.info(res.text)
@@ -38,6 +42,9 @@ class ThirdPartyVixCentralService:
   # Index 1 is the front month and index 2 is the next month for that historical
   # date, so downstream code has to infer contract identity separately.
   async def get_historical(self, date: str):
+    return await schedule_fetch(VIX_CENTRAL_PROVIDER, lambda: self._get_historical(date=date))
+
+  async def _get_historical(self, date: str):
     res = await self.http_client.get(url='/ajax_historical',
                                      params={"n1": date})
     if res.status != 200:
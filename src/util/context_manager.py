@@ -1,16 +1,242 @@
+import asyncio
+import contextvars
+import datetime
+import functools
+import inspect
+import json
 import logging
+import os
+import threading
 import time
 from contextlib import ContextDecorator
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.config import config
 
 logger = logging.getLogger('Time tracker context')
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    parent: 'Span | None'
+    started_at_ns: int
+    ended_at_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    # Concurrent spans from different tasks go on separate trace rows.
+    track: int = 0
+
+    @property
+    def path(self) -> str:
+        return self.name if self.parent is None else f'{self.parent.path} > {self.name}'
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.ended_at_ns or time.perf_counter_ns()) - self.started_at_ns
+
+
+class SpanTrace:
+    """All spans recorded during one job run."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.spans: list[Span] = []
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        self._tracks: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent: Span | None, attributes: dict[str, Any]) -> Span:
+        span = Span(
+            name=name,
+            parent=parent,
+            started_at_ns=time.perf_counter_ns(),
+            attributes=attributes,
+            track=self._get_track(),
+        )
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def to_chrome_trace(self) -> dict:
+        """Trace Event Format, loadable in chrome://tracing or Perfetto."""
+        if len(self.spans) == 0:
+            return {'traceEvents': [], 'displayTimeUnit': 'ms'}
+        origin_ns = min(span.started_at_ns for span in self.spans)
+        events = [
+            {
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': os.getpid(),
+                'tid': track,
+                'args': {'name': 'main' if track == 0 else f'task {track}'},
+            }
+            for track in sorted({span.track for span in self.spans})
+        ]
+        for span in self.spans:
+            events.append({
+                'name': span.name,
+                'cat': self.name,
+                'ph': 'X',
+                'ts': (span.started_at_ns - origin_ns) / 1000,
+                'dur': span.duration_ns / 1000,
+                'pid': os.getpid(),
+                'tid': span.track,
+                'args': {key: _to_json_value(value) for key, value in span.attributes.items()},
+            })
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'trace': self.name, 'started_at': self.started_at.isoformat()},
+        }
+
+    def write_chrome_trace(self, directory: str) -> str:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(
+            directory,
+            f'{self.name}-{self.started_at.strftime("%Y%m%dT%H%M%SZ")}.trace.json',
+        )
+        with open(path, 'w') as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+        return path
+
+    def format_summary(self) -> str:
+        """Per span path: calls, total and max wall time, share of the root span."""
+        totals: dict[str, list] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.path, [span, 0, 0, 0])
+            entry[1] += 1
+            entry[2] += span.duration_ns
+            entry[3] = max(entry[3], span.duration_ns)
+        root_ns = sum(total_ns for span, _calls, total_ns, _max_ns in totals.values() if span.parent is None)
+        lines = [f'{"span":<60} {"calls":>6} {"total_ms":>10} {"max_ms":>10} {"%":>6}']
+        # Spans are recorded in start order, so parents come before children.
+        for path, (span, calls, total_ns, max_ns) in totals.items():
+            label = '  ' * path.count(' > ') + span.name
+            share = 100 * total_ns / root_ns if root_ns > 0 else 0
+            lines.append(
+                f'{label:<60} {calls:>6} {total_ns / 1e6:>10.1f} {max_ns / 1e6:>10.1f} {share:>6.1f}'
+            )
+        return '\n'.join(lines)
+
+    def _get_track(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = 0 if task is None else id(task)
+        with self._lock:
+            if len(self._tracks) == 0:
+                # The task that opens the trace is the main row.
+                self._tracks[key] = 0
+            return self._tracks.setdefault(key, len(self._tracks))
+
+
+def _to_json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+_current_trace: contextvars.ContextVar[SpanTrace | None] = contextvars.ContextVar(
+    'span_trace',
+    default=None,
+)
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    'span',
+    default=None,
+)
+
+
+class TraceSpan(ContextDecorator):
+    """Record a nested span in the active trace; a no-op outside of one.
+
+    The active span is held in a context variable, so tasks created inside the
+    block (for example by `asyncio.gather`) nest their spans under it. Works as
+    a context manager and as a decorator for sync and async functions.
+    """
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self._tokens: list[contextvars.Token] = []
+
+    def __enter__(self) -> Span | None:
+        trace = _current_trace.get()
+        if trace is None:
+            self._tokens.append(None)
+            return None
+        span = trace.start_span(self.name, _current_span.get(), dict(self.attributes))
+        self._tokens.append(_current_span.set(span))
+        return span
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        token = self._tokens.pop()
+        if token is None:
+            return
+        span = _current_span.get()
+        span.ended_at_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            span.attributes['error'] = exc_type.__name__
+        _current_span.reset(token)
+
+    def _recreate_cm(self):
+        # A decorated function may run concurrently with itself.
+        return TraceSpan(self.name, **self.attributes)
+
+    def __call__(self, func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with self._recreate_cm():
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        return super().__call__(func)
+
+
+def trace_span(name: str, **attributes) -> TraceSpan:
+    return TraceSpan(name, **attributes)
+
+
+def set_span_attribute(key: str, value: Any) -> None:
+    span = _current_span.get()
+    if span is not None:
+        span.attributes[key] = value
+
+
 class TimeTrackerContext(ContextDecorator):
+    """Logs the elapsed time of a block and traces the spans opened inside it.
+
+    The outermost tracker starts a trace. On exit it logs a per-span summary
+    and, when `TRACE_OUTPUT_DIR` is set, writes the run as a Chrome trace.
+    """
+
     def __init__(self, name: str):
         self.name = name
 
     def __enter__(self):
         self.start_time = time.time()
         logger.info(f'Starting {self.name}')
+        self.trace = None
+        self.trace_token = None
+        if _current_trace.get() is None:
+            self.trace = SpanTrace(self.name)
+            self.trace_token = _current_trace.set(self.trace)
+        self.span = trace_span(self.name)
+        self.span.__enter__()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.span.__exit__(exc_type, exc_val, exc_tb)
         time_elapsed = time.time() - self.start_time
         logger.info(f'Completed {self.name}. Time taken: {time_elapsed}')
+        if self.trace is None:
+            return
+        _current_trace.reset(self.trace_token)
+        logger.info(f'Spans for {self.name}:\n{self.trace.format_summary()}')
+        trace_output_dir = config.get_trace_output_dir()
+        if trace_output_dir:
+            try:
+                path = self.trace.write_chrome_trace(trace_output_dir)
+                logger.info(f'Wrote Chrome trace to {path}')
+            except OSError as e:
+                logger.error(f'Failed to write Chrome trace for {self.name}: {e}')
@@ -1,12 +1,25 @@
 import datetime
+import functools
 from typing import cast
 from zoneinfo import ZoneInfo
 
-import exchange_calendars as xcals
 from market_data_library.util import date_util as market_data_library_date_util
 
+from src.util.trading_sessions import XNYS_SESSIONS_PATH, TradingSessionTable
+
 ny_tz = ZoneInfo("America/New_York")
-XNYS_CALENDAR = xcals.get_calendar("XNYS")
+# Precomputed from exchange_calendars. Lookups outside its range fall back to
+# the calendar, which is only built then.
+XNYS_SESSIONS = TradingSessionTable.load(XNYS_SESSIONS_PATH)
+
+
+@functools.cache
+def get_xnys_calendar():
+    # Importing exchange_calendars and building the calendar takes most of a
+    # second, so it is only done for dates outside XNYS_SESSIONS.
+    import exchange_calendars as xcals
+
+    return xcals.get_calendar("XNYS")
 
 
 def get_current_datetime():
@@ -55,7 +68,7 @@ def _fallback_get_trading_day_at_or_before(
         if isinstance(reference_date, datetime.datetime)
         else reference_date
     )
-    session = XNYS_CALENDAR.date_to_session(
+    session = get_xnys_calendar().date_to_session(
         normalized_date.isoformat(),
         direction="previous",
     )
@@ -65,8 +78,18 @@ def _fallback_get_trading_day_at_or_before(
 def _get_trading_day_at_or_before(
     reference_date: datetime.date | datetime.datetime,
 ) -> datetime.date:
-    # Prefer the shared library helper so backend behavior tracks the published
-    # library contract once that release is available. Keep the local fallback
+    normalized_date = (
+        reference_date.date()
+        if isinstance(reference_date, datetime.datetime)
+        else reference_date
+    )
+    session = XNYS_SESSIONS.get_session_at_or_before(normalized_date)
+    if session is not None:
+        return session
+
+    # Outside the session table, prefer the shared library helper so backend
+    # behavior tracks the published library contract once that release is
+    # available. Keep the local fallback
     # for the current pinned git dependency until the library change is merged
     # and the backend dependency is advanced to include it.
     shared_helper = getattr(
@@ -88,3 +111,26 @@ def get_most_recent_non_weekend_or_today(date: datetime.datetime) -> datetime.da
         month=target_date.month,
         day=target_date.day,
     )
+
+
+def get_trading_sessions_ending_at(
+    reference_date: datetime.date | datetime.datetime,
+    count: int,
+) -> list[datetime.date]:
+    """Return the last `count` XNYS sessions at or before the date, newest first."""
+    if count <= 0:
+        return []
+    normalized_date = (
+        reference_date.date()
+        if isinstance(reference_date, datetime.datetime)
+        else reference_date
+    )
+    sessions = XNYS_SESSIONS.get_sessions_ending_at(normalized_date, count)
+    if sessions is not None:
+        return sessions
+    session = get_xnys_calendar().date_to_session(
+        normalized_date.isoformat(),
+        direction="previous",
+    )
+    sessions = get_xnys_calendar().sessions_window(session, -count)
+    return [cast(datetime.date, window_session.date()) for window_session in reversed(sessions)]
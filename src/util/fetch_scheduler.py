@@ -0,0 +1,327 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import random
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, TypeVar
+
+from src.config import config
+from src.util.metrics import UPSTREAM_REQUEST_DURATION, UPSTREAM_REQUEST_ERRORS
+
+logger = logging.getLogger('Fetch scheduler')
+
+T = TypeVar('T')
+
+CMC_PROVIDER = 'cmc'
+ALTERNATIVE_ME_PROVIDER = 'alternativeme'
+CNN_PROVIDER = 'cnn'
+CRYPTOQUANT_PROVIDER = 'cryptoquant'
+COINALYZE_PROVIDER = 'coinalyze'
+VIX_CENTRAL_PROVIDER = 'vixcentral'
+BARCHART_PROVIDER = 'barchart'
+
+
+class FetchPriority(IntEnum):
+    # Lower values are dispatched first.
+    LIVE = 0
+    BACKFILL = 1
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderLimits:
+    rate_per_second: float
+    burst: int
+    max_in_flight: int
+    max_attempts: int = 3
+    base_backoff_seconds: float = 0.5
+    max_backoff_seconds: float = 8.0
+
+
+DEFAULT_PROVIDER_LIMITS = {
+    CMC_PROVIDER: ProviderLimits(rate_per_second=5, burst=10, max_in_flight=4),
+    ALTERNATIVE_ME_PROVIDER: ProviderLimits(rate_per_second=2, burst=4, max_in_flight=2),
+    # CNN is scraped through a browser session, so keep it strictly serial.
+    CNN_PROVIDER: ProviderLimits(rate_per_second=1, burst=1, max_in_flight=1),
+    CRYPTOQUANT_PROVIDER: ProviderLimits(rate_per_second=1, burst=2, max_in_flight=1),
+    COINALYZE_PROVIDER: ProviderLimits(rate_per_second=0.5, burst=4, max_in_flight=2),
+    VIX_CENTRAL_PROVIDER: ProviderLimits(rate_per_second=5, burst=10, max_in_flight=4),
+    BARCHART_PROVIDER: ProviderLimits(rate_per_second=2, burst=4, max_in_flight=2),
+}
+
+_current_priority: contextvars.ContextVar[FetchPriority] = contextvars.ContextVar(
+    'fetch_priority',
+    default=FetchPriority.LIVE,
+)
+
+
+@contextmanager
+def fetch_priority(priority: FetchPriority):
+    """Run provider calls made inside the block in the given priority lane.
+
+    Tasks created inside the block (for example by `asyncio.gather`) inherit
+    the lane, so callers do not have to thread it through service signatures.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def get_retryable_status(error: BaseException) -> int | None:
+    """Return the HTTP status behind `error` when a retry may succeed."""
+    candidates = [error, getattr(error, 'response', None)]
+    for candidate in candidates:
+        if candidate is None:
+            continue
+        for attribute in ('status', 'status_code'):
+            status = getattr(candidate, attribute, None)
+            if isinstance(status, int) and (status == 429 or 500 <= status <= 599):
+                return status
+    return None
+
+
+def _get_retry_after_seconds(error: BaseException) -> float | None:
+    headers = getattr(error, 'headers', None)
+    if headers is None:
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated_at = clock()
+
+    def try_take(self) -> float:
+        """Take a token and return 0, or return seconds until one is available."""
+        now = self.clock()
+        self.tokens = min(
+            float(self.burst),
+            self.tokens + (now - self.updated_at) * self.rate_per_second,
+        )
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate_per_second
+
+
+@dataclass(slots=True)
+class _ProviderState:
+    limits: ProviderLimits
+    bucket: TokenBucket
+    in_flight: int = 0
+    waiters: list[tuple[int, int, asyncio.Future]] = field(default_factory=list)
+    wakeup: asyncio.TimerHandle | None = None
+
+
+@dataclass(slots=True)
+class FetchSchedulerStats:
+    dispatched: int = 0
+    retries: int = 0
+    failures: int = 0
+
+
+class FetchScheduler:
+    """Shared gate for upstream provider calls.
+
+    Each provider has a token bucket and a max in-flight limit. Waiting calls
+    are dispatched by priority lane, then FIFO, so live-run requests overtake
+    queued backfill requests. 429 and 5xx failures are retried with jittered
+    exponential backoff, honouring Retry-After when the provider sends it.
+    """
+
+    def __init__(
+        self,
+        provider_limits: dict[str, ProviderLimits] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.provider_limits = (
+            DEFAULT_PROVIDER_LIMITS if provider_limits is None else provider_limits
+        )
+        self.clock = clock
+        self.sleep = sleep
+        self.stats: dict[str, FetchSchedulerStats] = {}
+        self._states: dict[str, _ProviderState] = {}
+        self._sequence = itertools.count()
+
+    async def run(
+        self,
+        provider: str,
+        fetch: Callable[[], Awaitable[T]],
+        priority: FetchPriority | None = None,
+    ) -> T:
+        if priority is None:
+            priority = _current_priority.get()
+        state = self._get_state(provider)
+        stats = self.stats[provider]
+        attempt = 1
+        while True:
+            await self._acquire(state, priority)
+            stats.dispatched += 1
+            started_at = time.perf_counter()
+            try:
+                result = await fetch()
+                UPSTREAM_REQUEST_DURATION.observe(
+                    time.perf_counter() - started_at, provider=provider, outcome='success',
+                )
+                return result
+            except Exception as error:
+                UPSTREAM_REQUEST_DURATION.observe(
+                    time.perf_counter() - started_at, provider=provider, outcome='error',
+                )
+                UPSTREAM_REQUEST_ERRORS.inc(provider=provider)
+                status = get_retryable_status(error)
+                if status is None or attempt >= state.limits.max_attempts:
+                    stats.failures += 1
+                    raise
+                delay_seconds = self._get_backoff_seconds(state.limits, attempt, error)
+                logger.warning(
+                    '%s returned %s; retrying attempt %s/%s in %.2fs',
+                    provider,
+                    status,
+                    attempt + 1,
+                    state.limits.max_attempts,
+                    delay_seconds,
+                )
+            finally:
+                self._release(state)
+            stats.retries += 1
+            attempt += 1
+            await self.sleep(delay_seconds)
+
+    def _get_state(self, provider: str) -> _ProviderState:
+        state = self._states.get(provider)
+        if state is None:
+            limits = self.provider_limits[provider]
+            state = _ProviderState(
+                limits=limits,
+                bucket=TokenBucket(
+                    rate_per_second=limits.rate_per_second,
+                    burst=limits.burst,
+                    clock=self.clock,
+                ),
+            )
+            self._states[provider] = state
+            self.stats[provider] = FetchSchedulerStats()
+        return state
+
+    async def _acquire(self, state: _ProviderState, priority: FetchPriority) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(state.waiters, (int(priority), next(self._sequence), waiter))
+        self._dispatch(state)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been granted just before the cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self._release(state)
+            else:
+                waiter.cancel()
+                self._dispatch(state)
+            raise
+
+    def _release(self, state: _ProviderState) -> None:
+        state.in_flight -= 1
+        self._dispatch(state)
+
+    def _dispatch(self, state: _ProviderState) -> None:
+        while state.waiters and state.in_flight < state.limits.max_in_flight:
+            waiter = state.waiters[0][2]
+            if waiter.done():
+                heapq.heappop(state.waiters)
+                continue
+            wait_seconds = state.bucket.try_take()
+            if wait_seconds > 0:
+                if state.wakeup is None:
+                    state.wakeup = asyncio.get_running_loop().call_later(
+                        wait_seconds,
+                        self._wake,
+                        state,
+                    )
+                return
+            heapq.heappop(state.waiters)
+            state.in_flight += 1
+            waiter.set_result(None)
+
+    def _wake(self, state: _ProviderState) -> None:
+        state.wakeup = None
+        self._dispatch(state)
+
+    @staticmethod
+    def _get_backoff_seconds(
+        limits: ProviderLimits,
+        attempt: int,
+        error: BaseException,
+    ) -> float:
+        retry_after_seconds = _get_retry_after_seconds(error)
+        if retry_after_seconds is not None:
+            return min(retry_after_seconds, limits.max_backoff_seconds)
+        # Full jitter keeps retries from many coins from landing together.
+        return random.uniform(
+            0,
+            min(limits.max_backoff_seconds, limits.base_backoff_seconds * 2 ** (attempt - 1)),
+        )
+
+
+# Futures and timers belong to one event loop, so each loop gets its own
+# scheduler (jobs run a single loop; tests create one per test).
+_schedulers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FetchScheduler] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_fetch_scheduler() -> FetchScheduler:
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        provider_limits = dict(DEFAULT_PROVIDER_LIMITS)
+        for provider, (rate_per_second, max_in_flight) in (
+            config.get_fetch_scheduler_provider_limits().items()
+        ):
+            default_limits = provider_limits.get(provider)
+            provider_limits[provider] = ProviderLimits(
+                rate_per_second=rate_per_second,
+                burst=(
+                    default_limits.burst
+                    if default_limits is not None
+                    else max(1, int(rate_per_second))
+                ),
+                max_in_flight=max_in_flight,
+            )
+        scheduler = FetchScheduler(provider_limits=provider_limits)
+        _schedulers[loop] = scheduler
+    return scheduler
+
+
+async def schedule_fetch(
+    provider: str,
+    fetch: Callable[[], Awaitable[T]],
+    priority: FetchPriority | None = None,
+) -> T:
+    return await get_fetch_scheduler().run(
+        provider=provider,
+        fetch=fetch,
+        priority=priority,
+    )
@@ -0,0 +1,244 @@
+import bisect
+import functools
+import inspect
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# Upper bounds in seconds. Wide enough for Redis round trips at the low end
+# and CNN browser scrapes at the high end.
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+EXPOSITION_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(label_pairs: list[tuple[str, str]]) -> str:
+    if len(label_pairs) == 0:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in label_pairs) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    metric_type = ''
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _get_label_values(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f'{self.name} expects labels {self.label_names}, got {tuple(labels)}')
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self) -> list[str]:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.metric_type}',
+        ]
+        with self._lock:
+            lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._get_label_values(labels), 0)
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f'{self.name}{_format_labels(list(zip(self.label_names, label_values)))} {_format_value(value)}'
+            for label_values, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    metric_type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        label_values = self._get_label_values(labels)
+        bucket_index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[label_values] = series
+            series[0][bucket_index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def get_count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._get_label_values(labels))
+            return 0 if series is None else series[2]
+
+    def _render_samples(self) -> list[str]:
+        lines = []
+        for label_values, (bucket_counts, total, count) in sorted(self._series.items()):
+            label_pairs = list(zip(self.label_names, label_values))
+            cumulative = 0
+            for upper_bound, bucket_count in zip((*self.buckets, float('inf')), bucket_counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels([*label_pairs, ('le', _format_value(upper_bound))])
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(label_pairs)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(label_pairs)} {count}')
+        return lines
+
+
+class MetricsRegistry:
+    """Process-local metrics rendered in the Prometheus text exposition format.
+
+    The server exposes it on `/metrics`. Jobs are short-lived processes, so
+    they write it to a textfile for node_exporter's textfile collector to
+    pick up instead.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: str) -> None:
+        # Write then rename, so the collector never reads a partial file.
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-', suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w') as temp_file:
+                temp_file.write(self.render())
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _register(self, metric: _Metric):
+        if metric.name in self._metrics:
+            raise ValueError(f'Metric {metric.name} is already registered')
+        self._metrics[metric.name] = metric
+        return metric
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route template.',
+    ('method', 'route', 'status'),
+)
+UPSTREAM_REQUEST_DURATION = REGISTRY.histogram(
+    'upstream_request_duration_seconds',
+    'Latency of each upstream provider call attempt.',
+    ('provider', 'outcome'),
+)
+UPSTREAM_REQUEST_ERRORS = REGISTRY.counter(
+    'upstream_request_errors_total',
+    'Failed upstream provider call attempts, including ones that were retried.',
+    ('provider',),
+)
+REDIS_COMMAND_DURATION = REGISTRY.histogram(
+    'redis_command_duration_seconds',
+    'Redis command round-trip latency.',
+    ('command',),
+)
+SQLITE_QUERY_DURATION = REGISTRY.histogram(
+    'sqlite_query_duration_seconds',
+    'Latency of SQLite repository methods.',
+    ('repository', 'method'),
+)
+TELEGRAM_REQUEST_DURATION = REGISTRY.histogram(
+    'telegram_request_duration_seconds',
+    'Telegram Bot API request latency by endpoint.',
+    ('endpoint', 'outcome'),
+)
+JOB_RUN_DURATION = REGISTRY.histogram(
+    'job_run_duration_seconds',
+    'Wall time of a scheduled job run.',
+    ('job',),
+)
+
+
+def instrument_sqlite_repository(repository: str):
+    """Class decorator that times every public method into SQLITE_QUERY_DURATION."""
+    def decorator(cls):
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.isfunction(attribute):
+                continue
+            setattr(cls, name, _time_sqlite_method(attribute, repository))
+        return cls
+    return decorator
+
+
+def _time_sqlite_method(method, repository: str):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with SQLITE_QUERY_DURATION.time(repository=repository, method=method.__name__):
+            return method(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,136 @@
+import inspect
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from src.config import config
+from src.data_source.market_data_library import get_crypto_api, get_tradfi_api
+from src.db.redis import Redis
+from src.dependencies import Dependencies
+from src.notification_destination import telegram_notification
+from src.util.date_util import get_xnys_calendar
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@dataclass(slots=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass(slots=True)
+class StepTiming:
+    name: str
+    seconds: float
+    error: str | None = None
+
+
+def parse_import_times(importtime_output: str) -> list[ImportTiming]:
+    """Parse the stderr of `python -X importtime`."""
+    timings = []
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # The header row.
+            continue
+        timings.append(ImportTiming(
+            module=parts[2].strip(),
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1]),
+        ))
+    return timings
+
+
+def profile_imports(module: str) -> list[ImportTiming]:
+    # A fresh interpreter, since everything is already imported in this one.
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Failed to import {module}: {result.stderr.strip().splitlines()[-1:]}')
+    return parse_import_times(result.stderr)
+
+
+def get_module_name(cls: type) -> str:
+    # Jobs run as scripts, where the module is __main__.
+    path = os.path.relpath(inspect.getfile(cls), PROJECT_ROOT)
+    return os.path.splitext(path)[0].replace(os.sep, '.')
+
+
+async def time_steps(steps: list[tuple[str, Callable[[], Any]]]) -> list[StepTiming]:
+    timings = []
+    for name, step in steps:
+        started_at = time.perf_counter()
+        error = None
+        try:
+            result = step()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            error = e.__class__.__name__
+        timings.append(StepTiming(name=name, seconds=time.perf_counter() - started_at, error=error))
+    return timings
+
+
+async def time_startup() -> list[StepTiming]:
+    """Time the startup steps shared by the server and jobs, then the lazily
+    built providers on their first use."""
+    try:
+        return await time_steps([
+            ('init_telegram_bots', telegram_notification.init_telegram_bots),
+            ('Redis.start_redis', Redis.start_redis),
+            ('Dependencies.build', Dependencies.build),
+            ('telegram bot (first use)', lambda: telegram_notification.chat_id_to_telegram_client[
+                config.get_telegram_crypto_admin_id()
+            ]),
+            ('XNYS calendar (first use)', get_xnys_calendar),
+            ('CryptoAPI (first use)', get_crypto_api),
+            ('TradFiAPI (first use)', get_tradfi_api),
+        ])
+    finally:
+        if getattr(Redis, 'redis', None) is not None:
+            await Redis.stop_redis()
+        await Dependencies.cleanup()
+
+
+def format_startup_report(
+    module: str,
+    import_timings: list[ImportTiming],
+    step_timings: list[StepTiming],
+    limit: int = 15,
+) -> str:
+    total_us = next((timing.cumulative_us for timing in import_timings if timing.module == module), 0)
+    package_us: dict[str, list[int]] = {}
+    for timing in import_timings:
+        entry = package_us.setdefault(timing.module.split('.')[0], [0, 0])
+        entry[0] += timing.self_us
+        entry[1] += 1
+    top_packages = sorted(package_us.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    top_modules = sorted(import_timings, key=lambda timing: timing.self_us, reverse=True)[:limit]
+
+    lines = [f'Startup report for {module}', '', f'Import {module}: {total_us / 1000:.1f} ms']
+    lines.append(f'{"package":<50} {"self_ms":>10} {"modules":>8}')
+    for package, (self_us, count) in top_packages:
+        lines.append(f'{package:<50} {self_us / 1000:>10.1f} {count:>8}')
+    lines += ['', f'{"module":<50} {"self_ms":>10} {"cum_ms":>8}']
+    for timing in top_modules:
+        lines.append(f'{timing.module:<50} {timing.self_us / 1000:>10.1f} {timing.cumulative_us / 1000:>8.1f}')
+    lines += ['', f'{"init step":<50} {"ms":>10}']
+    for step in step_timings:
+        suffix = '' if step.error is None else f'  failed: {step.error}'
+        lines.append(f'{step.name:<50} {step.seconds * 1000:>10.1f}{suffix}')
+    return '\n'.join(lines)
+
+
+async def build_startup_report(module: str) -> str:
+    return format_startup_report(module, profile_imports(module), await time_startup())
@@ -0,0 +1,125 @@
+import argparse
+import bisect
+import datetime
+import json
+import logging
+import os
+
+logger = logging.getLogger('Trading sessions')
+
+XNYS_SESSIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'xnys_sessions.json')
+
+
+class TradingSessionTable:
+    """Sorted session dates of one exchange between `start` and `end`.
+
+    Lookups bisect a list of day ordinals. They return None when the answer
+    depends on days outside the table, so callers can fall back to
+    exchange_calendars.
+    """
+
+    def __init__(self, start: datetime.date, end: datetime.date, sessions: list[datetime.date]):
+        self.start = start
+        self.end = end
+        self.sessions = sessions
+        self._ordinals = [session.toordinal() for session in sessions]
+
+    @classmethod
+    def empty(cls) -> 'TradingSessionTable':
+        return cls(datetime.date.max, datetime.date.min, [])
+
+    def covers(self, date: datetime.date) -> bool:
+        return self.start <= date <= self.end
+
+    def get_session_at_or_before(self, date: datetime.date) -> datetime.date | None:
+        if not self.covers(date):
+            return None
+        index = bisect.bisect_right(self._ordinals, date.toordinal()) - 1
+        return self.sessions[index] if index >= 0 else None
+
+    def get_session_at_or_after(self, date: datetime.date) -> datetime.date | None:
+        if not self.covers(date):
+            return None
+        index = bisect.bisect_left(self._ordinals, date.toordinal())
+        return self.sessions[index] if index < len(self.sessions) else None
+
+    def get_previous_session(self, date: datetime.date) -> datetime.date | None:
+        return self.get_session_at_or_before(date - datetime.timedelta(days=1))
+
+    def get_next_session(self, date: datetime.date) -> datetime.date | None:
+        return self.get_session_at_or_after(date + datetime.timedelta(days=1))
+
+    def get_sessions_ending_at(self, date: datetime.date, count: int) -> list[datetime.date] | None:
+        """The last `count` sessions at or before the date, newest first."""
+        if not self.covers(date):
+            return None
+        end_index = bisect.bisect_right(self._ordinals, date.toordinal())
+        if end_index < count:
+            return None
+        return self.sessions[end_index - count:end_index][::-1]
+
+    def to_json(self, calendar_name: str) -> dict:
+        # Gaps between consecutive sessions are single digits, so the whole
+        # table is one short string instead of a list of dates.
+        previous_ordinal = self.start.toordinal()
+        gaps = []
+        for ordinal in self._ordinals:
+            gap = ordinal - previous_ordinal
+            if gap > 9:
+                raise ValueError(f'Gap of {gap} days before {datetime.date.fromordinal(ordinal)} does not fit the format')
+            gaps.append(str(gap))
+            previous_ordinal = ordinal
+        return {
+            'calendar': calendar_name,
+            'start': self.start.isoformat(),
+            'end': self.end.isoformat(),
+            'gaps': ''.join(gaps),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'TradingSessionTable':
+        start = datetime.date.fromisoformat(data['start'])
+        ordinal = start.toordinal()
+        sessions = []
+        for gap in data['gaps']:
+            ordinal += int(gap)
+            sessions.append(datetime.date.fromordinal(ordinal))
+        return cls(start, datetime.date.fromisoformat(data['end']), sessions)
+
+    @classmethod
+    def load(cls, path: str) -> 'TradingSessionTable':
+        try:
+            with open(path) as table_file:
+                return cls.from_json(json.load(table_file))
+        except FileNotFoundError:
+            logger.warning(f'{path} is missing, trading session lookups use exchange_calendars')
+            return cls.empty()
+
+
+def build_session_table(calendar_name: str, start: datetime.date, end: datetime.date) -> TradingSessionTable:
+    import exchange_calendars as xcals
+
+    calendar = xcals.get_calendar(calendar_name, start=start.isoformat(), end=end.isoformat())
+    sessions = [session.date() for session in calendar.sessions]
+    return TradingSessionTable(start, end, sessions)
+
+
+def write_session_table(table: TradingSessionTable, calendar_name: str, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as table_file:
+        json.dump(table.to_json(calendar_name), table_file, indent=2)
+        table_file.write('\n')
+
+
+# Regenerate after an exchange_calendars upgrade or when the table nears its end:
+# PYTHONPATH="$(pwd)" poetry run python src/util/trading_sessions.py --start 2010-01-01 --end 2030-12-31
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Writes the precomputed XNYS session table')
+    parser.add_argument('--start', type=datetime.date.fromisoformat, default=datetime.date(2010, 1, 1))
+    parser.add_argument('--end', type=datetime.date.fromisoformat, default=datetime.date(2030, 12, 31))
+    parser.add_argument('--output', default=XNYS_SESSIONS_PATH)
+    cli_args = parser.parse_args()
+
+    session_table = build_session_table('XNYS', cli_args.start, cli_args.end)
+    write_session_table(session_table, 'XNYS', cli_args.output)
+    print(f'Wrote {len(session_table.sessions)} sessions to {cli_args.output}')
@@ -0,0 +1,442 @@
+"""Time crypto signal hot paths at several scales and compare with a baseline.
+
+Each scale is COINSxDAYS. A real SQLite file is filled through
+CryptoSignalRepository with deterministic synthetic runs, candidate cohorts,
+and market-regime metrics, then every case is timed best-of --repeat. Results
+are written as JSON; pass an earlier result file as --baseline to print the
+ratio per case and flag regressions.
+
+Usage:
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/crypto_signal_suite.py
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/crypto_signal_suite.py --output var/benchmark/baseline.json
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/crypto_signal_suite.py --baseline var/benchmark/baseline.json
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/crypto_signal_suite.py --full
+"""
+import argparse
+import datetime
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from market_data_library.types import cmc_type
+
+from src.job.crypto.crypto_digest_formatter import (
+    build_digest_message,
+    get_standout_entries,
+)
+from src.job.crypto.crypto_signal_formatter import build_crypto_signal_message
+from src.runtime.runtime_mode import RuntimeMode
+from src.service.crypto_signal.market_regime import (
+    FUNDING_RATE_METRIC,
+    OPEN_INTEREST_METRIC,
+)
+from src.service.crypto_signal.market_regime_collector import (
+    AGGREGATE_INSTRUMENT_SCOPE,
+    AGGREGATE_VENUE_SCOPE,
+    COINALYZE_PROVIDER,
+)
+from src.service.crypto_signal.models import CryptoSignalDigestView
+from src.service.crypto_signal.repository import (
+    BTC_COIN_ID,
+    ETH_COIN_ID,
+    CryptoSignalRepository,
+)
+from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+from src.service.crypto_signal.snapshot_builder import build_snapshot
+from tests.benchmark.synthetic_data import (
+    DEFAULT_END_TIMESTAMP_UTC,
+    DEFAULT_SEED,
+    build_synthetic_candidate,
+    build_synthetic_coin_ids,
+    iter_synthetic_market_regime_snapshots,
+    iter_synthetic_snapshots,
+)
+
+
+QUICK_SCALES = ['100x30', '100x90', '1000x30']
+FULL_SCALES = [
+    f'{coin_count}x{days}'
+    for coin_count in (100, 1_000, 10_000)
+    for days in (30, 90, 365)
+]
+WINDOW_LABELS = ['3d', '7d', '30d']
+WATCHLIST_COIN_IDS = {BTC_COIN_ID, ETH_COIN_ID}
+RESULTS_VERSION = 1
+
+
+def _best_of(repeat: int, func, setup=None) -> tuple[float, object]:
+    best_seconds = float('inf')
+    result = None
+    for attempt in range(repeat):
+        arguments = () if setup is None else (setup(attempt),)
+        started_at = time.perf_counter()
+        result = func(*arguments)
+        best_seconds = min(best_seconds, time.perf_counter() - started_at)
+    return best_seconds, result
+
+
+def _parse_scale(scale: str) -> tuple[int, int]:
+    coin_count, days = scale.lower().split('x')
+    return int(coin_count), int(days)
+
+
+def _build_view(snapshot, cohorts_per_section: int) -> CryptoSignalDigestView:
+    candidates = sorted(
+        (build_synthetic_candidate(coin) for coin in snapshot.coins),
+        key=lambda candidate: candidate.latest_price_change_24h,
+    )
+    return CryptoSignalDigestView(
+        latest_snapshot=snapshot,
+        window_label='7d',
+        market_regime_label='Mixed',
+        market_regime_reason='benchmark',
+        strong_candidates=candidates[::-1][:cohorts_per_section],
+        weak_candidates=candidates[:cohorts_per_section],
+        watchlist_candidates=[
+            candidate for candidate in candidates if candidate.is_watchlist
+        ][:cohorts_per_section],
+    )
+
+
+def _populate(
+    repository: CryptoSignalRepository,
+    coin_count: int,
+    days: int,
+    runs_per_day: int,
+    cohorts_per_section: int,
+    market_regime_metric_count: int,
+    repeat: int,
+) -> tuple[int, float, object]:
+    """Save every run with its cohorts; the last `repeat` saves are timed."""
+    run_count = days * runs_per_day
+    save_seconds = float('inf')
+    latest_snapshot = None
+    for run_index, snapshot in enumerate(
+        iter_synthetic_snapshots(
+            coin_count=coin_count,
+            days=days,
+            runs_per_day=runs_per_day,
+            watchlist_coin_ids=WATCHLIST_COIN_IDS,
+        )
+    ):
+        started_at = time.perf_counter()
+        repository.save_snapshot(snapshot)
+        if run_index >= run_count - repeat:
+            save_seconds = min(save_seconds, time.perf_counter() - started_at)
+        repository.save_candidate_cohorts_from_view(
+            _build_view(snapshot, cohorts_per_section)
+        )
+        latest_snapshot = snapshot
+    for regime_snapshot in iter_synthetic_market_regime_snapshots(
+        metric_count=market_regime_metric_count,
+        days=days,
+        runs_per_day=runs_per_day,
+    ):
+        repository.save_market_regime_snapshot(regime_snapshot)
+    return run_count, save_seconds, latest_snapshot
+
+
+def _build_coin_detail(rng: random.Random, coin_id: int) -> cmc_type.CoinDetail:
+    return cmc_type.CoinDetail(
+        id=coin_id,
+        name=f'Coin {coin_id}',
+        symbol=f'C{coin_id}',
+        volume=rng.uniform(1e6, 5e9),
+        volumeChangePercentage24h=rng.gauss(0, 20),
+        statistics=cmc_type.CoinDetailStatistics(
+            price=rng.uniform(0.5, 500.0),
+            priceChangePercentage24h=rng.gauss(0, 6),
+        ),
+    )
+
+
+def _build_cmc_inputs(coin_count: int) -> dict:
+    """Provider-shaped inputs for the snapshot builder and digest formatter."""
+    rng = random.Random(DEFAULT_SEED)
+    coin_ids = build_synthetic_coin_ids(coin_count)
+    coin_details = {coin_id: _build_coin_detail(rng, coin_id) for coin_id in coin_ids}
+
+    def build_list_coin(coin_id: int) -> cmc_type.TrendingList:
+        detail = coin_details[coin_id]
+        return cmc_type.TrendingList(
+            id=coin_id,
+            name=detail.name,
+            symbol=detail.symbol,
+            priceChange=cmc_type.PriceChange(
+                price=detail.statistics.price,
+                priceChange24h=detail.statistics.priceChangePercentage24h,
+                volume24h=detail.volume,
+            ),
+        )
+
+    spotlight = cmc_type.Spotlight(
+        trendingList=[build_list_coin(coin_id) for coin_id in coin_ids[:10]],
+        gainerList=[build_list_coin(coin_id) for coin_id in coin_ids[10:20]],
+        loserList=[build_list_coin(coin_id) for coin_id in coin_ids[20:30]],
+        mostVisitedList=[],
+        recentlyAddedList=[],
+    )
+    sectors = []
+    sector_details = {}
+    for sector_id, sector_coin_ids in [
+        ('synthetic-strong', coin_ids[: coin_count // 2]),
+        ('synthetic-weak', coin_ids[coin_count // 2:]),
+    ]:
+        sectors.append(
+            cmc_type.Sector24hChange(
+                sectorId=sector_id,
+                title=sector_id.replace('-', ' ').title(),
+                avgPriceChange=rng.uniform(-10, 10),
+                marketChange=rng.uniform(-10, 10),
+                volumeChange=rng.uniform(-20, 20),
+                gainersNum=rng.randint(0, 20),
+                losersNum=rng.randint(0, 20),
+            )
+        )
+        sector_details[sector_id] = cmc_type.SectorDetail(
+            sectorId=sector_id,
+            title=sectors[-1].title,
+            coins=[
+                cmc_type.SectorCoin(
+                    id=coin_id,
+                    name=coin_details[coin_id].name,
+                    slug=f'coin-{coin_id}',
+                    symbol=coin_details[coin_id].symbol,
+                    quote={
+                        'USD': cmc_type.SectorCoinQuote(
+                            price=coin_details[coin_id].statistics.price,
+                            percent_change_24h=coin_details[coin_id].statistics.priceChangePercentage24h,
+                            volume_24h=coin_details[coin_id].volume,
+                        )
+                    },
+                )
+                for coin_id in sector_coin_ids
+            ],
+        )
+    standout_entries = get_standout_entries(spotlight)
+    return {
+        'strongest_sector': sectors[0],
+        'weakest_sector': sectors[1],
+        'standout_entries': standout_entries,
+        'standout_coin_details': {
+            coin.id: coin_details[coin.id] for coin, _reasons in standout_entries
+        },
+        'sector_details': sector_details,
+        'sector_detail_coin_details': coin_details,
+        'tracked_universe_entries': [
+            (coin_details[coin_id].symbol, coin_id) for coin_id in coin_ids
+        ],
+        'tracked_universe_coin_details': coin_details,
+    }
+
+
+def run_scale(
+    coin_count: int,
+    days: int,
+    runs_per_day: int,
+    cohorts_per_section: int,
+    market_regime_metric_count: int,
+    repeat: int,
+) -> dict[str, float]:
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        seed_db_path = Path(temp_dir) / 'seed.sqlite3'
+        repository = CryptoSignalRepository(db_path=str(seed_db_path))
+        started_at = time.perf_counter()
+        run_count, results['save_snapshot'], latest_snapshot = _populate(
+            repository,
+            coin_count=coin_count,
+            days=days,
+            runs_per_day=runs_per_day,
+            cohorts_per_section=cohorts_per_section,
+            market_regime_metric_count=market_regime_metric_count,
+            repeat=repeat,
+        )
+        print(
+            f'  populated {run_count} runs x {coin_count} coins in '
+            f'{time.perf_counter() - started_at:.1f}s',
+            file=sys.stderr,
+        )
+
+        for window_label in WINDOW_LABELS:
+            window_start_utc = get_window_start(latest_snapshot, window_label=window_label)
+            results[f'get_snapshots_since[{window_label}]'], history = _best_of(
+                repeat,
+                lambda start=window_start_utc: repository.get_snapshots_since(start),
+            )
+            results[f'build_digest_view[{window_label}]'], view = _best_of(
+                repeat,
+                lambda history=history, window_label=window_label: build_digest_view(
+                    latest_snapshot=latest_snapshot,
+                    history=history,
+                    watchlist_coin_ids=WATCHLIST_COIN_IDS,
+                    window_label=window_label,
+                ),
+            )
+            results[f'build_crypto_signal_message[{window_label}]'], _message = _best_of(
+                repeat,
+                lambda view=view: build_crypto_signal_message(view),
+            )
+
+        results['get_market_regime_metrics[30d]'], _metrics = _best_of(
+            repeat,
+            lambda: repository.get_market_regime_metrics(
+                runtime_mode=latest_snapshot.run.runtime_mode,
+                start_timestamp_utc=get_window_start(latest_snapshot, window_label='30d'),
+                end_timestamp_utc=latest_snapshot.run.run_timestamp_utc,
+                metric_names=[OPEN_INTEREST_METRIC, FUNDING_RATE_METRIC],
+                provider=COINALYZE_PROVIDER,
+                venue_scope=AGGREGATE_VENUE_SCOPE,
+                instrument_scope=AGGREGATE_INSTRUMENT_SCOPE,
+                interval='1hour',
+            ),
+        )
+        # Re-saving the latest run's cohorts is an upsert over existing rows.
+        latest_view = _build_view(latest_snapshot, cohorts_per_section)
+        results['save_candidate_cohorts_from_view'], _cohorts = _best_of(
+            repeat,
+            lambda: repository.save_candidate_cohorts_from_view(latest_view),
+        )
+        repository._connection_manager().close()
+
+        def copy_seed_db(attempt: int) -> CryptoSignalRepository:
+            # Resolution is a write, so each attempt starts from a fresh copy.
+            db_path = Path(temp_dir) / f'resolve_{attempt}.sqlite3'
+            shutil.copyfile(seed_db_path, db_path)
+            return CryptoSignalRepository(db_path=str(db_path))
+
+        # Every outcome is due after the longest window has passed.
+        results['resolve_due_candidate_outcomes'], _outcomes = _best_of(
+            repeat,
+            lambda attempt_repository: attempt_repository.resolve_due_candidate_outcomes(
+                runtime_mode='prod',
+                current_timestamp_utc=DEFAULT_END_TIMESTAMP_UTC + datetime.timedelta(days=8),
+            ),
+            setup=copy_seed_db,
+        )
+
+    cmc_inputs = _build_cmc_inputs(coin_count)
+    results['build_snapshot'], _snapshot = _best_of(
+        repeat,
+        lambda: build_snapshot(
+            current=DEFAULT_END_TIMESTAMP_UTC,
+            runtime_mode=RuntimeMode(),
+            source_name='Synthetic benchmark',
+            sentiment=None,
+            watchlist_entries=[('BTC', BTC_COIN_ID), ('ETH', ETH_COIN_ID)],
+            **cmc_inputs,
+        ),
+    )
+    results['build_digest_message'], _message = _best_of(
+        repeat,
+        lambda: build_digest_message(
+            current=DEFAULT_END_TIMESTAMP_UTC,
+            sentiment=None,
+            strongest_sector=cmc_inputs['strongest_sector'],
+            weakest_sector=cmc_inputs['weakest_sector'],
+            standout_entries=cmc_inputs['standout_entries'],
+            standout_coin_details=cmc_inputs['standout_coin_details'],
+            sector_details=cmc_inputs['sector_details'],
+            sector_detail_coin_details=cmc_inputs['sector_detail_coin_details'],
+        ),
+    )
+    return results
+
+
+def compare_with_baseline(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    max_regression: float,
+) -> list[str]:
+    """Print current/baseline ratios and return the cases that regressed."""
+    regressions = []
+    print(f'\n{"case":<52} {"baseline_ms":>12} {"current_ms":>12} {"ratio":>7}')
+    for scale, cases in results.items():
+        for case, seconds in cases.items():
+            baseline_seconds = baseline.get(scale, {}).get(case)
+            name = f'{scale} {case}'
+            if baseline_seconds is None or baseline_seconds <= 0:
+                print(f'{name:<52} {"-":>12} {seconds * 1000:>12.2f} {"new":>7}')
+                continue
+            ratio = seconds / baseline_seconds
+            marker = ''
+            if ratio > 1 + max_regression:
+                regressions.append(name)
+                marker = '  REGRESSED'
+            print(
+                f'{name:<52} {baseline_seconds * 1000:>12.2f} '
+                f'{seconds * 1000:>12.2f} {ratio:>6.2f}x{marker}'
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=str, default=','.join(QUICK_SCALES),
+                        help='Comma-separated COINSxDAYS scales')
+    parser.add_argument('--full', action='store_true',
+                        help=f'Run every scale in {",".join(FULL_SCALES)}; slow and memory hungry')
+    parser.add_argument('--runs_per_day', type=int, default=4)
+    parser.add_argument('--cohorts_per_section', type=int, default=3)
+    parser.add_argument('--market_regime_metrics', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', type=str, default='var/benchmark/crypto_signal_suite.json')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Earlier --output file to compare against')
+    parser.add_argument('--max_regression', type=float, default=0.25,
+                        help='Flag cases slower than baseline by more than this fraction')
+    args = parser.parse_args()
+
+    scales = FULL_SCALES if args.full else [scale.strip() for scale in args.scales.split(',')]
+    results: dict[str, dict[str, float]] = {}
+    for scale in scales:
+        coin_count, days = _parse_scale(scale)
+        print(f'{scale}:', file=sys.stderr)
+        results[scale] = run_scale(
+            coin_count=coin_count,
+            days=days,
+            runs_per_day=args.runs_per_day,
+            cohorts_per_section=args.cohorts_per_section,
+            market_regime_metric_count=args.market_regime_metrics,
+            repeat=args.repeat,
+        )
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({
+        'version': RESULTS_VERSION,
+        'created_at_utc': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'runs_per_day': args.runs_per_day,
+        'repeat': args.repeat,
+        'results_seconds': results,
+    }, indent=2, sort_keys=True))
+    print(f'Wrote {output_path}', file=sys.stderr)
+
+    if args.baseline is None:
+        for scale, cases in results.items():
+            for case, seconds in cases.items():
+                print(f'{scale} {case:<44} {seconds * 1000:>10.2f} ms')
+        return
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    if baseline.get('runs_per_day') != args.runs_per_day:
+        print('Warning: baseline used a different --runs_per_day', file=sys.stderr)
+    regressions = compare_with_baseline(
+        results,
+        baseline['results_seconds'],
+        max_regression=args.max_regression,
+    )
+    if regressions:
+        print(f'\n{len(regressions)} case(s) regressed by more than {args.max_regression:.0%}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Compare list and history-cube digest scoring as the coin universe grows.
+
+Usage:
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/history_cube_benchmark.py
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/history_cube_benchmark.py --coins 50 500 2000 --window 30d
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.service.crypto_signal.history_cube import build_digest_view_from_cube
+from src.service.crypto_signal.repository import CryptoSignalRepository
+from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+from tests.benchmark.synthetic_data import build_synthetic_coin_ids, populate_repository
+
+
+def _best_of(repeat: int, func) -> tuple[float, object]:
+    best_seconds = float('inf')
+    result = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = func()
+        best_seconds = min(best_seconds, time.perf_counter() - started_at)
+    return best_seconds, result
+
+
+def _benchmark_coin_count(
+    coin_count: int,
+    days: int,
+    runs_per_day: int,
+    window_label: str,
+    repeat: int,
+) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        repository = CryptoSignalRepository(
+            db_path=str(Path(temp_dir) / 'crypto_signal.sqlite3')
+        )
+        populate_repository(
+            repository,
+            coin_count=coin_count,
+            days=days,
+            runs_per_day=runs_per_day,
+        )
+        latest_snapshot = repository.get_latest_snapshot()
+        window_start_utc = get_window_start(latest_snapshot, window_label=window_label)
+        coin_ids = build_synthetic_coin_ids(coin_count)
+        view_kwargs = {
+            'latest_snapshot': latest_snapshot,
+            'watchlist_coin_ids': set(coin_ids[:3]),
+            'tracked_universe_coin_ids': set(coin_ids[:10]),
+            'window_label': window_label,
+            'limit': 3,
+        }
+
+        def score_lists():
+            return build_digest_view(
+                history=repository.get_snapshots_since(window_start_utc),
+                **view_kwargs,
+            )
+
+        def score_cube():
+            return build_digest_view_from_cube(
+                history_cube=repository.get_history_cube_since(window_start_utc),
+                **view_kwargs,
+            )
+
+        list_seconds, list_view = _best_of(repeat, score_lists)
+        cube_seconds, cube_view = _best_of(repeat, score_cube)
+        if list_view != cube_view:
+            raise RuntimeError(
+                f'History-cube digest diverged from list digest for {coin_count} coins'
+            )
+        print(
+            f'{coin_count:>6} coins, {window_label} window: '
+            f'list {list_seconds * 1000:9.1f} ms, '
+            f'cube {cube_seconds * 1000:9.1f} ms, '
+            f'speedup {list_seconds / cube_seconds:5.2f}x'
+        )
+        repository._connection_manager().close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--coins', type=int, nargs='+', default=[50, 500, 2000])
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--runs_per_day', type=int, default=2)
+    parser.add_argument('--window', choices=['3d', '7d', '30d'], default='30d')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for coin_count in args.coins:
+        _benchmark_coin_count(
+            coin_count=coin_count,
+            days=args.days,
+            runs_per_day=args.runs_per_day,
+            window_label=args.window,
+            repeat=args.repeat,
+        )
+
+
+if __name__ == '__main__':
+    main()
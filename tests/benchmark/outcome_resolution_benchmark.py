@@ -0,0 +1,124 @@
+"""Time resolve_due_candidate_outcomes over a synthetic outcome backlog.
+
+The backlog models a long job outage: every cohort emitted over the retained
+history becomes due at once, with a mix of resolved, stale, and missing
+follow-up runs.
+
+Usage:
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/outcome_resolution_benchmark.py
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/outcome_resolution_benchmark.py --cohorts_per_run 58 --days 12
+"""
+import argparse
+import datetime
+import shutil
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from src.service.crypto_signal.models import CryptoSignalDigestView
+from src.service.crypto_signal.repository import (
+    OUTCOME_WINDOWS,
+    CryptoSignalRepository,
+)
+from tests.benchmark.synthetic_data import (
+    DEFAULT_END_TIMESTAMP_UTC,
+    build_synthetic_candidate,
+    iter_synthetic_snapshots,
+)
+
+
+def _populate_backlog(
+    repository: CryptoSignalRepository,
+    days: int,
+    runs_per_day: int,
+    cohorts_per_run: int,
+) -> int:
+    # Each coin can appear in the strong, weak, and watchlist sections.
+    coin_count = max(2, -(-cohorts_per_run // 3))
+    cohort_count = 0
+    for snapshot in iter_synthetic_snapshots(
+        coin_count=coin_count,
+        days=days,
+        runs_per_day=runs_per_day,
+    ):
+        repository.save_snapshot(snapshot)
+        candidates = [build_synthetic_candidate(coin) for coin in snapshot.coins]
+        sections = [candidates, candidates, candidates]
+        remaining = cohorts_per_run
+        section_candidates = []
+        for section in sections:
+            section_candidates.append(section[:remaining])
+            remaining -= len(section_candidates[-1])
+        cohort_count += len(
+            repository.save_candidate_cohorts_from_view(
+                CryptoSignalDigestView(
+                    latest_snapshot=snapshot,
+                    window_label='7d',
+                    market_regime_label='Mixed',
+                    market_regime_reason='benchmark',
+                    strong_candidates=section_candidates[0],
+                    weak_candidates=section_candidates[1],
+                    watchlist_candidates=section_candidates[2],
+                )
+            )
+        )
+    return cohort_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=12)
+    parser.add_argument('--runs_per_day', type=int, default=24)
+    parser.add_argument('--cohorts_per_run', type=int, default=58)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        seed_db_path = Path(temp_dir) / 'seed.sqlite3'
+        seed_repository = CryptoSignalRepository(db_path=str(seed_db_path))
+        populate_started_at = time.perf_counter()
+        cohort_count = _populate_backlog(
+            seed_repository,
+            days=args.days,
+            runs_per_day=args.runs_per_day,
+            cohorts_per_run=args.cohorts_per_run,
+        )
+        seed_repository._connection_manager().close()
+        print(
+            f'Populated {cohort_count} cohorts / '
+            f'{cohort_count * len(OUTCOME_WINDOWS)} outcomes in '
+            f'{time.perf_counter() - populate_started_at:.1f} s'
+        )
+
+        # Every outcome is due after the longest window has passed.
+        current_timestamp_utc = DEFAULT_END_TIMESTAMP_UTC + datetime.timedelta(days=8)
+        best_seconds = float('inf')
+        for attempt in range(args.repeat):
+            # Resolution is a write, so each attempt starts from a fresh copy.
+            db_path = Path(temp_dir) / f'attempt_{attempt}.sqlite3'
+            shutil.copyfile(seed_db_path, db_path)
+            repository = CryptoSignalRepository(db_path=str(db_path))
+            started_at = time.perf_counter()
+            outcomes = repository.resolve_due_candidate_outcomes(
+                runtime_mode='prod',
+                current_timestamp_utc=current_timestamp_utc,
+            )
+            best_seconds = min(best_seconds, time.perf_counter() - started_at)
+            repository._connection_manager().close()
+
+        statuses = Counter(
+            (outcome.status, outcome.missing_reason) for outcome in outcomes
+        )
+        print(
+            f'Resolved {len(outcomes)} outcomes in {best_seconds * 1000:.1f} ms '
+            f'({len(outcomes) / best_seconds:,.0f} outcomes/s)'
+        )
+        for (status, missing_reason), count in sorted(
+            statuses.items(), key=lambda item: -item[1]
+        ):
+            print(f'  {status:<8} {missing_reason or "":<40} {count}')
+
+
+if __name__ == '__main__':
+    main()
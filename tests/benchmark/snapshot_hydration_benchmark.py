@@ -0,0 +1,98 @@
+"""Compare per-run and batched snapshot hydration on a generated 90-day DB.
+
+Usage:
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/snapshot_hydration_benchmark.py
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/snapshot_hydration_benchmark.py --coins 200 --days 90
+"""
+import argparse
+import datetime
+import tempfile
+import time
+from pathlib import Path
+
+from src.service.crypto_signal.repository import CryptoSignalRepository
+from tests.benchmark.synthetic_data import DEFAULT_END_TIMESTAMP_UTC, populate_repository
+
+
+def _load_per_run(
+    repository: CryptoSignalRepository,
+    start_timestamp_utc: datetime.datetime,
+) -> list:
+    # Reproduces the previous N+1 shape: one coin query per run row.
+    with repository._read_connection() as connection:
+        run_rows = connection.execute(
+            """
+            SELECT *
+            FROM crypto_signal_runs
+            WHERE run_timestamp_utc >= ?
+            ORDER BY run_timestamp_utc ASC
+            """,
+            (repository._format_timestamp(start_timestamp_utc),),
+        ).fetchall()
+        return [
+            repository._build_snapshot_from_row(connection, run_row)
+            for run_row in run_rows
+        ]
+
+
+def _best_of(repeat: int, func) -> tuple[float, object]:
+    best_seconds = float('inf')
+    result = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = func()
+        best_seconds = min(best_seconds, time.perf_counter() - started_at)
+    return best_seconds, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--coins', type=int, default=50)
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--runs_per_day', type=int, default=24)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        repository = CryptoSignalRepository(
+            db_path=str(Path(temp_dir) / 'crypto_signal.sqlite3')
+        )
+        started_at = time.perf_counter()
+        run_count = populate_repository(
+            repository,
+            coin_count=args.coins,
+            days=args.days,
+            runs_per_day=args.runs_per_day,
+        )
+        print(
+            f'Generated {run_count} runs x {args.coins} coins in '
+            f'{time.perf_counter() - started_at:.2f}s'
+        )
+
+        for window_days in (3, 7, 30, args.days):
+            start_timestamp_utc = DEFAULT_END_TIMESTAMP_UTC - datetime.timedelta(
+                days=window_days
+            )
+            per_run_seconds, per_run_snapshots = _best_of(
+                args.repeat,
+                lambda start=start_timestamp_utc: _load_per_run(repository, start),
+            )
+            batched_seconds, batched_snapshots = _best_of(
+                args.repeat,
+                lambda start=start_timestamp_utc: repository.get_snapshots_since(start),
+            )
+            if per_run_snapshots != batched_snapshots:
+                raise RuntimeError(
+                    f'Batched hydration diverged from per-run hydration for {window_days}d'
+                )
+            print(
+                f'{window_days:>3}d window, {len(batched_snapshots):>5} runs: '
+                f'per-run {per_run_seconds * 1000:8.1f} ms, '
+                f'batched {batched_seconds * 1000:8.1f} ms, '
+                f'speedup {per_run_seconds / batched_seconds:5.2f}x'
+            )
+        repository._connection_manager().close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+import datetime
+import random
+from typing import Iterator
+
+from src.service.crypto_signal.market_regime import (
+    FUNDING_RATE_METRIC,
+    OPEN_INTEREST_METRIC,
+)
+from src.service.crypto_signal.models import (
+    CryptoSignalCandidate,
+    CryptoSignalCoinSnapshot,
+    CryptoSignalMarketRegimeMetric,
+    CryptoSignalMarketRegimeSnapshot,
+    CryptoSignalRunRecord,
+    CryptoSignalSnapshot,
+)
+from src.service.crypto_signal.repository import (
+    BTC_COIN_ID,
+    ETH_COIN_ID,
+    SNAPSHOT_VERSION,
+    CryptoSignalRepository,
+)
+
+
+DEFAULT_SEED = 20260501
+DEFAULT_END_TIMESTAMP_UTC = datetime.datetime(
+    2026,
+    5,
+    1,
+    0,
+    0,
+    tzinfo=datetime.timezone.utc,
+)
+_CONTEXT_TAG_CHOICES = [
+    (),
+    (),
+    (),
+    ('spotlight_trending',),
+    ('spotlight_gainer',),
+    ('spotlight_loser',),
+    ('sector_leader_strongest',),
+    ('sector_loser_weakest',),
+    ('spotlight_trending', 'spotlight_gainer'),
+]
+
+
+def build_synthetic_coin_ids(coin_count: int) -> list[int]:
+    # Keep the BTC/ETH benchmarks present so outcome resolution has prices.
+    return [BTC_COIN_ID, ETH_COIN_ID, *range(10_000, 10_000 + max(0, coin_count - 2))][
+        :coin_count
+    ]
+
+
+def iter_synthetic_snapshots(
+    coin_count: int,
+    days: int,
+    runs_per_day: int = 24,
+    seed: int = DEFAULT_SEED,
+    end_timestamp_utc: datetime.datetime = DEFAULT_END_TIMESTAMP_UTC,
+    runtime_mode: str = 'prod',
+    watchlist_coin_ids: set[int] | None = None,
+) -> Iterator[CryptoSignalSnapshot]:
+    """Yield deterministic oldest-to-newest snapshots for benchmarks.
+
+    Prices follow a per-coin random walk so 24h changes, volume changes and
+    context tags carry a realistic mix of signs for the scorer.
+    """
+    rng = random.Random(seed)
+    coin_ids = build_synthetic_coin_ids(coin_count)
+    watchlist_coin_ids = (
+        {BTC_COIN_ID, ETH_COIN_ID} if watchlist_coin_ids is None else watchlist_coin_ids
+    )
+    prices = {coin_id: rng.uniform(0.5, 500.0) for coin_id in coin_ids}
+    volumes = {coin_id: rng.uniform(1e6, 5e9) for coin_id in coin_ids}
+    drifts = {coin_id: rng.uniform(-0.004, 0.004) for coin_id in coin_ids}
+    run_count = days * runs_per_day
+    run_interval = datetime.timedelta(days=1) / runs_per_day
+
+    for run_index in range(run_count):
+        run_timestamp_utc = end_timestamp_utc - run_interval * (
+            run_count - 1 - run_index
+        )
+        coins = []
+        for coin_id in coin_ids:
+            previous_price = prices[coin_id]
+            previous_volume = volumes[coin_id]
+            prices[coin_id] = max(
+                1e-6,
+                previous_price * (1 + drifts[coin_id] + rng.gauss(0, 0.02)),
+            )
+            volumes[coin_id] = max(1.0, previous_volume * (1 + rng.gauss(0, 0.1)))
+            is_watchlist = coin_id in watchlist_coin_ids
+            context_tags = rng.choice(_CONTEXT_TAG_CHOICES)
+            if is_watchlist:
+                context_tags = (*context_tags, 'watchlist')
+            coins.append(
+                CryptoSignalCoinSnapshot(
+                    coin_id=coin_id,
+                    symbol=f'C{coin_id}',
+                    name=f'Coin {coin_id}',
+                    price_usd=prices[coin_id],
+                    # Bias the reported 24h move by the coin drift so some
+                    # coins trend persistently in either direction.
+                    price_change_24h=drifts[coin_id] * 2_400 + rng.gauss(0, 6.0),
+                    volume_24h=volumes[coin_id],
+                    volume_change_pct_24h=(volumes[coin_id] / previous_volume - 1)
+                    * 100,
+                    is_watchlist=is_watchlist,
+                    context_tags=context_tags,
+                )
+            )
+        sentiment_value = float(rng.randint(10, 90))
+        yield CryptoSignalSnapshot(
+            run=CryptoSignalRunRecord(
+                run_timestamp_utc=run_timestamp_utc,
+                runtime_mode=runtime_mode,
+                source_name='Synthetic benchmark',
+                snapshot_version=SNAPSHOT_VERSION,
+                sentiment_now_value=sentiment_value,
+                sentiment_now_label='Neutral',
+                sentiment_yesterday_value=sentiment_value,
+                sentiment_last_week_value=sentiment_value,
+                sentiment_7d_avg=sentiment_value,
+                sentiment_30d_avg=sentiment_value,
+                strongest_sector_id='synthetic-strong',
+                strongest_sector_name='Synthetic Strong',
+                strongest_sector_avg_price_change_24h=rng.uniform(0, 10),
+                strongest_sector_market_change_24h=rng.uniform(0, 10),
+                strongest_sector_volume_change_24h=rng.uniform(-20, 20),
+                strongest_sector_gainers_num=rng.randint(5, 20),
+                strongest_sector_losers_num=rng.randint(0, 5),
+                weakest_sector_id='synthetic-weak',
+                weakest_sector_name='Synthetic Weak',
+                weakest_sector_avg_price_change_24h=rng.uniform(-10, 0),
+                weakest_sector_market_change_24h=rng.uniform(-10, 0),
+                weakest_sector_volume_change_24h=rng.uniform(-20, 20),
+                weakest_sector_gainers_num=rng.randint(0, 5),
+                weakest_sector_losers_num=rng.randint(5, 20),
+            ),
+            coins=coins,
+        )
+
+
+def iter_synthetic_market_regime_snapshots(
+    metric_count: int,
+    days: int,
+    runs_per_day: int = 24,
+    seed: int = DEFAULT_SEED,
+    end_timestamp_utc: datetime.datetime = DEFAULT_END_TIMESTAMP_UTC,
+    runtime_mode: str = 'prod',
+    interval: str = '1hour',
+) -> Iterator[CryptoSignalMarketRegimeSnapshot]:
+    """Yield one BTC perpetual-basket snapshot per run with `metric_count` metrics.
+
+    The first two metrics are the open interest and funding rate series the
+    regime summary reads; the rest are filler series of the same shape.
+    """
+    # The collector module pulls in the provider client library, which the
+    # snapshot-only benchmarks do not need.
+    from src.service.crypto_signal.market_regime_collector import (
+        AGGREGATE_INSTRUMENT_SCOPE,
+        AGGREGATE_VENUE_SCOPE,
+        BTC_ASSET_SYMBOL,
+        COINALYZE_PROVIDER,
+        SOURCE_PAYLOAD_VERSION,
+    )
+
+    rng = random.Random(seed + 1)
+    metric_names = [OPEN_INTEREST_METRIC, FUNDING_RATE_METRIC, *[
+        f'synthetic_metric_{index}' for index in range(max(0, metric_count - 2))
+    ]][:metric_count]
+    values = {metric_name: rng.uniform(1e9, 3e10) for metric_name in metric_names}
+    values[FUNDING_RATE_METRIC] = 0.0001
+    run_count = days * runs_per_day
+    run_interval = datetime.timedelta(days=1) / runs_per_day
+
+    for run_index in range(run_count):
+        observed_at_utc = end_timestamp_utc - run_interval * (run_count - 1 - run_index)
+        metrics = []
+        for metric_name in metric_names:
+            if metric_name == FUNDING_RATE_METRIC:
+                values[metric_name] = rng.gauss(0.0001, 0.0002)
+            else:
+                values[metric_name] *= 1 + rng.gauss(0, 0.01)
+            metrics.append(
+                CryptoSignalMarketRegimeMetric(
+                    metric_name=metric_name,
+                    metric_value=values[metric_name],
+                    unit='ratio' if metric_name == FUNDING_RATE_METRIC else 'usd',
+                    source_timestamp_utc=observed_at_utc,
+                    provider=COINALYZE_PROVIDER,
+                    asset_symbol=BTC_ASSET_SYMBOL,
+                    venue_scope=AGGREGATE_VENUE_SCOPE,
+                    instrument_scope=AGGREGATE_INSTRUMENT_SCOPE,
+                    interval=interval,
+                )
+            )
+        yield CryptoSignalMarketRegimeSnapshot(
+            observed_at_utc=observed_at_utc,
+            runtime_mode=runtime_mode,
+            provider=COINALYZE_PROVIDER,
+            asset_symbol=BTC_ASSET_SYMBOL,
+            venue_scope=AGGREGATE_VENUE_SCOPE,
+            instrument_scope=AGGREGATE_INSTRUMENT_SCOPE,
+            interval=interval,
+            source_payload_version=SOURCE_PAYLOAD_VERSION,
+            metrics=metrics,
+        )
+
+
+def build_synthetic_candidate(coin: CryptoSignalCoinSnapshot) -> CryptoSignalCandidate:
+    return CryptoSignalCandidate(
+        coin_id=coin.coin_id,
+        symbol=coin.symbol,
+        name=coin.name,
+        latest_price_usd=coin.price_usd,
+        latest_volume_24h=coin.volume_24h,
+        latest_price_change_24h=coin.price_change_24h,
+        window_price_change_pct=None,
+        latest_volume_change_pct_24h=coin.volume_change_pct_24h,
+        latest_context_tags=coin.context_tags,
+        score=0,
+        price_persistence_score=0,
+        volume_confirmation_score=0,
+        attention_persistence_score=0,
+        breadth_alignment_score=0,
+        observation_count=1,
+        reason_tags=(),
+        flags=(),
+        is_watchlist=coin.is_watchlist,
+    )
+
+
+def populate_repository(
+    repository: CryptoSignalRepository,
+    coin_count: int,
+    days: int,
+    runs_per_day: int = 24,
+    seed: int = DEFAULT_SEED,
+    end_timestamp_utc: datetime.datetime = DEFAULT_END_TIMESTAMP_UTC,
+    market_regime_metric_count: int = 0,
+) -> int:
+    run_count = 0
+    for snapshot in iter_synthetic_snapshots(
+        coin_count=coin_count,
+        days=days,
+        runs_per_day=runs_per_day,
+        seed=seed,
+        end_timestamp_utc=end_timestamp_utc,
+    ):
+        repository.save_snapshot(snapshot)
+        run_count += 1
+    if market_regime_metric_count > 0:
+        for regime_snapshot in iter_synthetic_market_regime_snapshots(
+            metric_count=market_regime_metric_count,
+            days=days,
+            runs_per_day=runs_per_day,
+            seed=seed,
+            end_timestamp_utc=end_timestamp_utc,
+        ):
+            repository.save_market_regime_snapshot(regime_snapshot)
+    return run_count
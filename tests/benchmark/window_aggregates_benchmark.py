@@ -0,0 +1,117 @@
+"""Compare digest latency from raw history and from rolling window aggregates.
+
+Aggregate-backed digests should stay flat as runs per day grow, while the
+history scorer grows with every retained run in the window.
+
+Usage:
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/window_aggregates_benchmark.py
+  PYTHONPATH="$(pwd)" poetry run python tests/benchmark/window_aggregates_benchmark.py --runs_per_day 2 6 24 --coins 300
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.service.crypto_signal.repository import CryptoSignalRepository
+from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+from src.service.crypto_signal.window_aggregates import (
+    build_digest_view_from_aggregates,
+)
+from tests.benchmark.synthetic_data import build_synthetic_coin_ids, populate_repository
+
+
+def _best_of(repeat: int, func) -> tuple[float, object]:
+    best_seconds = float('inf')
+    result = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = func()
+        best_seconds = min(best_seconds, time.perf_counter() - started_at)
+    return best_seconds, result
+
+
+def _benchmark_cadence(
+    coin_count: int,
+    days: int,
+    runs_per_day: int,
+    window_label: str,
+    repeat: int,
+) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        repository = CryptoSignalRepository(
+            db_path=str(Path(temp_dir) / 'crypto_signal.sqlite3')
+        )
+        populate_started_at = time.perf_counter()
+        populate_repository(
+            repository,
+            coin_count=coin_count,
+            days=days,
+            runs_per_day=runs_per_day,
+        )
+        save_seconds = (time.perf_counter() - populate_started_at) / (
+            days * runs_per_day
+        )
+        latest_snapshot = repository.get_latest_snapshot()
+        window_start_utc = get_window_start(latest_snapshot, window_label=window_label)
+        coin_ids = build_synthetic_coin_ids(coin_count)
+        watchlist_coin_ids = set(coin_ids[:3])
+        view_kwargs = {
+            'latest_snapshot': latest_snapshot,
+            'watchlist_coin_ids': watchlist_coin_ids,
+            'tracked_universe_coin_ids': set(coin_ids[:10]),
+            'window_label': window_label,
+            'limit': 3,
+        }
+
+        def score_history():
+            return build_digest_view(
+                history=repository.get_snapshots_since(window_start_utc),
+                **view_kwargs,
+            )
+
+        def score_aggregates():
+            return build_digest_view_from_aggregates(
+                window_aggregates=repository.get_window_aggregates(
+                    latest_snapshot=latest_snapshot,
+                    window_label=window_label,
+                    watchlist_coin_ids=watchlist_coin_ids,
+                ),
+                **view_kwargs,
+            )
+
+        history_seconds, history_view = _best_of(repeat, score_history)
+        aggregate_seconds, aggregate_view = _best_of(repeat, score_aggregates)
+        if history_view != aggregate_view:
+            raise RuntimeError(
+                f'Aggregate digest diverged from history digest at {runs_per_day} runs/day'
+            )
+        print(
+            f'{runs_per_day:>4} runs/day, {coin_count} coins, {window_label} window: '
+            f'history {history_seconds * 1000:9.1f} ms, '
+            f'aggregates {aggregate_seconds * 1000:7.1f} ms, '
+            f'save {save_seconds * 1000:7.1f} ms/run'
+        )
+        repository._connection_manager().close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs_per_day', type=int, nargs='+', default=[2, 6, 24])
+    parser.add_argument('--coins', type=int, default=300)
+    parser.add_argument('--days', type=int, default=10)
+    parser.add_argument('--window', choices=['3d', '7d', '30d'], default='7d')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for runs_per_day in args.runs_per_day:
+        _benchmark_cadence(
+            coin_count=args.coins,
+            days=args.days,
+            runs_per_day=runs_per_day,
+            window_label=args.window,
+            repeat=args.repeat,
+        )
+
+
+if __name__ == '__main__':
+    main()
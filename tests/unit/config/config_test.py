@@ -276,6 +276,16 @@ def test_crypto_signal_market_regime_collection_is_disabled_by_default(monkeypat
     assert config.is_crypto_signal_market_regime_enabled() is False
 
 
+def test_crypto_signal_history_cube_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv('CRYPTO_SIGNAL_HISTORY_CUBE_ENABLED', raising=False)
+
+    assert config.is_crypto_signal_history_cube_enabled() is False
+
+    monkeypatch.setenv('CRYPTO_SIGNAL_HISTORY_CUBE_ENABLED', 'true')
+
+    assert config.is_crypto_signal_history_cube_enabled() is True
+
+
 def test_crypto_signal_market_regime_coinalyze_symbols_are_explicit(monkeypatch):
     monkeypatch.delenv('CRYPTO_SIGNAL_MARKET_REGIME_COINALYZE_SYMBOLS', raising=False)
 
@@ -384,3 +394,21 @@ def test_crypto_signal_dynamic_candidate_floors_reject_negative_values(
         match=f'{env_name} must be a positive number',
     ):
         getter()
+
+
+def test_fetch_scheduler_provider_limits_parse_overrides(monkeypatch):
+    monkeypatch.delenv('FETCH_SCHEDULER_PROVIDER_LIMITS', raising=False)
+
+    assert config.get_fetch_scheduler_provider_limits() == {}
+
+    monkeypatch.setenv('FETCH_SCHEDULER_PROVIDER_LIMITS', ' CMC:2.5:3, coinalyze:0.2:1 ')
+
+    assert config.get_fetch_scheduler_provider_limits() == {
+        'cmc': (2.5, 3),
+        'coinalyze': (0.2, 1),
+    }
+
+    monkeypatch.setenv('FETCH_SCHEDULER_PROVIDER_LIMITS', 'cmc:0:3')
+
+    with pytest.raises(RuntimeError, match='provider:rate_per_second:max_in_flight'):
+        config.get_fetch_scheduler_provider_limits()
@@ -124,3 +124,35 @@ def test_init_market_data_api_passes_coinalyze_key_only_when_configured(
     finally:
         market_data_library.crypto_api = None
         market_data_library.tradfi_api = None
+
+
+def test_get_crypto_api_does_not_build_tradfi_api(monkeypatch):
+    market_data_library.crypto_api = None
+    market_data_library.tradfi_api = None
+
+    crypto_api_cls = Mock(return_value=Mock())
+    tradfi_api_cls = Mock(return_value=Mock())
+
+    monkeypatch.setattr(market_data_library, 'CryptoAPI', crypto_api_cls)
+    monkeypatch.setattr(market_data_library, 'TradFiAPI', tradfi_api_cls)
+    monkeypatch.setattr(
+        market_data_library.config,
+        'get_cryptoquant_api_token',
+        lambda: 'token',
+    )
+    monkeypatch.setattr(
+        market_data_library.config,
+        'has_coinalyze_api_key',
+        lambda: False,
+    )
+
+    try:
+        assert market_data_library.get_crypto_api() is crypto_api_cls.return_value
+        assert market_data_library.get_crypto_api() is crypto_api_cls.return_value
+
+        crypto_api_cls.assert_called_once_with(cryptoquant_api_token='token')
+        tradfi_api_cls.assert_not_called()
+        assert market_data_library.tradfi_api is None
+    finally:
+        market_data_library.crypto_api = None
+        market_data_library.tradfi_api = None
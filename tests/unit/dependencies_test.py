@@ -1,8 +1,10 @@
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 
 from src.dependencies import Dependencies
+from src.service.response_cache import ResponseCache
+from src.service.vix_central_history_store import VixCentralHistoryStore
 
 
 @pytest.fixture(autouse=True)
@@ -10,6 +12,7 @@ def reset_dependencies_state():
     original_values = {
         "is_initialised": Dependencies.is_initialised,
         "tradingview_service": Dependencies.tradingview_service,
+        "tradingview_ingestion_queue": Dependencies.tradingview_ingestion_queue,
         "thirdparty_vix_central_service": Dependencies.thirdparty_vix_central_service,
         "vix_central_service": Dependencies.vix_central_service,
         "thirdparty_barchart_service": Dependencies.thirdparty_barchart_service,
@@ -18,10 +21,13 @@ def reset_dependencies_state():
         "cryptoquant_api_service": Dependencies.cryptoquant_api_service,
         "crypto_sentiment_service": Dependencies.crypto_sentiment_service,
         "crypto_stats_service": Dependencies.crypto_stats_service,
+        "response_cache": Dependencies.response_cache,
+        "telegram_outbox": Dependencies.telegram_outbox,
     }
 
     Dependencies.is_initialised = False
     Dependencies.tradingview_service = None
+    Dependencies.tradingview_ingestion_queue = None
     Dependencies.thirdparty_vix_central_service = None
     Dependencies.vix_central_service = None
     Dependencies.thirdparty_barchart_service = None
@@ -30,6 +36,8 @@ def reset_dependencies_state():
     Dependencies.cryptoquant_api_service = None
     Dependencies.crypto_sentiment_service = None
     Dependencies.crypto_stats_service = None
+    Dependencies.response_cache = None
+    Dependencies.telegram_outbox = None
 
     try:
         yield
@@ -100,16 +108,20 @@ async def test_build_and_cleanup_wire_dependencies_without_live_clients(monkeypa
     tradingview_cls.assert_called_once_with()
     thirdparty_vix_cls.assert_called_once_with(http_client=vix_http_client)
     vix_central_cls.assert_called_once_with(
-        third_party_service=thirdparty_vix_central_service
+        third_party_service=thirdparty_vix_central_service,
+        history_store=ANY,
     )
-    thirdparty_barchart_cls.assert_called_once_with()
-    barchart_cls.assert_called_once_with(
-        third_party_service=thirdparty_barchart_service
+    assert isinstance(
+        vix_central_cls.call_args.kwargs['history_store'],
+        VixCentralHistoryStore,
     )
-    stocks_sentiment_cls.assert_called_once_with()
-    cryptoquant_cls.assert_called_once_with()
-    crypto_sentiment_cls.assert_called_once_with()
-    crypto_stats_cls.assert_called_once_with()
+    # Market data library backed services wait for their first use.
+    thirdparty_barchart_cls.assert_not_called()
+    barchart_cls.assert_not_called()
+    stocks_sentiment_cls.assert_not_called()
+    cryptoquant_cls.assert_not_called()
+    crypto_sentiment_cls.assert_not_called()
+    crypto_stats_cls.assert_not_called()
 
     assert Dependencies.get_tradingview_service() is tradingview_service
     assert Dependencies.get_vix_central_service() is vix_central_service
@@ -118,11 +130,28 @@ async def test_build_and_cleanup_wire_dependencies_without_live_clients(monkeypa
     assert Dependencies.get_cryptoquant_api_service() is cryptoquant_cls.return_value
     assert Dependencies.get_crypto_sentiment_service() is crypto_sentiment_service
     assert Dependencies.get_crypto_stats_service() is crypto_stats_service
+    assert Dependencies.get_barchart_service() is barchart_service
+    assert Dependencies.get_crypto_stats_service() is crypto_stats_service
+
+    thirdparty_barchart_cls.assert_called_once_with()
+    barchart_cls.assert_called_once_with(
+        third_party_service=thirdparty_barchart_service
+    )
+    stocks_sentiment_cls.assert_called_once_with()
+    cryptoquant_cls.assert_called_once_with()
+    crypto_sentiment_cls.assert_called_once_with()
+    crypto_stats_cls.assert_called_once_with()
+    assert isinstance(Dependencies.get_response_cache(), ResponseCache)
+    # Async webhook ingestion is opt-in.
+    assert Dependencies.get_tradingview_ingestion_queue() is None
+    assert Dependencies.get_telegram_outbox() is None
 
     await Dependencies.cleanup()
 
     vix_central_service.cleanup.assert_awaited_once()
     cleanup_market_data_api.assert_awaited_once()
     assert Dependencies.is_initialised is False
+    assert Dependencies.get_barchart_service() is None
     assert Dependencies.get_crypto_sentiment_service() is None
     assert Dependencies.get_crypto_stats_service() is None
+    assert Dependencies.get_response_cache() is None
@@ -11,6 +11,7 @@ import pytest
 from dacite import from_dict
 from market_data_library.types import cmc_type
 
+from src.job.crypto.crypto_digest_formatter import get_standout_entries
 from src.job.crypto.crypto_digest_message_sender import CryptoDigestMessageSender
 from src.runtime.runtime_mode import DEFAULT_RUNTIME_MODE
 from src.service.crypto_signal.models import CALIBRATION_FOLLOW_UP_CONTEXT_TAG
@@ -382,6 +383,38 @@ class TestCryptoDigestMessageSender:
         message_sender.signal_repository.save_snapshot.assert_called_once()
         message_sender.signal_backfill_service.build_snapshots.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_format_message_fetches_each_coin_detail_once_per_run(self):
+        standout_coin_id = get_standout_entries(self.spotlight)[0][0].id
+        message_sender = self.build_message_sender()
+        # The standout coin is also tracked and due for follow-up, so three
+        # enrichment phases ask for it.
+        message_sender.tracked_universe_entries.append(('STANDOUT', standout_coin_id))
+        message_sender.signal_repository.get_unresolved_candidate_follow_up_entries = Mock(
+            return_value=[('STANDOUT', standout_coin_id), ('BTC', 1)]
+        )
+        message_sender.sentiment_service.get_crypto_fear_greed_index = AsyncMock(
+            return_value=self.sentiment
+        )
+        message_sender.cmc_service.get_sectors_24h_change = AsyncMock(
+            side_effect=[[self.sector_24h_change[0]], [self.sector_24h_change[-1]]]
+        )
+        message_sender.cmc_service.get_spotlight = AsyncMock(return_value=self.spotlight)
+        message_sender.cmc_service.get_coin_detail = AsyncMock(return_value=self.coin_detail)
+        message_sender.cmc_service.get_sector_detail = AsyncMock(
+            side_effect=RuntimeError('403 Forbidden')
+        )
+
+        await message_sender.format_message()
+
+        requested_coin_ids = [
+            call.kwargs['id']
+            for call in message_sender.cmc_service.get_coin_detail.await_args_list
+        ]
+        assert standout_coin_id in requested_coin_ids
+        assert len(requested_coin_ids) == len(set(requested_coin_ids))
+        assert message_sender.coin_detail_loader.stats.saved_calls >= 1
+
     @pytest.mark.asyncio
     async def test_format_message_collects_due_candidate_follow_up_entries(self):
         strongest_sector = copy.deepcopy(self.sector_24h_change[0])
@@ -1,3 +1,5 @@
+import datetime
+
 from src.runtime.runtime_mode import RuntimeMode
 from src.job.crypto.crypto import CryptoNotificationJob
 from src.job.crypto.crypto_digest_message_sender import CryptoDigestMessageSender
@@ -20,3 +22,14 @@ class TestCryptoNotificationJob:
         job = CryptoNotificationJob()
 
         assert job.should_run(RuntimeMode.from_test_mode(True)) is True
+
+    def test_get_scheduled_times_pairs_configured_hours_and_minutes(self, monkeypatch) -> None:
+        monkeypatch.setenv('CRYPTO_JOB_START_LOCAL_HOURS', '8,16')
+        monkeypatch.setenv('CRYPTO_JOB_START_LOCAL_MINUTES', '45,15')
+        job = CryptoNotificationJob()
+        now = datetime.datetime(2026, 3, 2, 12, 30, 15, 500)
+
+        assert job.get_scheduled_times(now) == [
+            datetime.datetime(2026, 3, 2, 8, 45),
+            datetime.datetime(2026, 3, 2, 16, 15),
+        ]
@@ -1,4 +1,5 @@
 import datetime
+import threading
 
 import pytest
 
@@ -99,6 +100,9 @@ class _FakeRepository:
     def get_snapshots_since(self, _start):
         return self.history
 
+    def get_window_aggregates(self, **_kwargs):
+        return None
+
     def get_market_regime_metrics(self, **_kwargs):
         return []
 
@@ -292,3 +296,17 @@ async def test_format_message_skips_stale_snapshot(monkeypatch):
     messages = await sender.format_message()
 
     assert messages == []
+
+
+@pytest.mark.asyncio
+async def test_format_message_reads_the_repository_off_the_event_loop_thread():
+    class _ThreadRecordingRepository(_FakeRepository):
+        def get_latest_snapshot(self):
+            self.latest_snapshot_thread = threading.current_thread()
+            return None
+
+    repository = _ThreadRecordingRepository(None)
+    sender = _build_sender(repository)
+
+    assert await sender.format_message() == []
+    assert repository.latest_snapshot_thread is not threading.current_thread()
@@ -66,13 +66,18 @@ class _FakeRepository:
     def __init__(self, latest_snapshot: CryptoSignalSnapshot):
         self.latest_snapshot = latest_snapshot
         self.market_regime_kwargs = None
+        self.snapshot_load_starts = []
 
     def get_latest_snapshot(self):
         return self.latest_snapshot
 
-    def get_snapshots_since(self, _start):
+    def get_snapshots_since(self, start):
+        self.snapshot_load_starts.append(start)
         return [self.latest_snapshot]
 
+    def get_window_aggregates(self, **_kwargs):
+        return None
+
     def get_market_regime_metrics(self, **kwargs):
         self.market_regime_kwargs = kwargs
         return [
@@ -166,3 +171,69 @@ async def test_main_prints_report_to_stdout_when_send_telegram_disabled(
         == AGGREGATE_INSTRUMENT_SCOPE
     )
     assert fake_repository.market_regime_kwargs['interval'] == '1hour'
+
+
+@pytest.mark.asyncio
+async def test_main_renders_every_window_from_one_history_load(
+    monkeypatch,
+    capsys,
+):
+    snapshot = _build_snapshot()
+    fake_repository = _FakeRepository(snapshot)
+    send_crypto_signal_message = AsyncMock()
+
+    monkeypatch.setattr(
+        crypto_signal_report.argparse.ArgumentParser,
+        'parse_args',
+        lambda _self: SimpleNamespace(window='all', limit=3, send_telegram=1, test_mode=0),
+    )
+    monkeypatch.setattr(
+        crypto_signal_report,
+        'CryptoSignalRepository',
+        lambda runtime_mode=None: fake_repository,
+    )
+    monkeypatch.setattr(
+        crypto_signal_report,
+        'build_crypto_signal_message',
+        lambda view: f'*Crypto trend signal* {view.window_label}',
+    )
+    monkeypatch.setattr(
+        crypto_signal_report.config,
+        'get_crypto_signal_watchlist',
+        lambda: [('BTC', 1)],
+    )
+    monkeypatch.setattr(
+        crypto_signal_report.config,
+        'is_crypto_signal_history_cube_enabled',
+        lambda: False,
+    )
+    monkeypatch.setattr(
+        crypto_signal_report.config,
+        'get_crypto_signal_recipient_id',
+        lambda: 'signal-recipient',
+    )
+    monkeypatch.setattr(crypto_signal_report, 'init_telegram_bots', lambda: None)
+    monkeypatch.setattr(
+        crypto_signal_report,
+        'send_crypto_signal_message',
+        send_crypto_signal_message,
+    )
+
+    await crypto_signal_report.main()
+
+    captured = capsys.readouterr()
+    assert captured.out == (
+        '*Crypto trend signal* 3d\n'
+        '*Crypto trend signal* 7d\n'
+        '*Crypto trend signal* 30d\n'
+    )
+    assert fake_repository.snapshot_load_starts == [
+        snapshot.run.run_timestamp_utc - datetime.timedelta(days=30)
+    ]
+    assert [
+        call.kwargs['message'] for call in send_crypto_signal_message.await_args_list
+    ] == [
+        '*Crypto trend signal* 3d',
+        '*Crypto trend signal* 7d',
+        '*Crypto trend signal* 30d',
+    ]
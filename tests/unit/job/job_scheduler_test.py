@@ -0,0 +1,203 @@
+import asyncio
+import contextlib
+import datetime
+
+import pytest
+
+from src.job.job_scheduler import JobScheduler
+from src.job.job_slot_store import JobSlotStore
+from src.job.job_wrapper import JobWrapper
+from src.runtime.runtime_mode import RuntimeMode
+from src.type.market_data_type import MarketDataType
+
+SLOT = datetime.datetime(2026, 3, 2, 9, 0)
+
+
+class ScheduledJob(JobWrapper):
+    def __init__(self, error: Exception | None = None):
+        super().__init__()
+        self.error = error
+        self.release = asyncio.Event()
+        self.release.set()
+        self.run_runtime_modes = []
+        self.reported_errors = []
+
+    def should_run(self, runtime_mode: RuntimeMode | None = None) -> bool:
+        return False
+
+    def get_scheduled_times(self, now: datetime.datetime) -> list[datetime.datetime]:
+        return [SLOT]
+
+    async def run_message_senders(self) -> list:
+        self.run_runtime_modes.append(self.runtime_mode)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return []
+
+    async def report_failure(self, e: Exception) -> None:
+        self.reported_errors.append(e)
+
+    @property
+    def market_data_type(self) -> MarketDataType:
+        return MarketDataType.STOCKS
+
+    @property
+    def message_senders(self):
+        return []
+
+
+@pytest.fixture(autouse=True)
+def no_time_tracker(monkeypatch):
+    monkeypatch.setattr(
+        'src.job.job_scheduler.TimeTrackerContext',
+        lambda _label: contextlib.nullcontext(),
+    )
+    monkeypatch.setenv('JOB_DELAY_TOLERANCE_SECOND', '1800')
+
+
+class FakeRedis:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.values = {}
+        self.set_calls = []
+
+    async def set(self, key, value, nx=False, ex=None):
+        self.set_calls.append((key, ex))
+        if self.error is not None:
+            raise self.error
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+
+def build_scheduler(
+    job: JobWrapper,
+    now: list[datetime.datetime],
+    slot_store: JobSlotStore | None = None,
+) -> JobScheduler:
+    return JobScheduler(jobs={'stocks': job}, clock=lambda: now[0], slot_store=slot_store)
+
+
+@pytest.mark.asyncio
+async def test_start_due_jobs_runs_each_slot_once_within_tolerance():
+    job = ScheduledJob()
+    now = [SLOT - datetime.timedelta(minutes=1)]
+    scheduler = build_scheduler(job, now)
+
+    assert await scheduler.start_due_jobs() == []
+
+    now[0] = SLOT + datetime.timedelta(minutes=1)
+    assert await scheduler.start_due_jobs() == ['stocks']
+    await scheduler.wait_for_running_jobs()
+
+    now[0] = SLOT + datetime.timedelta(minutes=2)
+    assert await scheduler.start_due_jobs() == []
+    assert job.run_runtime_modes == [RuntimeMode()]
+    assert scheduler.last_runs['stocks'].trigger == 'schedule'
+    assert scheduler.last_runs['stocks'].status == 'succeeded'
+
+
+@pytest.mark.asyncio
+async def test_start_due_jobs_skips_slots_past_tolerance():
+    job = ScheduledJob()
+    scheduler = build_scheduler(job, [SLOT + datetime.timedelta(seconds=1801)])
+
+    assert await scheduler.start_due_jobs() == []
+    assert job.run_runtime_modes == []
+
+
+@pytest.mark.asyncio
+async def test_trigger_runs_in_test_mode_and_rejects_overlapping_runs():
+    job = ScheduledJob()
+    job.release.clear()
+    scheduler = build_scheduler(job, [SLOT + datetime.timedelta(minutes=1)])
+
+    assert scheduler.trigger('stocks', test_mode=True) is True
+    assert scheduler.trigger('stocks') is False
+    # A slot that comes due while the manual run is busy is skipped.
+    assert await scheduler.start_due_jobs() == []
+    assert scheduler.get_status()['stocks']['running'] is True
+
+    job.release.set()
+    await scheduler.wait_for_running_jobs()
+    await asyncio.sleep(0)
+
+    assert job.run_runtime_modes == [RuntimeMode.from_test_mode(True)]
+    assert scheduler.get_status()['stocks']['running'] is False
+    assert scheduler.last_runs['stocks'].trigger == 'manual'
+    with pytest.raises(KeyError):
+        scheduler.trigger('missing')
+
+
+def test_get_status_reports_a_misconfigured_schedule_per_job():
+    class MisconfiguredJob(ScheduledJob):
+        def get_scheduled_times(self, now: datetime.datetime) -> list[datetime.datetime]:
+            raise RuntimeError('start local hours and start local minutes are not configured properly')
+
+    now = SLOT - datetime.timedelta(minutes=1)
+    scheduler = JobScheduler(jobs={'stocks': ScheduledJob(), 'crypto': MisconfiguredJob()}, clock=lambda: now)
+
+    status = scheduler.get_status()
+
+    assert status['stocks']['scheduled_times'] == [SLOT.isoformat()]
+    assert status['stocks']['schedule_error'] is None
+    assert status['crypto']['scheduled_times'] == []
+    assert status['crypto']['schedule_error'] == (
+        'start local hours and start local minutes are not configured properly'
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_run_is_reported_and_recorded():
+    error = RuntimeError('upstream down')
+    job = ScheduledJob(error=error)
+    scheduler = build_scheduler(job, [SLOT])
+
+    scheduler.trigger('stocks')
+    await scheduler.wait_for_running_jobs()
+
+    assert job.reported_errors == [error]
+    assert scheduler.last_runs['stocks'].status == 'failed'
+    assert scheduler.last_runs['stocks'].finished_at == SLOT
+
+
+@pytest.mark.asyncio
+async def test_slot_store_keeps_a_restarted_scheduler_from_refiring_a_slot():
+    redis_client = FakeRedis()
+    slot_store = JobSlotStore(redis_client_getter=lambda: redis_client)
+    now = [SLOT + datetime.timedelta(minutes=1)]
+    job = ScheduledJob()
+    scheduler = build_scheduler(job, now, slot_store=slot_store)
+
+    assert await scheduler.start_due_jobs() == ['stocks']
+    await scheduler.wait_for_running_jobs()
+
+    # A new process, or a second replica, within the delay tolerance.
+    restarted_job = ScheduledJob()
+    now[0] = SLOT + datetime.timedelta(minutes=5)
+    restarted_scheduler = build_scheduler(restarted_job, now, slot_store=slot_store)
+
+    assert await restarted_scheduler.start_due_jobs() == []
+    assert restarted_job.run_runtime_modes == []
+    assert redis_client.set_calls == [
+        (f'job-scheduler:slot:stocks:{SLOT.isoformat()}', 1800),
+        (f'job-scheduler:slot:stocks:{SLOT.isoformat()}', 1800),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slot_store_outage_falls_back_to_the_in_process_check():
+    redis_client = FakeRedis(error=ConnectionError('redis down'))
+    slot_store = JobSlotStore(redis_client_getter=lambda: redis_client)
+    job = ScheduledJob()
+    now = [SLOT + datetime.timedelta(minutes=1)]
+    scheduler = build_scheduler(job, now, slot_store=slot_store)
+
+    assert await scheduler.start_due_jobs() == ['stocks']
+    await scheduler.wait_for_running_jobs()
+    now[0] = SLOT + datetime.timedelta(minutes=2)
+
+    assert await scheduler.start_due_jobs() == []
+    assert len(job.run_runtime_modes) == 1
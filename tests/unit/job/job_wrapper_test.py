@@ -43,7 +43,7 @@ async def test_job_wrapper_start_builds_runtime_mode_from_test_mode_flag(monkeyp
 
     monkeypatch.setattr(
         'src.job.job_wrapper.argparse.ArgumentParser.parse_args',
-        lambda _self: SimpleNamespace(force_run=0, test_mode=1),
+        lambda _self: SimpleNamespace(force_run=0, test_mode=1, startup_report=0),
     )
     monkeypatch.setattr(
         'src.job.job_wrapper.TimeTrackerContext',
@@ -70,7 +70,7 @@ async def test_job_wrapper_start_skips_work_when_not_scheduled(monkeypatch):
 
     monkeypatch.setattr(
         'src.job.job_wrapper.argparse.ArgumentParser.parse_args',
-        lambda _self: SimpleNamespace(force_run=0, test_mode=0),
+        lambda _self: SimpleNamespace(force_run=0, test_mode=0, startup_report=0),
     )
     init_telegram_bots = Mock()
     start_redis = AsyncMock()
@@ -7,6 +7,13 @@ import pytest
 from src.job.stocks.tradingview_message_sender import TradingViewMessageSender
 from src.runtime.runtime_mode import RuntimeMode
 from src.type.trading_view import TradingViewRedisData, TradingViewData, TradingViewStocksData, TradingViewDataType
+from src.util.date_util import get_trading_sessions_ending_at
+
+
+@pytest.fixture(autouse=True)
+def isolated_daily_bar_store(monkeypatch, tmp_path):
+    monkeypatch.setenv('STOCKS_DAILY_BAR_DB_PATH', str(tmp_path / 'stocks_daily_bars.sqlite3'))
+    monkeypatch.setenv('STOCKS_DAILY_BAR_TEST_DB_PATH', str(tmp_path / 'stocks_daily_bars.test.sqlite3'))
 
 
 class TestTradingviewMessageSender:
@@ -305,6 +312,42 @@ class TestTradingviewMessageSender:
         assert '\n\n*Economy indicators*' in res[0]
         assert 'Below ema20' in res[0] or 'At/above ema20' in res[0]
 
+    @pytest.mark.parametrize(
+        'historical_volumes',
+        [
+            # The previous session reported zero volume.
+            [100, 0, 0],
+            # Malformed provider data.
+            [100, None, 50],
+        ],
+    )
+    @patch('src.job.stocks.tradingview_message_sender.Dependencies.get_tradingview_service')
+    @patch('src.job.stocks.tradingview_message_sender.Dependencies.get_barchart_service')
+    def test_build_stocks_message_entry_skips_volume_alert_for_bad_history(
+        self,
+        get_barchart_service,
+        get_tradingview_service,
+        historical_volumes,
+    ):
+        tradingview_message_sender = TradingViewMessageSender(
+            runtime_mode=RuntimeMode.from_test_mode(True)
+        )
+
+        entry = tradingview_message_sender._build_stocks_message_entry(
+            TradingViewStocksData(
+                symbol='SPY',
+                timeframe='1D',
+                close_prices=[10],
+                ema20s=[10],
+                volumes=[100],
+            ),
+            historical_volumes=historical_volumes,
+        )
+
+        assert entry.symbol == 'SPY'
+        assert entry.volume_text is not None
+        assert entry.volume_alert is None
+
     @pytest.mark.asyncio
     @patch('src.job.stocks.tradingview_message_sender.get_current_date_preserve_time')
     @patch('src.job.stocks.tradingview_message_sender.Dependencies.get_tradingview_service')
@@ -361,48 +404,23 @@ class TestTradingviewMessageSender:
         tradingview_message_sender.tradingview_service.get_tradingview_daily_stocks_data = AsyncMock(
             side_effect=[stocks_data, economy_indicator_data]
         )
+        # The volume rank needs every one of the 30 sessions.
+        sessions = get_trading_sessions_ending_at(datetime.date(2023, 7, 18), 30)
         tradingview_message_sender.barchart_service.get_stock_price = AsyncMock(
             side_effect=[
                 [
                     barchart_type.StockPrice(
-                        symbol='SPY',
-                        date='2023-06-09',
+                        symbol=symbol,
+                        date=session.isoformat(),
                         open_price=1,
                         high_price=1,
                         low_price=1,
                         close_price=1,
-                        volume=100,
-                    ),
-                    barchart_type.StockPrice(
-                        symbol='SPY',
-                        date='2023-06-08',
-                        open_price=1,
-                        high_price=1,
-                        low_price=1,
-                        close_price=1,
-                        volume=95,
-                    ),
-                ],
-                [
-                    barchart_type.StockPrice(
-                        symbol='AMD',
-                        date='2023-06-09',
-                        open_price=1,
-                        high_price=1,
-                        low_price=1,
-                        close_price=1,
-                        volume=110,
-                    ),
-                    barchart_type.StockPrice(
-                        symbol='AMD',
-                        date='2023-06-08',
-                        open_price=1,
-                        high_price=1,
-                        low_price=1,
-                        close_price=1,
-                        volume=100,
-                    ),
-                ],
+                        volume=(latest_volume, previous_volume)[index] if index < 2 else 90 - index,
+                    )
+                    for index, session in enumerate(sessions)
+                ]
+                for symbol, latest_volume, previous_volume in (('SPY', 100, 95), ('AMD', 110, 100))
             ]
         )
 
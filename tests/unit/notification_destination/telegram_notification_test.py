@@ -6,6 +6,7 @@ import pytest
 from src.notification_destination import telegram_notification
 from src.runtime.runtime_mode import RuntimeMode
 from src.type.market_data_type import MarketDataType
+from src.util.metrics import REGISTRY
 
 
 def _build_message_response(message_id: int):
@@ -22,6 +23,16 @@ def test_init_telegram_bots_uses_configured_httpx_request(monkeypatch):
     request_ctor.side_effect = [object(), object(), object(), object(), object(), object()]
 
     monkeypatch.setattr(telegram_notification.telegram, 'Bot', bot_ctor)
+    monkeypatch.setattr(
+        telegram_notification,
+        'chat_id_to_telegram_client',
+        telegram_notification._TelegramClients(),
+    )
+    for bot_name in [
+        'stocks_bot', 'stocks_admin_bot', 'stocks_dev_bot',
+        'crypto_bot', 'crypto_admin_bot', 'crypto_dev_bot',
+    ]:
+        monkeypatch.setattr(telegram_notification, bot_name, None)
     monkeypatch.setattr(
         telegram_notification.telegram.request,
         'HTTPXRequest',
@@ -110,6 +121,25 @@ def test_init_telegram_bots_uses_configured_httpx_request(monkeypatch):
 
     telegram_notification.init_telegram_bots()
 
+    # Bots are built on first use.
+    assert bot_ctor.call_count == 0
+    assert request_ctor.call_count == 0
+
+    clients = telegram_notification.chat_id_to_telegram_client
+    crypto_admin_client = clients['crypto-admin-chat']
+    assert clients['crypto-admin-chat'] is crypto_admin_client
+    assert telegram_notification.crypto_admin_bot is crypto_admin_client
+    assert bot_ctor.call_count == 1
+    assert bot_ctor.call_args.kwargs['token'] == 'crypto-admin-token'
+    with pytest.raises(KeyError):
+        clients['unknown-chat']
+
+    for chat_id in [
+        'stocks-channel', 'stocks-admin-chat', 'stocks-dev-chat',
+        'crypto-channel', 'crypto-dev-chat',
+    ]:
+        clients[chat_id]
+
     assert request_ctor.call_count == 6
     for call in request_ctor.call_args_list:
         assert call.kwargs == {
@@ -257,6 +287,98 @@ async def test_send_message_to_channel_splits_large_user_facing_message(monkeypa
     assert second_call.kwargs['text'] == 'beta section'
 
 
+@pytest.mark.asyncio
+async def test_enqueue_message_to_channel_splits_and_routes_without_sending(monkeypatch):
+    channel_client = AsyncMock()
+    outbox = Mock()
+    outbox.enqueue = AsyncMock(return_value='entry-id')
+
+    monkeypatch.setattr(
+        telegram_notification,
+        'chat_id_to_telegram_client',
+        {'crypto-dev-chat': channel_client},
+    )
+    monkeypatch.setattr(
+        telegram_notification,
+        'get_admin_channel_id_from_market_data_type',
+        lambda _market_data_type: 'crypto-admin-chat',
+    )
+    monkeypatch.setattr(
+        telegram_notification,
+        'get_dev_channel_id_from_market_data_type',
+        lambda _market_data_type: 'crypto-dev-chat',
+    )
+    monkeypatch.setattr(telegram_notification, 'MAX_TELEGRAM_MESSAGE_LENGTH', 20)
+    monkeypatch.setattr(telegram_notification.config, 'get_disable_telegram', lambda: False)
+    monkeypatch.setattr(
+        telegram_notification.config,
+        'get_simulate_tradingview_traffic',
+        lambda: False,
+    )
+
+    separator = telegram_notification.escape_markdown(
+        f"\n{telegram_notification.message_separator()}\n"
+    )
+    res = await telegram_notification.enqueue_message_to_channel(
+        outbox=outbox,
+        message=f'alpha section{separator}beta section',
+        chat_id='crypto-channel',
+        market_data_type=MarketDataType.CRYPTO,
+        runtime_mode=RuntimeMode.from_test_mode(True),
+    )
+
+    assert res == 'entry-id'
+    outbox.enqueue.assert_awaited_once_with(
+        chat_id='crypto-dev-chat',
+        chunks=['alpha section', 'beta section'],
+    )
+    channel_client.send_message.assert_not_awaited()
+
+
+def test_split_rejected_outbox_chunk_splits_only_too_long_user_facing_chunks(monkeypatch):
+    monkeypatch.setattr(
+        telegram_notification,
+        'market_data_type_to_admin_chat_id',
+        {MarketDataType.CRYPTO: 'crypto-admin-chat'},
+    )
+    monkeypatch.setattr(
+        telegram_notification,
+        'MAX_TELEGRAM_MESSAGE_LENGTH',
+        20,
+    )
+    too_long = Exception('Message is too long')
+    chunk = 'alpha paragraph\n\nbeta paragraph'
+
+    assert telegram_notification.split_rejected_outbox_chunk('crypto-channel', chunk, too_long) == [
+        'alpha paragraph',
+        'beta paragraph',
+    ]
+    assert telegram_notification.split_rejected_outbox_chunk('crypto-admin-chat', chunk, too_long) is None
+    assert telegram_notification.split_rejected_outbox_chunk(
+        'crypto-channel', chunk, Exception("Can't parse entities")
+    ) is None
+
+
+@pytest.mark.asyncio
+async def test_alert_dropped_outbox_message_sends_error_alert_to_the_chat(monkeypatch):
+    channel_client = AsyncMock()
+    monkeypatch.setattr(
+        telegram_notification,
+        'chat_id_to_telegram_client',
+        {'crypto-channel': channel_client},
+    )
+
+    await telegram_notification.alert_dropped_outbox_message(
+        'crypto-channel', Exception("Can't parse entities")
+    )
+
+    channel_client.send_message.assert_awaited_once()
+    call = channel_client.send_message.await_args
+    assert call.args == ('crypto-channel',)
+    assert call.kwargs['text'].startswith('Telegram outbox delivery failed')
+    assert call.kwargs['parse_mode'] == 'MarkdownV2'
+
+
 @pytest.mark.asyncio
 async def test_send_message_to_channel_keeps_admin_path_explicit_when_too_large(monkeypatch):
     admin_client = AsyncMock()
@@ -525,3 +647,21 @@ async def test_send_crypto_signal_message_keeps_admin_routing_in_test_mode(
         parse_mode='MarkdownV2',
     )
     dev_client.send_message.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_instrumented_telegram_request_times_calls_by_api_method():
+    inner_request = AsyncMock()
+    inner_request.do_request = AsyncMock(return_value=(200, b'{"ok": true}'))
+    request = telegram_notification._InstrumentedTelegramRequest(inner_request)
+    duration = telegram_notification.TELEGRAM_REQUEST_DURATION
+    calls_before = duration.get_count(endpoint='sendMessage', outcome='success')
+
+    res = await request.do_request('https://api.telegram.org/botsecret-token/sendMessage', 'POST')
+
+    assert res == (200, b'{"ok": true}')
+    inner_request.do_request.assert_awaited_once_with(
+        'https://api.telegram.org/botsecret-token/sendMessage', 'POST'
+    )
+    assert duration.get_count(endpoint='sendMessage', outcome='success') - calls_before == 1
+    assert 'secret-token' not in REGISTRY.render()
@@ -0,0 +1,194 @@
+import pytest
+from telegram.error import BadRequest, RetryAfter
+
+from src.notification_destination.telegram_outbox import (
+    TelegramOutbox,
+    TelegramOutboxWorker,
+)
+
+
+class _FakeListRedis:
+    """Subset of the Redis list and set commands used by the outbox."""
+
+    def __init__(self):
+        self.now = 1_000.0
+        self.lists = {}
+        self.sets = {}
+
+    async def rpush(self, name, value):
+        self.lists.setdefault(name, []).append(value)
+        return len(self.lists[name])
+
+    async def lindex(self, name, index):
+        values = self.lists.get(name, [])
+        return values[index] if index < len(values) else None
+
+    async def lset(self, name, index, value):
+        self.lists[name][index] = value
+
+    async def lpop(self, name):
+        values = self.lists.get(name, [])
+        return values.pop(0) if values else None
+
+    async def llen(self, name):
+        return len(self.lists.get(name, []))
+
+    async def sadd(self, name, value):
+        self.sets.setdefault(name, set()).add(value)
+
+    async def srem(self, name, value):
+        self.sets.get(name, set()).discard(value)
+
+    async def smembers(self, name):
+        return {value.encode() for value in self.sets.get(name, set())}
+
+
+def _build_outbox(fake_redis: _FakeListRedis) -> TelegramOutbox:
+    return TelegramOutbox(
+        redis_client_getter=lambda: fake_redis,
+        clock=lambda: fake_redis.now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_sends_chunks_in_order_within_rate_limits_and_records_latency():
+    fake_redis = _FakeListRedis()
+    outbox = _build_outbox(fake_redis)
+    sent = []
+
+    async def sender(chat_id, text):
+        sent.append((chat_id, text))
+
+    worker = TelegramOutboxWorker(
+        outbox=outbox,
+        sender=sender,
+        per_chat_interval_seconds=1.0,
+        global_rate_per_second=1_000.0,
+    )
+    await outbox.enqueue(chat_id='admin', chunks=['a1', 'a2'])
+    await outbox.enqueue(chat_id='admin', chunks=['b1'])
+    await outbox.enqueue(chat_id='channel', chunks=['c1'])
+
+    sent_counts = []
+    for _ in range(4):
+        sent_counts.append(await worker.deliver_due())
+        # Still inside the per-chat interval: nothing else may go out.
+        fake_redis.now += 0.5
+        sent_counts.append(await worker.deliver_due())
+        fake_redis.now += 0.5
+
+    stats = await outbox.get_stats()
+    assert sent == [('admin', 'a1'), ('channel', 'c1'), ('admin', 'a2'), ('admin', 'b1')]
+    assert sent_counts == [1, 1, 1, 0, 1, 0, 0, 0]
+    assert stats.queued_by_chat == {}
+    assert stats.delivered == 3
+    assert stats.latency_ms_max == 2_000
+    assert fake_redis.sets[outbox.chats_key] == set()
+
+
+@pytest.mark.asyncio
+async def test_worker_honors_retry_after_per_chat_and_drops_after_max_attempts():
+    fake_redis = _FakeListRedis()
+    outbox = _build_outbox(fake_redis)
+    sent = []
+    failures = {'admin': [RetryAfter(30)], 'channel': [RuntimeError('boom')] * 2}
+
+    async def sender(chat_id, text):
+        if failures[chat_id]:
+            raise failures[chat_id].pop(0)
+        sent.append((chat_id, text))
+
+    worker = TelegramOutboxWorker(
+        outbox=outbox,
+        sender=sender,
+        per_chat_interval_seconds=1.0,
+        global_rate_per_second=1_000.0,
+        max_attempts=2,
+        retry_backoff_seconds=5.0,
+    )
+    await outbox.enqueue(chat_id='admin', chunks=['a1', 'a2'])
+    await outbox.enqueue(chat_id='channel', chunks=['c1'])
+    await outbox.enqueue(chat_id='channel', chunks=['c2'])
+
+    # One send per pass here: the global spacing is checked before each chat.
+    for step_seconds in [1, 5, 1]:
+        await worker.deliver_due()
+        fake_redis.now += step_seconds
+    await worker.deliver_due()
+    paused_stats = await outbox.get_stats()
+    fake_redis.now = 1_030
+    await worker.deliver_due()
+    fake_redis.now += 1
+    await worker.deliver_due()
+
+    stats = await outbox.get_stats()
+    # c1 failed twice and was dropped; the admin chat resumed after retry_after.
+    assert paused_stats.queued_by_chat == {'admin': 1, 'channel': 0}
+    assert sent == [('channel', 'c2'), ('admin', 'a1'), ('admin', 'a2')]
+    assert stats.rate_limited == 1
+    assert stats.dropped == 1
+    assert stats.delivered == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_drops_bad_request_without_retrying_and_alerts_the_chat():
+    fake_redis = _FakeListRedis()
+    outbox = _build_outbox(fake_redis)
+    send_attempts = []
+    drop_alerts = []
+
+    async def sender(chat_id, text):
+        send_attempts.append(text)
+        raise BadRequest("Can't parse entities")
+
+    async def on_drop(chat_id, error):
+        drop_alerts.append((chat_id, str(error)))
+
+    worker = TelegramOutboxWorker(
+        outbox=outbox,
+        sender=sender,
+        split_rejected_chunk=lambda chat_id, chunk, error: None,
+        on_drop=on_drop,
+        global_rate_per_second=1_000.0,
+    )
+    await outbox.enqueue(chat_id='channel', chunks=['c1', 'c2'])
+
+    await worker.deliver_due()
+    fake_redis.now += 60
+    await worker.deliver_due()
+
+    stats = await outbox.get_stats()
+    assert send_attempts == ['c1']
+    assert drop_alerts == [('channel', "Can't parse entities")]
+    assert stats.dropped == 1
+    assert stats.queued_by_chat == {}
+
+
+@pytest.mark.asyncio
+async def test_worker_splits_a_chunk_rejected_as_too_long_and_keeps_order():
+    fake_redis = _FakeListRedis()
+    outbox = _build_outbox(fake_redis)
+    sent = []
+
+    async def sender(chat_id, text):
+        if text == 'long':
+            raise BadRequest('Message is too long')
+        sent.append(text)
+
+    worker = TelegramOutboxWorker(
+        outbox=outbox,
+        sender=sender,
+        split_rejected_chunk=lambda chat_id, chunk, error: ['lo', 'ng'],
+        per_chat_interval_seconds=1.0,
+        global_rate_per_second=1_000.0,
+    )
+    await outbox.enqueue(chat_id='channel', chunks=['first', 'long', 'last'])
+
+    for _ in range(5):
+        await worker.deliver_due()
+        fake_redis.now += 1
+
+    stats = await outbox.get_stats()
+    assert sent == ['first', 'lo', 'ng', 'last']
+    assert stats.dropped == 0
+    assert stats.delivered == 1
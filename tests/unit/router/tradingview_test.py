@@ -16,10 +16,15 @@ class DummyRequest:
         self._body = body.encode('utf-8')
         self.client = SimpleNamespace(host=host)
         self.headers = headers or {}
+        self.body_read = False
 
     async def body(self):
         return self._body
 
+    async def stream(self):
+        self.body_read = True
+        yield self._body
+
 
 class TestTradingViewRouter:
     @pytest.mark.asyncio
@@ -71,11 +76,38 @@ class TestTradingViewRouter:
 
         assert response == {'data': {'num_added': 1, 'num_removed': 0}}
         tradingview_service.get_redis_key_for_stocks.assert_called_once_with(type=TradingViewDataType.STOCKS)
-        saved_payload = json.loads(tradingview_service.save_tradingview_data.await_args.kwargs['data'])
+        saved_payload = tradingview_service.save_tradingview_data.await_args.kwargs['data']
         assert saved_payload == {'type': 'stocks', 'test_mode': 'false', 'unix_ms': 1, 'data': []}
         assert tradingview_service.save_tradingview_data.await_args.kwargs['score'] == 1
         emitted.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_tradingview_daily_stocks_data_queues_payload_and_returns_202(self, monkeypatch):
+        tradingview_service = SimpleNamespace(save_tradingview_data=AsyncMock())
+        ingestion_queue = SimpleNamespace(enqueue=AsyncMock(return_value='1-0'))
+
+        monkeypatch.setattr(tradingview.Dependencies, 'get_tradingview_service', lambda: tradingview_service)
+        monkeypatch.setattr(tradingview.Dependencies, 'get_tradingview_ingestion_queue', lambda: ingestion_queue)
+        monkeypatch.setattr(tradingview.async_ee, 'emit', Mock())
+        monkeypatch.setattr(tradingview.config, 'get_tradingview_webhook_secret', lambda: 'secret')
+        monkeypatch.setattr(tradingview.config, 'get_simulate_tradingview_traffic', lambda: False)
+        monkeypatch.setattr(tradingview.config, 'get_trading_view_ips', lambda: ['52.89.214.238'])
+        monkeypatch.setattr(tradingview.config, 'get_whitelist_ips', lambda: [])
+
+        request = DummyRequest(
+            '{"type": "stocks", "secret": "secret", "test_mode": "false", "unix_ms": 1, "data": []}',
+            host='52.89.214.238',
+        )
+
+        response = await tradingview.tradingview_daily_stocks_data(request)
+
+        assert response.status_code == 202
+        ingestion_queue.enqueue.assert_awaited_once_with(
+            body={'type': 'stocks', 'test_mode': 'false', 'unix_ms': 1, 'data': []},
+            client_host='52.89.214.238',
+        )
+        tradingview_service.save_tradingview_data.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_tradingview_daily_stocks_data_logs_metadata_only(
         self,
@@ -172,6 +204,9 @@ class TestTradingViewRouter:
         monkeypatch.setattr(tradingview.Dependencies, 'get_tradingview_service', lambda: tradingview_service)
         monkeypatch.setattr(tradingview.async_ee, 'emit', emitted)
         monkeypatch.setattr(tradingview.config, 'get_env', lambda: 'prod')
+        monkeypatch.setattr(tradingview.config, 'get_simulate_tradingview_traffic', lambda: False)
+        monkeypatch.setattr(tradingview.config, 'get_trading_view_ips', lambda: [])
+        monkeypatch.setattr(tradingview.config, 'get_whitelist_ips', lambda: ['127.0.0.1'])
         monkeypatch.setattr(tradingview.config, 'get_telegram_stocks_admin_id', lambda: 'admin-chat')
 
         request = DummyRequest(
@@ -194,6 +229,9 @@ class TestTradingViewRouter:
 
         monkeypatch.setattr(tradingview.async_ee, 'emit', emitted)
         monkeypatch.setattr(tradingview.config, 'get_tradingview_webhook_secret', lambda: 'expected-secret')
+        monkeypatch.setattr(tradingview.config, 'get_simulate_tradingview_traffic', lambda: False)
+        monkeypatch.setattr(tradingview.config, 'get_trading_view_ips', lambda: [])
+        monkeypatch.setattr(tradingview.config, 'get_whitelist_ips', lambda: ['127.0.0.1'])
         monkeypatch.setattr(tradingview.config, 'get_telegram_stocks_admin_id', lambda: 'admin-chat')
 
         request = DummyRequest(
@@ -218,7 +256,7 @@ class TestTradingViewRouter:
         assert 'Body' not in message
 
     @pytest.mark.asyncio
-    async def test_tradingview_daily_stocks_data_alerts_bounded_context_for_bad_ip(
+    async def test_tradingview_daily_stocks_data_rejects_bad_ip_without_reading_body(
         self,
         monkeypatch,
     ):
@@ -234,23 +272,59 @@ class TestTradingViewRouter:
         request = DummyRequest(
             r'{\"type\": \"stocks\", \"secret\": \"expected-secret\", \"test_mode\": \"false\", \"unix_ms\": 1774468860948, \"data\": [{\"symbol\": \"QQQ\", \"timeframe\": \"1D\", \"close_prices\": [1, 2], \"ema20s\": [1, 2], \"volumes\": [10, 20]}]}',
             host='203.0.113.10',
-            headers={'X-Api-Auth': 'private-token'},
+            headers={'X-Api-Auth': 'private-token', 'content-length': '190'},
         )
 
         response = await tradingview.tradingview_daily_stocks_data(request)
 
         assert response == {'data': 'OK'}
+        assert request.body_read is False
         message = emitted.call_args.kwargs['message']
         assert 'not from a configured TradingView source' in message
-        assert 'Payload type' in message
-        assert 'Data item count' in message
-        assert 'QQQ 1D' in message
-        assert 'Payload preview' in message
-        assert 'close\\_prices' in message
+        assert '203\\.0\\.113\\.10' in message
+        assert 'Content length:* 190' in message
+        assert 'QQQ' not in message
         assert 'private-token' not in message
         assert 'expected-secret' not in message
-        assert 'Headers' not in message
-        assert 'Body' not in message
+
+    @pytest.mark.asyncio
+    async def test_tradingview_daily_stocks_data_rejects_oversized_body(self, monkeypatch):
+        emitted = Mock()
+
+        monkeypatch.setattr(tradingview.async_ee, 'emit', emitted)
+        monkeypatch.setattr(tradingview.config, 'get_simulate_tradingview_traffic', lambda: True)
+        monkeypatch.setattr(tradingview.config, 'get_tradingview_max_body_bytes', lambda: 64)
+        monkeypatch.setattr(tradingview.config, 'get_telegram_stocks_admin_id', lambda: 'admin-chat')
+
+        declared = DummyRequest('{}', headers={'content-length': '65'})
+        streamed = DummyRequest('{"type": "stocks", "data": [' + ', '.join(['{}'] * 30) + ']}')
+
+        assert await tradingview.tradingview_daily_stocks_data(declared) == {'data': 'OK'}
+        assert declared.body_read is False
+        assert await tradingview.tradingview_daily_stocks_data(streamed) == {'data': 'OK'}
+        assert emitted.call_count == 2
+        assert 'larger than 64 bytes' in emitted.call_args.kwargs['message']
+
+    @pytest.mark.asyncio
+    async def test_tradingview_daily_stocks_data_rejects_invalid_data_items(self, monkeypatch):
+        tradingview_service = SimpleNamespace(save_tradingview_data=AsyncMock())
+        emitted = Mock()
+
+        monkeypatch.setattr(tradingview.Dependencies, 'get_tradingview_service', lambda: tradingview_service)
+        monkeypatch.setattr(tradingview.async_ee, 'emit', emitted)
+        monkeypatch.setattr(tradingview.config, 'get_tradingview_webhook_secret', lambda: 'secret')
+        monkeypatch.setattr(tradingview.config, 'get_simulate_tradingview_traffic', lambda: True)
+        monkeypatch.setattr(tradingview.config, 'get_telegram_stocks_admin_id', lambda: 'admin-chat')
+
+        request = DummyRequest(
+            '{"type": "stocks", "secret": "secret", "data": [{"symbol": "SPY", "close_prices": [1, "2"]}]}'
+        )
+
+        response = await tradingview.tradingview_daily_stocks_data(request)
+
+        assert response == {'data': 'OK'}
+        tradingview_service.save_tradingview_data.assert_not_awaited()
+        assert 'close\\_prices must be a list of numbers' in emitted.call_args.kwargs['message']
 
     @pytest.mark.asyncio
     async def test_tradingview_daily_stocks_data_keeps_test_mode_request_local_under_concurrency(
@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 from starlette.datastructures import URL
+from starlette.requests import Request
+from starlette.responses import Response
 
 from src import server
 
@@ -116,3 +118,43 @@ async def test_auth_check_protects_fastapi_docs_routes_in_prod(monkeypatch, path
 
     assert response.status_code == 500
     call_next.assert_not_called()
+
+
+
+def _build_starlette_request(method: str, path: str) -> Request:
+    return Request({
+        'type': 'http',
+        'app': server.app,
+        'method': method,
+        'path': path,
+        'root_path': '',
+        'query_string': b'',
+        'headers': [],
+        'client': ('203.0.113.10', 1234),
+    })
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('path', 'expected_route'),
+    [
+        ('/vixcentral/recent-values', '/vixcentral/recent-values'),
+        ('/wp-login.php', 'unmatched'),
+    ],
+)
+async def test_request_latency_is_labelled_by_route_template(path, expected_route):
+    request = _build_starlette_request('GET', path)
+    call_next = AsyncMock(return_value=Response(status_code=200))
+    count_before = server.HTTP_REQUEST_DURATION.get_count(method='GET', route=expected_route, status='200')
+
+    await server.log_request_and_time_taken(request, call_next)
+
+    assert server.HTTP_REQUEST_DURATION.get_count(method='GET', route=expected_route, status='200') - count_before == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_renders_exposition_format():
+    response = await server.get_metrics()
+
+    assert response.media_type.startswith('text/plain; version=0.0.4')
+    assert b'# TYPE http_request_duration_seconds histogram' in response.body
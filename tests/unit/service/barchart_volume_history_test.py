@@ -0,0 +1,123 @@
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.service.barchart_volume_history import BarchartVolumeHistoryLoader
+from src.service.stocks_daily_bar_store import StocksDailyBarStore
+from src.type.trading_view import TradingViewStocksData
+from src.util.date_util import get_trading_sessions_ending_at
+
+
+class _FakeBarchartService:
+    def __init__(self, failing_symbols=(), sessions=None, skipped_sessions=()):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_symbols = set(failing_symbols)
+        self.sessions = sessions or []
+        self.skipped_sessions = set(skipped_sessions)
+
+    async def get_stock_price(self, symbol, num_days=30):
+        self.calls.append((symbol, num_days))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if symbol in self.failing_symbols:
+            raise RuntimeError(f'{symbol} failed')
+        return [
+            SimpleNamespace(
+                date=session.isoformat(),
+                open_price=1.0,
+                high_price=1.0,
+                low_price=1.0,
+                close_price=1.0,
+                volume=float(1_000 - index),
+            )
+            for index, session in enumerate(self.sessions[:num_days])
+            if session not in self.skipped_sessions
+        ]
+
+
+@pytest.mark.asyncio
+async def test_load_without_store_fetches_unique_symbols_concurrently_and_isolates_failures():
+    sessions = get_trading_sessions_ending_at(datetime.date(2024, 4, 19), 2)
+    barchart_service = _FakeBarchartService(failing_symbols={'AMD'}, sessions=sessions)
+    loader = BarchartVolumeHistoryLoader(barchart_service=barchart_service)
+
+    res = await loader.load(symbols=['SPY', 'AMD', 'SPY', 'QQQ'], num_days=30)
+
+    assert barchart_service.calls == [('SPY', 30), ('AMD', 30), ('QQQ', 30)]
+    assert barchart_service.max_in_flight == 3
+    assert res['SPY'] == [1_000.0, 999.0]
+    assert res['QQQ'] == [1_000.0, 999.0]
+    assert isinstance(res['AMD'], RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_load_fills_only_missing_sessions_and_needs_no_barchart_once_warm(tmp_path):
+    store = StocksDailyBarStore(db_path=str(tmp_path / 'bars.sqlite3'))
+    thursday = datetime.date(2024, 4, 18)
+    friday = datetime.date(2024, 4, 19)
+    sessions = get_trading_sessions_ending_at(thursday, 5)
+
+    cold_service = _FakeBarchartService(sessions=sessions)
+    cold = await BarchartVolumeHistoryLoader(cold_service, bar_store=store).load(
+        symbols=['SPY'],
+        num_days=5,
+        trading_date=thursday,
+    )
+
+    warm_service = _FakeBarchartService()
+    warm_loader = BarchartVolumeHistoryLoader(warm_service, bar_store=store)
+    warm_loader.record_tradingview_bars(
+        payloads=[
+            TradingViewStocksData(
+                symbol='spy',
+                timeframe='1D',
+                close_prices=[510.0, 500.0],
+                ema20s=[505.0, 504.0],
+                volumes=[2_000, 1_500],
+            )
+        ],
+        trading_date=friday,
+    )
+    warm = await warm_loader.load(symbols=['SPY'], num_days=5, trading_date=friday)
+
+    assert cold_service.calls == [('SPY', 5)]
+    assert cold['SPY'] == [1_000.0, 999.0, 998.0, 997.0, 996.0]
+    # Thursday keeps the Barchart volume; Friday comes from TradingView.
+    assert warm_service.calls == []
+    assert warm['SPY'] == [2_000.0, 1_000.0, 999.0, 998.0, 997.0]
+
+
+@pytest.mark.asyncio
+async def test_load_rejects_history_with_a_missing_session(tmp_path):
+    store = StocksDailyBarStore(db_path=str(tmp_path / 'bars.sqlite3'))
+    trading_date = datetime.date(2024, 4, 19)
+    sessions = get_trading_sessions_ending_at(trading_date, 5)
+    # Barchart leaves a gap, so index 1 would otherwise be two sessions back.
+    barchart_service = _FakeBarchartService(
+        sessions=sessions,
+        skipped_sessions={sessions[1]},
+    )
+    complete_service = _FakeBarchartService(sessions=sessions)
+
+    res = await BarchartVolumeHistoryLoader(barchart_service, bar_store=store).load(
+        symbols=['SPY'],
+        num_days=5,
+        trading_date=trading_date,
+    )
+    filled = await BarchartVolumeHistoryLoader(complete_service, bar_store=store).load(
+        symbols=['SPY'],
+        num_days=5,
+        trading_date=trading_date,
+    )
+
+    assert isinstance(res['SPY'], ValueError)
+    assert sessions[1].isoformat() in str(res['SPY'])
+    # The next load only asks for the sessions up to the gap.
+    assert complete_service.calls == [('SPY', 2)]
+    assert filled['SPY'] == [1_000.0, 999.0, 998.0, 997.0, 996.0]
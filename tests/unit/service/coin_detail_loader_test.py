@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.service.crypto.coin_detail_loader import (
+    CoinDetailLoader,
+    CoinDetailLoaderStats,
+)
+
+
+class _FakeCmcService:
+    def __init__(self, failing_coin_ids=()):
+        self.failing_coin_ids = set(failing_coin_ids)
+        self.requested_coin_ids = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_coin_detail(self, id: int):
+        self.requested_coin_ids.append(id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if id in self.failing_coin_ids:
+                raise RuntimeError(f'429 for {id}')
+            return SimpleNamespace(id=id)
+        finally:
+            self.in_flight -= 1
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_load_fetches_each_coin_once_across_phases():
+    cmc_service = _FakeCmcService()
+    loader = CoinDetailLoader(cmc_service=cmc_service)
+
+    spotlight = await loader.load([1, 1027, 5690, 1])
+    sector_detail = await loader.load([5690, 74])
+    tracked_universe = await loader.load([1, 1027, 5426, 74])
+
+    assert spotlight == {
+        1: SimpleNamespace(id=1),
+        1027: SimpleNamespace(id=1027),
+        5690: SimpleNamespace(id=5690),
+    }
+    assert list(sector_detail) == [5690, 74]
+    assert list(tracked_universe) == [1, 1027, 5426, 74]
+    assert sorted(cmc_service.requested_coin_ids) == [1, 74, 1027, 5426, 5690]
+    assert loader.stats == CoinDetailLoaderStats(
+        requested=9,
+        upstream_calls=5,
+        memo_hits=4,
+    )
+    assert loader.stats.saved_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_load_coalesces_concurrent_phases_and_bounds_concurrency():
+    cmc_service = _FakeCmcService()
+    loader = CoinDetailLoader(cmc_service=cmc_service, max_concurrency=2)
+
+    await asyncio.gather(
+        loader.load(list(range(10))),
+        loader.load(list(range(5, 15))),
+    )
+
+    assert sorted(cmc_service.requested_coin_ids) == list(range(15))
+    assert cmc_service.max_in_flight == 2
+    assert loader.stats.upstream_calls == 15
+    assert loader.stats.coalesced == 5
+
+
+@pytest.mark.asyncio
+async def test_load_refetches_after_ttl_and_does_not_memoize_failures():
+    clock = _Clock()
+    cmc_service = _FakeCmcService(failing_coin_ids={2})
+    loader = CoinDetailLoader(cmc_service=cmc_service, ttl_seconds=60, clock=clock)
+
+    first = await loader.load([1, 2])
+    clock.now = 30
+    await loader.load([1, 2])
+    clock.now = 61
+    await loader.load([1])
+
+    assert isinstance(first[2], RuntimeError)
+    assert cmc_service.requested_coin_ids == [1, 2, 2, 1]
+    assert loader.stats.memo_hits == 1
@@ -8,6 +8,7 @@ from src.service.crypto_signal.backfill import (
     BACKFILL_SOURCE_NAME,
     CryptoSignalBackfillService,
 )
+from src.service.crypto_signal.repository import CryptoSignalRepository
 
 
 def _build_quote(
@@ -202,3 +203,94 @@ async def test_build_snapshots_skips_failed_coin_history_and_returns_empty_for_e
     assert empty_result == []
     assert skipped_result == []
     assert fake_service.calls == [(1, '24h')]
+
+
+@pytest.mark.asyncio
+async def test_build_snapshots_serves_fresh_coins_from_candle_store(tmp_path):
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'crypto_signal.sqlite3'))
+    fake_service = _FakeCryptoStatsService(
+        responses={
+            1: _build_history(
+                coin_id=1,
+                name='Bitcoin',
+                symbol='BTC',
+                quotes=[
+                    _build_quote('2026-04-21T23:59:59.999Z', close=100.0, volume=10.0),
+                    _build_quote('2026-04-22T23:59:59.999Z', close=110.0, volume=12.0),
+                    # In-progress candle; never stored.
+                    _build_quote('2026-04-23T23:59:59.999Z', close=999.0, volume=99.0),
+                ],
+            ),
+        }
+    )
+    service = CryptoSignalBackfillService(
+        cmc_service=fake_service,
+        candle_store=repository,
+    )
+    current_timestamp_utc = datetime.datetime(
+        2026,
+        4,
+        23,
+        8,
+        45,
+        tzinfo=datetime.timezone.utc,
+    )
+
+    cold_snapshots = await service.build_snapshots(
+        coin_entries=[('BTC', 1)],
+        watchlist_coin_ids={1},
+        current_timestamp_utc=current_timestamp_utc,
+        days=30,
+    )
+    fake_service.responses[1] = RuntimeError('cmc should not be called')
+    warm_snapshots = await service.build_snapshots(
+        coin_entries=[('BTC', 1)],
+        watchlist_coin_ids={1},
+        current_timestamp_utc=current_timestamp_utc + datetime.timedelta(hours=12),
+        days=30,
+    )
+
+    assert fake_service.calls == [(1, '24h')]
+    assert warm_snapshots == cold_snapshots
+    assert [snapshot.coins[0].price_usd for snapshot in warm_snapshots] == [100.0, 110.0]
+    assert round(warm_snapshots[1].coins[0].price_change_24h or 0, 2) == 10.0
+
+
+@pytest.mark.asyncio
+async def test_build_snapshots_falls_back_to_stored_candles_when_refresh_fails(tmp_path):
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'crypto_signal.sqlite3'))
+    fake_service = _FakeCryptoStatsService(
+        responses={
+            1: _build_history(
+                coin_id=1,
+                name='Bitcoin',
+                symbol='BTC',
+                quotes=[
+                    _build_quote('2026-04-20T23:59:59.999Z', close=100.0, volume=10.0),
+                ],
+            ),
+        }
+    )
+    service = CryptoSignalBackfillService(
+        cmc_service=fake_service,
+        candle_store=repository,
+    )
+    await service.build_snapshots(
+        coin_entries=[('BTC', 1)],
+        watchlist_coin_ids=set(),
+        current_timestamp_utc=datetime.datetime(2026, 4, 21, 8, tzinfo=datetime.timezone.utc),
+        days=30,
+    )
+    fake_service.responses[1] = RuntimeError('cmc unavailable')
+
+    snapshots = await service.build_snapshots(
+        coin_entries=[('BTC', 1)],
+        watchlist_coin_ids=set(),
+        current_timestamp_utc=datetime.datetime(2026, 4, 23, 8, tzinfo=datetime.timezone.utc),
+        days=30,
+    )
+
+    assert fake_service.calls == [(1, '24h'), (1, '24h')]
+    assert [snapshot.run.run_timestamp_utc for snapshot in snapshots] == [
+        datetime.datetime(2026, 4, 20, 23, 59, 59, tzinfo=datetime.timezone.utc),
+    ]
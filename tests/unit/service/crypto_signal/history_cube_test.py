@@ -0,0 +1,347 @@
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from src.config import config
+from src.service.crypto_signal.digest_view_loader import load_digest_views
+from src.service.crypto_signal.history_cube import (
+    build_digest_view_from_cube,
+    build_history_cube_from_snapshots,
+    slice_history_cube_since,
+)
+from src.service.crypto_signal.models import (
+    CALIBRATION_FOLLOW_UP_CONTEXT_TAG,
+    CryptoSignalCoinSnapshot,
+    CryptoSignalRunRecord,
+    CryptoSignalSnapshot,
+)
+from src.service.crypto_signal.repository import CryptoSignalRepository
+from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+
+
+_CONTEXT_TAG_CHOICES = [
+    (),
+    ('spotlight_trending',),
+    ('spotlight_gainer',),
+    ('spotlight_loser',),
+    ('sector_leader_strongest',),
+    ('sector_loser_weakest',),
+    ('spotlight_trending', 'spotlight_gainer', 'sector_leader_strongest'),
+    (CALIBRATION_FOLLOW_UP_CONTEXT_TAG, 'spotlight_loser'),
+]
+
+
+def _build_run(
+    run_timestamp_utc: datetime.datetime,
+    sentiment_now_value: float | None = 63.0,
+) -> CryptoSignalRunRecord:
+    return CryptoSignalRunRecord(
+        run_timestamp_utc=run_timestamp_utc,
+        runtime_mode='prod',
+        source_name='CMC + Alternative.me',
+        snapshot_version=1,
+        sentiment_now_value=sentiment_now_value,
+        sentiment_now_label='Greed',
+        sentiment_yesterday_value=58.0,
+        sentiment_last_week_value=49.0,
+        sentiment_7d_avg=55.4,
+        sentiment_30d_avg=51.8,
+        strongest_sector_id='ai-big-data',
+        strongest_sector_name='AI & Big Data',
+        strongest_sector_avg_price_change_24h=8.4,
+        strongest_sector_market_change_24h=6.9,
+        strongest_sector_volume_change_24h=21.7,
+        strongest_sector_gainers_num=18,
+        strongest_sector_losers_num=5,
+        weakest_sector_id='gaming',
+        weakest_sector_name='Gaming',
+        weakest_sector_avg_price_change_24h=-6.1,
+        weakest_sector_market_change_24h=-4.8,
+        weakest_sector_volume_change_24h=-12.3,
+        weakest_sector_gainers_num=4,
+        weakest_sector_losers_num=19,
+    )
+
+
+def _build_random_history(seed: int) -> list[CryptoSignalSnapshot]:
+    rng = random.Random(seed)
+    first_run_time = datetime.datetime(2026, 4, 1, 0, 0, tzinfo=datetime.timezone.utc)
+    coin_ids = [1, 1027, *range(10_000, 10_000 + rng.randint(1, 30))]
+    drifts = {coin_id: rng.uniform(-6.0, 6.0) for coin_id in coin_ids}
+    history = []
+    for run_index in range(rng.randint(1, 40)):
+        coins = []
+        for coin_id in coin_ids:
+            # Leave gaps, NULL columns, and zero moves in the history so the
+            # cube masks are exercised as well as the arithmetic.
+            if rng.random() < 0.15:
+                continue
+            coins.append(
+                CryptoSignalCoinSnapshot(
+                    coin_id=coin_id,
+                    symbol=f'C{coin_id}',
+                    name=f'Coin {coin_id}',
+                    price_usd=None if rng.random() < 0.1 else rng.uniform(0.01, 500.0),
+                    price_change_24h=rng.choice(
+                        [None, 0.0, drifts[coin_id] + rng.gauss(0, 5.0)]
+                    ),
+                    volume_24h=rng.uniform(1e6, 5e9),
+                    volume_change_pct_24h=(
+                        None if rng.random() < 0.1 else rng.gauss(15.0, 20.0)
+                    ),
+                    is_watchlist=coin_id in {1, 1027},
+                    context_tags=rng.choice(_CONTEXT_TAG_CHOICES),
+                )
+            )
+        history.append(
+            CryptoSignalSnapshot(
+                run=_build_run(
+                    first_run_time + datetime.timedelta(hours=12 * run_index),
+                    sentiment_now_value=rng.choice([None, 30.0, 50.0, 70.0]),
+                ),
+                coins=coins,
+            )
+        )
+    return history
+
+
+def test_build_digest_view_from_cube_matches_list_scorer_on_random_histories():
+    for seed in range(40):
+        history = _build_random_history(seed)
+        latest_snapshot = history[-1]
+        for window_label in ('3d', '7d', '30d'):
+            view_kwargs = {
+                'latest_snapshot': latest_snapshot,
+                'watchlist_coin_ids': {1, 1027, 10_000},
+                'window_label': window_label,
+                'tracked_universe_coin_ids': {1, 10_001},
+                'limit': 50,
+                'min_dynamic_price_usd': 1.0,
+                'min_dynamic_volume_24h': 1e8,
+            }
+
+            assert build_digest_view_from_cube(
+                history_cube=build_history_cube_from_snapshots(history),
+                **view_kwargs,
+            ) == build_digest_view(history=history, **view_kwargs)
+
+
+def test_build_digest_view_from_cube_rescores_rows_near_boundaries_with_exact_mean():
+    first_run_time = datetime.datetime(2026, 4, 20, 8, 0, tzinfo=datetime.timezone.utc)
+    # Huge cancelling moves make float summation drift from the exact means
+    # (44/3 for volume, which must stay below the 15% confirmation threshold).
+    moves = [(1e17, 1e17), (9.0, 44.0), (-1e17, -1e17)]
+    history = [
+        CryptoSignalSnapshot(
+            run=_build_run(first_run_time + datetime.timedelta(hours=12 * index)),
+            coins=[
+                CryptoSignalCoinSnapshot(
+                    coin_id=5426,
+                    symbol='SOL',
+                    name='Solana',
+                    price_usd=100.0 + index,
+                    price_change_24h=price_change_24h,
+                    volume_24h=4_820_000_000,
+                    volume_change_pct_24h=volume_change_pct_24h,
+                    is_watchlist=True,
+                    context_tags=('watchlist',),
+                )
+            ],
+        )
+        for index, (price_change_24h, volume_change_pct_24h) in enumerate(moves)
+    ]
+    view_kwargs = {
+        'latest_snapshot': history[-1],
+        'watchlist_coin_ids': {5426},
+        'window_label': '3d',
+    }
+
+    cube_view = build_digest_view_from_cube(
+        history_cube=build_history_cube_from_snapshots(history),
+        **view_kwargs,
+    )
+
+    assert cube_view == build_digest_view(history=history, **view_kwargs)
+    assert cube_view.watchlist_candidates[0].volume_confirmation_score == 0
+
+
+def test_build_digest_view_from_cube_keeps_watchlist_coin_missing_from_latest_run():
+    first_run_time = datetime.datetime(2026, 4, 20, 8, 0, tzinfo=datetime.timezone.utc)
+    history = _build_random_history(seed=7)
+    history = [
+        CryptoSignalSnapshot(
+            run=_build_run(first_run_time + datetime.timedelta(hours=12 * index)),
+            coins=snapshot.coins,
+        )
+        for index, snapshot in enumerate(history[:4])
+    ]
+    history.append(
+        CryptoSignalSnapshot(
+            run=_build_run(first_run_time + datetime.timedelta(hours=48)),
+            coins=[coin for coin in history[-1].coins if coin.coin_id != 1027],
+        )
+    )
+    view_kwargs = {
+        'latest_snapshot': history[-1],
+        'watchlist_coin_ids': {1027},
+        'window_label': '7d',
+    }
+
+    cube_view = build_digest_view_from_cube(
+        history_cube=build_history_cube_from_snapshots(history),
+        **view_kwargs,
+    )
+
+    assert cube_view == build_digest_view(history=history, **view_kwargs)
+    assert [candidate.coin_id for candidate in cube_view.watchlist_candidates] == [1027]
+
+
+def test_repository_history_cube_matches_cube_built_from_loaded_snapshots(tmp_path):
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'crypto_signal.sqlite3'))
+    history = _build_random_history(seed=3)
+    for snapshot in history:
+        repository.save_snapshot(snapshot)
+    window_start = history[1].run.run_timestamp_utc
+
+    sqlite_cube = repository.get_history_cube_since(window_start)
+    snapshot_cube = build_history_cube_from_snapshots(
+        repository.get_snapshots_since(window_start)
+    )
+
+    assert sqlite_cube.run_timestamps_utc == snapshot_cube.run_timestamps_utc
+    assert set(sqlite_cube.coin_index_by_id) == set(snapshot_cube.coin_index_by_id)
+    for coin_id, sqlite_index in sqlite_cube.coin_index_by_id.items():
+        snapshot_index = snapshot_cube.coin_index_by_id[coin_id]
+        assert (
+            sqlite_cube.latest_coins[sqlite_index]
+            == snapshot_cube.latest_coins[snapshot_index]
+        )
+        for column_name in (
+            'present',
+            'price_usd',
+            'price_change_24h',
+            'volume_24h',
+            'volume_change_pct_24h',
+            'is_watchlist',
+        ):
+            np.testing.assert_array_equal(
+                getattr(sqlite_cube, column_name)[sqlite_index],
+                getattr(snapshot_cube, column_name)[snapshot_index],
+            )
+        assert [
+            sqlite_cube.context_tag_vocabulary[code]
+            for code in sqlite_cube.context_tag_codes[sqlite_index]
+        ] == [
+            snapshot_cube.context_tag_vocabulary[code]
+            for code in snapshot_cube.context_tag_codes[snapshot_index]
+        ]
+
+
+def test_repository_history_cube_is_empty_when_db_is_missing(tmp_path):
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'missing.sqlite3'))
+
+    history_cube = repository.get_history_cube_since(
+        datetime.datetime(2026, 4, 20, tzinfo=datetime.timezone.utc)
+    )
+
+    assert history_cube.present.shape == (0, 0)
+    assert history_cube.latest_coins == []
+
+
+def test_slice_history_cube_since_matches_cube_built_for_shorter_window():
+    for seed in range(40):
+        history = _build_random_history(seed)
+        # Watchlist coin 10_000 stops reporting four days before the latest
+        # run, so it is only in the cube rows of the longer windows.
+        history = history[:-8] + [
+            CryptoSignalSnapshot(
+                run=snapshot.run,
+                coins=[coin for coin in snapshot.coins if coin.coin_id != 10_000],
+            )
+            for snapshot in history[-8:]
+        ]
+        latest_snapshot = history[-1]
+        superset_cube = build_history_cube_from_snapshots(history)
+        for window_label in ('3d', '7d', '30d'):
+            window_start = get_window_start(latest_snapshot, window_label=window_label)
+            window_history = [
+                snapshot
+                for snapshot in history
+                if snapshot.run.run_timestamp_utc >= window_start
+            ]
+            view_kwargs = {
+                'latest_snapshot': latest_snapshot,
+                'watchlist_coin_ids': {1, 1027, 10_000},
+                'window_label': window_label,
+                'tracked_universe_coin_ids': {1, 10_001},
+                'limit': 50,
+                'min_dynamic_price_usd': 1.0,
+                'min_dynamic_volume_24h': 1e8,
+            }
+
+            assert build_digest_view_from_cube(
+                history_cube=slice_history_cube_since(superset_cube, window_start),
+                **view_kwargs,
+            ) == build_digest_view(history=window_history, **view_kwargs)
+
+
+@pytest.mark.parametrize('history_cube_enabled', [False, True])
+def test_load_digest_views_slices_windows_from_one_history_load(
+    monkeypatch,
+    tmp_path,
+    history_cube_enabled,
+):
+    monkeypatch.setattr(
+        config,
+        'is_crypto_signal_history_cube_enabled',
+        lambda: history_cube_enabled,
+    )
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'crypto_signal.sqlite3'))
+    history = _build_random_history(seed=11)
+    for snapshot in history:
+        repository.save_snapshot(snapshot)
+    # Drop the aggregate anchor so every window falls back to history.
+    with repository._connection_manager().writer() as connection:
+        connection.execute(
+            "DELETE FROM crypto_signal_metadata WHERE key = 'window_aggregates_anchor_utc'"
+        )
+    latest_snapshot = repository.get_latest_snapshot()
+    view_kwargs = {
+        'watchlist_coin_ids': {1, 1027, 10_000},
+        'tracked_universe_coin_ids': {1, 10_001},
+        'limit': 50,
+        'min_dynamic_price_usd': 1.0,
+        'min_dynamic_volume_24h': 1e8,
+    }
+    expected_views = {
+        window_label: build_digest_view(
+            latest_snapshot=latest_snapshot,
+            history=repository.get_snapshots_since(
+                get_window_start(latest_snapshot, window_label=window_label)
+            ),
+            window_label=window_label,
+            **view_kwargs,
+        )
+        for window_label in ('3d', '7d', '30d')
+    }
+    load_starts = []
+    for method_name in ('get_snapshots_since', 'get_history_cube_since'):
+        load = getattr(repository, method_name)
+        monkeypatch.setattr(
+            repository,
+            method_name,
+            lambda start, load=load: load_starts.append(start) or load(start),
+        )
+
+    views = load_digest_views(
+        repository=repository,
+        latest_snapshot=latest_snapshot,
+        window_labels=['3d', '7d', '30d'],
+        **view_kwargs,
+    )
+
+    assert views == expected_views
+    assert list(views) == ['3d', '7d', '30d']
+    assert load_starts == [get_window_start(latest_snapshot, window_label='30d')]
@@ -1,6 +1,11 @@
 import datetime
 import sqlite3
+import subprocess
+import sys
 from dataclasses import replace
+from pathlib import Path
+
+import pytest
 
 from src.service.crypto_signal.models import (
     CryptoSignalCandidate,
@@ -8,6 +13,7 @@ from src.service.crypto_signal.models import (
     CryptoSignalDigestView,
     CryptoSignalMarketRegimeMetric,
     CryptoSignalMarketRegimeSnapshot,
+    CryptoSignalOhlcvCandle,
     CryptoSignalRunRecord,
     CryptoSignalSnapshot,
 )
@@ -222,7 +228,51 @@ def test_init_schema_sets_schema_version_metadata(tmp_path):
     ).fetchone()
     connection.close()
 
-    assert row == ('1',)
+    assert row == ('4',)
+
+
+def _build_candle(coin_id: int, day: int, close_usd: float) -> CryptoSignalOhlcvCandle:
+    return CryptoSignalOhlcvCandle(
+        coin_id=coin_id,
+        symbol='BTC' if coin_id == 1 else 'ETH',
+        name='Bitcoin' if coin_id == 1 else 'Ethereum',
+        interval='24h',
+        candle_timestamp_utc=datetime.datetime(
+            2026, 4, day, 23, 59, 59, tzinfo=datetime.timezone.utc
+        ),
+        open_usd=close_usd,
+        high_usd=close_usd,
+        low_usd=close_usd,
+        close_usd=close_usd,
+        volume_usd=close_usd * 10,
+    )
+
+
+def test_ohlcv_candles_upsert_and_read_with_previous_candle(tmp_path):
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'crypto_signal.sqlite3'))
+
+    assert repository.get_latest_ohlcv_candle_timestamps([1], '24h') == {}
+    repository.save_ohlcv_candles(
+        [_build_candle(1, day, 100.0 + day) for day in range(1, 6)]
+        + [_build_candle(1027, 4, 10.0)]
+    )
+    repository.save_ohlcv_candles([_build_candle(1, 5, 200.0)])
+
+    assert repository.get_latest_ohlcv_candle_timestamps([1, 1027, 5426], '24h') == {
+        1: datetime.datetime(2026, 4, 5, 23, 59, 59, tzinfo=datetime.timezone.utc),
+        1027: datetime.datetime(2026, 4, 4, 23, 59, 59, tzinfo=datetime.timezone.utc),
+    }
+    assert repository.get_latest_ohlcv_candle_timestamps([1], '1h') == {}
+
+    candles = repository.get_ohlcv_candles_since(
+        [1, 1027],
+        '24h',
+        datetime.datetime(2026, 4, 4, 12, tzinfo=datetime.timezone.utc),
+    )
+
+    assert [candle.close_usd for candle in candles[1]] == [103.0, 104.0, 200.0]
+    assert [candle.close_usd for candle in candles[1027]] == [10.0]
+    assert candles[1][0].symbol == 'BTC'
 
 
 def test_repository_uses_runtime_specific_default_db_path(monkeypatch):
@@ -290,21 +340,80 @@ def test_get_latest_snapshot_reads_existing_db_through_readonly_connection(tmp_p
     writable_repository.save_snapshot(snapshot)
 
     readonly_repository = CryptoSignalRepository(db_path=str(db_path))
-
-    def _readonly_connect():
-        connection = sqlite3.connect(
-            f'file:{db_path}?mode=ro',
-            uri=True,
-        )
-        connection.row_factory = sqlite3.Row
-        return connection
-
-    readonly_repository._connect = _readonly_connect
     latest_snapshot = readonly_repository.get_latest_snapshot()
 
     assert latest_snapshot is not None
     assert latest_snapshot.run.run_timestamp_utc == snapshot.run.run_timestamp_utc
     assert [coin.symbol for coin in latest_snapshot.coins] == ['BTC']
+    with readonly_repository._read_connection() as connection:
+        with pytest.raises(sqlite3.OperationalError, match='readonly'):
+            connection.execute('DELETE FROM crypto_signal_runs')
+
+
+def test_repositories_share_wal_writer_and_memoize_schema_init(tmp_path):
+    db_path = tmp_path / 'crypto_signal.sqlite3'
+    repository = CryptoSignalRepository(db_path=str(db_path))
+    other_repository = CryptoSignalRepository(db_path=str(db_path))
+
+    repository.init_schema()
+    connection_manager = repository._connection_manager()
+    with connection_manager.writer() as connection:
+        connection.execute('DROP TABLE crypto_signal_metadata')
+    # Both instances share the process-wide manager, so the second init is a
+    # memoized no-op instead of re-running the DDL batch.
+    other_repository.init_schema()
+
+    assert other_repository._connection_manager() is connection_manager
+    with connection_manager.writer() as connection:
+        journal_mode = connection.execute('PRAGMA journal_mode').fetchone()[0]
+        metadata_table = connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'crypto_signal_metadata'"
+        ).fetchone()
+    assert journal_mode == 'wal'
+    assert metadata_table is None
+
+
+def test_get_snapshots_since_groups_coin_rows_by_run_with_one_coin_query(tmp_path):
+    repository = CryptoSignalRepository(
+        db_path=str(tmp_path / 'crypto_signal.sqlite3')
+    )
+    first_run_time = datetime.datetime(2026, 5, 1, 8, 0, tzinfo=datetime.timezone.utc)
+    for hours, sol_price_usd in [(0, 100.0), (1, None), (2, 103.0), (3, 104.0)]:
+        repository.save_snapshot(
+            _build_snapshot_at(
+                first_run_time + datetime.timedelta(hours=hours),
+                sol_price_usd=sol_price_usd,
+            )
+        )
+    executed_statements = []
+    # Released readers go back to a LIFO pool, so the next read reuses this one.
+    with repository._read_connection() as traced_connection:
+        traced_connection.set_trace_callback(executed_statements.append)
+    try:
+        snapshots = repository.get_snapshots_since(
+            first_run_time + datetime.timedelta(hours=1)
+        )
+    finally:
+        traced_connection.set_trace_callback(None)
+
+    assert [snapshot.run.run_timestamp_utc for snapshot in snapshots] == [
+        first_run_time + datetime.timedelta(hours=hours) for hours in (1, 2, 3)
+    ]
+    assert [
+        [coin.symbol for coin in snapshot.coins] for snapshot in snapshots
+    ] == [['BTC', 'ETH'], ['BTC', 'ETH', 'SOL'], ['BTC', 'ETH', 'SOL']]
+    assert {
+        coin.run_id for coin in snapshots[2].coins
+    } == {snapshots[2].run.run_id}
+    assert snapshots[2].coins[2].price_usd == 104.0
+    assert snapshots[2].coins[2].context_tags == ('watchlist',)
+    assert len(
+        [
+            statement
+            for statement in executed_statements
+            if 'crypto_signal_coin_snapshots' in statement
+        ]
+    ) == 1
 
 
 def test_get_latest_snapshot_returns_none_when_db_is_missing(tmp_path):
@@ -594,6 +703,81 @@ def test_resolve_due_candidate_outcomes_marks_stale_follow_up_run_missing(tmp_pa
     assert stale_24h_outcomes[0].missing_reason == 'stale_follow_up_run'
 
 
+def test_resolve_due_candidate_outcomes_resolves_backlog_with_one_read(tmp_path):
+    repository = CryptoSignalRepository(
+        db_path=str(tmp_path / 'crypto_signal.sqlite3')
+    )
+    signal_time = datetime.datetime(2026, 5, 1, 8, 0, tzinfo=datetime.timezone.utc)
+    for days, sol_price_usd, btc_price_usd, eth_price_usd in [
+        (0, 100.0, 100_000.0, 4_000.0),
+        (1, 110.0, 102_000.0, 4_100.0),
+    ]:
+        repository.save_snapshot(
+            _build_snapshot_at(
+                signal_time + datetime.timedelta(days=days),
+                sol_price_usd=sol_price_usd,
+                btc_price_usd=btc_price_usd,
+                eth_price_usd=eth_price_usd,
+            )
+        )
+        repository.save_candidate_cohorts_from_view(
+            _build_digest_view(repository.get_latest_snapshot())
+        )
+    repository.save_snapshot(
+        _build_snapshot_at(
+            signal_time + datetime.timedelta(days=2),
+            sol_price_usd=121.0,
+            btc_price_usd=104_040.0,
+            eth_price_usd=4_305.0,
+        )
+    )
+    executed_statements = []
+    with repository._write_connection() as traced_connection:
+        traced_connection.set_trace_callback(executed_statements.append)
+    try:
+        outcomes = repository.resolve_due_candidate_outcomes(
+            runtime_mode='prod',
+            current_timestamp_utc=signal_time + datetime.timedelta(days=8),
+        )
+    finally:
+        traced_connection.set_trace_callback(None)
+
+    assert [
+        (
+            outcome.target_timestamp_utc - signal_time,
+            outcome.outcome_window,
+            outcome.status,
+            outcome.missing_reason,
+        )
+        for outcome in outcomes
+    ] == [
+        (datetime.timedelta(days=1), '24h', 'resolved', None),
+        (datetime.timedelta(days=2), '24h', 'resolved', None),
+        (datetime.timedelta(days=3), '3d', 'missing', 'missing_follow_up_run'),
+        (datetime.timedelta(days=4), '3d', 'missing', 'missing_follow_up_run'),
+        (datetime.timedelta(days=7), '7d', 'missing', 'missing_follow_up_run'),
+        (datetime.timedelta(days=8), '7d', 'missing', 'missing_follow_up_run'),
+    ]
+    assert outcomes[0].absolute_return_pct == pytest.approx(10.0)
+    assert outcomes[0].btc_relative_return_pct == pytest.approx(8.0)
+    assert outcomes[0].eth_relative_return_pct == pytest.approx(7.5)
+    # The fixture view freezes every cohort at a 100.0 baseline price.
+    assert outcomes[1].absolute_return_pct == pytest.approx(21.0)
+    assert outcomes[1].btc_relative_return_pct == pytest.approx(19.0)
+    assert outcomes[1].eth_relative_return_pct == pytest.approx(16.0)
+    assert len(
+        [
+            statement
+            for statement in executed_statements
+            if 'FROM crypto_signal_candidate_outcomes' in statement
+        ]
+    ) == 1
+    assert repository.get_unresolved_candidate_follow_up_entries(
+        runtime_mode='prod',
+        current_timestamp_utc=signal_time + datetime.timedelta(days=8),
+    ) == []
+
+
 def test_get_coin_observation_counts_since_does_not_create_missing_db(tmp_path):
     db_path = tmp_path / 'missing_crypto_signal.sqlite3'
     repository = CryptoSignalRepository(db_path=str(db_path))
@@ -805,7 +989,8 @@ def test_get_coin_observation_counts_since_returns_zero_for_missing_coin(tmp_pat
     }
 
 
-def test_save_market_regime_snapshot_upserts_metrics(tmp_path):
+def test_save_market_regime_snapshot_upserts_metrics(tmp_path, monkeypatch):
+    monkeypatch.setenv('CRYPTO_SIGNAL_MARKET_REGIME_AUDIT_LOG_ENABLED', 'true')
     repository = CryptoSignalRepository(
         db_path=str(tmp_path / 'crypto_signal.sqlite3')
     )
@@ -956,10 +1141,174 @@ def test_save_market_regime_snapshot_upserts_metrics(tmp_path):
     metric_count = connection.execute(
         'SELECT COUNT(*) FROM crypto_signal_market_regime_metrics'
     ).fetchone()[0]
+    latest_metric_count = connection.execute(
+        'SELECT COUNT(*) FROM crypto_signal_market_regime_latest_metrics'
+    ).fetchone()[0]
     connection.close()
 
     assert snapshot_count == 3
     assert metric_count == 4
+    assert latest_metric_count == 3
+
+
+def _build_open_interest_snapshot(
+    observed_at_utc: datetime.datetime,
+    values_by_source_hour: dict[int, float],
+) -> CryptoSignalMarketRegimeSnapshot:
+    return CryptoSignalMarketRegimeSnapshot(
+        observed_at_utc=observed_at_utc,
+        runtime_mode='prod',
+        provider='coinalyze',
+        asset_symbol='BTC',
+        venue_scope='aggregate',
+        instrument_scope='btc_perpetual_basket',
+        interval='1hour',
+        source_payload_version=1,
+        metrics=[
+            CryptoSignalMarketRegimeMetric(
+                metric_name=OPEN_INTEREST_METRIC,
+                metric_value=metric_value,
+                unit='usd',
+                source_timestamp_utc=datetime.datetime(
+                    2026, 4, 27, hour, 0, tzinfo=datetime.timezone.utc
+                ),
+            )
+            for hour, metric_value in values_by_source_hour.items()
+        ],
+    )
+
+
+def _get_open_interest_values(
+    repository: CryptoSignalRepository,
+) -> list[tuple[int, float]]:
+    metrics = repository.get_market_regime_metrics(
+        runtime_mode='prod',
+        start_timestamp_utc=datetime.datetime(
+            2026, 4, 27, 0, 0, tzinfo=datetime.timezone.utc
+        ),
+        end_timestamp_utc=datetime.datetime(
+            2026, 4, 27, 23, 0, tzinfo=datetime.timezone.utc
+        ),
+        metric_names=[OPEN_INTEREST_METRIC],
+    )
+    return [
+        (metric.source_timestamp_utc.hour, metric.metric_value)
+        for metric in metrics
+    ]
+
+
+def test_market_regime_latest_metrics_keep_one_row_per_fact(tmp_path):
+    db_path = tmp_path / 'crypto_signal.sqlite3'
+    repository = CryptoSignalRepository(db_path=str(db_path))
+    observed_at_utc = datetime.datetime(
+        2026, 4, 27, 12, 0, tzinfo=datetime.timezone.utc
+    )
+
+    # Each collection re-fetches the overlapping backfill window.
+    repository.save_market_regime_snapshot(
+        _build_open_interest_snapshot(observed_at_utc, {9: 1.0, 10: 2.0})
+    )
+    repository.save_market_regime_snapshot(
+        _build_open_interest_snapshot(
+            observed_at_utc + datetime.timedelta(hours=1),
+            {9: 1.5, 10: 2.5, 11: 3.0},
+        )
+    )
+    # A late write of an older observation does not replace newer values.
+    repository.save_market_regime_snapshot(
+        _build_open_interest_snapshot(
+            observed_at_utc - datetime.timedelta(hours=1),
+            {9: 0.5},
+        )
+    )
+
+    assert _get_open_interest_values(repository) == [
+        (9, 1.5),
+        (10, 2.5),
+        (11, 3.0),
+    ]
+    connection = sqlite3.connect(db_path)
+    latest_metric_count = connection.execute(
+        'SELECT COUNT(*) FROM crypto_signal_market_regime_latest_metrics'
+    ).fetchone()[0]
+    metric_count = connection.execute(
+        'SELECT COUNT(*) FROM crypto_signal_market_regime_metrics'
+    ).fetchone()[0]
+    connection.close()
+
+    assert latest_metric_count == 3
+    # The raw observation log is off unless the audit trail is enabled.
+    assert metric_count == 0
+
+
+def test_get_market_regime_metrics_is_a_covering_range_scan(tmp_path):
+    db_path = tmp_path / 'crypto_signal.sqlite3'
+    repository = CryptoSignalRepository(db_path=str(db_path))
+    repository.init_schema()
+
+    connection = sqlite3.connect(db_path)
+    plan = connection.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT *
+        FROM crypto_signal_market_regime_latest_metrics
+        WHERE runtime_mode = ?
+          AND asset_symbol = ?
+          AND metric_name IN (?, ?)
+          AND source_timestamp_utc >= ?
+          AND source_timestamp_utc <= ?
+          AND provider = ?
+        ORDER BY source_timestamp_utc ASC, metric_name ASC
+        """,
+        ('prod', 'BTC', OPEN_INTEREST_METRIC, FUNDING_RATE_METRIC, 'a', 'b', 'coinalyze'),
+    ).fetchall()
+    connection.close()
+
+    details = [row[3] for row in plan]
+    assert any(
+        detail.startswith('SEARCH crypto_signal_market_regime_latest_metrics USING PRIMARY KEY')
+        and 'source_timestamp_utc>? AND source_timestamp_utc<?' in detail
+        for detail in details
+    )
+    assert not any(detail.startswith('SCAN') for detail in details)
+
+
+def test_init_schema_backfills_latest_market_regime_metrics_from_log(
+    tmp_path,
+    monkeypatch,
+):
+    db_path = tmp_path / 'crypto_signal.sqlite3'
+    monkeypatch.setenv('CRYPTO_SIGNAL_MARKET_REGIME_AUDIT_LOG_ENABLED', 'true')
+    repository = CryptoSignalRepository(db_path=str(db_path))
+    observed_at_utc = datetime.datetime(
+        2026, 4, 27, 12, 0, tzinfo=datetime.timezone.utc
+    )
+    repository.save_market_regime_snapshot(
+        _build_open_interest_snapshot(
+            observed_at_utc + datetime.timedelta(hours=1),
+            {9: 1.5, 10: 2.5},
+        )
+    )
+    repository.save_market_regime_snapshot(
+        _build_open_interest_snapshot(observed_at_utc, {9: 1.0, 11: 3.0})
+    )
+    # Simulate a DB written before the latest-value table existed.
+    repository._connection_manager().close()
+    connection = sqlite3.connect(db_path)
+    connection.execute('DROP TABLE crypto_signal_market_regime_latest_metrics')
+    connection.commit()
+    connection.close()
+
+    assert _get_open_interest_values(CryptoSignalRepository(db_path=str(db_path))) == []
+
+    repository = CryptoSignalRepository(db_path=str(db_path))
+    repository.init_schema()
+
+    assert _get_open_interest_values(repository) == [
+        (9, 1.5),
+        (10, 2.5),
+        (11, 3.0),
+    ]
 
 
 def test_get_market_regime_metrics_returns_empty_for_missing_db(tmp_path):
@@ -987,3 +1336,23 @@ def test_get_market_regime_metrics_returns_empty_for_missing_db(tmp_path):
         ),
         metric_names=[OPEN_INTEREST_METRIC],
     ) == []
+
+
+def test_repository_import_does_not_load_numpy():
+    # The history cube is optional, so NumPy must only load when it is used.
+    result = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys\n'
+            'import src.service.crypto_signal.digest_view_loader\n'
+            'import src.service.crypto_signal.repository\n'
+            'print("numpy" in sys.modules)',
+        ],
+        cwd=Path(__file__).resolve().parents[4],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,215 @@
+import datetime
+import random
+import sqlite3
+from dataclasses import replace
+
+from src.service.crypto_signal.models import (
+    CALIBRATION_FOLLOW_UP_CONTEXT_TAG,
+    CryptoSignalCoinSnapshot,
+    CryptoSignalRunRecord,
+    CryptoSignalSnapshot,
+)
+from src.service.crypto_signal.repository import CryptoSignalRepository
+from src.service.crypto_signal.scorer import build_digest_view, get_window_start
+from src.service.crypto_signal.window_aggregates import (
+    build_digest_view_from_aggregates,
+)
+
+
+_CONTEXT_TAG_CHOICES = [
+    (),
+    ('spotlight_trending',),
+    ('spotlight_gainer',),
+    ('spotlight_loser',),
+    ('sector_leader_strongest',),
+    ('sector_loser_weakest',),
+    ('spotlight_trending', 'spotlight_gainer', 'sector_leader_strongest'),
+    (CALIBRATION_FOLLOW_UP_CONTEXT_TAG, 'spotlight_loser'),
+]
+_WATCHLIST_COIN_IDS = {1, 1027, 10_000}
+
+
+def _build_run(run_timestamp_utc: datetime.datetime) -> CryptoSignalRunRecord:
+    return CryptoSignalRunRecord(
+        run_timestamp_utc=run_timestamp_utc,
+        runtime_mode='prod',
+        source_name='CMC + Alternative.me',
+        snapshot_version=1,
+        sentiment_now_value=63.0,
+        sentiment_now_label='Greed',
+        sentiment_yesterday_value=58.0,
+        sentiment_last_week_value=49.0,
+        sentiment_7d_avg=55.4,
+        sentiment_30d_avg=51.8,
+        strongest_sector_id='ai-big-data',
+        strongest_sector_name='AI & Big Data',
+        strongest_sector_avg_price_change_24h=8.4,
+        strongest_sector_market_change_24h=6.9,
+        strongest_sector_volume_change_24h=21.7,
+        strongest_sector_gainers_num=18,
+        strongest_sector_losers_num=5,
+        weakest_sector_id='gaming',
+        weakest_sector_name='Gaming',
+        weakest_sector_avg_price_change_24h=-6.1,
+        weakest_sector_market_change_24h=-4.8,
+        weakest_sector_volume_change_24h=-12.3,
+        weakest_sector_gainers_num=4,
+        weakest_sector_losers_num=19,
+    )
+
+
+def _build_random_coin(rng: random.Random, coin_id: int) -> CryptoSignalCoinSnapshot:
+    return CryptoSignalCoinSnapshot(
+        coin_id=coin_id,
+        symbol=f'C{coin_id}',
+        name=f'Coin {coin_id}',
+        price_usd=rng.choice([None, 0.0, rng.uniform(0.01, 500.0), rng.uniform(0.01, 500.0)]),
+        price_change_24h=rng.choice([None, 0.0, rng.gauss(1.0, 8.0), rng.gauss(-1.0, 8.0)]),
+        volume_24h=rng.uniform(1e6, 5e9),
+        volume_change_pct_24h=None if rng.random() < 0.1 else rng.gauss(15.0, 20.0),
+        is_watchlist=coin_id in {1, 1027},
+        context_tags=rng.choice(_CONTEXT_TAG_CHOICES),
+    )
+
+
+def _build_random_history(seed: int) -> list[CryptoSignalSnapshot]:
+    rng = random.Random(seed)
+    coin_ids = [1, 1027, *range(10_000, 10_000 + rng.randint(1, 12))]
+    run_timestamp_utc = datetime.datetime(2026, 3, 1, 0, 0, tzinfo=datetime.timezone.utc)
+    history = []
+    for _run_index in range(rng.randint(5, 45)):
+        # Irregular gaps of up to three days push runs through every window
+        # boundary, so each save exercises expiry as well as additions.
+        run_timestamp_utc += datetime.timedelta(hours=rng.choice([1, 6, 12, 24, 72]))
+        history.append(
+            CryptoSignalSnapshot(
+                run=_build_run(run_timestamp_utc),
+                coins=[
+                    _build_random_coin(rng, coin_id)
+                    for coin_id in coin_ids
+                    if rng.random() >= 0.2
+                ],
+            )
+        )
+    return history
+
+
+def _assert_aggregate_views_match_history(repository: CryptoSignalRepository) -> None:
+    latest_snapshot = repository.get_latest_snapshot()
+    for window_label in ('3d', '7d', '30d'):
+        view_kwargs = {
+            'latest_snapshot': latest_snapshot,
+            'watchlist_coin_ids': _WATCHLIST_COIN_IDS,
+            'window_label': window_label,
+            'tracked_universe_coin_ids': {1, 10_001},
+            'limit': 50,
+            'min_dynamic_price_usd': 1.0,
+            'min_dynamic_volume_24h': 1e8,
+        }
+        window_aggregates = repository.get_window_aggregates(
+            latest_snapshot=latest_snapshot,
+            window_label=window_label,
+            watchlist_coin_ids=_WATCHLIST_COIN_IDS,
+        )
+
+        assert window_aggregates is not None
+        assert build_digest_view_from_aggregates(
+            window_aggregates=window_aggregates,
+            **view_kwargs,
+        ) == build_digest_view(
+            history=repository.get_snapshots_since(
+                get_window_start(latest_snapshot, window_label=window_label)
+            ),
+            **view_kwargs,
+        )
+
+
+def test_window_aggregates_match_history_scorer_after_each_save(tmp_path):
+    for seed in range(12):
+        repository = CryptoSignalRepository(
+            db_path=str(tmp_path / f'crypto_signal_{seed}.sqlite3')
+        )
+        history = _build_random_history(seed)
+        # Mostly chronological with some late backfills, like bootstrap runs.
+        backfilled = random.Random(seed).sample(history, len(history) // 4)
+        save_order = [
+            snapshot for snapshot in history if snapshot not in backfilled
+        ] + backfilled
+        for snapshot in save_order:
+            repository.save_snapshot(snapshot)
+            _assert_aggregate_views_match_history(repository)
+
+
+def test_window_aggregates_follow_merged_coin_rows(tmp_path):
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'crypto_signal.sqlite3'))
+    history = _build_random_history(seed=5)
+    for snapshot in history:
+        repository.save_snapshot(snapshot)
+
+    rng = random.Random(5)
+    for snapshot in [history[-1], history[0], *rng.sample(history, min(5, len(history)))]:
+        # Replace existing coin rows and add a coin the run did not have.
+        merged_coins = [
+            _build_random_coin(rng, coin.coin_id) for coin in snapshot.coins[:3]
+        ]
+        merged_coins.append(_build_random_coin(rng, 20_000 + len(merged_coins)))
+        repository.save_or_merge_snapshot(
+            CryptoSignalSnapshot(
+                run=replace(snapshot.run, run_id=None, created_at_utc=None),
+                coins=merged_coins,
+            )
+        )
+        _assert_aggregate_views_match_history(repository)
+
+
+def test_window_aggregates_are_rebuilt_for_existing_history(tmp_path):
+    db_path = tmp_path / 'crypto_signal.sqlite3'
+    repository = CryptoSignalRepository(db_path=str(db_path))
+    history = _build_random_history(seed=9)
+    for snapshot in history[:-1]:
+        repository.save_snapshot(snapshot)
+    # Simulate a DB written before the aggregates table was maintained.
+    with repository._connection_manager().writer() as connection:
+        connection.execute('DELETE FROM crypto_signal_window_aggregates')
+        connection.execute(
+            "DELETE FROM crypto_signal_metadata WHERE key = 'window_aggregates_anchor_utc'"
+        )
+
+    latest_snapshot = repository.get_latest_snapshot()
+    assert repository.get_window_aggregates(
+        latest_snapshot=latest_snapshot,
+        window_label='7d',
+        watchlist_coin_ids=_WATCHLIST_COIN_IDS,
+    ) is None
+
+    repository.save_snapshot(history[-1])
+
+    _assert_aggregate_views_match_history(repository)
+    connection = sqlite3.connect(db_path)
+    anchor_row = connection.execute(
+        "SELECT value FROM crypto_signal_metadata WHERE key = 'window_aggregates_anchor_utc'"
+    ).fetchone()
+    connection.close()
+    assert anchor_row == (
+        history[-1].run.run_timestamp_utc.isoformat().replace('+00:00', 'Z'),
+    )
+
+
+def test_get_window_aggregates_is_none_when_not_anchored_to_latest_snapshot(tmp_path):
+    repository = CryptoSignalRepository(db_path=str(tmp_path / 'crypto_signal.sqlite3'))
+    history = _build_random_history(seed=2)
+
+    assert repository.get_window_aggregates(
+        latest_snapshot=history[-1],
+        window_label='7d',
+        watchlist_coin_ids=_WATCHLIST_COIN_IDS,
+    ) is None
+
+    for snapshot in history:
+        repository.save_snapshot(snapshot)
+
+    assert repository.get_window_aggregates(
+        latest_snapshot=history[-2],
+        window_label='7d',
+        watchlist_coin_ids=_WATCHLIST_COIN_IDS,
+    ) is None
@@ -0,0 +1,199 @@
+import asyncio
+from dataclasses import dataclass
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.service.response_cache import (
+    ResponseCache,
+    ResponseCacheStats,
+    build_cache_key,
+    load_cached,
+)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.set_calls = []
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, px=None):
+        self.set_calls.append((key, px))
+        self.values[key] = value
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@dataclass
+class _Sector:
+    name: str
+    avg_price_change: float
+
+
+def _build_cache(redis_client=None, clock=None, max_local_entries=256) -> ResponseCache:
+    redis_client = redis_client or _FakeRedis()
+    return ResponseCache(
+        max_local_entries=max_local_entries,
+        redis_client_getter=lambda: redis_client,
+        clock=clock or _Clock(),
+    )
+
+
+def test_build_cache_key_normalizes_query_params():
+    assert build_cache_key('sentiment', {'days': 365, 'from_source': False}) == build_cache_key(
+        'sentiment',
+        {'from_source': 'False', 'days': ' 365'},
+    )
+    assert build_cache_key('cryptoquant', {'symbol': 'BTC', 'limit': None}) == build_cache_key(
+        'cryptoquant',
+        {'symbol': 'BTC'},
+    )
+    assert build_cache_key('sentiment', {'days': 30}) != build_cache_key(
+        'sentiment',
+        {'days': 365},
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_serves_local_hits_until_ttl_expires():
+    clock = _Clock()
+    redis_client = _FakeRedis()
+    cache = _build_cache(redis_client=redis_client, clock=clock)
+    loader = AsyncMock(return_value=[_Sector(name='AI', avg_price_change=8.4)])
+
+    first = await cache.get_or_load('crypto_stats/topsectors', {'limit': 10}, 60, loader)
+    second = await cache.get_or_load('crypto_stats/topsectors', {'limit': '10'}, 60, loader)
+    clock.now += 61
+    redis_client.values.clear()
+    third = await cache.get_or_load('crypto_stats/topsectors', {'limit': 10}, 60, loader)
+
+    assert first == second == third == [{'name': 'AI', 'avg_price_change': 8.4}]
+    assert loader.await_count == 2
+    assert cache.get_stats() == ResponseCacheStats(local_hits=1, misses=2)
+    assert redis_client.set_calls[0][1] == 60_000
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_shares_entries_across_processes_through_redis():
+    clock = _Clock()
+    redis_client = _FakeRedis()
+    loader = AsyncMock(return_value={'value': 63})
+    first_cache = _build_cache(redis_client=redis_client, clock=clock)
+    second_cache = _build_cache(redis_client=redis_client, clock=clock)
+
+    await first_cache.get_or_load('sentiment/crypto-fear-greed', {'days': 365}, 300, loader)
+    res = await second_cache.get_or_load('sentiment/crypto-fear-greed', {'days': 365}, 300, loader)
+    # The shared entry keeps its original expiry in the second local tier.
+    clock.now += 301
+    redis_client.values.clear()
+    await second_cache.get_or_load('sentiment/crypto-fear-greed', {'days': 365}, 300, loader)
+
+    assert res == {'value': 63}
+    assert loader.await_count == 2
+    assert second_cache.get_stats() == ResponseCacheStats(redis_hits=1, misses=1)
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_coalesces_concurrent_misses_into_one_upstream_call():
+    cache = _build_cache()
+    release_upstream = asyncio.Event()
+    upstream_calls = 0
+
+    async def loader():
+        nonlocal upstream_calls
+        upstream_calls += 1
+        await release_upstream.wait()
+        return {'value': 42}
+
+    requests = [
+        asyncio.create_task(
+            cache.get_or_load('thirdparty/vixcentral/current', {}, 60, loader)
+        )
+        for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    release_upstream.set()
+    results = await asyncio.gather(*requests)
+
+    assert results == [{'value': 42}] * 10
+    assert upstream_calls == 1
+    assert cache.get_stats() == ResponseCacheStats(misses=1, coalesced=9)
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_does_not_cache_upstream_errors():
+    cache = _build_cache()
+    loader = AsyncMock(side_effect=[RuntimeError('rate limited'), {'value': 1}])
+
+    with pytest.raises(RuntimeError, match='rate limited'):
+        await cache.get_or_load('cryptoquant/price-ohlcv', {'symbol': 'BTC'}, 60, loader)
+    res = await cache.get_or_load('cryptoquant/price-ohlcv', {'symbol': 'BTC'}, 60, loader)
+
+    assert res == {'value': 1}
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_evicts_least_recently_used_local_entries():
+    redis_client = _FakeRedis()
+    cache = _build_cache(redis_client=redis_client, max_local_entries=2)
+    loader = AsyncMock(return_value={'value': 1})
+
+    await cache.get_or_load('vix', {'date': '2026-01-02'}, 60, loader)
+    await cache.get_or_load('vix', {'date': '2026-01-03'}, 60, loader)
+    await cache.get_or_load('vix', {'date': '2026-01-02'}, 60, loader)
+    await cache.get_or_load('vix', {'date': '2026-01-04'}, 60, loader)
+    await cache.get_or_load('vix', {'date': '2026-01-03'}, 60, loader)
+
+    assert cache.get_stats() == ResponseCacheStats(local_hits=1, redis_hits=1, misses=3)
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_falls_back_to_upstream_when_redis_is_unavailable():
+    redis_client = AsyncMock()
+    redis_client.get.side_effect = ConnectionError('redis down')
+    redis_client.set.side_effect = ConnectionError('redis down')
+    cache = _build_cache(redis_client=redis_client)
+    loader = AsyncMock(return_value={'value': 1})
+
+    first = await cache.get_or_load('sentiment/stocks-fear-greed', {}, 60, loader)
+    second = await cache.get_or_load('sentiment/stocks-fear-greed', {}, 60, loader)
+
+    assert first == second == {'value': 1}
+    loader.assert_awaited_once()
+    assert cache.get_stats() == ResponseCacheStats(local_hits=1, misses=1, redis_errors=2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('raw_entry', ['{"expires_at": 2000', '"not an entry"', '{"data": 1}'])
+async def test_get_or_load_treats_unreadable_redis_entries_as_misses(raw_entry):
+    redis_client = _FakeRedis()
+    redis_client.values[build_cache_key('sentiment/stocks-fear-greed', {})] = raw_entry
+    cache = _build_cache(redis_client=redis_client)
+    loader = AsyncMock(return_value={'value': 1})
+
+    res = await cache.get_or_load('sentiment/stocks-fear-greed', {}, 60, loader)
+
+    assert res == {'value': 1}
+    loader.assert_awaited_once()
+    assert cache.get_stats() == ResponseCacheStats(misses=1, redis_errors=1)
+    assert len(redis_client.set_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_load_cached_calls_loader_directly_without_cache():
+    loader = AsyncMock(return_value={'value': 1})
+
+    res = await load_cached(None, 'sentiment', {}, 60, loader)
+
+    assert res == {'value': 1}
+    loader.assert_awaited_once()
@@ -0,0 +1,38 @@
+from src.service.stocks_daily_bar_store import (
+    BARCHART_SOURCE,
+    TRADINGVIEW_SOURCE,
+    StocksDailyBar,
+    StocksDailyBarStore,
+)
+
+
+def _build_bar(session_date: str, source: str, volume: float, open: float | None = None) -> StocksDailyBar:
+    return StocksDailyBar(
+        symbol='SPY',
+        session_date=session_date,
+        open=open,
+        high=None,
+        low=None,
+        close=500.0,
+        volume=volume,
+        source=source,
+    )
+
+
+def test_barchart_bars_replace_tradingview_bars_but_not_the_reverse(tmp_path):
+    store = StocksDailyBarStore(db_path=str(tmp_path / 'bars.sqlite3'))
+
+    assert store.get_bars(['SPY'], '2024-04-18', '2024-04-19') == {}
+
+    store.save_bars([
+        _build_bar('2024-04-18', TRADINGVIEW_SOURCE, volume=1.0),
+        _build_bar('2024-04-19', BARCHART_SOURCE, volume=2.0, open=499.0),
+    ])
+    store.save_bars([
+        _build_bar('2024-04-18', BARCHART_SOURCE, volume=3.0, open=498.0),
+        _build_bar('2024-04-19', TRADINGVIEW_SOURCE, volume=4.0),
+    ])
+
+    bars = store.get_bars(['SPY', 'QQQ'], '2024-04-18', '2024-04-19')['SPY']
+    assert bars['2024-04-18'] == _build_bar('2024-04-18', BARCHART_SOURCE, volume=3.0, open=498.0)
+    assert bars['2024-04-19'] == _build_bar('2024-04-19', BARCHART_SOURCE, volume=2.0, open=499.0)
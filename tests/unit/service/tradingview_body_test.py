@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from src.service.tradingview_body import (
+    parse_tradingview_body_text,
+    validate_tradingview_body,
+)
+
+BODY = {
+    'type': 'stocks',
+    'note': 'a "quoted" \\ path\nline',
+    'data': [{'symbol': 'SPY', 'timeframe': '1D', 'close_prices': [1, 2.5], 'ema20s': [1], 'volumes': [10]}],
+}
+
+
+@pytest.mark.parametrize('raw_text', [
+    json.dumps(BODY),
+    json.dumps(json.dumps(BODY)),
+    # Shell-escaped: the JSON text with its quotes and backslashes escaped once.
+    json.dumps(json.dumps(BODY))[1:-1],
+    '{ ' + json.dumps(json.dumps(BODY))[2:-1],
+])
+def test_parse_tradingview_body_text_decodes_each_encoding(raw_text):
+    assert parse_tradingview_body_text(raw_text) == BODY
+
+
+def test_parse_tradingview_body_text_bounds_nested_encodings():
+    raw_text = json.dumps(BODY)
+    for _ in range(3):
+        raw_text = json.dumps(raw_text)
+
+    with pytest.raises(ValueError, match='encoding layers'):
+        parse_tradingview_body_text(raw_text)
+
+
+def test_parse_tradingview_body_text_rejects_garbage():
+    with pytest.raises(json.JSONDecodeError):
+        parse_tradingview_body_text('{\\"type\\": \\"stocks\\"')
+
+
+@pytest.mark.parametrize('body, error', [
+    ({'type': 'crypto', 'data': []}, 'type must be one of'),
+    ({'type': 'stocks'}, 'data must be a list'),
+    ({'type': 'stocks', 'data': ['SPY']}, r'data\[0\] must be an object'),
+    ({'type': 'stocks', 'data': [{'symbol': ''}]}, r'data\[0\]\.symbol'),
+    ({'type': 'stocks', 'data': [{'symbol': 'SPY', 'timeframe': 1}]}, r'data\[0\]\.timeframe'),
+    ({'type': 'stocks', 'data': [{'symbol': 'SPY', 'volumes': [True]}]}, r'data\[0\]\.volumes'),
+])
+def test_validate_tradingview_body_rejects_invalid_fields(body, error):
+    with pytest.raises(ValueError, match=error):
+        validate_tradingview_body(body)
+
+
+def test_validate_tradingview_body_accepts_economy_indicator_without_ema_or_volume():
+    validate_tradingview_body({
+        'type': 'economy_indicator',
+        'data': [{'symbol': 'VIX', 'timeframe': '1D', 'close_prices': [14.2, 15]}],
+    })
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from src.service.tradingview_codec import (
+    COMPACT_MAGIC,
+    CompactTradingViewPayloadCodec,
+    JsonTradingViewPayloadCodec,
+    decode_tradingview_payload,
+)
+
+
+def _build_body() -> dict:
+    return {
+        'type': 'stocks',
+        'unix_ms': 1713484800000,
+        'data': [
+            {
+                'symbol': 'SPY',
+                'timeframe': '1D',
+                'close_prices': [500.25, 501, 499.75],
+                'ema20s': [498.5, 498.75, 499.0],
+                'volumes': [80000000, 75000000, 91000000],
+            },
+            {
+                'symbol': 'QQQ',
+                'timeframe': '1D',
+                'close_prices': [430.1, None, 431.2],
+                'volumes': [],
+            },
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    'body',
+    [
+        _build_body(),
+        {'type': 'stocks', 'unix_ms': 1, 'data': []},
+        {'type': 'stocks', 'unix_ms': 1, 'data': 'unexpected'},
+        {'type': 'stocks', 'unix_ms': 1},
+    ]
+)
+def test_compact_round_trip_preserves_values_and_types(body):
+    encoded = CompactTradingViewPayloadCodec().encode(body)
+    decoded = decode_tradingview_payload(encoded)
+
+    assert encoded.startswith(COMPACT_MAGIC)
+    assert decoded == body
+    assert json.dumps(decoded) == json.dumps(body)
+
+
+def test_compact_encoding_is_smaller_than_json():
+    body = _build_body()
+    body['data'] = [
+        {**body['data'][0], 'close_prices': [500.25 + i for i in range(300)], 'volumes': list(range(300))}
+        for _ in range(20)
+    ]
+
+    assert len(CompactTradingViewPayloadCodec().encode(body)) < len(JsonTradingViewPayloadCodec().encode(body))
+
+
+@pytest.mark.parametrize('raw', [json.dumps(_build_body()), json.dumps(_build_body()).encode('utf-8')])
+def test_decode_reads_legacy_json_members(raw):
+    assert CompactTradingViewPayloadCodec().decode(raw) == _build_body()
+
+
+def test_decode_rejects_unknown_version():
+    encoded = CompactTradingViewPayloadCodec().encode(_build_body())
+    encoded = COMPACT_MAGIC + bytes([99]) + encoded[len(COMPACT_MAGIC) + 1:]
+
+    with pytest.raises(ValueError, match='version 99'):
+        decode_tradingview_payload(encoded)
@@ -0,0 +1,212 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ResponseError
+
+from src.service.tradingview_ingestion_queue import (
+    TradingViewIngestionQueue,
+    TradingViewIngestionStats,
+    TradingViewIngestionWorker,
+)
+
+
+class _FakeStreamRedis:
+    """Single-stream, single-group subset of the Redis stream commands."""
+
+    def __init__(self):
+        self.now_ms = 1_000
+        self.entries = []
+        self.group_created = False
+        self.last_delivered_index = 0
+        # entry id -> [consumer, delivered_at_ms, times_delivered]
+        self.pending = {}
+        self.group_create_errors = []
+
+    def flush(self):
+        # A Redis restart without persistence: the stream and its group are gone.
+        self.entries = []
+        self.group_created = False
+        self.last_delivered_index = 0
+        self.pending = {}
+
+    def _check_group(self):
+        if not self.group_created:
+            raise ResponseError('NOGROUP No such key or consumer group')
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        entry_id = f'{self.now_ms}-{len(self.entries)}'.encode()
+        self.entries.append((entry_id, {key.encode(): value.encode() for key, value in fields.items()}))
+        return entry_id
+
+    async def xgroup_create(self, name, groupname, id='$', mkstream=False):
+        if self.group_create_errors:
+            raise self.group_create_errors.pop(0)
+        if self.group_created:
+            raise ResponseError('BUSYGROUP Consumer Group name already exists')
+        self.group_created = True
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        self._check_group()
+        # Yield like a blocking read so a running worker does not spin.
+        await asyncio.sleep(0)
+        new_entries = self.entries[self.last_delivered_index:][:count]
+        self.last_delivered_index += len(new_entries)
+        for entry_id, _fields in new_entries:
+            self.pending[entry_id] = [consumername, self.now_ms, 1]
+        return [[b'tradingview-webhook-stream', new_entries]] if new_entries else []
+
+    async def xack(self, name, groupname, *ids):
+        for entry_id in ids:
+            self.pending.pop(entry_id, None)
+        return len(ids)
+
+    async def xpending_range(self, name, groupname, min, max, count, idle=None):
+        self._check_group()
+        return [
+            {
+                'message_id': entry_id,
+                'consumer': consumer,
+                'time_since_delivered': self.now_ms - delivered_at_ms,
+                'times_delivered': times_delivered,
+            }
+            for entry_id, (consumer, delivered_at_ms, times_delivered) in self.pending.items()
+            if idle is None or self.now_ms - delivered_at_ms >= idle
+        ][:count]
+
+    async def xclaim(self, name, groupname, consumername, min_idle_time, message_ids):
+        fields_by_id = dict(self.entries)
+        for entry_id in message_ids:
+            _consumer, _delivered_at_ms, times_delivered = self.pending[entry_id]
+            self.pending[entry_id] = [consumername, self.now_ms, times_delivered + 1]
+        return [(entry_id, fields_by_id[entry_id]) for entry_id in message_ids]
+
+    async def xlen(self, name):
+        return len(self.entries)
+
+    async def xinfo_groups(self, name):
+        return [
+            {
+                'name': b'tradingview-webhook-workers',
+                'pending': len(self.pending),
+                'lag': len(self.entries) - self.last_delivered_index,
+            }
+        ]
+
+    async def xpending(self, name, groupname):
+        return {
+            'pending': len(self.pending),
+            'min': min(self.pending) if self.pending else None,
+        }
+
+
+async def _wait_for(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError('condition not met')
+
+
+def _build_queue(fake_redis: _FakeStreamRedis) -> TradingViewIngestionQueue:
+    return TradingViewIngestionQueue(
+        redis_client_getter=lambda: fake_redis,
+        clock=lambda: fake_redis.now_ms / 1000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_processes_queued_payloads_in_order_and_acks_them():
+    fake_redis = _FakeStreamRedis()
+    queue = _build_queue(fake_redis)
+    handled = []
+
+    async def handler(body, client_host):
+        handled.append((body['unix_ms'], client_host))
+
+    worker = TradingViewIngestionWorker(queue=queue, handler=handler, consumer_name='worker-1')
+    await queue.ensure_group()
+    await queue.ensure_group()
+    for unix_ms in range(3):
+        await queue.enqueue(body={'type': 'stocks', 'unix_ms': unix_ms}, client_host='52.89.214.238')
+
+    assert await queue.get_stats() == TradingViewIngestionStats(
+        length=3,
+        pending=0,
+        lag=3,
+        oldest_pending_age_ms=None,
+    )
+    assert await worker.process_batch() == 3
+    assert handled == [(0, '52.89.214.238'), (1, '52.89.214.238'), (2, '52.89.214.238')]
+    assert fake_redis.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_worker_reclaims_failed_entries_and_drops_them_after_max_deliveries():
+    fake_redis = _FakeStreamRedis()
+    queue = _build_queue(fake_redis)
+    attempts = []
+    drops = []
+
+    async def failing_handler(body, client_host):
+        attempts.append(body['unix_ms'])
+        raise RuntimeError('redis write failed')
+
+    async def on_drop(body, client_host, error):
+        drops.append((body['unix_ms'], client_host, str(error)))
+
+    worker = TradingViewIngestionWorker(
+        queue=queue,
+        handler=failing_handler,
+        on_drop=on_drop,
+        consumer_name='worker-2',
+        claim_idle_ms=60_000,
+        max_deliveries=2,
+    )
+    await queue.ensure_group()
+    await queue.enqueue(body={'type': 'stocks', 'unix_ms': 7}, client_host='127.0.0.1')
+
+    await worker.process_batch()
+    fake_redis.now_ms += 30_000
+    stats = await queue.get_stats()
+    # Not idle long enough to be reclaimed yet.
+    assert await worker.process_batch() == 0
+    fake_redis.now_ms += 30_000
+    assert await worker.process_batch() == 1
+    fake_redis.now_ms += 60_000
+    assert await worker.process_batch() == 0
+
+    assert stats.pending == 1
+    assert stats.lag == 0
+    assert stats.oldest_pending_age_ms == 30_000
+    assert attempts == [7, 7]
+    # Alerted once, on the final delivery, not on every retry.
+    assert drops == [(7, '127.0.0.1', 'redis write failed')]
+    assert fake_redis.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_group_creation_and_recreates_a_lost_group():
+    fake_redis = _FakeStreamRedis()
+    fake_redis.group_create_errors.append(ConnectionError('redis unavailable'))
+    queue = _build_queue(fake_redis)
+    handled = []
+
+    async def handler(body, client_host):
+        handled.append(body['unix_ms'])
+
+    worker = TradingViewIngestionWorker(queue=queue, handler=handler, consumer_name='worker-3', block_ms=1)
+    await queue.enqueue(body={'type': 'stocks', 'unix_ms': 1}, client_host='127.0.0.1')
+    task = asyncio.create_task(worker.run())
+    try:
+        await _wait_for(lambda: handled == [1])
+        fake_redis.flush()
+        # XADD recreates the stream, but not the consumer group.
+        await queue.enqueue(body={'type': 'stocks', 'unix_ms': 2}, client_host='127.0.0.1')
+        await _wait_for(lambda: handled == [1, 2])
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert fake_redis.group_created
+    assert fake_redis.pending == {}
@@ -2,7 +2,8 @@ from unittest.mock import Mock, patch, AsyncMock
 
 import pytest
 
-from src.service.tradingview_service import TradingViewService
+from src.service.tradingview_codec import CompactTradingViewPayloadCodec
+from src.service.tradingview_service import SAVE_TRADINGVIEW_DATA_SCRIPT, TradingViewService
 from src.type.trading_view import TradingViewDataType, TradingViewData, TradingViewStocksData, TradingViewRedisData
 
 
@@ -23,6 +24,16 @@ class TestTradingViewService:
                         ]
                     ))
             ),
+            (
+                    [[CompactTradingViewPayloadCodec().encode({'type': 'stocks', 'unix_ms': 1, 'data': [{'symbol': 'SPY', 'timeframe': '1D', 'close_prices': [100, 200.5], 'ema20s': [100.25, 200], 'volumes': [1, 2]}]}), 1234567890]],
+                    TradingViewRedisData(key='key', score=1234567890, data=TradingViewData(
+                        type=TradingViewDataType.STOCKS,
+                        unix_ms=1,
+                        data=[
+                            TradingViewStocksData(symbol='SPY', timeframe='1D', close_prices=[100, 200.5], ema20s=[100.25, 200], volumes=[1, 2])
+                        ]
+                    ))
+            ),
             ([], TradingViewRedisData(key='key', score=None, data=None)
              ),
             (None, None)
@@ -39,42 +50,35 @@ class TestTradingViewService:
 
 
     @pytest.mark.parametrize(
-        'redis_data, add_res, num_elements, trim_remove_res, input_data, test_mode, expected, use_pipeline',
+        'script_res, test_mode, days_to_store, expected_args, expected',
         [
-            ([[]], 1, 1, 0, 'data', False, [1, 0], True),
-            ([], 1, 1, 0, 'data', False, [1, 0], False),
-            ([], 1, 31, 1, 'data', False, [1, 1], False),
-            ([[]], 1, 1, 0, 'data', True, [1, 0], False),
-            ([[]], 1, 31, 1, 'data', True, [1, 1], False),
+            ([1, 0], False, 30, [1, 0, 30], [1, 0]),
+            ([1, 1], False, '30', [1, 0, 30], [1, 1]),
+            ([1, 0], True, 30, [1, 1, 30], [1, 0]),
+            ([0, 0], True, 30, [1, 1, 30], [0, 0]),
         ]
     )
+    @patch("src.service.tradingview_service.config.get_trading_view_days_to_store")
     @patch("src.service.tradingview_service.Redis")
     @pytest.mark.asyncio
-    async def test_save_tradingview_data(self, redis_mock, redis_data, add_res, num_elements, trim_remove_res, input_data, test_mode, expected, use_pipeline):
-        pipeline = Mock()
-        pipeline.zremrangebyscore = Mock(return_value=pipeline)
-        pipeline.zadd = Mock(return_value=pipeline)
-        pipeline.execute = AsyncMock(return_value=[1, add_res])
-
+    async def test_save_tradingview_data(self, redis_mock, get_trading_view_days_to_store, script_res, test_mode, days_to_store, expected_args, expected):
+        save_script = AsyncMock(return_value=script_res)
         redis_client = redis_mock.get_client.return_value
-        redis_client.zrange = AsyncMock(return_value=redis_data)
-        redis_client.zadd = AsyncMock(return_value=add_res)
-        redis_client.zcard = AsyncMock(return_value=num_elements)
-        redis_client.zremrangebyrank = AsyncMock(return_value=trim_remove_res)
-        redis_client.pipeline = Mock(return_value=pipeline)
+        redis_client.register_script = Mock(return_value=save_script)
+        get_trading_view_days_to_store.return_value = days_to_store
+
+        data = {'type': 'stocks', 'unix_ms': 1, 'data': []}
 
-        res = await self.tradingview_service.save_tradingview_data(data=input_data, key='key', score=1, test_mode=test_mode)
+        res = await self.tradingview_service.save_tradingview_data(data=data, key='key', score=1, test_mode=test_mode)
 
         assert res == expected
-        if use_pipeline:
-            redis_client.pipeline.assert_called_once_with(transaction=True)
-            pipeline.zremrangebyscore.assert_called_once_with('key', min=1, max=1)
-            pipeline.zadd.assert_called_once_with('key', {'data': 1})
-            pipeline.execute.assert_awaited_once()
-            redis_client.zadd.assert_not_awaited()
-        else:
-            redis_client.pipeline.assert_not_called()
-            redis_client.zadd.assert_awaited_once_with('key', {'data': 1})
+        redis_client.register_script.assert_called_once_with(SAVE_TRADINGVIEW_DATA_SCRIPT)
+        save_script.assert_awaited_once_with(
+            keys=['key'],
+            args=[CompactTradingViewPayloadCodec().encode(data), *expected_args],
+        )
+        redis_client.zadd.assert_not_called()
+        redis_client.zcard.assert_not_called()
 
     @pytest.mark.parametrize(
         'data, expected',
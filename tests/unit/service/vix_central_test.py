@@ -5,6 +5,7 @@ import pytest
 
 from src.runtime.runtime_mode import RuntimeMode
 from src.service.vix_central import VixCentralService, RecentVixFuturesValues, VixFuturesValue
+from src.service.vix_central_history_store import VixCentralHistoryStore
 
 
 class TestVixCentralService:
@@ -555,6 +556,75 @@ class TestVixCentralService:
         assert test_values.vix_futures_values[-2].formatted_contango_change_prev_day == "0.00%"
         assert test_values.vix_futures_values[-2].is_contango_single_day_decrease_alert is False
 
+    @pytest.mark.asyncio
+    @patch("src.service.vix_central.date_util.get_most_recent_non_weekend_or_today")
+    @patch("src.service.vix_central.date_util.get_current_datetime")
+    async def test_get_recent_values_fetches_each_historical_date_once_across_processes(
+        self,
+        get_current_datetime: Mock,
+        get_most_recent_non_weekend_or_today: Mock,
+    ):
+        class FakeRedis:
+            def __init__(self):
+                self.hashes = {}
+
+            async def hmget(self, key, fields):
+                return [self.hashes.get(key, {}).get(field) for field in fields]
+
+            async def hset(self, key, mapping):
+                self.hashes.setdefault(key, {}).update(mapping)
+
+        class StubThirdPartyService:
+            def __init__(self):
+                self.historical_dates = []
+
+            async def get_current(self):
+                return [['Apr'], None, [47, 50]]
+
+            async def get_historical(self, date):
+                self.historical_dates.append(date)
+                return ['Apr', 46, 49]
+
+        fake_redis = FakeRedis()
+        get_most_recent_non_weekend_or_today.side_effect = lambda date: date
+
+        def build_cold_service(third_party_service, current_date):
+            get_current_datetime.return_value = current_date
+            return VixCentralService(
+                third_party_service=third_party_service,
+                number_of_days_to_store=4,
+                history_store=VixCentralHistoryStore(redis_client_getter=lambda: fake_redis),
+            )
+
+        first_third_party_service = StubThirdPartyService()
+        await build_cold_service(
+            first_third_party_service,
+            datetime.datetime(2024, 4, 18),
+        ).get_recent_values()
+        second_third_party_service = StubThirdPartyService()
+        result = await build_cold_service(
+            second_third_party_service,
+            datetime.datetime(2024, 4, 19),
+        ).get_recent_values()
+
+        third_third_party_service = StubThirdPartyService()
+        await build_cold_service(
+            third_third_party_service,
+            datetime.datetime(2024, 4, 19),
+        ).get_recent_values()
+
+        assert first_third_party_service.historical_dates == ['2024-04-17', '2024-04-16', '2024-04-15']
+        # Only the newly settled day is missing from the store.
+        assert second_third_party_service.historical_dates == ['2024-04-18']
+        assert third_third_party_service.historical_dates == []
+        assert [value.current_date for value in result.vix_futures_values] == [
+            '2024-04-19',
+            '2024-04-18',
+            '2024-04-17',
+            '2024-04-16',
+        ]
+        assert result.vix_futures_values[1].raw_contango == pytest.approx((49 / 46) - 1)
+
     def test_calculate_contango(self):
         assert self.vix_central_service._calculate_contango(23, 24) == 0.04347826086956519
 
@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import pytest
+
+from src.util.context_manager import TimeTrackerContext, set_span_attribute, trace_span
+
+
+@trace_span('load')
+async def _load(value: int) -> int:
+    set_span_attribute('value', value)
+    await asyncio.sleep(0)
+    return value
+
+
+@trace_span('parse')
+def _parse(value: int) -> int:
+    return value
+
+
+@pytest.mark.asyncio
+async def test_time_tracker_records_nested_spans_across_tasks(monkeypatch, tmp_path):
+    monkeypatch.setattr('src.util.context_manager.config.get_trace_output_dir', lambda: str(tmp_path))
+    tracker = TimeTrackerContext('digest_job')
+
+    with tracker:
+        with trace_span('enrich', phase='coins'):
+            results = await asyncio.gather(_load(1), _load(2))
+        _parse(3)
+        with pytest.raises(ValueError):
+            with trace_span('persist'):
+                raise ValueError('disk full')
+
+    assert results == [1, 2]
+    spans = tracker.trace.spans
+    assert [span.path for span in spans] == [
+        'digest_job',
+        'digest_job > enrich',
+        'digest_job > enrich > load',
+        'digest_job > enrich > load',
+        'digest_job > parse',
+        'digest_job > persist',
+    ]
+    assert all(span.ended_at_ns is not None for span in spans)
+    assert sorted(span.attributes['value'] for span in spans if span.name == 'load') == [1, 2]
+    # gather runs each coroutine in its own task, on its own trace row.
+    assert len({span.track for span in spans if span.name == 'load'}) == 2
+    assert spans[-1].attributes == {'error': 'ValueError'}
+
+    summary = tracker.trace.format_summary().splitlines()
+    assert summary[1].split()[:2] == ['digest_job', '1']
+    assert summary[3].split()[:2] == ['load', '2']
+
+    [trace_path] = tmp_path.iterdir()
+    trace = json.loads(trace_path.read_text())
+    complete_events = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+    assert [event['name'] for event in complete_events] == [span.name for span in spans]
+    assert complete_events[1]['args'] == {'phase': 'coins'}
+    assert complete_events[0]['ts'] == 0
+
+
+def test_spans_are_not_recorded_outside_a_tracker():
+    with trace_span('orphan') as span:
+        set_span_attribute('ignored', True)
+
+    assert span is None
+    assert _parse(1) == 1
@@ -6,6 +6,7 @@ import pytest
 
 from src.util import date_util
 from src.util.date_util import ny_tz
+from src.util.trading_sessions import TradingSessionTable
 
 
 class TestDateUtil:
@@ -81,6 +82,8 @@ class TestDateUtil:
         assert res == expected
 
     def test_get_most_recent_non_weekend_or_today_uses_shared_library_helper(self, monkeypatch):
+        # The helper only answers dates outside the session table.
+        monkeypatch.setattr(date_util, 'XNYS_SESSIONS', TradingSessionTable.empty())
         shared_helper = Mock(return_value=datetime.date(2025, 1, 17))
         monkeypatch.setattr(
             date_util,
@@ -95,6 +98,7 @@ class TestDateUtil:
         assert res == self.build_utc_datetime(2025, 1, 17, 21, 0, 0, 0)
 
     def test_get_most_recent_non_weekend_or_today_falls_back_when_library_helper_missing(self, monkeypatch):
+        monkeypatch.setattr(date_util, 'XNYS_SESSIONS', TradingSessionTable.empty())
         monkeypatch.setattr(
             date_util,
             'market_data_library_date_util',
@@ -126,3 +130,26 @@ class TestDateUtil:
     def test_parse(self, date, format_string, expected):
         res = date_util.parse(dt=date, format=format_string)
         assert res == expected
+
+    @pytest.mark.parametrize('reference_date, count, expected', [
+        # Saturday resolves to Friday; Good Friday 2024-03-29 is skipped.
+        (datetime.date(2024, 4, 6), 6, [
+            datetime.date(2024, 4, 5),
+            datetime.date(2024, 4, 4),
+            datetime.date(2024, 4, 3),
+            datetime.date(2024, 4, 2),
+            datetime.date(2024, 4, 1),
+            datetime.date(2024, 3, 28),
+        ]),
+        (datetime.datetime(2024, 4, 1, 16, 0, tzinfo=ny_tz), 1, [datetime.date(2024, 4, 1)]),
+        (datetime.date(2024, 4, 1), 0, []),
+    ])
+    def test_get_trading_sessions_ending_at(self, reference_date, count, expected):
+        res = date_util.get_trading_sessions_ending_at(reference_date, count)
+        assert res == expected
+
+    def test_get_trading_sessions_ending_at_matches_calendar_fallback(self, monkeypatch):
+        from_table = date_util.get_trading_sessions_ending_at(datetime.date(2024, 4, 6), 30)
+        monkeypatch.setattr(date_util, 'XNYS_SESSIONS', TradingSessionTable.empty())
+
+        assert date_util.get_trading_sessions_ending_at(datetime.date(2024, 4, 6), 30) == from_table
@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+
+from src.util.fetch_scheduler import (
+    FetchPriority,
+    FetchScheduler,
+    ProviderLimits,
+    TokenBucket,
+    fetch_priority,
+    get_fetch_scheduler,
+)
+from src.util.metrics import UPSTREAM_REQUEST_DURATION, UPSTREAM_REQUEST_ERRORS
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, headers=None):
+        super().__init__(f'HTTP {status}')
+        self.status = status
+        self.headers = headers or {}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _build_scheduler(max_in_flight=2, max_attempts=3, sleep=None) -> FetchScheduler:
+    async def _no_sleep(_seconds):
+        return None
+
+    return FetchScheduler(
+        provider_limits={
+            'cmc': ProviderLimits(
+                rate_per_second=1_000,
+                burst=1_000,
+                max_in_flight=max_in_flight,
+                max_attempts=max_attempts,
+            )
+        },
+        sleep=sleep or _no_sleep,
+    )
+
+
+class TestFetchScheduler:
+    def test_token_bucket_refills_at_the_configured_rate(self):
+        clock = _Clock()
+        bucket = TokenBucket(rate_per_second=2, burst=2, clock=clock)
+
+        assert bucket.try_take() == 0
+        assert bucket.try_take() == 0
+        assert bucket.try_take() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert bucket.try_take() == 0
+        clock.now = 10
+        assert [bucket.try_take() for _ in range(3)] == [0, 0, pytest.approx(0.5)]
+
+    @pytest.mark.asyncio
+    async def test_run_bounds_in_flight_calls_per_provider(self):
+        scheduler = _build_scheduler(max_in_flight=3)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch(value):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return value
+
+        results = await asyncio.gather(
+            *[scheduler.run('cmc', lambda value=value: fetch(value)) for value in range(20)]
+        )
+
+        assert results == list(range(20))
+        assert max_in_flight == 3
+        assert scheduler.stats['cmc'].dispatched == 20
+
+    @pytest.mark.asyncio
+    async def test_live_requests_are_dispatched_before_queued_backfill(self):
+        scheduler = _build_scheduler(max_in_flight=1)
+        release_first = asyncio.Event()
+        order = []
+
+        async def fetch(name):
+            order.append(name)
+            if name == 'live-1':
+                await release_first.wait()
+            return name
+
+        first = asyncio.create_task(scheduler.run('cmc', lambda: fetch('live-1')))
+        await asyncio.sleep(0)
+        with fetch_priority(FetchPriority.BACKFILL):
+            backfill = [
+                asyncio.create_task(scheduler.run('cmc', lambda name=name: fetch(name)))
+                for name in ('backfill-1', 'backfill-2')
+            ]
+        await asyncio.sleep(0)
+        live = asyncio.create_task(scheduler.run('cmc', lambda: fetch('live-2')))
+        await asyncio.sleep(0)
+        release_first.set()
+        await asyncio.gather(first, live, *backfill)
+
+        assert order == ['live-1', 'live-2', 'backfill-1', 'backfill-2']
+
+    @pytest.mark.asyncio
+    async def test_run_retries_rate_limits_and_server_errors_with_backoff(self):
+        delays = []
+
+        async def record_sleep(seconds):
+            delays.append(seconds)
+
+        scheduler = _build_scheduler(max_attempts=3, sleep=record_sleep)
+        attempts = [
+            _HttpError(429, headers={'Retry-After': '2'}),
+            _HttpError(503),
+            {'value': 1},
+        ]
+
+        async def fetch():
+            result = attempts.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        errors_before = UPSTREAM_REQUEST_ERRORS.get(provider='cmc')
+        successes_before = UPSTREAM_REQUEST_DURATION.get_count(provider='cmc', outcome='success')
+
+        res = await scheduler.run('cmc', fetch)
+
+        assert res == {'value': 1}
+        assert delays[0] == 2
+        assert 0 <= delays[1] <= 1.0
+        assert scheduler.stats['cmc'].retries == 2
+        assert UPSTREAM_REQUEST_ERRORS.get(provider='cmc') - errors_before == 2
+        assert UPSTREAM_REQUEST_DURATION.get_count(provider='cmc', outcome='success') - successes_before == 1
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_retry_client_errors_or_exhausted_attempts(self):
+        scheduler = _build_scheduler(max_attempts=2)
+        calls = 0
+
+        async def fetch(error):
+            nonlocal calls
+            calls += 1
+            raise error
+
+        with pytest.raises(_HttpError):
+            await scheduler.run('cmc', lambda: fetch(_HttpError(404)))
+        assert calls == 1
+
+        with pytest.raises(_HttpError):
+            await scheduler.run('cmc', lambda: fetch(_HttpError(500)))
+        assert calls == 3
+        assert scheduler.stats['cmc'].failures == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        scheduler = _build_scheduler(max_in_flight=1)
+        release_first = asyncio.Event()
+
+        async def block():
+            await release_first.wait()
+
+        first = asyncio.create_task(scheduler.run('cmc', block))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(scheduler.run('cmc', block))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        release_first.set()
+        await first
+
+        async def fetch():
+            return 'ok'
+
+        assert await asyncio.wait_for(scheduler.run('cmc', fetch), timeout=1) == 'ok'
+
+    @pytest.mark.asyncio
+    async def test_get_fetch_scheduler_reuses_one_scheduler_per_loop(self):
+        assert get_fetch_scheduler() is get_fetch_scheduler()
@@ -0,0 +1,77 @@
+import pytest
+
+from src.util.metrics import (
+    SQLITE_QUERY_DURATION,
+    MetricsRegistry,
+    instrument_sqlite_repository,
+)
+
+
+def test_render_histogram_and_counter_in_exposition_format():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('latency_seconds', 'Latency.', ('route',), buckets=(0.1, 1.0))
+    counter = registry.counter('errors_total', 'Errors.', ('provider',))
+
+    histogram.observe(0.05, route='/a')
+    histogram.observe(0.5, route='/a')
+    histogram.observe(5, route='/a')
+    histogram.observe(0.1, route='/b"\\\n')
+    counter.inc(provider='cmc')
+    counter.inc(2, provider='cmc')
+
+    assert registry.render() == '\n'.join([
+        '# HELP latency_seconds Latency.',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+        'latency_seconds_sum{route="/a"} 5.55',
+        'latency_seconds_count{route="/a"} 3',
+        'latency_seconds_bucket{route="/b\\"\\\\\\n",le="0.1"} 1',
+        'latency_seconds_bucket{route="/b\\"\\\\\\n",le="1"} 1',
+        'latency_seconds_bucket{route="/b\\"\\\\\\n",le="+Inf"} 1',
+        'latency_seconds_sum{route="/b\\"\\\\\\n"} 0.1',
+        'latency_seconds_count{route="/b\\"\\\\\\n"} 1',
+        '# HELP errors_total Errors.',
+        '# TYPE errors_total counter',
+        'errors_total{provider="cmc"} 3',
+    ]) + '\n'
+
+
+def test_rejects_wrong_labels_and_duplicate_names():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('latency_seconds', 'Latency.', ('route',))
+
+    with pytest.raises(ValueError):
+        histogram.observe(1, method='GET')
+    with pytest.raises(ValueError):
+        registry.counter('latency_seconds', 'Again.')
+
+
+def test_write_textfile_replaces_file_atomically(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter('runs_total', 'Runs.').inc()
+    path = tmp_path / 'textfile' / 'job.prom'
+
+    registry.write_textfile(str(path))
+    registry.write_textfile(str(path))
+
+    assert path.read_text() == registry.render()
+    assert [file.name for file in path.parent.iterdir()] == ['job.prom']
+
+
+def test_instrument_sqlite_repository_times_public_methods_only():
+    @instrument_sqlite_repository('metrics_test_repository')
+    class Repository:
+        def get_rows(self, limit: int) -> list[int]:
+            return self._load()[:limit]
+
+        def _load(self) -> list[int]:
+            return [1, 2, 3]
+
+    repository = Repository()
+
+    assert repository.get_rows(2) == [1, 2]
+    assert Repository.get_rows.__name__ == 'get_rows'
+    assert SQLITE_QUERY_DURATION.get_count(repository='metrics_test_repository', method='get_rows') == 1
+    assert SQLITE_QUERY_DURATION.get_count(repository='metrics_test_repository', method='_load') == 0
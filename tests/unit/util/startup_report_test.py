@@ -0,0 +1,73 @@
+import pytest
+
+from src.job.stocks.stocks import StocksNotificationJob
+from src.util.startup_report import (
+    ImportTiming,
+    StepTiming,
+    format_startup_report,
+    get_module_name,
+    parse_import_times,
+    profile_imports,
+    time_steps,
+)
+
+
+def test_parse_import_times_skips_header_and_strips_nesting():
+    output = '\n'.join([
+        'import time: self [us] | cumulative | imported package',
+        'import time:       120 |        120 |     telegram._bot',
+        'import time:      3000 |       3120 |   telegram',
+        'Traceback (most recent call last):',
+    ])
+
+    assert parse_import_times(output) == [
+        ImportTiming(module='telegram._bot', self_us=120, cumulative_us=120),
+        ImportTiming(module='telegram', self_us=3000, cumulative_us=3120),
+    ]
+
+
+def test_profile_imports_runs_in_a_fresh_interpreter():
+    timings = profile_imports('json')
+
+    assert 'json' in [timing.module for timing in timings]
+    with pytest.raises(RuntimeError):
+        profile_imports('module_that_does_not_exist')
+
+
+def test_get_module_name_uses_the_source_path():
+    assert get_module_name(StocksNotificationJob) == 'src.job.stocks.stocks'
+
+
+@pytest.mark.asyncio
+async def test_time_steps_records_failures_and_continues():
+    calls = []
+
+    async def build():
+        calls.append('build')
+
+    def fail():
+        raise RuntimeError('missing token')
+
+    timings = await time_steps([('fail', fail), ('build', build)])
+
+    assert calls == ['build']
+    assert [(timing.name, timing.error) for timing in timings] == [
+        ('fail', 'RuntimeError'),
+        ('build', None),
+    ]
+
+
+def test_format_startup_report_groups_import_time_by_package():
+    report = format_startup_report(
+        'src.server',
+        [
+            ImportTiming(module='telegram._bot', self_us=1000, cumulative_us=1000),
+            ImportTiming(module='telegram', self_us=2000, cumulative_us=3000),
+            ImportTiming(module='src.server', self_us=500, cumulative_us=3500),
+        ],
+        [StepTiming(name='Dependencies.build', seconds=0.0125)],
+    )
+
+    assert 'Import src.server: 3.5 ms' in report
+    assert f'{"telegram":<50} {3.0:>10.1f} {2:>8}' in report
+    assert f'{"Dependencies.build":<50} {12.5:>10.1f}' in report
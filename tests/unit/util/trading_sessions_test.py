@@ -0,0 +1,74 @@
+import datetime
+
+import pytest
+
+from src.util.trading_sessions import (
+    XNYS_SESSIONS_PATH,
+    TradingSessionTable,
+    build_session_table,
+)
+
+# Tuesday 2024-12-31 to Friday 2025-01-10; 2025-01-01 and 2025-01-09 are closed.
+TABLE = TradingSessionTable(
+    datetime.date(2024, 12, 31),
+    datetime.date(2025, 1, 10),
+    [
+        datetime.date(2024, 12, 31),
+        datetime.date(2025, 1, 2),
+        datetime.date(2025, 1, 3),
+        datetime.date(2025, 1, 6),
+        datetime.date(2025, 1, 7),
+        datetime.date(2025, 1, 8),
+        datetime.date(2025, 1, 10),
+    ],
+)
+
+
+def test_lookups_skip_closed_days():
+    assert TABLE.get_session_at_or_before(datetime.date(2025, 1, 5)) == datetime.date(2025, 1, 3)
+    assert TABLE.get_session_at_or_after(datetime.date(2025, 1, 4)) == datetime.date(2025, 1, 6)
+    assert TABLE.get_previous_session(datetime.date(2025, 1, 10)) == datetime.date(2025, 1, 8)
+    assert TABLE.get_next_session(datetime.date(2025, 1, 8)) == datetime.date(2025, 1, 10)
+    assert TABLE.get_sessions_ending_at(datetime.date(2025, 1, 9), 3) == [
+        datetime.date(2025, 1, 8),
+        datetime.date(2025, 1, 7),
+        datetime.date(2025, 1, 6),
+    ]
+
+
+def test_lookups_outside_the_table_return_none():
+    assert TABLE.get_session_at_or_before(datetime.date(2024, 12, 30)) is None
+    assert TABLE.get_session_at_or_after(datetime.date(2025, 1, 11)) is None
+    assert TABLE.get_next_session(datetime.date(2025, 1, 10)) is None
+    assert TABLE.get_sessions_ending_at(datetime.date(2025, 1, 2), 3) is None
+    assert TradingSessionTable.empty().get_session_at_or_before(datetime.date(2025, 1, 2)) is None
+
+
+def test_json_round_trip_encodes_gaps():
+    data = TABLE.to_json('XNYS')
+
+    assert data['gaps'] == '0213112'
+    restored = TradingSessionTable.from_json(data)
+    assert restored.sessions == TABLE.sessions
+    assert (restored.start, restored.end) == (TABLE.start, TABLE.end)
+
+
+def test_to_json_rejects_gaps_longer_than_one_digit():
+    table = TradingSessionTable(
+        datetime.date(2025, 1, 1),
+        datetime.date(2025, 1, 31),
+        [datetime.date(2025, 1, 2), datetime.date(2025, 1, 20)],
+    )
+
+    with pytest.raises(ValueError):
+        table.to_json('XNYS')
+
+
+def test_shipped_xnys_table_matches_exchange_calendars():
+    shipped = TradingSessionTable.load(XNYS_SESSIONS_PATH)
+
+    expected = build_session_table('XNYS', shipped.start, shipped.end)
+
+    assert shipped.sessions == expected.sessions, (
+        'Regenerate with: python src/util/trading_sessions.py'
+    )